@@ -5,22 +5,35 @@
 Clean Architecture:
 - Command(UseCase): 이 파일 - Port 호출, 오케스트레이션
 - Service: IntentClassifierService - 순수 비즈니스 로직 (Port 의존 없음)
-- Port: LLMClientPort, CachePort, PromptLoaderPort - 외부 의존
+- Port: LLMClientPort, CachePort, SemanticCachePort, PromptLoaderPort, IntentPredictorPort
+  - 외부 의존
 - Node(Adapter): intent_node.py - LangGraph glue
 
 구조:
-- Command: 캐시 조회/저장, LLM 호출, Service 호출, 오케스트레이션
+- Command: 로컬 예측, 캐시 조회/저장, LLM 호출, Service 호출, 오케스트레이션
 - Service: 프롬프트 구성, LLM 응답 파싱, 신뢰도 계산, 복잡도 판단
+
+로컬 분류기 (IntentPredictorPort, 선택):
+- fast path: 신뢰도가 임계값 이상이면 캐시/LLM 없이 바로 반환
+- shadow: fast path 비활성(또는 shadow 샘플링)이면 LLM 결과와 일치 여부만 기록
+- 멀티턴 맥락(context)이 있으면 사용하지 않음 (캐시와 동일 조건)
+
+유사 질문 캐시 (SemanticCachePort, 선택):
+- 정확 일치 캐시 앞단에서 표기만 다른 질문("버려?"/"버려요")의 LLM 분류 결과 재사용
+- 로컬 분류기 결과는 저장하지 않음 (LLM 결과만 저장)
 """
 
 from __future__ import annotations
 
 import logging
+import random
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from chat_worker.application.services.intent_classifier_service import (
     INTENT_CACHE_TTL,
+    LOCAL_INTENT_CONFIDENCE_THRESHOLD,
+    IntentClassificationResult,
     IntentClassificationSchema,
     IntentClassifierService,
     MultiIntentDetectionSchema,
@@ -32,12 +45,19 @@ from chat_worker.infrastructure.assets.character_name_detector import (
 )
 
 if TYPE_CHECKING:
-    from chat_worker.application.ports.cache import CachePort
+    from chat_worker.application.ports.cache import CachePort, SemanticCachePort
+    from chat_worker.application.ports.intent_predictor import (
+        IntentPrediction,
+        IntentPredictorPort,
+    )
     from chat_worker.application.ports.llm import LLMClientPort
+    from chat_worker.application.ports.metrics import MetricsPort
     from chat_worker.application.ports.prompt_loader import PromptLoaderPort
 
 logger = logging.getLogger(__name__)
 
+SEMANTIC_INTENT_NAMESPACE = "intent"
+
 
 @dataclass(frozen=True)
 class ClassifyIntentInput:
@@ -79,15 +99,20 @@ class ClassifyIntentCommand:
     """의도 분류 Command (UseCase).
 
     Port 호출 + 오케스트레이션:
-    1. 캐시 조회 (CachePort)
-    2. LLM 호출 (LLMClientPort)
-    3. Service 호출 (순수 로직)
-    4. 캐시 저장 (CachePort)
+    1. 로컬 예측 (IntentPredictorPort, 고신뢰면 여기서 종료)
+    2. 유사 질문 캐시 조회 (SemanticCachePort)
+    3. 캐시 조회 (CachePort)
+    4. LLM 호출 (LLMClientPort)
+    5. Service 호출 (순수 로직)
+    6. 캐시 저장 (CachePort, SemanticCachePort)
 
     Port 주입:
     - llm: LLM 클라이언트
     - prompt_loader: 프롬프트 로더
     - cache: 캐시 Port (선택)
+    - intent_predictor: 로컬 분류기 Port (선택)
+    - metrics: 메트릭 Port (선택, 경로별 적중률/일치율)
+    - semantic_cache: 유사 질문 캐시 Port (선택)
     """
 
     def __init__(
@@ -96,6 +121,12 @@ class ClassifyIntentCommand:
         prompt_loader: "PromptLoaderPort",
         cache: "CachePort | None" = None,
         enable_multi_intent: bool = True,
+        intent_predictor: "IntentPredictorPort | None" = None,
+        metrics: "MetricsPort | None" = None,
+        enable_local_fast_path: bool = False,
+        local_confidence_threshold: float = LOCAL_INTENT_CONFIDENCE_THRESHOLD,
+        local_shadow_rate: float = 0.0,
+        semantic_cache: "SemanticCachePort | None" = None,
     ) -> None:
         """Command 초기화.
 
@@ -104,11 +135,23 @@ class ClassifyIntentCommand:
             prompt_loader: 프롬프트 로더
             cache: 캐시 Port (선택)
             enable_multi_intent: Multi-Intent 처리 활성화 여부
+            intent_predictor: 로컬 분류기 Port (None이면 로컬 예측 안 함)
+            metrics: 메트릭 Port (선택)
+            enable_local_fast_path: 고신뢰 로컬 예측으로 LLM 생략 (False면 shadow 모드)
+            local_confidence_threshold: fast path 신뢰도 임계값 (키워드 신호 반영 후)
+            local_shadow_rate: fast path 대상 중 LLM으로도 검증할 비율 (0.0~1.0)
+            semantic_cache: 유사 질문 캐시 Port (None이면 정확 일치 캐시만 사용)
         """
         self._llm = llm
         self._cache = cache
         self._enable_cache = cache is not None
         self._enable_multi_intent = enable_multi_intent
+        self._intent_predictor = intent_predictor
+        self._metrics = metrics
+        self._enable_local_fast_path = enable_local_fast_path
+        self._local_confidence_threshold = local_confidence_threshold
+        self._local_shadow_rate = local_shadow_rate
+        self._semantic_cache = semantic_cache
 
         # Service 생성 (프롬프트 로드 - Port 없이 문자열만 전달)
         self._service = IntentClassifierService(
@@ -195,7 +238,43 @@ class ClassifyIntentCommand:
 
         Model-Centric 접근: Structured Output으로 모델 판단 신뢰.
         """
-        # 1. 캐시 조회 (Command에서 Port 호출)
+        # 0. 로컬 분류기 (맥락 없는 메시지만, 고신뢰면 캐시/LLM 생략)
+        local: IntentClassificationResult | None = None
+        if self._intent_predictor is not None and context is None:
+            local = self._predict_local(message)
+            if local is not None and local.confidence >= self._local_confidence_threshold:
+                if self._enable_local_fast_path and random.random() >= self._local_shadow_rate:
+                    events.append("local_intent_hit")
+                    self._track_path("local")
+                    return ClassifyIntentOutput(
+                        intent=local.intent.value,
+                        confidence=local.confidence,
+                        is_complex=local.is_complex,
+                        has_multi_intent=self._service.has_multi_intent(message),
+                        additional_intents=[],
+                        decomposed_queries=[message],
+                        events=events,
+                    )
+                events.append("local_intent_shadow")
+
+        # 1. 유사 질문 캐시 조회 (프로세스 내, 맥락 없는 메시지만)
+        if self._semantic_cache is not None and context is None:
+            semantic = self._lookup_semantic(message)
+            if semantic is not None:
+                events.append("semantic_cache_hit")
+                self._track_path("semantic_cache")
+                self._track_agreement(local, semantic["intent"])
+                return ClassifyIntentOutput(
+                    intent=semantic["intent"],
+                    confidence=semantic.get("confidence", 1.0),
+                    is_complex=semantic.get("is_complex", False),
+                    has_multi_intent=self._service.has_multi_intent(message),
+                    additional_intents=[],
+                    decomposed_queries=[message],
+                    events=events,
+                )
+
+        # 2. 캐시 조회 (Command에서 Port 호출)
         if self._enable_cache and context is None:
             cache_key = self._service.generate_cache_key(message)
             try:
@@ -203,6 +282,8 @@ class ClassifyIntentCommand:
                 if cached:
                     logger.debug(f"Intent cache hit: {cache_key}")
                     events.append("cache_hit")
+                    self._track_path("cache")
+                    self._track_agreement(local, cached.get("intent", "general"))
                     # 캐시된 결과 반환
                     return ClassifyIntentOutput(
                         intent=cached.get("intent", "general"),
@@ -217,10 +298,10 @@ class ClassifyIntentCommand:
                 logger.warning(f"Cache get failed: {e}")
                 events.append("cache_error")
 
-        # 2. 프롬프트 구성 (Service - 순수 로직)
+        # 3. 프롬프트 구성 (Service - 순수 로직)
         prompt = self._service.build_prompt_with_context(message, context)
 
-        # 3. LLM Structured Output 호출 (Model-Centric)
+        # 4. LLM Structured Output 호출 (Model-Centric)
         try:
             structured_result = await self._llm.generate_structured(
                 prompt=prompt,
@@ -233,6 +314,7 @@ class ClassifyIntentCommand:
         except Exception as e:
             logger.error(f"LLM structured call failed: {e}")
             events.append("llm_error")
+            self._track_path("llm_error")
             return ClassifyIntentOutput(
                 intent="general",
                 confidence=0.0,
@@ -240,26 +322,33 @@ class ClassifyIntentCommand:
                 events=events,
             )
 
-        # 4. Structured 응답 파싱 (Service - Model-Centric)
+        # 5. Structured 응답 파싱 (Service - Model-Centric)
         result = self._service.parse_structured_intent_response(structured_result, message, context)
         events.append("intent_classified")
-
-        # 5. 캐시 저장 (Command에서 Port 호출)
+        self._track_path("llm")
+        self._track_agreement(local, result.intent.value)
+
+        # 6. 캐시 저장 (Command에서 Port 호출)
+        cached_value = {
+            "intent": result.intent.value,
+            "confidence": result.confidence,
+            "is_complex": result.is_complex,
+        }
         if self._enable_cache and context is None:
             try:
                 cache_key = self._service.generate_cache_key(message)
-                await self._cache.set(
-                    cache_key,
-                    {
-                        "intent": result.intent.value,
-                        "confidence": result.confidence,
-                        "is_complex": result.is_complex,
-                    },
-                    ttl=INTENT_CACHE_TTL,
-                )
+                await self._cache.set(cache_key, cached_value, ttl=INTENT_CACHE_TTL)
                 events.append("cache_saved")
             except Exception as e:
                 logger.warning(f"Cache set failed: {e}")
+        if self._semantic_cache is not None and context is None:
+            try:
+                self._semantic_cache.store(
+                    SEMANTIC_INTENT_NAMESPACE, message, cached_value, ttl=INTENT_CACHE_TTL
+                )
+                events.append("semantic_cache_saved")
+            except Exception as e:
+                logger.warning(f"Semantic cache store failed: {e}")
 
         # Multi-Intent 가능성 체크 (Service - 순수 로직)
         has_multi_intent = self._service.has_multi_intent(message)
@@ -283,6 +372,49 @@ class ClassifyIntentCommand:
             events=events,
         )
 
+    def _predict_local(self, message: str) -> IntentClassificationResult | None:
+        """로컬 분류기 예측 + 키워드 신호 반영 (실패 시 None, LLM 경로로 진행)."""
+        try:
+            prediction: IntentPrediction | None = self._intent_predictor.predict(message)
+        except Exception as e:
+            logger.warning(f"Local intent prediction failed: {e}")
+            return None
+        if prediction is None:
+            return None
+        return self._service.parse_local_prediction(
+            prediction.intent, prediction.probability, message
+        )
+
+    def _lookup_semantic(self, message: str) -> dict[str, Any] | None:
+        """유사 질문 캐시 조회 (실패 시 None, 다음 단계로 진행)."""
+        try:
+            hit = self._semantic_cache.lookup(SEMANTIC_INTENT_NAMESPACE, message)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+        if hit is None or "intent" not in hit.value:
+            return None
+        logger.debug(
+            "Intent semantic cache hit",
+            extra={"similarity": hit.similarity, "matched_text": hit.matched_text[:30]},
+        )
+        return hit.value
+
+    def _track_path(self, path: str) -> None:
+        """분류 경로 메트릭 기록 (local/semantic_cache/cache/llm/llm_error)."""
+        if self._metrics is not None:
+            self._metrics.track_intent_path(path)
+
+    def _track_agreement(self, local: IntentClassificationResult | None, actual: str) -> None:
+        """로컬 예측과 LLM(캐시) 결과 일치 여부 기록."""
+        if local is None or self._metrics is None:
+            return
+        self._metrics.track_intent_agreement(
+            predicted=local.intent.value,
+            actual=actual,
+            confidence=local.confidence,
+        )
+
     async def _execute_multi_intent(
         self,
         input_dto: ClassifyIntentInput,
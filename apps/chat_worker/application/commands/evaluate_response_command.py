@@ -176,6 +176,7 @@ class EvaluateResponseCommand:
 
         calibration_status = await self._run_calibration(input_dto.job_id)
         await self._save_result(eval_result, input_dto.job_id)
+        await self._record_drift_scores(llm_scores)
 
         needs_regeneration = (
             eval_result.grade == "C" and self._eval_config.eval_regeneration_enabled
@@ -255,6 +256,14 @@ class EvaluateResponseCommand:
         except Exception:
             logger.warning("Save eval result failed", extra={"job_id": job_id}, exc_info=True)
 
+    async def _record_drift_scores(self, llm_scores: dict | None) -> None:
+        """L2 축별 점수를 L3 CUSUM 누적 상태에 반영 (실패 시 로그만)."""
+        if not llm_scores or self._calibration_monitor is None:
+            return
+        await self._calibration_monitor.record_scores(
+            {axis: score.score for axis, score in llm_scores.items()}
+        )
+
     async def _should_run_llm_grader(self) -> bool:
         """L2 LLM Grader 실행 여부 판단 (비용 가드레일 포함).
 
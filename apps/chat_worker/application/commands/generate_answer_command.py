@@ -5,7 +5,7 @@
 Clean Architecture:
 - Command(UseCase): 이 파일 - Port 호출, 오케스트레이션
 - Service: AnswerGeneratorService - 순수 비즈니스 로직 (Port 의존 없음)
-- Port: LLMClientPort, CachePort, PromptBuilderPort - 외부 의존
+- Port: LLMClientPort, CachePort, SemanticCachePort, PromptBuilderPort - 외부 의존
 - Node(Adapter): answer_node.py - LangGraph glue
 
 구조:
@@ -14,11 +14,13 @@ Clean Architecture:
 
 P2: Multi-Intent Policy 조합 주입
 P3: Answer 캐싱 (간단한 질문)
+P4: 유사 질문 Answer 캐싱 (단일 턴 분리배출 질문, 같은 RAG 컨텍스트일 때만)
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, AsyncIterator
@@ -27,7 +29,7 @@ from chat_worker.application.dto.answer_context import AnswerContext
 from chat_worker.application.services.answer_generator import AnswerGeneratorService
 
 if TYPE_CHECKING:
-    from chat_worker.application.ports.cache import CachePort
+    from chat_worker.application.ports.cache import CachePort, SemanticCachePort
     from chat_worker.application.ports.llm import LLMClientPort
     from chat_worker.application.ports.prompt_builder import PromptBuilderPort
 
@@ -37,6 +39,10 @@ logger = logging.getLogger(__name__)
 ANSWER_CACHE_TTL = 3600  # 1시간
 CACHEABLE_INTENTS = frozenset({"general", "greeting"})
 
+# 유사 질문 Answer 캐시 설정
+SEMANTIC_ANSWER_CACHE_TTL = 1800  # 30분 (날씨 컨텍스트 포함 가능)
+SEMANTIC_CACHEABLE_INTENTS = frozenset({"waste"})
+
 
 @dataclass(frozen=True)
 class GenerateAnswerInput:
@@ -84,22 +90,24 @@ class PreparedPrompt:
     cache_key: str
     is_cacheable: bool
     cached_answer: str | None = None
+    semantic_namespace: str | None = None  # 유사 캐시 저장 대상이면 namespace
 
 
 class GenerateAnswerCommand:
     """답변 생성 Command (UseCase).
 
     Port 호출 + 오케스트레이션:
-    1. 캐시 조회 (CachePort)
+    1. 캐시 조회 (CachePort, SemanticCachePort)
     2. 컨텍스트 구성 (Service - 순수 로직)
     3. 프롬프트 구성 (Service - 순수 로직)
     4. LLM 호출 (LLMClientPort)
-    5. 캐시 저장 (CachePort)
+    5. 캐시 저장 (CachePort, SemanticCachePort)
 
     Port 주입:
     - llm: LLM 클라이언트
     - prompt_builder: 프롬프트 빌더 Port
     - cache: 캐시 Port (선택)
+    - semantic_cache: 유사 질문 캐시 Port (선택, prepare 경로)
     """
 
     def __init__(
@@ -108,6 +116,8 @@ class GenerateAnswerCommand:
         prompt_builder: "PromptBuilderPort",
         cache: "CachePort | None" = None,
         service: AnswerGeneratorService | None = None,
+        semantic_cache: "SemanticCachePort | None" = None,
+        semantic_cache_ttl: int = SEMANTIC_ANSWER_CACHE_TTL,
     ) -> None:
         """Command 초기화.
 
@@ -116,11 +126,15 @@ class GenerateAnswerCommand:
             prompt_builder: 프롬프트 빌더 Port
             cache: 캐시 Port (선택)
             service: 답변 생성 서비스 (선택, 테스트 주입용)
+            semantic_cache: 유사 질문 캐시 Port (선택)
+            semantic_cache_ttl: 유사 캐시 답변 TTL 초
         """
         self._llm = llm
         self._prompt_builder = prompt_builder
         self._cache = cache
         self._service = service or AnswerGeneratorService()
+        self._semantic_cache = semantic_cache
+        self._semantic_cache_ttl = semantic_cache_ttl
 
     def _generate_cache_key(self, message: str, intent: str) -> str:
         """Answer 캐시 키 생성."""
@@ -140,6 +154,65 @@ class GenerateAnswerCommand:
             return False
         return True
 
+    def _semantic_namespace(self, input_dto: GenerateAnswerInput) -> str | None:
+        """유사 캐시 namespace (대상이 아니면 None).
+
+        조건:
+        - SEMANTIC_CACHEABLE_INTENTS 단일 Intent
+        - 단일 턴 (히스토리는 현재 메시지뿐, 요약 없음)
+        - 이미지 분류/캐릭터/이미지 생성 컨텍스트 없음 (개인화 답변 제외)
+
+        namespace에 답변 컨텍스트(검색된 규정, 날씨 등) 해시를 넣어
+        같은 컨텍스트에서 표기만 다른 질문끼리만 적중합니다.
+        규정 에셋이 바뀌면 해시도 바뀌므로 이전 답변은 적중하지 않습니다.
+        """
+        if self._semantic_cache is None:
+            return None
+        if input_dto.intent not in SEMANTIC_CACHEABLE_INTENTS:
+            return None
+        if input_dto.has_multi_intent or input_dto.additional_intents:
+            return None
+        if len(input_dto.conversation_history or []) > 1 or input_dto.conversation_summary:
+            return None
+        if (
+            input_dto.classification
+            or input_dto.character_context
+            or input_dto.image_generation_context
+        ):
+            return None
+
+        context = {
+            "disposal_rules": input_dto.disposal_rules,
+            "location_context": input_dto.location_context,
+            "web_search_results": input_dto.web_search_results,
+            "recyclable_price_context": input_dto.recyclable_price_context,
+            "bulk_waste_context": input_dto.bulk_waste_context,
+            "weather_context": input_dto.weather_context,
+            "collection_point_context": input_dto.collection_point_context,
+        }
+        encoded = json.dumps(context, sort_keys=True, ensure_ascii=False, default=str)
+        fingerprint = hashlib.sha256(encoded.encode()).hexdigest()[:16]
+        return f"answer:{input_dto.intent}:{fingerprint}"
+
+    def _lookup_semantic(self, namespace: str, input_dto: GenerateAnswerInput) -> str | None:
+        """유사 캐시 답변 조회 (실패 시 None)."""
+        try:
+            hit = self._semantic_cache.lookup(namespace, input_dto.message)
+        except Exception as e:
+            logger.warning(f"Answer semantic cache lookup failed: {e}")
+            return None
+        if hit is None:
+            return None
+        logger.info(
+            "Answer semantic cache hit",
+            extra={
+                "job_id": input_dto.job_id,
+                "intent": input_dto.intent,
+                "similarity": hit.similarity,
+            },
+        )
+        return hit.value.get("answer")
+
     def _build_context(self, input_dto: GenerateAnswerInput) -> AnswerContext:
         """AnswerContext 구성 (Service 사용)."""
         disposal_rules = None
@@ -199,6 +272,11 @@ class GenerateAnswerCommand:
             except Exception as e:
                 logger.warning(f"Answer cache get failed: {e}")
 
+        # 유사 질문 캐시 확인 (단일 턴 분리배출 질문)
+        semantic_namespace = self._semantic_namespace(input_dto)
+        if semantic_namespace is not None and not cached_answer:
+            cached_answer = self._lookup_semantic(semantic_namespace, input_dto)
+
         # 3. 프롬프트 구성 (Service - 순수 로직)
         prompt = self._service.build_prompt(context)
         system_prompt = self._build_system_prompt(input_dto)
@@ -215,6 +293,7 @@ class GenerateAnswerCommand:
             cache_key=cache_key,
             is_cacheable=is_cacheable,
             cached_answer=cached_answer,
+            semantic_namespace=semantic_namespace,
         )
 
     async def save_to_cache(self, cache_key: str, answer: str) -> None:
@@ -233,6 +312,24 @@ class GenerateAnswerCommand:
         except Exception as e:
             logger.warning(f"Answer cache set failed: {e}")
 
+    def save_to_semantic_cache(self, namespace: str, message: str, answer: str) -> None:
+        """유사 질문 캐시에 답변 저장.
+
+        Args:
+            namespace: prepare에서 받은 semantic_namespace
+            message: 사용자 메시지
+            answer: 저장할 답변
+        """
+        if self._semantic_cache is None or not answer:
+            return
+
+        try:
+            self._semantic_cache.store(
+                namespace, message, {"answer": answer}, ttl=self._semantic_cache_ttl
+            )
+        except Exception as e:
+            logger.warning(f"Answer semantic cache store failed: {e}")
+
     async def execute(
         self,
         input_dto: GenerateAnswerInput,
@@ -6,14 +6,15 @@ factory.py에서 주입하여 eval_node 동작 제어.
 참조: docs/plans/chat-eval-pipeline-plan.md Section 2.1
 
 3가지 실행 모드:
-- sync: L1 Code Grader만 동기 실행. C등급 시 재생성 1회. < 50ms.
-- async: L1 동기 + L2/L3를 Celery Worker로 비동기. Production 품질 추적.
-- shadow: L1+L2+L3 모두 비동기. 응답에 영향 없음. 로그만. A/B 테스트.
+- sync: answer → eval → END. 모든 요청이 평가 완료 후 done. C등급 시 재생성 1회.
+- async: eval_blocking_intents만 동기 평가(재생성 가능), 나머지는 샘플링하여
+  eval job 스트림에 적재 후 즉시 done. 별도 eval_worker가 평가. Production 품질 추적.
+- shadow: 모든 요청을 샘플링하여 비동기 평가. 응답에 영향 없음. A/B 테스트.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal
 
 
@@ -33,6 +34,7 @@ class EvalConfig:
         eval_self_consistency_runs: Self-Consistency 채점 횟수 (고위험 구간)
         eval_cusum_check_interval: N번째 요청마다 Calibration 실행
         eval_cost_budget_daily_usd: 일일 평가 비용 상한 (USD)
+        eval_blocking_intents: async 모드에서도 동기 평가할 intent (재생성 대상)
     """
 
     enable_eval_pipeline: bool = False
@@ -46,6 +48,15 @@ class EvalConfig:
     eval_self_consistency_runs: int = 3
     eval_cusum_check_interval: int = 100
     eval_cost_budget_daily_usd: float = 50.0
+    eval_blocking_intents: frozenset[str] = field(default_factory=frozenset)
+
+    def is_blocking(self, intent: str) -> bool:
+        """해당 intent 답변을 done 전에 동기 평가할지 여부."""
+        if self.eval_mode == "sync":
+            return True
+        if self.eval_mode == "async":
+            return intent in self.eval_blocking_intents
+        return False
 
 
 __all__ = ["EvalConfig"]
@@ -14,19 +14,25 @@ Layer-first 구조:
 - Vision: VisionModelPort
 - Events: ProgressNotifierPort, DomainEventBusPort
 - Retrieval: RetrieverPort
-- Cache: CachePort
+- Cache: CachePort, SemanticCachePort
 - Metrics: MetricsPort
 - WebSearch: WebSearchPort
 - Integrations: CharacterClientPort, LocationClientPort
 - Feedback: LLMFeedbackEvaluatorPort
-- Eval: BARSEvaluator, EvalResultCommandGateway, EvalResultQueryGateway, CalibrationDataGateway
+- Eval: BARSEvaluator, EvalResultCommandGateway, EvalResultQueryGateway, CalibrationDataGateway,
+  EvalJobQueue, DriftStateGateway
 - Interaction: InputRequesterPort, InteractionStateStorePort
 - Prompt: PromptBuilderPort
+- Intent: IntentPredictorPort
 """
 
 # LLM
 # Cache
-from chat_worker.application.ports.cache import CachePort
+from chat_worker.application.ports.cache import (
+    CachePort,
+    SemanticCacheHit,
+    SemanticCachePort,
+)
 
 # Circuit Breaker
 from chat_worker.application.ports.circuit_breaker import (
@@ -64,6 +70,12 @@ from chat_worker.application.ports.events import (
     ProgressNotifierPort,
 )
 
+# Intent - 로컬 예측 (LLM fast path)
+from chat_worker.application.ports.intent_predictor import (
+    IntentPrediction,
+    IntentPredictorPort,
+)
+
 # Interaction - HITL
 from chat_worker.application.ports.input_requester import (
     InputRequesterPort,
@@ -117,6 +129,8 @@ from chat_worker.application.ports.web_search import WebSearchPort
 from chat_worker.application.ports.eval import (
     BARSEvaluator,
     CalibrationDataGateway,
+    DriftStateGateway,
+    EvalJobQueue,
     EvalResultCommandGateway,
     EvalResultQueryGateway,
 )
@@ -138,6 +152,8 @@ __all__ = [
     "RetrieverPort",
     # Cache
     "CachePort",
+    "SemanticCachePort",
+    "SemanticCacheHit",
     # Circuit Breaker
     "CircuitBreakerPort",
     "CircuitBreakerRegistryPort",
@@ -164,6 +180,9 @@ __all__ = [
     "LocationDTO",
     # Feedback
     "LLMFeedbackEvaluatorPort",
+    # Intent
+    "IntentPredictorPort",
+    "IntentPrediction",
     # Interaction
     "InputRequesterPort",
     "InteractionStateStorePort",
@@ -175,4 +194,6 @@ __all__ = [
     "EvalResultCommandGateway",
     "EvalResultQueryGateway",
     "CalibrationDataGateway",
+    "EvalJobQueue",
+    "DriftStateGateway",
 ]
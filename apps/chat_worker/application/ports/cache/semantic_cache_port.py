@@ -0,0 +1,73 @@
+"""Semantic Cache Port - 유사 질문 캐싱 인터페이스 정의.
+
+CachePort는 메시지 해시(정확 일치) 기반이라 "페트병 어떻게 버려?"와
+"페트병 어떻게 버려요"가 서로 다른 키가 됩니다.
+이 Port는 정규화한 텍스트의 유사도로 조회해 거의 같은 질문을 같은 결과로 묶습니다.
+
+Clean Architecture:
+- Port: 이 파일 (추상화, Application Layer)
+- Adapter: infrastructure/cache/semantic_cache.py (MinHash + LSH, 프로세스 내)
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SemanticCacheHit:
+    """유사 캐시 조회 결과.
+
+    Attributes:
+        value: 저장된 값
+        similarity: 조회 텍스트와 저장 텍스트의 유사도 (0.0 ~ 1.0, 1.0이면 정규화 후 동일)
+        matched_text: 값을 저장할 때 사용한 원본 텍스트
+    """
+
+    value: dict[str, Any]
+    similarity: float
+    matched_text: str
+
+
+class SemanticCachePort(ABC):
+    """유사 질문 캐시 Port.
+
+    namespace로 용도(intent, answer 등)와 조건을 분리합니다.
+    같은 namespace 안에서만 유사 매칭하므로, 결과가 달라질 수 있는 조건
+    (검색된 규정, 날씨 등)은 호출자가 namespace에 포함해야 합니다.
+
+    구현체는 네트워크 호출 없이 동기적으로 동작해야 합니다 (LLM 앞단 조회용).
+    """
+
+    @abstractmethod
+    def lookup(self, namespace: str, text: str) -> SemanticCacheHit | None:
+        """유사 텍스트로 저장된 값 조회.
+
+        Args:
+            namespace: 캐시 구분 (예: "intent", "answer:waste:<fingerprint>")
+            text: 조회할 사용자 메시지
+
+        Returns:
+            SemanticCacheHit, 유사한 항목이 없거나 만료되었으면 None
+        """
+        pass
+
+    @abstractmethod
+    def store(
+        self,
+        namespace: str,
+        text: str,
+        value: dict[str, Any],
+        ttl: int | None = None,
+    ) -> None:
+        """값 저장.
+
+        Args:
+            namespace: 캐시 구분
+            text: 사용자 메시지
+            value: 저장할 값 (JSON 직렬화 가능한 dict)
+            ttl: TTL 초 (None이면 구현체 기본값)
+        """
+        pass
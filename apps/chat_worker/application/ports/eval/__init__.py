@@ -7,12 +7,16 @@ Protocol 기반 포트 정의 (A.4 Convention Decision):
 CQS(Command-Query Separation) 패턴 적용:
 - EvalResultCommandGateway: 저장 (Command)
 - EvalResultQueryGateway: 조회 (Query)
+- EvalJobQueue: 비동기 평가 작업 적재
+- DriftStateGateway: 축별 CUSUM 누적 상태
 """
 
 from chat_worker.application.ports.eval.bars_evaluator import BARSEvaluator
 from chat_worker.application.ports.eval.calibration_data_gateway import (
     CalibrationDataGateway,
 )
+from chat_worker.application.ports.eval.drift_state_gateway import DriftStateGateway
+from chat_worker.application.ports.eval.eval_job_queue import EvalJobQueue
 from chat_worker.application.ports.eval.eval_result_command_gateway import (
     EvalResultCommandGateway,
 )
@@ -25,4 +29,6 @@ __all__ = [
     "EvalResultCommandGateway",
     "EvalResultQueryGateway",
     "CalibrationDataGateway",
+    "EvalJobQueue",
+    "DriftStateGateway",
 ]
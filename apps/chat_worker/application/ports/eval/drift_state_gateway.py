@@ -0,0 +1,58 @@
+"""Drift State Gateway Port - 축별 CUSUM 누적 상태 저장소.
+
+Clean Architecture:
+- Port: 이 파일 (추상화, Application Layer)
+- Adapter: infrastructure/persistence/eval/redis_drift_state_adapter.py
+
+Convention Decision (A.4):
+- 신규 포트는 Protocol 사용 (structural subtyping, 테스트 용이)
+
+CalibrationMonitorService가 평가 점수 기록 시 축별 CUSUM 누적합(S⁺, S⁻)을
+O(1)로 갱신하고, drift 판정 시 전체 축 상태를 1회 왕복으로 읽습니다.
+최근 N개 점수를 축마다 다시 조회해 처음부터 재계산하지 않습니다.
+
+참조: docs/plans/chat-eval-pipeline-plan.md Section 3.3
+"""
+
+from __future__ import annotations
+
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class DriftStateGateway(Protocol):
+    """축별 CUSUM 누적 상태 Gateway.
+
+    여러 Worker가 동시에 갱신하므로 구현체는 축 단위 원자적 갱신을 보장해야 합니다.
+    """
+
+    async def update_cusum(
+        self,
+        axis_scores: dict[str, float],
+        expected_mean: float,
+        slack: float,
+    ) -> None:
+        """점수 1건으로 축별 누적합 갱신 (원자적).
+
+        S⁺ = max(0, S⁺ + (x - μ₀ - k))
+        S⁻ = max(0, S⁻ + (μ₀ - x - k))
+
+        Args:
+            axis_scores: 축 -> 점수 (BARS 1-5)
+            expected_mean: 기대 평균 μ₀
+            slack: 슬랙 k
+        """
+        ...
+
+    async def get_cusum_state(self) -> dict[str, dict[str, float]]:
+        """전체 축 누적 상태 조회 (1회 왕복).
+
+        Returns:
+            축 -> {"cusum_positive", "cusum_negative", "sample_count"}
+            (기록이 없는 축은 포함하지 않음)
+        """
+        ...
+
+    async def reset_cusum(self) -> None:
+        """누적 상태 초기화 (재교정 후 새 기준으로 다시 감시)."""
+        ...
@@ -0,0 +1,32 @@
+"""Eval Job Queue Port - 비동기 평가 작업 적재.
+
+async/shadow 모드에서 답변 완료 직후 평가 작업을 적재하고,
+별도 eval_worker 프로세스가 소비하여 Eval 서브그래프를 실행합니다.
+done 이벤트는 평가를 기다리지 않습니다.
+
+Clean Architecture:
+- Port: 이 파일 (추상화, Application Layer)
+- Adapter: infrastructure/events/redis_eval_job_queue.py (Redis Streams)
+
+Convention Decision (A.4): 신규 포트는 Protocol 사용.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class EvalJobQueue(Protocol):
+    """Eval 작업 큐 (적재 측)."""
+
+    async def enqueue(self, job: dict[str, Any]) -> bool:
+        """평가 작업 적재.
+
+        Args:
+            job: JSON 직렬화 가능한 평가 입력 (query, intent, answer, rag_context 등)
+
+        Returns:
+            적재 성공 여부 (실패해도 답변 흐름은 계속)
+        """
+        ...
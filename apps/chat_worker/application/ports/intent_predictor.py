@@ -0,0 +1,48 @@
+"""Intent Predictor Port - 로컬 의도 예측 추상화.
+
+LLM 호출 전에 프로세스 내에서 의도를 빠르게 예측하는 분류기 Port입니다.
+신뢰도가 충분히 높으면 ClassifyIntentCommand가 LLM 호출을 생략합니다.
+
+Clean Architecture:
+- Port: 이 파일 (추상화, Application Layer)
+- Adapter: infrastructure/assets/intent_ngram_model.py (문자 n-gram 선형 모델)
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class IntentPrediction:
+    """로컬 의도 예측 결과.
+
+    Attributes:
+        intent: 예측된 의도 문자열 (Intent 값)
+        probability: 모델 확률 (0.0 ~ 1.0, 키워드 신호 반영 전)
+        coverage: 메시지 특징 중 모델이 아는 비율 (0.0 ~ 1.0)
+    """
+
+    intent: str
+    probability: float
+    coverage: float = 1.0
+
+
+class IntentPredictorPort(ABC):
+    """로컬 의도 예측 Port.
+
+    구현체는 네트워크 호출 없이 동기적으로 예측해야 합니다 (수십 µs 수준).
+    """
+
+    @abstractmethod
+    def predict(self, message: str) -> IntentPrediction | None:
+        """메시지 의도 예측.
+
+        Args:
+            message: 사용자 메시지
+
+        Returns:
+            IntentPrediction, 예측할 수 없으면 None (학습 분포 밖 메시지 등)
+        """
+        pass
@@ -78,6 +78,29 @@ class MetricsPort(ABC):
         """
         pass
 
+    def track_intent_path(self, path: str) -> None:
+        """Intent 분류 경로 기록.
+
+        Args:
+            path: 결과를 낸 경로 (local/semantic_cache/cache/llm/llm_error)
+        """
+        pass
+
+    def track_intent_agreement(
+        self,
+        predicted: str,
+        actual: str,
+        confidence: float,
+    ) -> None:
+        """로컬 분류기 예측과 LLM 결과 일치 여부 기록.
+
+        Args:
+            predicted: 로컬 분류기가 예측한 Intent
+            actual: LLM(또는 LLM 결과 캐시)이 분류한 Intent
+            confidence: 로컬 예측 신뢰도 (키워드 신호 반영 후)
+        """
+        pass
+
     def track_subagent_call(
         self,
         subagent: str,
@@ -8,6 +8,11 @@ CUSUM (Cumulative Sum) 알고리즘:
 - 임계치 초과 시 drift 경고/위험 판정
 - 축별 독립 감시
 
+증분 모드 (DriftStateGateway 주입 시):
+- 평가 점수 기록 시 축별 누적합을 O(1)로 갱신 (record_scores)
+- check_drift는 전체 축 상태를 1회 왕복으로 읽고, 결과를 짧은 TTL로 캐시
+- 미주입 시 축별 최근 N개 점수 조회 + 재계산 (기존 방식)
+
 Clean Architecture:
 - Service: 이 파일 (Port 의존)
 - Command: EvaluateResponseCommand에서 주기적 호출
@@ -18,13 +23,15 @@ Clean Architecture:
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from chat_worker.application.ports.eval.bars_evaluator import BARSEvaluator
     from chat_worker.application.ports.eval.calibration_data_gateway import (
         CalibrationDataGateway,
     )
+    from chat_worker.application.ports.eval.drift_state_gateway import DriftStateGateway
     from chat_worker.application.ports.eval.eval_result_query_gateway import (
         EvalResultQueryGateway,
     )
@@ -54,6 +61,9 @@ _CUSUM_SLACK: float = 0.5
 # 최근 점수 조회 기본 개수 (통계적 유의미성 확보를 위한 최소 표본)
 _DEFAULT_RECENT_N: int = 50
 
+# 증분 모드 drift 결과 캐시 TTL (초). 요청마다 check_drift해도 TTL당 1회만 조회
+_DEFAULT_STATUS_TTL: float = 10.0
+
 # 평가 축 목록
 _EVAL_AXES: list[str] = [
     "faithfulness",
@@ -84,6 +94,7 @@ class CalibrationMonitorService:
     - EvalResultQueryGateway: 최근 점수 조회
     - CalibrationDataGateway: Calibration Set 접근
     - BARSEvaluator: 재교정 시 사용 (현재 미구현)
+    - DriftStateGateway: 축별 CUSUM 누적 상태 (선택, 증분 모드)
     """
 
     def __init__(
@@ -91,6 +102,9 @@ class CalibrationMonitorService:
         eval_query_gw: EvalResultQueryGateway,
         calibration_gw: CalibrationDataGateway,
         bars_evaluator: BARSEvaluator,
+        drift_state_gw: DriftStateGateway | None = None,
+        status_ttl: float = _DEFAULT_STATUS_TTL,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """Service 초기화.
 
@@ -98,16 +112,51 @@ class CalibrationMonitorService:
             eval_query_gw: 평가 결과 조회 Gateway
             calibration_gw: Calibration Set 접근 Gateway
             bars_evaluator: BARS 평가기 (재교정 시 사용)
+            drift_state_gw: 축별 CUSUM 누적 상태 Gateway (None이면 매번 재계산)
+            status_ttl: 증분 모드 drift 결과 캐시 TTL (초, 0이면 캐시 안 함)
+            clock: 시각 함수 (테스트 주입용)
         """
         self._eval_query_gw = eval_query_gw
         self._calibration_gw = calibration_gw
         self._bars_evaluator = bars_evaluator
+        self._drift_state_gw = drift_state_gw
+        self._status_ttl = status_ttl
+        self._clock = clock
+        self._cached_drift: dict[str, Any] | None = None
+        self._cached_at: float = 0.0
+
+    async def record_scores(self, axis_scores: dict[str, float]) -> None:
+        """평가 점수 1건을 축별 CUSUM 누적합에 반영 (증분 모드, O(축 수)).
+
+        평가 결과 저장 시점에 호출합니다. 실패해도 예외를 전파하지 않습니다.
+
+        Args:
+            axis_scores: 축 -> BARS 점수 (1-5, 알 수 없는 축은 무시)
+        """
+        if self._drift_state_gw is None:
+            return
+        scores = {axis: float(score) for axis, score in axis_scores.items() if axis in _EVAL_AXES}
+        if not scores:
+            return
+        try:
+            await self._drift_state_gw.update_cusum(
+                scores, expected_mean=_EXPECTED_MEAN, slack=_CUSUM_SLACK
+            )
+        except Exception as e:
+            logger.warning("CUSUM state update failed: %s", e)
+
+    async def reset_drift(self) -> None:
+        """누적 상태와 캐시 초기화 (재교정 완료 후 호출)."""
+        self._cached_drift = None
+        if self._drift_state_gw is not None:
+            await self._drift_state_gw.reset_cusum()
 
     async def check_drift(self) -> dict[str, Any]:
         """CUSUM 기반 Calibration Drift 감지.
 
         각 평가축의 최근 N개 점수에 대해 CUSUM 통계량을 산출하고,
         임계치 초과 여부로 drift 상태를 판정합니다.
+        증분 모드에서는 누적 상태를 1회 조회하고 결과를 status_ttl 동안 재사용합니다.
 
         Returns:
             {
@@ -123,8 +172,15 @@ class CalibrationMonitorService:
                 "calibration_version": str,
             }
         """
+        if self._drift_state_gw is not None:
+            now = self._clock()
+            if self._cached_drift is not None and now - self._cached_at < self._status_ttl:
+                return self._cached_drift
+            result = await self._check_drift_incremental()
+            self._cached_drift, self._cached_at = result, now
+            return result
+
         axes_detail: dict[str, dict[str, Any]] = {}
-        overall_status = STATUS_STABLE
 
         for axis in _EVAL_AXES:
             recent_scores = await self._eval_query_gw.get_recent_scores(
@@ -152,11 +208,35 @@ class CalibrationMonitorService:
                 "sample_count": len(recent_scores),
             }
 
-            # 전체 상태 결정 (가장 심각한 축 기준)
-            if severity == _SEVERITY_CRITICAL:
-                overall_status = STATUS_DRIFTING
-            elif severity == _SEVERITY_WARNING and overall_status == STATUS_STABLE:
-                overall_status = STATUS_DRIFTING
+        return await self._build_drift_result(axes_detail)
+
+    async def _check_drift_incremental(self) -> dict[str, Any]:
+        """누적 상태 1회 조회로 축별 심각도 판정."""
+        state = await self._drift_state_gw.get_cusum_state()  # type: ignore[union-attr]
+
+        axes_detail: dict[str, dict[str, Any]] = {}
+        for axis in _EVAL_AXES:
+            axis_state = state.get(axis, {})
+            cusum_pos = float(axis_state.get("cusum_positive", 0.0))
+            cusum_neg = float(axis_state.get("cusum_negative", 0.0))
+            axes_detail[axis] = {
+                "severity": self._classify_severity(cusum_pos, cusum_neg),
+                "cusum_positive": round(cusum_pos, 4),
+                "cusum_negative": round(cusum_neg, 4),
+                "sample_count": int(axis_state.get("sample_count", 0)),
+            }
+
+        return await self._build_drift_result(axes_detail)
+
+    async def _build_drift_result(self, axes_detail: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        """축별 상세로 전체 상태 결정 + Calibration 버전 조회."""
+        # 전체 상태 결정 (WARNING 이상인 축이 하나라도 있으면 DRIFTING)
+        overall_status = STATUS_STABLE
+        if any(
+            detail["severity"] in (_SEVERITY_WARNING, _SEVERITY_CRITICAL)
+            for detail in axes_detail.values()
+        ):
+            overall_status = STATUS_DRIFTING
 
         # Calibration 버전 조회
         try:
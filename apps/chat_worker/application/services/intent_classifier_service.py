@@ -89,6 +89,9 @@ SINGLE_INTENT_PATTERNS = [
 # 신뢰도 임계값
 CONFIDENCE_THRESHOLD = 0.6
 
+# 로컬 분류기 fast path 임계값 (키워드 신호 반영 후, 이 값 이상이면 LLM 생략)
+LOCAL_INTENT_CONFIDENCE_THRESHOLD = 0.9
+
 # Chain-of-Intent 부스트 상한 (ADR P2 명시)
 MAX_TRANSITION_BOOST = 0.15
 
@@ -346,6 +349,38 @@ class IntentClassifierService:
             signals=signals,
         )
 
+    def parse_local_prediction(
+        self,
+        intent_str: str,
+        probability: float,
+        message: str,
+    ) -> IntentClassificationResult:
+        """로컬 분류기 예측을 Intent 분류 결과로 변환.
+
+        LLM 없이 판단하므로 Model-Centric 경로와 달리 키워드 부스트/길이 페널티를
+        다시 적용합니다 (키워드가 예측과 어긋나면 신뢰도 감점).
+
+        Args:
+            intent_str: 로컬 분류기가 예측한 의도
+            probability: 로컬 분류기 확률
+            message: 원본 메시지
+
+        Returns:
+            IntentClassificationResult
+        """
+        intent, _, length_penalty = self._parse_intent_with_signals(intent_str, message)
+        signals = IntentSignals(
+            llm_confidence=probability,
+            keyword_boost=self._calculate_keyword_boost(message, intent),
+            length_penalty=length_penalty,
+        )
+        return IntentClassificationResult(
+            intent=intent,
+            confidence=signals.final_confidence,
+            is_complex=self.is_complex_query(message),
+            signals=signals,
+        )
+
     def parse_intent_response(
         self,
         llm_response: str,
@@ -757,6 +792,7 @@ __all__ = [
     "QueryDecompositionSchema",
     "CONFIDENCE_THRESHOLD",
     "INTENT_CACHE_TTL",
+    "LOCAL_INTENT_CONFIDENCE_THRESHOLD",
     "MAX_TRANSITION_BOOST",
     "MIN_CONFIDENCE_FOR_BOOST",
 ]
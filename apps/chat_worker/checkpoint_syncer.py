@@ -60,8 +60,16 @@ async def main() -> None:
         batch_size=settings.syncer_batch_size,
         drain_timeout=settings.syncer_interval,
         checkpoint_ttl_minutes=settings.checkpoint_ttl_minutes,
+        bulk=settings.syncer_bulk_enabled,
+        fetch_concurrency=settings.syncer_fetch_concurrency,
     )
 
+    if settings.syncer_metrics_port:
+        from prometheus_client import start_http_server
+
+        start_http_server(settings.syncer_metrics_port)
+        logger.info("Syncer metrics server started (port=%d)", settings.syncer_metrics_port)
+
     stop_event = asyncio.Event()
 
     loop = asyncio.get_running_loop()
@@ -69,10 +77,11 @@ async def main() -> None:
         loop.add_signal_handler(sig, stop_event.set)
 
     logger.info(
-        "Checkpoint syncer ready (postgres=%s, batch_size=%d, interval=%.1fs)",
+        "Checkpoint syncer ready (postgres=%s, batch_size=%d, interval=%.1fs, bulk=%s)",
         settings.syncer_postgres_url[:30] + "...",
         settings.syncer_batch_size,
         settings.syncer_interval,
+        settings.syncer_bulk_enabled,
     )
 
     try:
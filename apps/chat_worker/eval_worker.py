@@ -0,0 +1,116 @@
+"""Chat Eval Worker.
+
+async/shadow 모드 평가 작업을 Redis Streams에서 소비해 Eval 서브그래프를 실행.
+chat_worker 이미지의 별도 entrypoint로 실행.
+
+실행:
+    python -m chat_worker.eval_worker
+
+아키텍처:
+    Worker → answer 노드 → done 응답
+                │
+                └─ eval_dispatch 노드 (XADD chat:eval:jobs)
+                     │
+                     └─ 이 프로세스 (EvalWorkerService)
+                          └─ XREADGROUP → Eval 서브그래프 (L1/L2/L3) → 결과 저장
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import os
+import signal
+import sys
+
+from chat_worker.setup.config import get_settings
+
+
+def configure_logging() -> None:
+    """로깅 설정."""
+    settings = get_settings()
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper(), logging.INFO),
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        stream=sys.stdout,
+    )
+
+
+async def main() -> None:
+    """Eval worker 메인 루프."""
+    settings = get_settings()
+
+    if not settings.enable_eval_pipeline or settings.eval_mode == "sync":
+        logging.error(
+            "Eval worker requires CHAT_WORKER_ENABLE_EVAL_PIPELINE=true "
+            "and CHAT_WORKER_EVAL_MODE in (async, shadow)."
+        )
+        sys.exit(1)
+
+    from chat_worker.infrastructure.orchestration.langgraph.eval_graph_factory import (
+        create_eval_subgraph,
+    )
+    from chat_worker.infrastructure.orchestration.langgraph.eval_worker_service import (
+        EvalWorkerService,
+    )
+    from chat_worker.setup.dependencies import (
+        close_eval_pg_pool,
+        create_eval_services,
+        get_eval_config,
+        get_eval_job_queue,
+        get_eval_result_command_gateway,
+    )
+
+    logger = logging.getLogger(__name__)
+    logger.info("Starting eval worker...")
+
+    # 응답이 이미 나간 뒤 평가하므로 재생성 비활성화
+    eval_config = dataclasses.replace(get_eval_config(), eval_regeneration_enabled=False)
+    eval_subgraph = create_eval_subgraph(
+        eval_config=eval_config,
+        **(await create_eval_services(eval_config)),
+    )
+    service = EvalWorkerService(
+        job_queue=await get_eval_job_queue(),
+        eval_subgraph=eval_subgraph,
+        result_gateway=await get_eval_result_command_gateway(),
+        consumer_name=os.environ.get("HOSTNAME", "eval-worker"),
+        batch_size=settings.eval_worker_batch_size,
+        block_ms=settings.eval_worker_block_ms,
+        concurrency=settings.eval_worker_concurrency,
+        claim_idle_ms=settings.eval_worker_claim_idle_ms,
+        claim_interval_seconds=settings.eval_worker_claim_interval_seconds,
+    )
+
+    if settings.eval_worker_metrics_port:
+        from prometheus_client import start_http_server
+
+        start_http_server(settings.eval_worker_metrics_port)
+        logger.info(
+            "Eval worker metrics server started (port=%d)", settings.eval_worker_metrics_port
+        )
+
+    stop_event = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    logger.info(
+        "Eval worker ready (mode=%s, batch_size=%d, concurrency=%d)",
+        settings.eval_mode,
+        settings.eval_worker_batch_size,
+        settings.eval_worker_concurrency,
+    )
+
+    try:
+        await service.run(stop_event)
+    finally:
+        await close_eval_pg_pool()
+        logger.info("Eval worker stopped gracefully")
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(main())
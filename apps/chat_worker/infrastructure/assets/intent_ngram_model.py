@@ -0,0 +1,280 @@
+"""Char N-gram Intent Model - IntentPredictorPort 구현체.
+
+오프라인 학습한 문자 n-gram 선형 모델(다항 로지스틱 회귀)로 의도를 예측합니다.
+ClassifyIntentCommand의 LLM 앞단 fast path용: 짧고 반복적인 분리배출 질문을
+네트워크 호출 없이 프로세스 내에서 분류합니다.
+
+- 특징: 정규화한 메시지의 문자 n-gram (기본 1~3, 길이 정규화한 이진 값)
+- 예측: intent별 bias + 가중치 합 → softmax
+- 분포 밖 메시지: 아는 n-gram 비율(coverage)이 min_coverage 미만이면 예측하지 않음
+
+에셋:
+- data/intent_ngram_model.json: 학습된 모델 (scripts/train_intent_model.py로 생성)
+- data/intent_seed.jsonl: 초기 학습용 시드 데이터 (로그 intent와 합쳐 재학습)
+
+사용 예시:
+    model = get_intent_ngram_model()
+    prediction = model.predict("페트병 어떻게 버려?")
+    # IntentPrediction(intent="waste", probability=0.97, coverage=1.0)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import random
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+from chat_worker.application.ports.intent_predictor import (
+    IntentPrediction,
+    IntentPredictorPort,
+)
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent / "data"
+DEFAULT_MODEL_PATH = DATA_DIR / "intent_ngram_model.json"
+DEFAULT_SEED_PATH = DATA_DIR / "intent_seed.jsonl"
+
+MODEL_FORMAT_VERSION = 1
+DEFAULT_NGRAM_RANGE = (1, 3)
+DEFAULT_MIN_COVERAGE = 0.6
+
+_NON_WORD = re.compile(r"[^0-9a-z가-힣ㄱ-ㅎㅏ-ㅣ]+")
+
+
+def normalize_message(message: str) -> str:
+    """소문자화 + 문장부호/특수문자 제거 + 공백 정리."""
+    return _NON_WORD.sub(" ", message.lower()).strip()
+
+
+def extract_ngrams(message: str, ngram_range: tuple[int, int] = DEFAULT_NGRAM_RANGE) -> set[str]:
+    """정규화한 메시지의 문자 n-gram 집합 (단어 경계는 공백 패딩으로 표현)."""
+    normalized = normalize_message(message)
+    if not normalized:
+        return set()
+    text = f" {normalized} "
+    ngrams: set[str] = set()
+    low, high = ngram_range
+    for n in range(low, high + 1):
+        for i in range(len(text) - n + 1):
+            gram = text[i : i + n]
+            if not gram.isspace():
+                ngrams.add(gram)
+    return ngrams
+
+
+def _softmax(scores: list[float]) -> list[float]:
+    top = max(scores)
+    exps = [math.exp(s - top) for s in scores]
+    total = sum(exps)
+    return [e / total for e in exps]
+
+
+class CharNgramIntentModel(IntentPredictorPort):
+    """문자 n-gram 다항 로지스틱 회귀 모델 (로드 후 읽기 전용)."""
+
+    def __init__(
+        self,
+        labels: list[str],
+        bias: list[float],
+        weights: dict[str, list[float]],
+        ngram_range: tuple[int, int] = DEFAULT_NGRAM_RANGE,
+        min_coverage: float = DEFAULT_MIN_COVERAGE,
+    ) -> None:
+        """초기화.
+
+        Args:
+            labels: intent 라벨 목록 (가중치 벡터 순서)
+            bias: 라벨별 bias
+            weights: n-gram → 라벨별 가중치
+            ngram_range: 문자 n-gram 길이 범위 (최소, 최대)
+            min_coverage: 예측에 필요한 최소 아는 n-gram 비율
+        """
+        if len(bias) != len(labels):
+            raise ValueError("bias length must match labels")
+        self._labels = list(labels)
+        self._bias = list(bias)
+        self._weights = weights
+        self._ngram_range = ngram_range
+        self._min_coverage = min_coverage
+
+    @property
+    def labels(self) -> list[str]:
+        """intent 라벨 목록."""
+        return list(self._labels)
+
+    @property
+    def vocabulary_size(self) -> int:
+        """가중치가 있는 n-gram 수."""
+        return len(self._weights)
+
+    def predict(self, message: str) -> IntentPrediction | None:
+        """메시지 의도 예측 (분포 밖이면 None)."""
+        ngrams = extract_ngrams(message, self._ngram_range)
+        if not ngrams:
+            return None
+        weights = self._weights
+        known = [weights[g] for g in ngrams if g in weights]
+        coverage = len(known) / len(ngrams)
+        if coverage < self._min_coverage:
+            return None
+
+        # 학습과 같은 길이 정규화 (특징 값 1/sqrt(n))
+        scale = 1.0 / math.sqrt(len(ngrams))
+        scores = list(self._bias)
+        for vector in known:
+            for i, w in enumerate(vector):
+                scores[i] += w * scale
+
+        probabilities = _softmax(scores)
+        best = max(range(len(probabilities)), key=probabilities.__getitem__)
+        return IntentPrediction(
+            intent=self._labels[best],
+            probability=probabilities[best],
+            coverage=coverage,
+        )
+
+    # ===== 직렬화 =====
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 에셋 형식으로 변환 (가중치는 소수점 4자리)."""
+        return {
+            "version": MODEL_FORMAT_VERSION,
+            "ngram_range": list(self._ngram_range),
+            "min_coverage": self._min_coverage,
+            "labels": self._labels,
+            "bias": [round(b, 4) for b in self._bias],
+            "weights": {
+                gram: [round(w, 4) for w in vector]
+                for gram, vector in sorted(self._weights.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CharNgramIntentModel":
+        """JSON 에셋에서 생성."""
+        version = data.get("version")
+        if version != MODEL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported intent model version: {version}")
+        low, high = data.get("ngram_range", DEFAULT_NGRAM_RANGE)
+        return cls(
+            labels=data["labels"],
+            bias=data["bias"],
+            weights=data["weights"],
+            ngram_range=(int(low), int(high)),
+            min_coverage=float(data.get("min_coverage", DEFAULT_MIN_COVERAGE)),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path = DEFAULT_MODEL_PATH) -> "CharNgramIntentModel":
+        """JSON 에셋 파일에서 로드."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path: str | Path) -> None:
+        """JSON 에셋 파일로 저장 (한 줄, 한글 유지)."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+            f.write("\n")
+
+    # ===== 학습 (오프라인) =====
+
+    @classmethod
+    def train(
+        cls,
+        samples: Iterable[tuple[str, str]],
+        epochs: int = 30,
+        learning_rate: float = 0.5,
+        l2: float = 1e-4,
+        prune: float = 1e-3,
+        ngram_range: tuple[int, int] = DEFAULT_NGRAM_RANGE,
+        min_coverage: float = DEFAULT_MIN_COVERAGE,
+        seed: int = 0,
+    ) -> "CharNgramIntentModel":
+        """SGD로 다항 로지스틱 회귀 학습.
+
+        Args:
+            samples: (메시지, intent) 목록
+            epochs: 전체 데이터 반복 횟수
+            learning_rate: 초기 학습률 (epoch마다 1/(1+0.1*epoch) 감소)
+            l2: L2 정규화 계수 (과신 방지)
+            prune: 최대 |가중치|가 이 값 미만인 n-gram 제거 (에셋 크기 축소)
+            ngram_range: 문자 n-gram 길이 범위
+            min_coverage: 예측에 필요한 최소 아는 n-gram 비율
+            seed: 셔플 시드
+
+        Returns:
+            학습된 모델
+        """
+        data = [(extract_ngrams(message, ngram_range), intent) for message, intent in samples]
+        data = [(ngrams, intent) for ngrams, intent in data if ngrams]
+        if not data:
+            raise ValueError("No training samples")
+
+        labels = sorted({intent for _, intent in data})
+        index = {label: i for i, label in enumerate(labels)}
+        size = len(labels)
+        bias = [0.0] * size
+        weights: dict[str, list[float]] = {}
+        rng = random.Random(seed)
+
+        for epoch in range(epochs):
+            rng.shuffle(data)
+            rate = learning_rate / (1.0 + 0.1 * epoch)
+            decay = 1.0 - rate * l2
+            for ngrams, intent in data:
+                scale = 1.0 / math.sqrt(len(ngrams))
+                vectors = [weights.setdefault(g, [0.0] * size) for g in ngrams]
+                scores = list(bias)
+                for vector in vectors:
+                    for i in range(size):
+                        scores[i] += vector[i] * scale
+                probabilities = _softmax(scores)
+                target = index[intent]
+                gradient = [p - (1.0 if i == target else 0.0) for i, p in enumerate(probabilities)]
+                for i in range(size):
+                    bias[i] -= rate * gradient[i]
+                for vector in vectors:
+                    for i in range(size):
+                        vector[i] = vector[i] * decay - rate * gradient[i] * scale
+
+        pruned = {g: v for g, v in weights.items() if max(abs(w) for w in v) >= prune}
+        return cls(
+            labels=labels,
+            bias=bias,
+            weights=pruned,
+            ngram_range=ngram_range,
+            min_coverage=min_coverage,
+        )
+
+
+def load_labeled_jsonl(path: str | Path) -> list[dict[str, Any]]:
+    """라벨 JSONL 로드 (한 줄에 {"message", "intent", ...})."""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return records
+
+
+@lru_cache
+def get_intent_ngram_model() -> CharNgramIntentModel | None:
+    """CharNgramIntentModel 싱글톤 (에셋이 없거나 손상되면 None)."""
+    try:
+        model = CharNgramIntentModel.load(DEFAULT_MODEL_PATH)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Intent n-gram model not loaded: %s", e)
+        return None
+    logger.info(
+        "Intent n-gram model loaded (labels=%d, ngrams=%d)",
+        len(model.labels),
+        model.vocabulary_size,
+    )
+    return model
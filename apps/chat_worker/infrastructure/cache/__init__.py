@@ -2,5 +2,6 @@
 
 from chat_worker.infrastructure.cache.intent_cache import IntentCache
 from chat_worker.infrastructure.cache.redis_cache import RedisCacheAdapter
+from chat_worker.infrastructure.cache.semantic_cache import MinHashSemanticCache
 
-__all__ = ["IntentCache", "RedisCacheAdapter"]
+__all__ = ["IntentCache", "MinHashSemanticCache", "RedisCacheAdapter"]
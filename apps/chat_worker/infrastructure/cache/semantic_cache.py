@@ -0,0 +1,314 @@
+"""MinHash Semantic Cache - SemanticCachePort 구현체.
+
+정규화한 메시지의 문자 3-gram 집합으로 MinHash 서명을 만들고,
+LSH 밴드 인덱스(프로세스 내 ANN)로 후보를 찾은 뒤 실제 Jaccard 유사도로 검증합니다.
+"페트병 어떻게 버려?" / "페트병 어떻게 버려요" / "페트병어떻게 버려" 같은
+표기 차이만 있는 질문이 같은 항목에 적중합니다.
+
+- 정규화: 소문자화, 문장부호 제거, 끝 "요" 제거, 공백 제거 (띄어쓰기 차이 무시)
+- 정확 일치: 정규화 텍스트가 같으면 해시 조회로 바로 적중 (유사도 1.0)
+- 유사 일치: num_perm개 해시를 bands개 밴드로 나눠 같은 밴드 버킷 후보만 비교
+- 안전장치: 메시지 속 숫자가 다르면 적중하지 않음 ("2리터" vs "5리터")
+- 안전장치: 부정 표지(안/않/못/불/없)가 다르면 적중하지 않음 ("버려도 되나요" vs "버려도 안 되나요")
+- 만료: 항목별 TTL + 전체 max_entries LRU
+- 무효화: version_provider 값(예: 규정 에셋 fingerprint)이 바뀌면 전체 삭제
+
+프로세스 내 캐시이므로 Pod마다 따로 채워집니다.
+짧고 반복적인 질문 위주라 Pod별 워밍만으로도 적중률이 충분합니다.
+
+사용 예시:
+    cache = MinHashSemanticCache(version_provider=lambda: asset_version(SOURCE_DIR))
+    cache.store("intent", "페트병 어떻게 버려?", {"intent": "waste"})
+    hit = cache.lookup("intent", "페트병 어떻게 버려요")
+    # SemanticCacheHit(value={"intent": "waste"}, similarity=1.0, ...)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from chat_worker.application.ports.cache import SemanticCacheHit, SemanticCachePort
+from chat_worker.infrastructure.assets.intent_ngram_model import normalize_message
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16  # 16 밴드 x 4 행 → 후보 검출 임계 ≈ 0.5
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_TTL = 3600
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_VERSION_CHECK_INTERVAL = 60.0
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_SHINGLE_SIZE = 3
+_NUMBER = re.compile(r"\d+")
+# "안전", "불연성"처럼 부정이 아닌 단어도 걸리지만 적중만 줄어들 뿐이라 보수적으로 비교
+_NEGATION = re.compile(r"[안않못불없]")
+_POLITE_ENDING = "요"
+
+
+def normalize_query(text: str) -> str:
+    """유사 매칭용 정규화 (끝 "요" 제거 + 공백 제거)."""
+    normalized = normalize_message(text)
+    if len(normalized) > 1 and normalized.endswith(_POLITE_ENDING):
+        normalized = normalized[: -len(_POLITE_ENDING)]
+    return normalized.replace(" ", "")
+
+
+def extract_shingles(normalized: str) -> frozenset[str]:
+    """정규화 텍스트의 문자 3-gram 집합 (3자 미만이면 텍스트 자체)."""
+    if len(normalized) < _SHINGLE_SIZE:
+        return frozenset([normalized]) if normalized else frozenset()
+    return frozenset(
+        normalized[i : i + _SHINGLE_SIZE] for i in range(len(normalized) - _SHINGLE_SIZE + 1)
+    )
+
+
+def asset_version(path: str | Path) -> str:
+    """디렉토리 JSON 에셋 fingerprint (파일명/크기/수정시각 기반, 디렉토리가 없으면 "")."""
+    directory = Path(path)
+    if not directory.is_dir():
+        return ""
+    digest = hashlib.sha256()
+    for file in sorted(directory.glob("*.json")):
+        stat = file.stat()
+        digest.update(f"{file.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:12]
+
+
+@dataclass
+class _Entry:
+    """캐시 항목."""
+
+    text: str
+    shingles: frozenset[str]
+    numbers: tuple[str, ...]
+    negations: tuple[str, ...]
+    value: dict[str, Any]
+    expires_at: float
+    buckets: list[tuple[str, int, tuple[int, ...]]]
+
+
+class MinHashSemanticCache(SemanticCachePort):
+    """MinHash + LSH 기반 프로세스 내 유사 질문 캐시."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        default_ttl: int = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        version_provider: Callable[[], str] | None = None,
+        version_check_interval: float = DEFAULT_VERSION_CHECK_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+        seed: int = 1,
+    ) -> None:
+        """초기화.
+
+        Args:
+            threshold: 적중에 필요한 최소 Jaccard 유사도
+            default_ttl: store에 ttl이 없을 때 TTL 초
+            max_entries: 전체 최대 항목 수 (초과 시 LRU 제거)
+            num_perm: MinHash 해시 함수 수
+            bands: LSH 밴드 수 (num_perm의 약수)
+            version_provider: 데이터 버전 함수 (값이 바뀌면 전체 무효화)
+            version_check_interval: 버전 확인 주기 (초)
+            clock: 시각 함수 (테스트 주입용)
+            seed: MinHash 해시 계수 시드
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+        self._threshold = threshold
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._version_provider = version_provider
+        self._version_check_interval = version_check_interval
+        self._clock = clock
+
+        rng = random.Random(seed)
+        self._coefficients = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._buckets: dict[tuple[str, int, tuple[int, ...]], set[tuple[str, str]]] = {}
+        self._version: str | None = None
+        self._version_checked_at: float | None = None
+        self._stats = {"exact_hits": 0, "near_hits": 0, "misses": 0, "invalidations": 0}
+
+    @property
+    def version(self) -> str | None:
+        """마지막으로 확인한 데이터 버전."""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """적중/미스/무효화 횟수와 항목 수."""
+        return {**self._stats, "entries": len(self._entries)}
+
+    def lookup(self, namespace: str, text: str) -> SemanticCacheHit | None:
+        """유사 텍스트로 저장된 값 조회."""
+        self._check_version()
+        normalized = normalize_query(text)
+        if not normalized:
+            return None
+        now = self._clock()
+
+        # 1. 정규화 텍스트 정확 일치
+        key = (namespace, normalized)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > now:
+                self._entries.move_to_end(key)
+                self._stats["exact_hits"] += 1
+                return SemanticCacheHit(value=entry.value, similarity=1.0, matched_text=entry.text)
+            self._remove(key)
+
+        # 2. LSH 후보 → Jaccard 검증
+        shingles = extract_shingles(normalized)
+        numbers = tuple(_NUMBER.findall(normalized))
+        negations = tuple(_NEGATION.findall(normalized))
+        candidates: set[tuple[str, str]] = set()
+        for bucket in self._bucket_keys(namespace, shingles):
+            candidates.update(self._buckets.get(bucket, ()))
+
+        best_key: tuple[str, str] | None = None
+        best_similarity = 0.0
+        for candidate_key in candidates:
+            candidate = self._entries.get(candidate_key)
+            if candidate is None:
+                continue
+            if candidate.expires_at <= now:
+                self._remove(candidate_key)
+                continue
+            if candidate.numbers != numbers or candidate.negations != negations:
+                continue
+            similarity = len(shingles & candidate.shingles) / len(shingles | candidate.shingles)
+            if similarity > best_similarity:
+                best_key, best_similarity = candidate_key, similarity
+
+        if best_key is None or best_similarity < self._threshold:
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(best_key)
+        self._stats["near_hits"] += 1
+        best = self._entries[best_key]
+        return SemanticCacheHit(
+            value=best.value, similarity=best_similarity, matched_text=best.text
+        )
+
+    def store(
+        self,
+        namespace: str,
+        text: str,
+        value: dict[str, Any],
+        ttl: int | None = None,
+    ) -> None:
+        """값 저장 (같은 정규화 텍스트는 덮어씀)."""
+        self._check_version()
+        normalized = normalize_query(text)
+        if not normalized:
+            return
+        key = (namespace, normalized)
+        self._remove(key)
+
+        shingles = extract_shingles(normalized)
+        buckets = self._bucket_keys(namespace, shingles)
+        self._entries[key] = _Entry(
+            text=text,
+            shingles=shingles,
+            numbers=tuple(_NUMBER.findall(normalized)),
+            negations=tuple(_NEGATION.findall(normalized)),
+            value=value,
+            expires_at=self._clock() + (ttl if ttl is not None else self._default_ttl),
+            buckets=buckets,
+        )
+        for bucket in buckets:
+            self._buckets.setdefault(bucket, set()).add(key)
+
+        while len(self._entries) > self._max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def clear(self) -> None:
+        """전체 삭제."""
+        self._entries.clear()
+        self._buckets.clear()
+
+    # ===== 내부 =====
+
+    def _signature(self, shingles: frozenset[str]) -> list[int]:
+        """MinHash 서명 ((a*x + b) mod p 해시 함수별 최솟값)."""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big")
+            for s in shingles
+        ]
+        return [min((a * x + b) % _MERSENNE_PRIME for x in hashes) for a, b in self._coefficients]
+
+    def _bucket_keys(
+        self, namespace: str, shingles: frozenset[str]
+    ) -> list[tuple[str, int, tuple[int, ...]]]:
+        """LSH 밴드 버킷 키 목록."""
+        signature = self._signature(shingles)
+        rows = self._rows
+        return [
+            (namespace, band, tuple(signature[band * rows : (band + 1) * rows]))
+            for band in range(self._bands)
+        ]
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        """항목과 버킷 인덱스 제거."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for bucket in entry.buckets:
+            members = self._buckets.get(bucket)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._buckets[bucket]
+
+    def _check_version(self) -> None:
+        """주기적으로 데이터 버전 확인, 바뀌었으면 전체 무효화."""
+        if self._version_provider is None:
+            return
+        now = self._clock()
+        if (
+            self._version_checked_at is not None
+            and now - self._version_checked_at < self._version_check_interval
+        ):
+            return
+        self._version_checked_at = now
+        try:
+            version = self._version_provider()
+        except Exception as e:
+            logger.warning(f"Semantic cache version check failed: {e}")
+            return
+        if version == self._version:
+            return
+        if self._version is not None:
+            logger.info(
+                "Semantic cache invalidated",
+                extra={
+                    "old_version": self._version,
+                    "new_version": version,
+                    "entries": len(self._entries),
+                },
+            )
+            self.clear()
+            self._stats["invalidations"] += 1
+        self._version = version
@@ -2,10 +2,12 @@
 
 - RedisProgressNotifier: SSE/UI 진행률 (Redis Streams)
 - RedisStreamDomainEventBus: 도메인 이벤트 (Redis Streams)
+- RedisEvalJobQueue: 비동기 평가 작업 (Redis Streams, eval_worker 소비)
 
 Port 매핑:
 - ProgressNotifierPort → RedisProgressNotifier
 - DomainEventBusPort → RedisStreamDomainEventBus
+- EvalJobQueue → RedisEvalJobQueue
 
 Note:
     Event-First Architecture 적용으로 MessageSavePublisher 제거.
@@ -13,6 +15,7 @@ Note:
     별도 Consumer Group(chat-persistence)이 PostgreSQL에 저장.
 """
 
+from chat_worker.infrastructure.events.redis_eval_job_queue import RedisEvalJobQueue
 from chat_worker.infrastructure.events.redis_progress_notifier import (
     RedisProgressNotifier,
 )
@@ -21,6 +24,7 @@ from chat_worker.infrastructure.events.redis_stream_domain_event_bus import (
 )
 
 __all__ = [
+    "RedisEvalJobQueue",
     "RedisProgressNotifier",
     "RedisStreamDomainEventBus",
 ]
@@ -0,0 +1,167 @@
+"""Redis Eval Job Queue - EvalJobQueue 구현체.
+
+async/shadow 모드 평가 작업을 Redis Streams에 적재하고
+eval_worker가 Consumer Group으로 소비합니다.
+
+- 적재: XADD (MAXLEN ~ 근사 트림, 답변 경로에서 1회 왕복)
+- 소비: XREADGROUP (Consumer Group "eval-workers", 워커 수평 확장)
+- 재시작: 자기 consumer의 미확인(pending) 작업부터 다시 읽음
+- 회수: XAUTOCLAIM으로 오래 미확인인 작업을 가져옴
+  (교체된 Pod처럼 consumer 이름이 사라진 작업이 PEL에 영구히 남지 않도록)
+- 확인: 처리 후 XACK (평가는 best-effort이므로 실패해도 ACK)
+
+Port: application/ports/eval/eval_job_queue.py
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+EVAL_JOB_STREAM = "chat:eval:jobs"
+EVAL_JOB_GROUP = "eval-workers"
+EVAL_JOB_MAXLEN = 10000
+
+
+class RedisEvalJobQueue:
+    """Redis Streams 기반 Eval 작업 큐."""
+
+    def __init__(
+        self,
+        redis: "Redis",
+        stream_name: str = EVAL_JOB_STREAM,
+        group_name: str = EVAL_JOB_GROUP,
+        maxlen: int = EVAL_JOB_MAXLEN,
+    ):
+        """초기화.
+
+        Args:
+            redis: Redis 클라이언트 (decode_responses=True)
+            stream_name: 작업 스트림 이름
+            group_name: Consumer Group 이름
+            maxlen: 스트림 최대 길이 (워커 장애 시 오래된 작업부터 버림)
+        """
+        self._redis = redis
+        self._stream_name = stream_name
+        self._group_name = group_name
+        self._maxlen = maxlen
+
+    async def enqueue(self, job: dict[str, Any]) -> bool:
+        """평가 작업 적재 (실패 시 False, 예외 전파 안 함)."""
+        try:
+            payload = json.dumps({**job, "enqueued_at": time.time()}, ensure_ascii=False)
+            await self._redis.xadd(
+                self._stream_name,
+                {"payload": payload},
+                maxlen=self._maxlen,
+                approximate=True,
+            )
+            return True
+        except Exception as e:
+            logger.warning(
+                "eval_job_enqueue_failed",
+                extra={"stream": self._stream_name, "error": str(e)},
+            )
+            return False
+
+    # ===== 소비 측 (eval_worker) =====
+
+    async def ensure_group(self) -> None:
+        """Consumer Group 생성 (이미 있으면 무시)."""
+        try:
+            await self._redis.xgroup_create(
+                self._stream_name, self._group_name, id="0", mkstream=True
+            )
+            logger.info(
+                "Eval job consumer group created",
+                extra={"stream": self._stream_name, "group": self._group_name},
+            )
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def read(
+        self,
+        consumer: str,
+        count: int = 10,
+        block_ms: int = 5000,
+        pending: bool = False,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """작업 읽기.
+
+        Args:
+            consumer: consumer 이름 (워커 인스턴스별 고유)
+            count: 최대 작업 수
+            block_ms: 새 작업 대기 시간 (ms)
+            pending: True면 이 consumer의 미확인 작업을 읽음 (재시작 복구)
+
+        Returns:
+            (메시지 ID, 작업 dict) 목록. 파싱 실패한 메시지는 빈 dict.
+        """
+        response = await self._redis.xreadgroup(
+            self._group_name,
+            consumer,
+            {self._stream_name: "0" if pending else ">"},
+            count=count,
+            block=None if pending else block_ms,
+        )
+        jobs: list[tuple[str, dict[str, Any]]] = []
+        for _stream, messages in response or []:
+            jobs.extend(self._decode(messages))
+        return jobs
+
+    async def claim_idle(
+        self,
+        consumer: str,
+        min_idle_ms: int,
+        count: int = 10,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """다른 consumer에서 min_idle_ms 이상 미확인인 작업을 이 consumer로 회수.
+
+        MAXLEN 트림으로 본문이 사라진 항목은 XAUTOCLAIM이 PEL에서 제거.
+
+        Args:
+            consumer: 회수할 consumer 이름
+            min_idle_ms: 회수 대상 최소 미확인 시간 (ms)
+            count: 최대 작업 수
+
+        Returns:
+            (메시지 ID, 작업 dict) 목록. 파싱 실패한 메시지는 빈 dict.
+        """
+        # result: (next_start_id, [(msg_id, fields), ...], deleted_ids)
+        result = await self._redis.xautoclaim(
+            self._stream_name,
+            self._group_name,
+            consumer,
+            min_idle_time=min_idle_ms,
+            start_id="0-0",
+            count=count,
+        )
+        if len(result) < 2:
+            return []
+        return self._decode(result[1])
+
+    async def ack(self, message_ids: list[str]) -> None:
+        """작업 처리 확인."""
+        if message_ids:
+            await self._redis.xack(self._stream_name, self._group_name, *message_ids)
+
+    @staticmethod
+    def _decode(messages: list) -> list[tuple[str, dict[str, Any]]]:
+        """(메시지 ID, fields) 목록 → (메시지 ID, 작업 dict) 목록."""
+        jobs: list[tuple[str, dict[str, Any]]] = []
+        for message_id, fields in messages:
+            try:
+                job = json.loads((fields or {}).get("payload", ""))
+            except (json.JSONDecodeError, TypeError):
+                logger.warning("eval_job_decode_failed", extra={"message_id": message_id})
+                job = {}
+            jobs.append((message_id, job))
+        return jobs
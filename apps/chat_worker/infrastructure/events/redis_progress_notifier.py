@@ -32,6 +32,7 @@ Port: application/ports/events/progress_notifier.py
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -42,6 +43,7 @@ from typing import TYPE_CHECKING, Any
 from chat_worker.application.ports.events.progress_notifier import ProgressNotifierPort
 from chat_worker.infrastructure.metrics.metrics import (
     CHAT_STREAM_ACTIVE,
+    CHAT_STREAM_COALESCED_TOKENS,
     CHAT_STREAM_DURATION,
     CHAT_STREAM_REQUESTS_TOTAL,
     CHAT_STREAM_TOKEN_COUNT,
@@ -146,9 +148,18 @@ DEFAULT_SHARD_COUNT = int(os.environ.get("CHAT_SHARD_COUNT", "4"))
 # ─────────────────────────────────────────────────────────────────
 
 TOKEN_STREAM_PREFIX = "chat:tokens"  # job별 전용 Token Stream
-TOKEN_STATE_PREFIX = "chat:token_state"  # 주기적 누적 텍스트 스냅샷
+TOKEN_STATE_PREFIX = "chat:token_state"  # 주기적 State 스냅샷 (last_seq 등 메타데이터)
+# 누적 텍스트 (State 저장 시 APPEND, finalize 시 State로 병합)
+TOKEN_TEXT_PREFIX = "chat:token_text"
 TOKEN_STREAM_TTL = 3600  # 1시간
-TOKEN_STATE_SAVE_INTERVAL = 10  # 10 토큰마다 State 저장
+TOKEN_STATE_SAVE_INTERVAL = 10  # 10 엔트리마다 State 저장
+
+# Token 병합 (coalescing): 연속 토큰을 하나의 스트림 엔트리로 묶어 발행
+# - 첫 토큰은 즉시 발행 (TTFT 유지)
+# - 이후 토큰은 버퍼링 후 N ms 경과 또는 M 글자 누적 시 flush
+# - 0이면 병합 비활성화 (토큰마다 발행)
+TOKEN_COALESCE_MS = 100
+TOKEN_COALESCE_CHARS = 64
 
 # ─────────────────────────────────────────────────────────────────
 # Progress Event Stream (복구 가능한 Progress 이벤트)
@@ -236,17 +247,19 @@ return msg_id
 """
 
 # Token v2 스트리밍용 Script (복구 가능 - Token Stream + State)
+# ARGV[5]: 마지막 State 저장 이후 발행된 텍스트 (save_state=1일 때만 전달)
 # ARGV[10]: trace_id, ARGV[11]: span_id, ARGV[12]: traceparent
 TOKEN_XADD_V2_SCRIPT = """
 local token_stream = KEYS[1]   -- chat:tokens:{job_id}
 local token_state = KEYS[2]    -- chat:token_state:{job_id}
 local stage_stream = KEYS[3]   -- chat:events:{shard}
+local token_text = KEYS[4]     -- chat:token_text:{job_id}
 
 local job_id = ARGV[1]
 local seq = ARGV[2]
 local delta = ARGV[3]
 local ts = ARGV[4]
-local accumulated = ARGV[5]
+local text_chunk = ARGV[5]
 local save_state = tonumber(ARGV[6])  -- 1이면 State 저장
 local ttl = tonumber(ARGV[7])
 local maxlen = ARGV[8]
@@ -270,11 +283,14 @@ if stream_len == 1 then
 end
 
 -- 3. 주기적으로 State 저장 (accumulated 복구용)
+-- 누적 텍스트는 APPEND로 증분 저장 → 전체 텍스트를 매번 전송하지 않음
+-- 텍스트와 last_seq를 같은 Script에서 갱신하여 복구 시 정합성 보장
 if save_state == 1 then
+    local text_len = redis.call('APPEND', token_text, text_chunk)
+    redis.call('EXPIRE', token_text, ttl)
     local state = cjson.encode({
         last_seq = tonumber(seq),
-        accumulated = accumulated,
-        accumulated_len = string.len(accumulated),
+        accumulated_len = text_len,
         node = node,
         updated_at = tonumber(ts)
     })
@@ -332,6 +348,8 @@ class RedisProgressNotifier(ProgressNotifierPort):
         redis: "Redis",
         shard_count: int | None = None,
         maxlen: int = STREAM_MAXLEN,
+        coalesce_ms: int = TOKEN_COALESCE_MS,
+        coalesce_chars: int = TOKEN_COALESCE_CHARS,
     ):
         """초기화.
 
@@ -339,6 +357,8 @@ class RedisProgressNotifier(ProgressNotifierPort):
             redis: Redis 클라이언트 (async)
             shard_count: Shard 수 (기본: 4)
             maxlen: 스트림 최대 길이 (오래된 메시지 자동 삭제)
+            coalesce_ms: 토큰 병합 최대 대기 시간 (ms, 0이면 비활성화)
+            coalesce_chars: 토큰 병합 최대 글자 수 (0이면 비활성화)
         """
         self._redis = redis
         self._shard_count = shard_count or DEFAULT_SHARD_COUNT
@@ -347,15 +367,33 @@ class RedisProgressNotifier(ProgressNotifierPort):
         self._token_script = None
         self._token_v2_script = None
         self._token_seq: dict[str, int] = {}  # job_id → token seq counter
-        # Token v2: 누적 텍스트 추적
-        self._accumulated: dict[str, str] = {}  # job_id → 누적 텍스트
+        # Token v2: 누적 텍스트 추적 (조각 리스트, finalize에서 한 번만 join)
+        self._accumulated: dict[str, list[str]] = {}  # job_id → 발행된 텍스트 조각
+        self._unsaved_parts: dict[str, list[str]] = {}  # job_id → State 미반영 조각
         self._token_count: dict[str, int] = {}  # job_id → 토큰 카운트
         # Token v2: 스트림 시작 시간 (부하테스트 메트릭)
         self._stream_start_time: dict[str, float] = {}  # job_id → start time
         self._stream_node: dict[str, str] = {}  # job_id → 마지막 노드명
+        # Token v2: 병합 버퍼 (아직 발행되지 않은 토큰)
+        self._coalesce_interval = max(coalesce_ms, 0) / 1000
+        self._coalesce_chars = max(coalesce_chars, 0)
+        self._pending_parts: dict[str, list[str]] = {}  # job_id → 버퍼링된 delta
+        self._pending_len: dict[str, int] = {}  # job_id → 버퍼 글자 수
+        self._pending_tokens: dict[str, int] = {}  # job_id → 버퍼 토큰 수
+        self._pending_node: dict[str, str] = {}  # job_id → 버퍼 노드명
+        self._entry_count: dict[str, int] = {}  # job_id → 발행된 엔트리 수
+        self._last_flush: dict[str, float] = {}  # job_id → 마지막 flush 시각
+        self._flush_timers: dict[str, asyncio.TimerHandle] = {}
+        self._flush_locks: dict[str, asyncio.Lock] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
         logger.info(
             "RedisProgressNotifier initialized",
-            extra={"shards": self._shard_count, "maxlen": maxlen},
+            extra={
+                "shards": self._shard_count,
+                "maxlen": maxlen,
+                "coalesce_ms": coalesce_ms,
+                "coalesce_chars": coalesce_chars,
+            },
         )
 
     async def _ensure_scripts(self) -> None:
@@ -593,6 +631,7 @@ class RedisProgressNotifier(ProgressNotifierPort):
         # Token v2: 누적 텍스트 정리
         if task_id in self._accumulated:
             del self._accumulated[task_id]
+        self._unsaved_parts.pop(task_id, None)
         # Token v2: 토큰 카운트 정리
         if task_id in self._token_count:
             del self._token_count[task_id]
@@ -602,6 +641,17 @@ class RedisProgressNotifier(ProgressNotifierPort):
         # Token v2: 노드 추적 정리
         if task_id in self._stream_node:
             del self._stream_node[task_id]
+        # Token v2: 병합 버퍼/타이머 정리 (finalize 없이 호출되면 버퍼는 폐기)
+        timer = self._flush_timers.pop(task_id, None)
+        if timer is not None:
+            timer.cancel()
+        self._pending_parts.pop(task_id, None)
+        self._pending_len.pop(task_id, None)
+        self._pending_tokens.pop(task_id, None)
+        self._pending_node.pop(task_id, None)
+        self._entry_count.pop(task_id, None)
+        self._last_flush.pop(task_id, None)
+        self._flush_locks.pop(task_id, None)
 
     async def notify_token_v2(
         self,
@@ -615,92 +665,179 @@ class RedisProgressNotifier(ProgressNotifierPort):
 
         아키텍처:
         - Token Stream (chat:tokens:{job_id}): 모든 토큰 저장, catch-up 지원
-        - Token State (chat:token_state:{job_id}): 주기적 누적 텍스트 스냅샷
+        - Token State (chat:token_state:{job_id}): 주기적 스냅샷 (last_seq 등)
+        - Token Text (chat:token_text:{job_id}): 누적 텍스트, State 저장 시 증분 APPEND
         - Stage Stream (chat:events:{shard}): 기존 호환성 유지
 
+        토큰 병합:
+        - 첫 토큰은 즉시 발행, 이후 토큰은 job별 버퍼에 모아
+          coalesce_ms 경과 또는 coalesce_chars 도달 시 한 엔트리로 발행
+        - seq는 엔트리 단위로 단조증가 (Gateway last_token_seq 중복 제거 호환)
+        - 남은 버퍼는 타이머 또는 finalize_token_stream에서 flush
+
         Args:
             task_id: 작업 ID (job_id)
             content: 토큰 내용
             node: 토큰 발생 노드명 (answer, summarize 등)
 
         Returns:
-            발행된 메시지 ID (Token Stream)
+            발행된 메시지 ID (Token Stream). 버퍼링된 경우 빈 문자열.
         """
         await self._ensure_scripts()
 
-        # 누적 텍스트 계산
         is_first_token = task_id not in self._accumulated
         if is_first_token:
-            self._accumulated[task_id] = ""
+            self._accumulated[task_id] = []
+            self._unsaved_parts[task_id] = []
             self._token_count[task_id] = 0
             self._stream_start_time[task_id] = time.perf_counter()
             # Metrics: Active stream started
             CHAT_STREAM_ACTIVE.inc()
 
-        self._accumulated[task_id] += content
+        node_str = node or ""
+        # 노드가 바뀌면 이전 노드의 버퍼를 먼저 발행 (엔트리별 node 유지)
+        if task_id in self._pending_parts and self._pending_node.get(task_id) != node_str:
+            await self._flush_tokens(task_id)
+
         self._token_count[task_id] += 1
         # 노드 추적 (마지막 노드)
         if node:
             self._stream_node[task_id] = node
-        accumulated = self._accumulated[task_id]
-
-        # seq 계산 (Stage seq와 충돌 방지를 위해 1000+부터 시작)
-        if task_id not in self._token_seq:
-            self._token_seq[task_id] = TOKEN_SEQ_START
-        self._token_seq[task_id] += 1
-        seq = self._token_seq[task_id]
 
-        # State 저장 여부 (10 토큰마다)
-        save_state = 1 if self._token_count[task_id] % TOKEN_STATE_SAVE_INTERVAL == 0 else 0
+        # 병합 버퍼에 추가
+        self._pending_parts.setdefault(task_id, []).append(content)
+        self._pending_len[task_id] = self._pending_len.get(task_id, 0) + len(content)
+        self._pending_tokens[task_id] = self._pending_tokens.get(task_id, 0) + 1
+        self._pending_node[task_id] = node_str
+
+        last_flush = self._last_flush.get(task_id)
+        elapsed = time.perf_counter() - last_flush if last_flush is not None else 0.0
+        if (
+            is_first_token
+            or self._pending_len[task_id] >= self._coalesce_chars
+            or elapsed >= self._coalesce_interval
+        ):
+            return await self._flush_tokens(task_id)
+
+        # 토큰이 끊겨도 버퍼가 coalesce_ms 이상 머무르지 않도록 타이머 예약
+        if task_id not in self._flush_timers:
+            delay = max(self._coalesce_interval - elapsed, 0.0)
+            self._flush_timers[task_id] = asyncio.get_running_loop().call_later(
+                delay, self._on_flush_timer, task_id
+            )
+        return ""
 
-        ts = str(time.time())
-        node_str = node or ""
+    def _on_flush_timer(self, task_id: str) -> None:
+        """병합 타이머 만료 → 버퍼 flush task 생성."""
+        self._flush_timers.pop(task_id, None)
+        if task_id not in self._pending_parts:
+            return
+        task = asyncio.create_task(self._flush_tokens(task_id))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
 
-        # Trace context 추출
-        trace_id, span_id, traceparent = _get_current_trace_context()
+    async def _flush_tokens(self, task_id: str) -> str:
+        """job의 병합 버퍼를 하나의 Token Stream 엔트리로 발행.
 
-        # Redis keys
-        token_stream_key = f"{TOKEN_STREAM_PREFIX}:{task_id}"
-        token_state_key = f"{TOKEN_STATE_PREFIX}:{task_id}"
-        stage_stream_key = _get_stream_key(task_id, self._shard_count)
+        job별 Lock으로 flush를 직렬화하여 seq 순서대로 XADD 되도록 보장.
 
-        # Lua Script 실행 (with latency tracking)
-        xadd_start = time.perf_counter()
-        try:
-            result = await self._token_v2_script(
-                keys=[token_stream_key, token_state_key, stage_stream_key],
-                args=[
-                    task_id,  # ARGV[1] - job_id
-                    str(seq),  # ARGV[2] - seq
-                    content,  # ARGV[3] - delta
-                    ts,  # ARGV[4] - ts
-                    accumulated,  # ARGV[5] - accumulated
-                    str(save_state),  # ARGV[6] - save_state
-                    str(TOKEN_STREAM_TTL),  # ARGV[7] - ttl
-                    str(self._maxlen),  # ARGV[8] - maxlen
-                    node_str,  # ARGV[9] - node
-                    trace_id,  # ARGV[10]
-                    span_id,  # ARGV[11]
-                    traceparent,  # ARGV[12]
-                ],
-            )
-        except Exception as e:
+        Returns:
+            발행된 메시지 ID (Token Stream). 버퍼가 비었거나 실패 시 빈 문자열.
+        """
+        lock = self._flush_locks.setdefault(task_id, asyncio.Lock())
+        async with lock:
+            parts = self._pending_parts.pop(task_id, None)
+            if not parts:
+                return ""
+            timer = self._flush_timers.pop(task_id, None)
+            if timer is not None:
+                timer.cancel()
+
+            delta = "".join(parts)
+            token_count = self._pending_tokens.pop(task_id, len(parts))
+            node_str = self._pending_node.pop(task_id, "")
+            self._pending_len.pop(task_id, None)
+            self._last_flush[task_id] = time.perf_counter()
+
+            # 누적 텍스트는 조각 단위로만 추가 (문자열 재생성 없음)
+            self._accumulated.setdefault(task_id, []).append(delta)
+            unsaved = self._unsaved_parts.setdefault(task_id, [])
+            unsaved.append(delta)
+
+            # seq 계산 (Stage seq와 충돌 방지를 위해 1000+부터 시작)
+            if task_id not in self._token_seq:
+                self._token_seq[task_id] = TOKEN_SEQ_START
+            self._token_seq[task_id] += 1
+            seq = self._token_seq[task_id]
+
+            # State 저장 여부 (10 엔트리마다)
+            self._entry_count[task_id] = self._entry_count.get(task_id, 0) + 1
+            save_state = 1 if self._entry_count[task_id] % TOKEN_STATE_SAVE_INTERVAL == 0 else 0
+            # State 저장 시에만 미반영 조각 전송 (Redis에서 APPEND)
+            text_chunk = "".join(unsaved) if save_state else ""
+
+            ts = str(time.time())
+
+            # Trace context 추출
+            trace_id, span_id, traceparent = _get_current_trace_context()
+
+            # Redis keys
+            token_stream_key = f"{TOKEN_STREAM_PREFIX}:{task_id}"
+            token_state_key = f"{TOKEN_STATE_PREFIX}:{task_id}"
+            stage_stream_key = _get_stream_key(task_id, self._shard_count)
+            token_text_key = f"{TOKEN_TEXT_PREFIX}:{task_id}"
+
+            # Lua Script 실행 (with latency tracking)
+            xadd_start = time.perf_counter()
+            try:
+                result = await self._token_v2_script(
+                    keys=[token_stream_key, token_state_key, stage_stream_key, token_text_key],
+                    args=[
+                        task_id,  # ARGV[1] - job_id
+                        str(seq),  # ARGV[2] - seq
+                        delta,  # ARGV[3] - delta
+                        ts,  # ARGV[4] - ts
+                        text_chunk,  # ARGV[5] - text_chunk
+                        str(save_state),  # ARGV[6] - save_state
+                        str(TOKEN_STREAM_TTL),  # ARGV[7] - ttl
+                        str(self._maxlen),  # ARGV[8] - maxlen
+                        node_str,  # ARGV[9] - node
+                        trace_id,  # ARGV[10]
+                        span_id,  # ARGV[11]
+                        traceparent,  # ARGV[12]
+                    ],
+                )
+            except Exception as e:
+                xadd_latency = time.perf_counter() - xadd_start
+                track_stream_token(
+                    node=node_str or "answer",
+                    status="error",
+                    latency=xadd_latency,
+                    count=token_count,
+                )
+                logger.error(
+                    "token_v2_publish_failed: %s: %s",
+                    type(e).__name__,
+                    e,
+                    extra={
+                        "job_id": task_id,
+                        "seq": seq,
+                    },
+                )
+                return ""
             xadd_latency = time.perf_counter() - xadd_start
-            track_stream_token(node=node_str or "answer", status="error", latency=xadd_latency)
-            logger.error(
-                "token_v2_publish_failed: %s: %s",
-                type(e).__name__,
-                e,
-                extra={
-                    "job_id": task_id,
-                    "seq": seq,
-                },
-            )
-            return ""
-        xadd_latency = time.perf_counter() - xadd_start
+            if save_state:
+                # 실패 시에는 유지 → 다음 State 저장 때 함께 APPEND
+                unsaved.clear()
 
         # Metrics: Token count + Redis XADD latency (track_stream_token이 latency 기록 포함)
-        track_stream_token(node=node_str or "answer", status="success", latency=xadd_latency)
+        track_stream_token(
+            node=node_str or "answer",
+            status="success",
+            latency=xadd_latency,
+            count=token_count,
+        )
+        CHAT_STREAM_COALESCED_TOKENS.labels(node=node_str or "answer").observe(token_count)
 
         token_msg_id, stage_msg_id = result
         if isinstance(token_msg_id, bytes):
@@ -714,6 +851,7 @@ class RedisProgressNotifier(ProgressNotifierPort):
                 "job_id": task_id,
                 "seq": seq,
                 "node": node_str,
+                "tokens": token_count,
                 "token_msg_id": token_msg_id,
                 "stage_msg_id": stage_msg_id,
                 "save_state": bool(save_state),
@@ -725,7 +863,7 @@ class RedisProgressNotifier(ProgressNotifierPort):
     async def finalize_token_stream(self, task_id: str) -> None:
         """토큰 스트림 완료 처리.
 
-        토큰 스트리밍 완료 시 최종 State 저장 및 메모리 정리.
+        병합 버퍼 flush 후 최종 State 저장 및 메모리 정리.
 
         Args:
             task_id: 작업 ID
@@ -733,7 +871,10 @@ class RedisProgressNotifier(ProgressNotifierPort):
         if task_id not in self._accumulated:
             return
 
-        accumulated = self._accumulated[task_id]
+        # 병합 버퍼에 남은 토큰 발행 (finalize 전 flush 보장)
+        await self._flush_tokens(task_id)
+
+        accumulated = "".join(self._accumulated[task_id])
         seq = self._token_seq.get(task_id, TOKEN_SEQ_START)
         token_count = self._token_count.get(task_id, 0)
         stream_node = self._stream_node.get(task_id, "answer")
@@ -754,7 +895,9 @@ class RedisProgressNotifier(ProgressNotifierPort):
         CHAT_STREAM_REQUESTS_TOTAL.labels(status="success").inc()
 
         # 최종 State 저장 (completed 플래그 추가)
+        # 증분 텍스트 키를 State 하나로 병합 → 완료 후 복구는 GET 한 번
         token_state_key = f"{TOKEN_STATE_PREFIX}:{task_id}"
+        token_text_key = f"{TOKEN_TEXT_PREFIX}:{task_id}"
         state = {
             "last_seq": seq,
             "accumulated": accumulated,
@@ -764,11 +907,14 @@ class RedisProgressNotifier(ProgressNotifierPort):
         }
 
         try:
-            await self._redis.setex(
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.setex(
                 token_state_key,
                 TOKEN_STREAM_TTL,
                 json.dumps(state, ensure_ascii=False),
             )
+            pipe.delete(token_text_key)
+            await pipe.execute()
             logger.info(
                 "token_stream_finalized",
                 extra={
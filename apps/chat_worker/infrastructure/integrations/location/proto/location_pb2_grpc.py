@@ -40,6 +40,12 @@ class LocationServiceStub(object):
             response_deserializer=location__pb2.SearchNearbyResponse.FromString,
             _registered_method=True,
         )
+        self.SearchClusters = channel.unary_unary(
+            "/location.v1.LocationService/SearchClusters",
+            request_serializer=location__pb2.SearchClustersRequest.SerializeToString,
+            response_deserializer=location__pb2.SearchClustersResponse.FromString,
+            _registered_method=True,
+        )
 
 
 class LocationServiceServicer(object):
@@ -51,6 +57,12 @@ class LocationServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def SearchClusters(self, request, context):
+        """광역 줌 지도 클러스터 (격자 cell별 수/무게중심, 타일 캐시)"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_LocationServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -59,6 +71,11 @@ def add_LocationServiceServicer_to_server(servicer, server):
             request_deserializer=location__pb2.SearchNearbyRequest.FromString,
             response_serializer=location__pb2.SearchNearbyResponse.SerializeToString,
         ),
+        "SearchClusters": grpc.unary_unary_rpc_method_handler(
+            servicer.SearchClusters,
+            request_deserializer=location__pb2.SearchClustersRequest.FromString,
+            response_serializer=location__pb2.SearchClustersResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "location.v1.LocationService", rpc_method_handlers
@@ -100,3 +117,33 @@ class LocationService(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def SearchClusters(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/location.v1.LocationService/SearchClusters",
+            location__pb2.SearchClustersRequest.SerializeToString,
+            location__pb2.SearchClustersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
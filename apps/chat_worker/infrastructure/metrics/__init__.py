@@ -7,13 +7,21 @@ from chat_worker.infrastructure.metrics.metrics import (
     CHAT_ERRORS_TOTAL,
     CHAT_ACTIVE_JOBS,
     CHAT_INTENT_DISTRIBUTION,
+    CHAT_INTENT_PATH_TOTAL,
+    CHAT_INTENT_LOCAL_AGREEMENT_TOTAL,
     CHAT_VISION_REQUESTS,
     CHAT_SUBAGENT_CALLS,
     CHAT_TOKEN_USAGE,
     # Checkpoint metrics (Read-Through)
     CHAT_CHECKPOINT_PROMOTES_TOTAL,
     CHAT_CHECKPOINT_COLD_MISSES_TOTAL,
+    CHAT_CHECKPOINT_LOCAL_CACHE_TOTAL,
     CHAT_CHECKPOINT_PROMOTE_DURATION,
+    # Checkpoint sync metrics (checkpoint_syncer)
+    CHAT_CHECKPOINT_SYNC_QUEUE_DEPTH,
+    CHAT_CHECKPOINT_SYNC_LAG_SECONDS,
+    CHAT_CHECKPOINT_SYNC_TOTAL,
+    CHAT_CHECKPOINT_SYNC_BATCH_DURATION,
     # Token streaming metrics (Load Test용)
     CHAT_STREAM_TOKENS_TOTAL,
     CHAT_STREAM_REQUESTS_TOTAL,
@@ -21,6 +29,7 @@ from chat_worker.infrastructure.metrics.metrics import (
     CHAT_STREAM_TOKEN_INTERVAL,
     CHAT_STREAM_DURATION,
     CHAT_STREAM_TOKEN_COUNT,
+    CHAT_STREAM_COALESCED_TOKENS,
     CHAT_STREAM_RECOVERY_TOTAL,
     CHAT_STREAM_ACTIVE,
     # Helper functions
@@ -47,13 +56,21 @@ __all__ = [
     "CHAT_ERRORS_TOTAL",
     "CHAT_ACTIVE_JOBS",
     "CHAT_INTENT_DISTRIBUTION",
+    "CHAT_INTENT_PATH_TOTAL",
+    "CHAT_INTENT_LOCAL_AGREEMENT_TOTAL",
     "CHAT_VISION_REQUESTS",
     "CHAT_SUBAGENT_CALLS",
     "CHAT_TOKEN_USAGE",
     # Checkpoint metrics (Read-Through)
     "CHAT_CHECKPOINT_PROMOTES_TOTAL",
     "CHAT_CHECKPOINT_COLD_MISSES_TOTAL",
+    "CHAT_CHECKPOINT_LOCAL_CACHE_TOTAL",
     "CHAT_CHECKPOINT_PROMOTE_DURATION",
+    # Checkpoint sync metrics (checkpoint_syncer)
+    "CHAT_CHECKPOINT_SYNC_QUEUE_DEPTH",
+    "CHAT_CHECKPOINT_SYNC_LAG_SECONDS",
+    "CHAT_CHECKPOINT_SYNC_TOTAL",
+    "CHAT_CHECKPOINT_SYNC_BATCH_DURATION",
     # Token streaming metrics (Load Test용)
     "CHAT_STREAM_TOKENS_TOTAL",
     "CHAT_STREAM_REQUESTS_TOTAL",
@@ -61,6 +78,7 @@ __all__ = [
     "CHAT_STREAM_TOKEN_INTERVAL",
     "CHAT_STREAM_DURATION",
     "CHAT_STREAM_TOKEN_COUNT",
+    "CHAT_STREAM_COALESCED_TOKENS",
     "CHAT_STREAM_RECOVERY_TOTAL",
     "CHAT_STREAM_ACTIVE",
     # Helper functions
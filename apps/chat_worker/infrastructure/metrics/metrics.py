@@ -82,6 +82,21 @@ CHAT_INTENT_DISTRIBUTION = Counter(
     ["intent"],
 )
 
+# 분류 경로별 건수 (local: 로컬 분류기 fast path, semantic_cache, cache, llm, llm_error)
+CHAT_INTENT_PATH_TOTAL = Counter(
+    "chat_intent_path_total",
+    "Intent classifications by resolution path",
+    ["path"],
+)
+
+# 로컬 분류기 예측 vs LLM(캐시 포함) 결과 일치 여부 (임계값 튜닝용)
+# confidence_bucket: 키워드 신호 반영 후 신뢰도 0.05 단위 하한 (예: "0.90")
+CHAT_INTENT_LOCAL_AGREEMENT_TOTAL = Counter(
+    "chat_intent_local_agreement_total",
+    "Local intent classifier agreement with LLM results",
+    ["predicted", "confidence_bucket", "result"],
+)
+
 # ============================================================
 # Vision Metrics
 # ============================================================
@@ -140,12 +155,45 @@ CHAT_CHECKPOINT_COLD_MISSES_TOTAL = Counter(
     "Total checkpoint misses (not in Redis nor PostgreSQL)",
 )
 
+CHAT_CHECKPOINT_LOCAL_CACHE_TOTAL = Counter(
+    "chat_checkpoint_local_cache_total",
+    "Checkpoint lookups served by the in-process LRU",
+    ["result"],  # hit, miss
+)
+
 CHAT_CHECKPOINT_PROMOTE_DURATION = Histogram(
     "chat_checkpoint_promote_duration_seconds",
     "Checkpoint promote duration (PG read + Redis write-back)",
     buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5],
 )
 
+# ============================================================
+# Checkpoint Sync Metrics (checkpoint_syncer: Redis → PostgreSQL)
+# ============================================================
+
+CHAT_CHECKPOINT_SYNC_QUEUE_DEPTH = Gauge(
+    "chat_checkpoint_sync_queue_depth",
+    "Number of pending events in the checkpoint sync queue",
+)
+
+CHAT_CHECKPOINT_SYNC_LAG_SECONDS = Gauge(
+    "chat_checkpoint_sync_lag_seconds",
+    "Age of the oldest pending event in the checkpoint sync queue",
+)
+
+CHAT_CHECKPOINT_SYNC_TOTAL = Counter(
+    "chat_checkpoint_sync_total",
+    "Total checkpoint sync results",
+    ["result"],  # synced, expired, error
+)
+
+CHAT_CHECKPOINT_SYNC_BATCH_DURATION = Histogram(
+    "chat_checkpoint_sync_batch_duration_seconds",
+    "Checkpoint sync batch duration (Redis fetch + PostgreSQL write)",
+    ["mode"],  # bulk, serial
+    buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
 # ============================================================
 # Token Streaming Metrics (Load Test용)
 # ============================================================
@@ -196,6 +244,14 @@ CHAT_STREAM_TOKEN_COUNT = Histogram(
     buckets=[10, 50, 100, 200, 500, 1000, 2000],
 )
 
+# 병합 엔트리당 토큰 수 (Token coalescing 효율)
+CHAT_STREAM_COALESCED_TOKENS = Histogram(
+    "chat_stream_coalesced_tokens",
+    "Number of tokens merged into one token stream entry",
+    ["node"],
+    buckets=[1, 2, 4, 8, 16, 32, 64],
+)
+
 # Token 복구 메트릭
 CHAT_STREAM_RECOVERY_TOTAL = Counter(
     "chat_stream_recovery_total",
@@ -377,15 +433,17 @@ def track_stream_token(
     node: str = "answer",
     status: str = "success",
     latency: float | None = None,
+    count: int = 1,
 ) -> None:
-    """단일 토큰 발행 추적 (간단 버전).
+    """토큰 발행 추적 (간단 버전).
 
     Args:
         node: 노드명 (answer, summarize)
         status: 상태 (success, error)
         latency: Redis XADD 지연시간
+        count: 한 번에 발행된 토큰 수 (병합 엔트리)
     """
-    CHAT_STREAM_TOKENS_TOTAL.labels(node=node, status=status).inc()
+    CHAT_STREAM_TOKENS_TOTAL.labels(node=node, status=status).inc(count)
     if latency is not None:
         CHAT_STREAM_TOKEN_LATENCY.labels(node=node).observe(latency)
 
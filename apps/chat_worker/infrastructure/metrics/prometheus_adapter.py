@@ -17,6 +17,8 @@ from chat_worker.infrastructure.metrics.metrics import (
     CHAT_REQUEST_DURATION,
     CHAT_ERRORS_TOTAL,
     CHAT_INTENT_DISTRIBUTION,
+    CHAT_INTENT_LOCAL_AGREEMENT_TOTAL,
+    CHAT_INTENT_PATH_TOTAL,
     CHAT_SUBAGENT_CALLS,
     CHAT_SUBAGENT_DURATION,
 )
@@ -101,6 +103,36 @@ class PrometheusMetricsAdapter(MetricsPort):
         """
         logger.debug("cache_miss", extra={"cache_type": cache_type})
 
+    def track_intent_path(self, path: str) -> None:
+        """Intent 분류 경로 메트릭 기록."""
+        try:
+            CHAT_INTENT_PATH_TOTAL.labels(path=path).inc()
+        except Exception as e:
+            logger.warning(
+                "metrics_track_intent_path_failed",
+                extra={"path": path, "error": str(e)},
+            )
+
+    def track_intent_agreement(
+        self,
+        predicted: str,
+        actual: str,
+        confidence: float,
+    ) -> None:
+        """로컬 분류기 일치율 메트릭 기록 (신뢰도 0.05 단위 버킷)."""
+        try:
+            bucket = min(int(confidence * 20), 20) / 20
+            CHAT_INTENT_LOCAL_AGREEMENT_TOTAL.labels(
+                predicted=predicted,
+                confidence_bucket=f"{bucket:.2f}",
+                result="agree" if predicted == actual else "disagree",
+            ).inc()
+        except Exception as e:
+            logger.warning(
+                "metrics_track_intent_agreement_failed",
+                extra={"predicted": predicted, "actual": actual, "error": str(e)},
+            )
+
     def track_subagent_call(
         self,
         subagent: str,
@@ -136,6 +136,7 @@ async def create_read_through_checkpointer(
     ttl_minutes: int = DEFAULT_CHECKPOINT_TTL_MINUTES,
     pg_pool_min_size: int = 1,
     pg_pool_max_size: int = 2,
+    local_cache_max_bytes: int = 0,
 ) -> "ReadThroughCheckpointer":
     """Read-Through Checkpointer (Redis Primary + PG Cold Start Fallback).
 
@@ -154,6 +155,7 @@ async def create_read_through_checkpointer(
         ttl_minutes: Checkpoint TTL (분, 기본 24시간=1440분)
         pg_pool_min_size: PG read pool 최소 연결 수 (기본 1)
         pg_pool_max_size: PG read pool 최대 연결 수 (기본 2, cold start만 사용)
+        local_cache_max_bytes: 프로세스 내 checkpoint LRU 최대 바이트 (0이면 비활성화)
 
     Returns:
         ReadThroughCheckpointer 인스턴스
@@ -180,12 +182,14 @@ async def create_read_through_checkpointer(
     checkpointer = ReadThroughCheckpointer(
         redis_saver=redis_saver,
         pg_saver=pg_saver,
+        local_cache_max_bytes=local_cache_max_bytes,
     )
 
     logger.info(
-        "ReadThroughCheckpointer created (redis ttl=%d min, pg pool max=%d)",
+        "ReadThroughCheckpointer created (redis ttl=%d min, pg pool max=%d, local cache=%d bytes)",
         ttl_minutes,
         pg_pool_max_size,
+        local_cache_max_bytes,
     )
     return checkpointer
 
@@ -153,6 +153,28 @@ def route_to_graders(state: dict[str, Any]) -> list[Send]:
     return sends
 
 
+def create_route_after_answer(eval_config: EvalConfig):
+    """route_after_answer 클로저 팩토리 (async/shadow 모드).
+
+    EvalConfig.is_blocking(intent)인 답변만 Eval 서브그래프를 동기 실행하고
+    (재생성 가능), 나머지는 eval_dispatch로 보내 즉시 종료합니다.
+
+    Args:
+        eval_config: Eval Pipeline 설정
+
+    Returns:
+        route_after_answer 라우팅 함수
+    """
+
+    def route_after_answer(state: dict[str, Any]) -> str:
+        """라우팅 결과: "eval" (동기 평가) 또는 "dispatch" (비동기 평가 적재)."""
+        if eval_config.is_blocking(state.get("intent", "")):
+            return "eval"
+        return "dispatch"
+
+    return route_after_answer
+
+
 MINIMUM_IMPROVEMENT_THRESHOLD: float = 5.0
 """재생성 품질 게이트: 재생성 후 연속 점수가 이전 대비 이 값 이상 개선되지 않으면 중단."""
 
@@ -370,16 +392,19 @@ def _create_calibration_node(calibration_monitor: "CalibrationMonitorService"):
 def _create_eval_aggregator_node(
     score_aggregator: "ScoreAggregatorService",
     eval_config: EvalConfig,
+    calibration_monitor: "CalibrationMonitorService | None" = None,
 ):
     """Eval Aggregator 노드 생성.
 
     L1 Code Grader + L2 LLM Grader 결과를 ScoreAggregatorService로 통합.
+    L2 축별 점수는 calibration_monitor의 CUSUM 누적 상태에 반영합니다.
 
     See: docs/plans/chat-eval-pipeline-plan.md A.3
 
     Args:
         score_aggregator: 다층 결과 통합 Service
         eval_config: Eval Pipeline 설정
+        calibration_monitor: L3 Calibration Monitor (점수 기록용, 선택)
     """
     from chat_worker.application.services.eval.code_grader import CodeGraderResult
     from chat_worker.domain.value_objects.axis_score import AxisScore
@@ -432,6 +457,12 @@ def _create_eval_aggregator_node(
                 calibration_status=cal_status,
             )
 
+            # L3 CUSUM 누적 상태 갱신 (증분 drift 감시)
+            if llm_scores and calibration_monitor is not None:
+                await calibration_monitor.record_scores(
+                    {axis: score.score for axis, score in llm_scores.items()}
+                )
+
             # 개선 힌트 수집
             hints: list[str] = []
             for slice_name, passed in code_result.passed.items():
@@ -578,7 +609,8 @@ def create_eval_subgraph(
     # Aggregator + Decision 노드
     if score_aggregator is not None:
         eval_graph.add_node(
-            "eval_aggregator", _create_eval_aggregator_node(score_aggregator, eval_config)
+            "eval_aggregator",
+            _create_eval_aggregator_node(score_aggregator, eval_config, calibration_monitor),
         )
     else:
         eval_graph.add_node("eval_aggregator", _create_passthrough_aggregator())
@@ -665,6 +697,7 @@ __all__ = [
     "EvalState",
     "MINIMUM_IMPROVEMENT_THRESHOLD",
     "create_eval_subgraph",
+    "create_route_after_answer",
     "create_route_after_eval",
     "route_to_graders",
 ]
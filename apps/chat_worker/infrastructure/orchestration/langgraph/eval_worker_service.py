@@ -0,0 +1,162 @@
+"""Eval Worker Service - 비동기 평가 작업 소비.
+
+async/shadow 모드에서 답변 그래프는 평가 작업을 RedisEvalJobQueue에 적재만 하고
+사용자 응답(done)을 바로 반환합니다. 이 서비스가 작업을 읽어 Eval 서브그래프
+(L1 Code Grader + L2 LLM Grader + L3 Calibration)를 실행하고 결과를 저장합니다.
+
+- 시작 시: 자기 consumer의 미확인(pending) 작업부터 처리 (재시작 복구)
+- 주기적으로 claim_idle_ms 이상 미확인인 작업을 XAUTOCLAIM으로 회수
+  (consumer 이름이 HOSTNAME이라 교체된 Pod의 미확인 작업은 아무도 다시 읽지 않음)
+- 배치 내 작업은 concurrency만큼 동시 평가
+- 평가 실패/저장 실패도 ACK (평가는 best-effort, 재시도로 LLM 비용 중복 방지)
+- 재생성은 불가 (이미 응답이 나갔으므로 eval_regeneration_enabled=False로 구성)
+
+실행: python -m chat_worker.eval_worker
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from chat_worker.application.dto.eval_result import EvalResult
+
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+
+    from chat_worker.application.ports.eval import EvalResultCommandGateway
+    from chat_worker.infrastructure.events.redis_eval_job_queue import RedisEvalJobQueue
+
+logger = logging.getLogger(__name__)
+
+
+class EvalWorkerService:
+    """Redis Streams 평가 작업 소비 + Eval 서브그래프 실행."""
+
+    def __init__(
+        self,
+        job_queue: "RedisEvalJobQueue",
+        eval_subgraph: "CompiledStateGraph",
+        result_gateway: "EvalResultCommandGateway | None" = None,
+        consumer_name: str = "eval-worker",
+        batch_size: int = 10,
+        block_ms: int = 5000,
+        concurrency: int = 4,
+        claim_idle_ms: int = 300000,
+        claim_interval_seconds: float = 60.0,
+    ):
+        """초기화.
+
+        Args:
+            job_queue: 평가 작업 큐
+            eval_subgraph: 컴파일된 Eval 서브그래프 (재생성 비활성화)
+            result_gateway: 평가 결과 저장 Gateway (None이면 로그만)
+            consumer_name: Consumer Group 내 고유 이름 (Pod 이름 권장)
+            batch_size: 1회 읽기 최대 작업 수
+            block_ms: 새 작업 대기 시간 (ms)
+            concurrency: 배치 내 동시 평가 수
+            claim_idle_ms: 회수 대상 최소 미확인 시간 (ms, 0이면 회수 안 함)
+            claim_interval_seconds: 회수 주기 (초)
+        """
+        self._queue = job_queue
+        self._subgraph = eval_subgraph
+        self._result_gateway = result_gateway
+        self._consumer = consumer_name
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._semaphore = asyncio.Semaphore(max(concurrency, 1))
+        self._pending_done = False
+        self._claim_idle_ms = claim_idle_ms
+        self._claim_interval = claim_interval_seconds
+        self._next_claim_at = 0.0
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """stop_event가 set될 때까지 작업 처리."""
+        await self._queue.ensure_group()
+        while not stop_event.is_set():
+            try:
+                await self.process_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Eval worker batch failed: %s", e, exc_info=True)
+                await asyncio.sleep(1.0)
+
+    async def process_batch(self) -> int:
+        """작업 1배치 처리.
+
+        미확인 작업이 남아 있으면 그것부터, 회수 주기가 되면 오래 미확인인 작업을,
+        없으면 새 작업을 읽습니다.
+
+        Returns:
+            처리한 작업 수
+        """
+        jobs: list[tuple[str, dict[str, Any]]] = []
+        if not self._pending_done:
+            jobs = await self._queue.read(self._consumer, count=self._batch_size, pending=True)
+            self._pending_done = not jobs
+        if not jobs and self._claim_idle_ms > 0 and time.monotonic() >= self._next_claim_at:
+            self._next_claim_at = time.monotonic() + self._claim_interval
+            jobs = await self._queue.claim_idle(
+                self._consumer, self._claim_idle_ms, count=self._batch_size
+            )
+            if jobs:
+                logger.info("eval_jobs_reclaimed", extra={"count": len(jobs)})
+                # 회수분이 batch_size만큼이면 남은 작업이 있을 수 있어 다음 배치에서 이어서 회수
+                if len(jobs) >= self._batch_size:
+                    self._next_claim_at = 0.0
+        if not jobs:
+            jobs = await self._queue.read(
+                self._consumer, count=self._batch_size, block_ms=self._block_ms
+            )
+        if not jobs:
+            return 0
+
+        await asyncio.gather(*(self._evaluate(job) for _message_id, job in jobs))
+        await self._queue.ack([message_id for message_id, _job in jobs])
+        return len(jobs)
+
+    async def _evaluate(self, job: dict[str, Any]) -> None:
+        """작업 1건 평가 + 결과 저장 (예외 전파 안 함)."""
+        if not job:
+            return
+        job_id = job.get("job_id", "")
+        enqueued_at = job.pop("enqueued_at", None)
+        async with self._semaphore:
+            start = time.time()
+            try:
+                result = await self._subgraph.ainvoke(job)
+            except Exception as e:
+                logger.warning("Async eval failed (job=%s): %s", job_id, e, exc_info=True)
+                return
+            finished = time.time()
+
+            eval_result = result.get("eval_result") or {}
+            logger.info(
+                "async_eval_completed",
+                extra={
+                    "job_id": job_id,
+                    "intent": job.get("intent"),
+                    "grade": result.get("eval_grade"),
+                    "continuous_score": result.get("eval_continuous_score"),
+                    "eval_ms": round((finished - start) * 1000, 1),
+                    "lag_ms": (
+                        round((finished - enqueued_at) * 1000, 1)
+                        if isinstance(enqueued_at, (int, float))
+                        else None
+                    ),
+                },
+            )
+
+            # degraded/passthrough 결과는 EvalResult 형식이 아니므로 저장하지 않음
+            if self._result_gateway is None or "continuous_score" not in eval_result:
+                return
+            try:
+                await self._result_gateway.save_result(EvalResult.from_dict(eval_result))
+            except Exception as e:
+                logger.warning("Async eval save failed (job=%s): %s", job_id, e)
+
+
+__all__ = ["EvalWorkerService"]
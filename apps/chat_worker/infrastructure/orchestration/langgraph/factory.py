@@ -25,6 +25,8 @@ START → intent → [vision?] → dynamic_router
                             │
                             ▼
                          answer → END
+                            │
+                    [eval: sync → eval (동기) / async·shadow → eval_dispatch (job 적재)]
 ```
 
 Note: web_search는 독립 intent + enrichment로 동작.
@@ -84,6 +86,12 @@ from typing import TYPE_CHECKING, Any
 
 from langgraph.graph import END, StateGraph
 
+from chat_worker.application.commands.generate_answer_command import (
+    SEMANTIC_ANSWER_CACHE_TTL,
+)
+from chat_worker.application.services.intent_classifier_service import (
+    LOCAL_INTENT_CONFIDENCE_THRESHOLD,
+)
 from chat_worker.infrastructure.orchestration.langgraph.nodes import (
     create_aggregator_node,
     create_answer_node,
@@ -108,8 +116,12 @@ from chat_worker.infrastructure.orchestration.langgraph.nodes.kakao_place_node i
 )
 from chat_worker.infrastructure.orchestration.langgraph.eval_graph_factory import (
     create_eval_subgraph,
+    create_route_after_answer,
     create_route_after_eval,
 )
+from chat_worker.infrastructure.orchestration.langgraph.nodes.eval_node import (
+    create_eval_dispatch_node,
+)
 from chat_worker.infrastructure.orchestration.langgraph.state import ChatState
 from chat_worker.infrastructure.orchestration.langgraph.summarization import (
     SummarizationNode,
@@ -119,7 +131,7 @@ if TYPE_CHECKING:
     from langgraph.checkpoint.base import BaseCheckpointSaver
 
     from chat_worker.application.ports.bulk_waste_client import BulkWasteClientPort
-    from chat_worker.application.ports.cache import CachePort
+    from chat_worker.application.ports.cache import CachePort, SemanticCachePort
     from chat_worker.application.ports.character_asset import CharacterAssetPort
     from chat_worker.application.ports.collection_point_client import (
         CollectionPointClientPort,
@@ -133,15 +145,18 @@ if TYPE_CHECKING:
     from chat_worker.application.ports.character_client import CharacterClientPort
     from chat_worker.application.ports.events import ProgressNotifierPort
     from chat_worker.application.ports.input_requester import InputRequesterPort
+    from chat_worker.application.ports.intent_predictor import IntentPredictorPort
     from chat_worker.application.ports.kakao_local_client import KakaoLocalClientPort
     from chat_worker.application.ports.llm import LLMClientPort
     from chat_worker.application.ports.llm_evaluator import LLMFeedbackEvaluatorPort
     from chat_worker.application.ports.location_client import LocationClientPort
+    from chat_worker.application.ports.metrics import MetricsPort
     from chat_worker.application.ports.prompt_loader import PromptLoaderPort
     from chat_worker.application.ports.retrieval import RetrieverPort
     from chat_worker.application.ports.vision import VisionModelPort
     from chat_worker.application.ports.web_search import WebSearchPort
     from chat_worker.application.dto.eval_config import EvalConfig
+    from chat_worker.application.ports.eval import EvalJobQueue
     from chat_worker.application.services.eval.calibration_monitor import (
         CalibrationMonitorService,
     )
@@ -213,6 +228,14 @@ def create_chat_graph(
     image_default_size: str = "1024x1024",  # 이미지 기본 크기
     image_default_quality: str = "medium",  # 이미지 기본 품질
     cache: "CachePort | None" = None,  # P2: Intent 캐싱용 (CachePort 추상화)
+    intent_predictor: "IntentPredictorPort | None" = None,  # 로컬 Intent 분류기 (LLM fast path)
+    intent_local_fast_path: bool = False,  # False면 shadow (일치율만 기록)
+    intent_local_threshold: float = LOCAL_INTENT_CONFIDENCE_THRESHOLD,
+    intent_local_shadow_rate: float = 0.0,
+    semantic_cache: "SemanticCachePort | None" = None,  # 유사 질문 캐시 (Intent/단일 턴 답변)
+    semantic_answer_cache_enabled: bool = False,  # 유사 질문 답변 재사용 (임계값 튜닝 전 기본 off)
+    semantic_answer_cache_ttl: int = SEMANTIC_ANSWER_CACHE_TTL,
+    metrics: "MetricsPort | None" = None,  # Intent 경로/일치율 메트릭
     input_requester: "InputRequesterPort | None" = None,  # Reserved for future use
     checkpointer: "BaseCheckpointSaver | None" = None,
     fallback_orchestrator: "FallbackOrchestrator | None" = None,  # Fallback 체인
@@ -237,6 +260,8 @@ def create_chat_graph(
     llm_grader: "LLMGraderService | None" = None,
     score_aggregator: "ScoreAggregatorService | None" = None,
     calibration_monitor: "CalibrationMonitorService | None" = None,
+    eval_counter: Any | None = None,  # RedisEvalCounter (Calibration 주기 판단)
+    eval_job_queue: "EvalJobQueue | None" = None,  # async/shadow 모드 eval job 적재
 ) -> StateGraph:
     """Chat 파이프라인 그래프 생성.
 
@@ -254,6 +279,14 @@ def create_chat_graph(
         bulk_waste_client: 대형폐기물 클라이언트 (선택, 행정안전부 API)
         recyclable_price_client: 재활용자원 시세 클라이언트 (선택, 한국환경공단)
         image_generator: 이미지 생성 클라이언트 (선택, Responses API)
+        intent_predictor: 로컬 Intent 분류기 (선택, 고신뢰 예측 시 LLM 생략)
+        intent_local_fast_path: 로컬 fast path 활성화 (False면 shadow 모드)
+        intent_local_threshold: 로컬 fast path 신뢰도 임계값
+        intent_local_shadow_rate: fast path 대상 중 LLM으로도 검증할 비율
+        semantic_cache: 유사 질문 캐시 (선택, 표기만 다른 질문의 Intent/답변 재사용)
+        semantic_answer_cache_enabled: 유사 캐시로 답변까지 재사용할지 (False면 Intent만)
+        semantic_answer_cache_ttl: 유사 캐시 답변 TTL 초
+        metrics: 메트릭 Port (선택, Intent 분류 경로/로컬 일치율)
         input_requester: Reserved for future use (현재 미사용)
         checkpointer: LangGraph 체크포인터 (세션 유지용)
         fallback_orchestrator: Fallback 체인 오케스트레이터 (선택)
@@ -266,6 +299,9 @@ def create_chat_graph(
         enable_dynamic_routing: Send API 동적 라우팅 활성화 (기본 True)
         enable_multi_intent: Multi-intent fanout 활성화 (기본 True)
         enable_enrichment: Intent 기반 enrichment 활성화 (기본 True)
+        eval_config: Eval Pipeline 설정 (None이면 answer → END)
+        eval_counter: Calibration 주기 카운터 (선택)
+        eval_job_queue: Eval 작업 큐 (async/shadow 모드, None이면 항상 동기 평가)
 
     Returns:
         컴파일된 LangGraph
@@ -309,10 +345,24 @@ def create_chat_graph(
 
     # 핵심 노드 생성
     intent_node = create_intent_node(
-        llm, event_publisher, prompt_loader=prompt_loader, cache=cache
-    )  # P2: Intent 캐싱
+        llm,
+        event_publisher,
+        prompt_loader=prompt_loader,
+        cache=cache,  # P2: Intent 캐싱
+        intent_predictor=intent_predictor,
+        metrics=metrics,
+        enable_local_fast_path=intent_local_fast_path,
+        local_confidence_threshold=intent_local_threshold,
+        local_shadow_rate=intent_local_shadow_rate,
+        semantic_cache=semantic_cache,
+    )
     rag_node = create_rag_node(retriever, event_publisher)
-    answer_node = create_answer_node(llm, event_publisher=event_publisher)  # 네이티브 스트리밍
+    answer_node = create_answer_node(  # 네이티브 스트리밍
+        llm,
+        event_publisher=event_publisher,
+        semantic_cache=semantic_cache if semantic_answer_cache_enabled else None,
+        semantic_cache_ttl=semantic_answer_cache_ttl,
+    )
 
     # Vision 노드 (선택)
     if vision_model is not None:
@@ -656,6 +706,7 @@ def create_chat_graph(
         graph.add_edge("summarize", "answer")
 
     # Eval Pipeline 통합 (answer → eval → END or answer → END)
+    # async/shadow: is_blocking intent만 eval, 나머지는 eval_dispatch → END (done 즉시)
     if eval_config is not None and eval_config.enable_eval_pipeline:
         eval_subgraph = create_eval_subgraph(
             eval_config=eval_config,
@@ -663,9 +714,22 @@ def create_chat_graph(
             llm_grader=llm_grader,
             score_aggregator=score_aggregator,
             calibration_monitor=calibration_monitor,
+            eval_counter=eval_counter,
         )
         graph.add_node("eval", eval_subgraph)
-        graph.add_edge("answer", "eval")
+        if eval_config.eval_mode != "sync" and eval_job_queue is not None:
+            graph.add_node("eval_dispatch", create_eval_dispatch_node(eval_config, eval_job_queue))
+            graph.add_conditional_edges(
+                "answer",
+                create_route_after_answer(eval_config),
+                {
+                    "eval": "eval",
+                    "dispatch": "eval_dispatch",
+                },
+            )
+            graph.add_edge("eval_dispatch", END)
+        else:
+            graph.add_edge("answer", "eval")
         graph.add_conditional_edges(
             "eval",
             create_route_after_eval(eval_config),
@@ -675,9 +739,10 @@ def create_chat_graph(
             },
         )
         logger.info(
-            "Eval pipeline integrated (mode=%s, regeneration=%s)",
+            "Eval pipeline integrated (mode=%s, regeneration=%s, background=%s)",
             eval_config.eval_mode,
             eval_config.eval_regeneration_enabled,
+            eval_config.eval_mode != "sync" and eval_job_queue is not None,
         )
     else:
         graph.add_edge("answer", END)
@@ -12,6 +12,10 @@ Clean Architecture:
 - answer_node에서 모든 토큰을 직접 발행 (notify_token_v2)
 - ProcessChatCommand는 answer 노드의 토큰을 건너뜀 (중복 방지)
 - LangChain/네이티브 경로 모두 동일한 발행 메커니즘 사용
+
+유사 질문 캐시 (선택):
+- 단일 턴 분리배출 질문은 같은 RAG 컨텍스트의 유사 질문 답변을 재사용 (LLM 생략)
+- 적중 시 캐시 답변을 한 번에 토큰으로 발행
 """
 
 from __future__ import annotations
@@ -22,6 +26,7 @@ from typing import TYPE_CHECKING, Any
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 from chat_worker.application.commands.generate_answer_command import (
+    SEMANTIC_ANSWER_CACHE_TTL,
     GenerateAnswerCommand,
     GenerateAnswerInput,
 )
@@ -29,6 +34,7 @@ from chat_worker.infrastructure.assets.prompt_loader import PromptBuilder
 from chat_worker.infrastructure.orchestration.langgraph.sequence import cleanup_sequence
 
 if TYPE_CHECKING:
+    from chat_worker.application.ports.cache import SemanticCachePort
     from chat_worker.application.ports.events import ProgressNotifierPort
     from chat_worker.application.ports.llm import LLMClientPort
 
@@ -38,6 +44,8 @@ logger = logging.getLogger(__name__)
 def create_answer_node(
     llm: "LLMClientPort",
     event_publisher: "ProgressNotifierPort | None" = None,
+    semantic_cache: "SemanticCachePort | None" = None,
+    semantic_cache_ttl: int = SEMANTIC_ANSWER_CACHE_TTL,
 ):
     """답변 생성 노드 팩토리.
 
@@ -53,6 +61,8 @@ def create_answer_node(
     Args:
         llm: LLM 클라이언트
         event_publisher: 이벤트 발행자 (토큰 직접 발행용)
+        semantic_cache: 유사 질문 캐시 Port (None이면 항상 LLM 호출)
+        semantic_cache_ttl: 유사 캐시 답변 TTL 초
 
     Returns:
         answer_node 함수
@@ -62,6 +72,8 @@ def create_answer_node(
     command = GenerateAnswerCommand(
         llm=llm,
         prompt_builder=prompt_builder,
+        semantic_cache=semantic_cache,
+        semantic_cache_ttl=semantic_cache_ttl,
     )
 
     async def answer_node(state: dict[str, Any]) -> dict[str, Any]:
@@ -154,6 +166,23 @@ def create_answer_node(
             # 2. 프롬프트 준비 (Command에서 컨텍스트 빌드만 수행)
             prepared = await command.prepare(input_dto)
 
+            # 캐시 적중: LLM 생략, 캐시 답변을 그대로 발행
+            if prepared.cached_answer:
+                answer = prepared.cached_answer
+                if event_publisher is not None:
+                    await event_publisher.notify_token_v2(
+                        task_id=job_id,
+                        content=answer,
+                        node="answer",
+                    )
+                    await event_publisher.finalize_token_stream(job_id)
+                logger.info(
+                    "Answer served from cache",
+                    extra={"job_id": job_id, "length": len(answer)},
+                )
+                cleanup_sequence(job_id)
+                return {"answer": answer, "messages": [AIMessage(content=answer)]}
+
             # 3. LLM 스트리밍 호출 및 토큰 발행
             answer_parts = []
 
@@ -202,6 +231,11 @@ def create_answer_node(
                 extra={"job_id": job_id, "length": len(answer)},
             )
 
+            if prepared.semantic_namespace is not None:
+                command.save_to_semantic_cache(
+                    prepared.semantic_namespace, input_dto.message, answer
+                )
+
             # 6. Lamport Clock 정리 (메모리 관리)
             # answer_node는 파이프라인의 마지막 노드이므로 여기서 정리
             cleanup_sequence(job_id)
@@ -3,6 +3,9 @@
 얇은 어댑터: ChatState → EvalState 필드 매핑 + error fallback.
 Eval Pipeline 서브그래프의 진입점.
 
+비동기 모드(async/shadow)에서는 eval_dispatch 노드가 같은 필드를
+eval job으로 적재하고 바로 종료합니다 (eval_worker가 서브그래프 실행).
+
 Clean Architecture:
 - Node(Adapter): 이 파일 - LangGraph glue code (state 변환만 담당)
 - Subgraph: eval_graph_factory.py - 내부 eval 파이프라인
@@ -12,12 +15,17 @@ See: docs/plans/chat-eval-pipeline-plan.md B.3
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any
+import random
+from typing import TYPE_CHECKING, Any
 
 from chat_worker.application.dto.eval_config import EvalConfig
 from chat_worker.application.dto.eval_result import EvalResult
 
+if TYPE_CHECKING:
+    from chat_worker.application.ports.eval import EvalJobQueue
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,6 +157,67 @@ def create_eval_entry_node(eval_config: EvalConfig, eval_counter=None):
     return eval_entry
 
 
+# eval_entry가 읽는 ChatState 필드 (eval job에 그대로 담아 워커에서 재사용)
+EVAL_JOB_STATE_KEYS = (
+    "job_id",
+    "message",
+    "intent",
+    "answer",
+    "disposal_rules",
+    "conversation_history",
+    "rag_feedback",
+)
+
+
+def build_eval_job(state: dict[str, Any]) -> dict[str, Any]:
+    """ChatState에서 eval job 생성 (JSON 직렬화 가능한 값으로 변환).
+
+    Args:
+        state: 현재 ChatState
+
+    Returns:
+        eval_worker가 Eval 서브그래프 입력으로 사용할 dict
+    """
+    job = {key: state.get(key) for key in EVAL_JOB_STATE_KEYS if state.get(key) is not None}
+    # Pydantic/도메인 객체가 섞일 수 있어 JSON 왕복으로 정규화
+    return json.loads(json.dumps(job, ensure_ascii=False, default=str))
+
+
+def create_eval_dispatch_node(eval_config: EvalConfig, job_queue: "EvalJobQueue"):
+    """Eval dispatch 노드 팩토리 (async/shadow 모드).
+
+    eval_sample_rate 비율만큼 eval job을 적재하고 즉시 반환.
+    평가 결과를 기다리지 않으므로 done 지연에 영향이 없습니다 (XADD 1회).
+
+    Args:
+        eval_config: Eval 설정
+        job_queue: Eval 작업 큐 Port
+
+    Returns:
+        eval_dispatch 노드 함수
+    """
+
+    async def eval_dispatch(state: dict[str, Any]) -> dict[str, Any]:
+        """답변을 비동기 평가 대상으로 적재 (state 변경 없음)."""
+        if random.random() >= eval_config.eval_sample_rate:
+            return {}
+        try:
+            queued = await job_queue.enqueue(build_eval_job(state))
+        except Exception as e:
+            logger.warning("eval_dispatch failed: %s", e)
+            queued = False
+        logger.debug(
+            "eval_dispatch completed",
+            extra={"job_id": state.get("job_id"), "intent": state.get("intent"), "queued": queued},
+        )
+        return {}
+
+    return eval_dispatch
+
+
 __all__ = [
+    "EVAL_JOB_STATE_KEYS",
+    "build_eval_job",
+    "create_eval_dispatch_node",
     "create_eval_entry_node",
 ]
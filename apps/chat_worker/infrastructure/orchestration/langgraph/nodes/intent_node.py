@@ -18,11 +18,16 @@ from chat_worker.application.commands.classify_intent_command import (
     ClassifyIntentCommand,
     ClassifyIntentInput,
 )
+from chat_worker.application.services.intent_classifier_service import (
+    LOCAL_INTENT_CONFIDENCE_THRESHOLD,
+)
 
 if TYPE_CHECKING:
-    from chat_worker.application.ports.cache import CachePort
+    from chat_worker.application.ports.cache import CachePort, SemanticCachePort
     from chat_worker.application.ports.events import ProgressNotifierPort
+    from chat_worker.application.ports.intent_predictor import IntentPredictorPort
     from chat_worker.application.ports.llm import LLMClientPort
+    from chat_worker.application.ports.metrics import MetricsPort
     from chat_worker.application.ports.prompt_loader import PromptLoaderPort
 
 logger = logging.getLogger(__name__)
@@ -34,6 +39,12 @@ def create_intent_node(
     prompt_loader: "PromptLoaderPort",
     cache: "CachePort | None" = None,
     enable_multi_intent: bool = True,
+    intent_predictor: "IntentPredictorPort | None" = None,
+    metrics: "MetricsPort | None" = None,
+    enable_local_fast_path: bool = False,
+    local_confidence_threshold: float = LOCAL_INTENT_CONFIDENCE_THRESHOLD,
+    local_shadow_rate: float = 0.0,
+    semantic_cache: "SemanticCachePort | None" = None,
 ):
     """의도 분류 노드 팩토리.
 
@@ -49,6 +60,12 @@ def create_intent_node(
         prompt_loader: 프롬프트 로더
         cache: 캐시 Port
         enable_multi_intent: Multi-Intent 처리 활성화 여부
+        intent_predictor: 로컬 분류기 Port (선택, LLM 앞단 fast path)
+        metrics: 메트릭 Port (선택, 분류 경로/로컬 일치율)
+        enable_local_fast_path: 고신뢰 로컬 예측으로 LLM 생략 (False면 shadow 모드)
+        local_confidence_threshold: fast path 신뢰도 임계값 (키워드 신호 반영 후)
+        local_shadow_rate: fast path 대상 중 LLM으로도 검증할 비율
+        semantic_cache: 유사 질문 캐시 Port (선택, 표기만 다른 질문 재사용)
 
     Returns:
         intent_node 함수
@@ -59,6 +76,12 @@ def create_intent_node(
         prompt_loader=prompt_loader,
         cache=cache,
         enable_multi_intent=enable_multi_intent,
+        intent_predictor=intent_predictor,
+        metrics=metrics,
+        enable_local_fast_path=enable_local_fast_path,
+        local_confidence_threshold=local_confidence_threshold,
+        local_shadow_rate=local_shadow_rate,
+        semantic_cache=semantic_cache,
     )
 
     async def intent_node(state: dict[str, Any]) -> dict[str, Any]:
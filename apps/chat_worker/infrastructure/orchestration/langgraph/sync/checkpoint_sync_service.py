@@ -5,10 +5,13 @@ Worker가 Redis에 checkpoint를 저장하면 sync queue에 이벤트가 추가
 
 전략:
 1. BRPOP으로 sync queue에서 이벤트 대기 (blocking)
-2. 배치 수집 (최대 batch_size개 또는 drain_timeout 초)
-3. 각 이벤트에 대해 Redis에서 checkpoint 읽기
-4. PostgreSQL에 upsert (AsyncPostgresSaver.aput)
-5. 실패 시 이벤트를 DLQ로 이동
+2. 배치 수집 (RPOP count로 최대 batch_size개 일괄 drain)
+3. Redis에서 checkpoint 읽기 (bulk: fetch_concurrency 만큼 동시 조회)
+4. PostgreSQL에 upsert (bulk: 배치 전체를 단일 연결/단일 트랜잭션으로 기록)
+5. 실패 시 이벤트를 DLQ로 이동 (bulk 트랜잭션 실패 시 건별 재시도 후 DLQ)
+
+관측:
+- sync queue 깊이 / 가장 오래된 이벤트 나이를 배치마다 메트릭으로 기록
 
 장애 복구:
 - Syncer 재시작 시 queue에 남은 이벤트부터 처리
@@ -48,6 +51,8 @@ class CheckpointSyncService:
         batch_size: 배치당 최대 이벤트 수
         drain_timeout: 배치 수집 대기 시간 (초)
         max_retries: 이벤트당 최대 재시도 횟수
+        bulk: 일괄 동기화 모드 (동시 fetch + 배치 단일 트랜잭션)
+        fetch_concurrency: bulk 모드 Redis 동시 조회 수
     """
 
     def __init__(
@@ -58,6 +63,8 @@ class CheckpointSyncService:
         batch_size: int = 50,
         drain_timeout: float = 2.0,
         max_retries: int = 3,
+        bulk: bool = True,
+        fetch_concurrency: int = 8,
     ):
         self._redis = redis
         self._redis_saver = redis_saver
@@ -65,6 +72,8 @@ class CheckpointSyncService:
         self._batch_size = batch_size
         self._drain_timeout = drain_timeout
         self._max_retries = max_retries
+        self._bulk = bulk
+        self._fetch_concurrency = max(fetch_concurrency, 1)
         self._synced_count = 0
         self._error_count = 0
 
@@ -78,6 +87,8 @@ class CheckpointSyncService:
         batch_size: int = 50,
         drain_timeout: float = 2.0,
         checkpoint_ttl_minutes: int = 1440,
+        bulk: bool = True,
+        fetch_concurrency: int = 8,
     ) -> "CheckpointSyncService":
         """팩토리 메서드.
 
@@ -89,6 +100,8 @@ class CheckpointSyncService:
             batch_size: 배치당 최대 이벤트 수
             drain_timeout: 배치 수집 대기 시간 (초)
             checkpoint_ttl_minutes: Redis checkpoint TTL (분)
+            bulk: 일괄 동기화 모드
+            fetch_concurrency: bulk 모드 Redis 동시 조회 수
 
         Returns:
             CheckpointSyncService 인스턴스
@@ -131,6 +144,8 @@ class CheckpointSyncService:
             pg_saver=pg_saver,
             batch_size=batch_size,
             drain_timeout=drain_timeout,
+            bulk=bulk,
+            fetch_concurrency=fetch_concurrency,
         )
 
     async def run(self, stop_event: asyncio.Event) -> None:
@@ -139,14 +154,16 @@ class CheckpointSyncService:
         stop_event가 set될 때까지 sync queue를 소비합니다.
         """
         logger.info(
-            "Sync loop started (batch_size=%d, drain_timeout=%.1fs)",
+            "Sync loop started (batch_size=%d, drain_timeout=%.1fs, bulk=%s)",
             self._batch_size,
             self._drain_timeout,
+            self._bulk,
         )
 
         while not stop_event.is_set():
             try:
                 batch = await self._collect_batch(stop_event)
+                await self._record_queue_lag()
                 if not batch:
                     continue
 
@@ -170,7 +187,7 @@ class CheckpointSyncService:
         """Sync queue에서 배치 수집.
 
         BRPOP으로 첫 이벤트를 blocking 대기 후,
-        추가 이벤트를 non-blocking으로 drain.
+        추가 이벤트를 RPOP count로 non-blocking drain (이벤트당 RTT 제거).
         """
         batch: list[dict] = []
 
@@ -189,47 +206,164 @@ class CheckpointSyncService:
         while len(batch) < self._batch_size and time.monotonic() < deadline:
             if stop_event.is_set():
                 break
-            raw = await self._redis.rpop(SYNC_QUEUE_KEY)
-            if raw is None:
+            raws = await self._redis.rpop(SYNC_QUEUE_KEY, self._batch_size - len(batch))
+            if not raws:
                 break
-            event = self._parse_event(raw)
-            if event:
-                batch.append(event)
+            for raw in raws:
+                event = self._parse_event(raw)
+                if event:
+                    batch.append(event)
 
         return batch
 
+    async def _record_queue_lag(self) -> None:
+        """Sync queue 깊이 + 가장 오래된 이벤트 나이 메트릭 기록.
+
+        LPUSH/RPOP 구조이므로 가장 오래된 이벤트는 리스트 끝(-1).
+        """
+        try:
+            pipe = self._redis.pipeline()
+            pipe.llen(SYNC_QUEUE_KEY)
+            pipe.lindex(SYNC_QUEUE_KEY, -1)
+            depth, oldest_raw = await pipe.execute()
+
+            lag = 0.0
+            if oldest_raw:
+                oldest = self._parse_event(oldest_raw) or {}
+                if oldest.get("ts"):
+                    lag = max(time.time() - float(oldest["ts"]), 0.0)
+
+            from chat_worker.infrastructure.metrics import (
+                CHAT_CHECKPOINT_SYNC_LAG_SECONDS,
+                CHAT_CHECKPOINT_SYNC_QUEUE_DEPTH,
+            )
+
+            CHAT_CHECKPOINT_SYNC_QUEUE_DEPTH.set(depth)
+            CHAT_CHECKPOINT_SYNC_LAG_SECONDS.set(lag)
+        except Exception:
+            logger.debug("Failed to record sync queue lag", exc_info=True)
+
     async def _sync_batch(self, batch: list[dict]) -> int:
         """배치 동기화 실행."""
-        synced = 0
-
         # thread_id별로 deduplicate (동일 thread의 최신 checkpoint만 sync)
         latest: dict[tuple[str, str], dict] = {}
         for event in batch:
-            key = (event["thread_id"], event["checkpoint_ns"])
+            key = (event["thread_id"], event.get("checkpoint_ns", ""))
             latest[key] = event  # 마지막 것이 최신
 
-        for event in latest.values():
+        start = time.monotonic()
+        if self._bulk:
+            synced = await self._sync_batch_bulk(list(latest.values()))
+        else:
+            synced = await self._sync_batch_serial(list(latest.values()))
+        self._record_batch(time.monotonic() - start, synced)
+        return synced
+
+    async def _sync_batch_serial(self, events: list[dict]) -> int:
+        """이벤트별 순차 동기화 (fetch → PG 쓰기)."""
+        synced = 0
+        for event in events:
             try:
                 success = await self._sync_one(event)
                 if success:
                     synced += 1
             except Exception:
-                self._error_count += 1
-                logger.exception(
-                    "Failed to sync checkpoint: thread_id=%s, checkpoint_id=%s",
-                    event.get("thread_id"),
-                    event.get("checkpoint_id"),
-                )
-                # DLQ로 이동
-                await self._send_to_dlq(event)
+                await self._handle_failure(event)
+        return synced
+
+    async def _sync_batch_bulk(self, events: list[dict]) -> int:
+        """일괄 동기화.
+
+        1. Redis 조회: fetch_concurrency 만큼 동시 aget_tuple
+        2. PG 쓰기: 배치 전체를 단일 연결/단일 트랜잭션으로 기록
+        3. 트랜잭션 실패 시 건별 재시도 (문제 이벤트만 DLQ)
+        """
+        semaphore = asyncio.Semaphore(self._fetch_concurrency)
+
+        async def fetch(event: dict) -> Any:
+            async with semaphore:
+                return await self._fetch_tuple(event)
+
+        results = await asyncio.gather(*(fetch(e) for e in events), return_exceptions=True)
+
+        ready: list[tuple[dict, Any]] = []
+        for event, result in zip(events, results):
+            if isinstance(result, BaseException):
+                await self._handle_failure(event, result)
+            elif result is not None:
+                ready.append((event, result))
+
+        if not ready:
+            return 0
+
+        try:
+            await self._write_bulk([tuple_data for _, tuple_data in ready])
+            return len(ready)
+        except Exception:
+            logger.warning(
+                "Bulk checkpoint write failed, falling back to per-checkpoint writes (n=%d)",
+                len(ready),
+                exc_info=True,
+            )
 
+        synced = 0
+        for event, tuple_data in ready:
+            try:
+                await self._write_tuple(self._pg_saver, tuple_data)
+                synced += 1
+            except Exception:
+                await self._handle_failure(event)
         return synced
 
+    async def _write_bulk(self, tuples: list[Any]) -> None:
+        """Checkpoint 목록을 PG 단일 연결 + 단일 트랜잭션으로 기록.
+
+        pool에서 연결 하나를 빌려 그 연결에 바인딩된 AsyncPostgresSaver로 기록.
+        (checkpoint마다 pool 연결 획득/커밋 반복 제거)
+        """
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+        from psycopg_pool import AsyncConnectionPool
+
+        pool = self._pg_saver.conn
+        if not isinstance(pool, AsyncConnectionPool):
+            # 단일 연결 saver: 트랜잭션만 묶어서 기록
+            async with pool.transaction():
+                for tuple_data in tuples:
+                    await self._write_tuple(self._pg_saver, tuple_data)
+            return
+
+        async with pool.connection() as conn, conn.transaction():
+            saver = AsyncPostgresSaver(conn, serde=self._pg_saver.serde)
+            for tuple_data in tuples:
+                await self._write_tuple(saver, tuple_data)
+
+    async def _handle_failure(self, event: dict, error: BaseException | None = None) -> None:
+        """동기화 실패 처리 (에러 카운트 + DLQ)."""
+        self._error_count += 1
+        self._record_result("error")
+        logger.error(
+            "Failed to sync checkpoint: thread_id=%s, checkpoint_id=%s",
+            event.get("thread_id"),
+            event.get("checkpoint_id"),
+            exc_info=error or True,
+        )
+        # DLQ로 이동
+        await self._send_to_dlq(event)
+
     async def _sync_one(self, event: dict) -> bool:
         """단일 checkpoint 동기화.
 
         Redis에서 checkpoint 읽기 → PostgreSQL에 쓰기.
         """
+        tuple_data = await self._fetch_tuple(event)
+        if tuple_data is None:
+            return False
+
+        await self._write_tuple(self._pg_saver, tuple_data)
+        return True
+
+    async def _fetch_tuple(self, event: dict) -> Any:
+        """Redis에서 최신 checkpoint tuple 조회 (만료 시 None)."""
         thread_id = event["thread_id"]
         checkpoint_ns = event.get("checkpoint_ns", "")
 
@@ -245,26 +379,58 @@ class CheckpointSyncService:
         if tuple_data is None:
             # Redis에서 이미 만료됨 (TTL)
             logger.debug("Checkpoint expired in Redis: %s", thread_id)
-            return False
+            self._record_result("expired")
+        return tuple_data
+
+    @staticmethod
+    async def _write_tuple(pg_saver: Any, tuple_data: Any) -> None:
+        """Checkpoint tuple을 PostgreSQL에 쓰기.
 
-        # PostgreSQL에 쓰기
-        await self._pg_saver.aput(
+        new_versions에 전체 channel_versions 전달 → PG saver가 비-primitive channel
+        값(messages 등)을 blob 테이블에 upsert (버전 키 기준 멱등).
+        """
+        await pg_saver.aput(
             config=tuple_data.config,
             checkpoint=tuple_data.checkpoint,
             metadata=tuple_data.metadata,
-            new_versions={},
+            new_versions=tuple_data.checkpoint.get("channel_versions", {}),
         )
 
-        # Channel writes도 동기화
-        if tuple_data.pending_writes:
-            for task_id, channel, value in tuple_data.pending_writes:
-                await self._pg_saver.aput_writes(
-                    config=tuple_data.config,
-                    writes=[(channel, value)],
-                    task_id=task_id,
-                )
+        # Channel writes도 동기화 (task 단위로 묶어서 executemany 1회)
+        writes_by_task: dict[str, list[tuple[str, Any]]] = {}
+        for task_id, channel, value in tuple_data.pending_writes or []:
+            writes_by_task.setdefault(task_id, []).append((channel, value))
+        for task_id, writes in writes_by_task.items():
+            await pg_saver.aput_writes(
+                config=tuple_data.config,
+                writes=writes,
+                task_id=task_id,
+            )
+
+    def _record_batch(self, duration: float, synced: int) -> None:
+        """Prometheus sync 배치 메트릭 기록."""
+        try:
+            from chat_worker.infrastructure.metrics import (
+                CHAT_CHECKPOINT_SYNC_BATCH_DURATION,
+            )
+
+            mode = "bulk" if self._bulk else "serial"
+            CHAT_CHECKPOINT_SYNC_BATCH_DURATION.labels(mode=mode).observe(duration)
+        except Exception:
+            pass  # 메트릭 실패는 무시
+        self._record_result("synced", synced)
+
+    @staticmethod
+    def _record_result(result: str, count: int = 1) -> None:
+        """Prometheus sync 결과 메트릭 기록 (synced, expired, error)."""
+        if count <= 0:
+            return
+        try:
+            from chat_worker.infrastructure.metrics import CHAT_CHECKPOINT_SYNC_TOTAL
 
-        return True
+            CHAT_CHECKPOINT_SYNC_TOTAL.labels(result=result).inc(count)
+        except Exception:
+            pass  # 메트릭 실패는 무시
 
     async def _send_to_dlq(self, event: dict) -> None:
         """실패한 이벤트를 DLQ로 이동."""
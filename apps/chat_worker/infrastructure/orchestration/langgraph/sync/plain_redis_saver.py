@@ -9,14 +9,24 @@ LangGraph BaseCheckpointSaver 인터페이스를 구현.
 Key 구조:
 ```
 cp:{thread_id}:{checkpoint_ns}:{checkpoint_id}       → Hash (checkpoint + metadata)
+cp:blob:{thread_id}:{checkpoint_ns}:{channel}:{version} → String (channel 값, raw bytes)
 cp:writes:{thread_id}:{checkpoint_ns}:{checkpoint_id}:{task_id} → Hash (pending writes)
+cp:writes_idx:{thread_id}:{checkpoint_ns}:{checkpoint_id}   → Set (pending writes task_id 인덱스)
 cp:latest:{thread_id}:{checkpoint_ns}                → String (latest checkpoint_id)
 cp:history:{thread_id}:{checkpoint_ns}               → Sorted Set (checkpoint_id by ts)
 ```
+
+저장 포맷 (format=2):
+- 값은 "type_tag\\x00raw_bytes" 바이너리로 저장 (base64 없음)
+- checkpoint Hash에는 channel_values를 뺀 본문만 저장
+- channel 값은 (channel, version) 주소의 blob으로 분리, new_versions에 포함된
+  (버전이 바뀐) channel만 기록 → 조회 시 channel_versions로 blob을 모아 재조립
+- format 필드가 없는 legacy checkpoint("type_tag:base64" 전체 저장)도 그대로 조회 가능
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import logging
@@ -35,6 +45,35 @@ from redis.asyncio import Redis
 
 logger = logging.getLogger(__name__)
 
+# Checkpoint Hash 필드: pending writes가 인덱스(Set)로 관리됨을 표시
+# 필드가 없는 legacy checkpoint는 SCAN으로 조회 (TTL 만료 시 자연 소멸)
+WRITES_INDEXED_FIELD = "writes_indexed"
+
+# Checkpoint Hash 필드: 저장 포맷 버전 (없으면 legacy base64 전체 저장)
+FORMAT_FIELD = "format"
+FORMAT_BLOB = "2"
+
+# channel_versions에는 있지만 channel_values에 없는 channel (빈 channel) 표시
+EMPTY_TYPE = "empty"
+
+# checkpoint_id(미지정 시 latest pointer) + pending writes task 수를 1회 왕복으로 조회
+# KEYS[1]: latest key, ARGV[1]: checkpoint_id ("" = latest), ARGV[2]: writes 인덱스 키 prefix
+LATEST_STATE_SCRIPT = """
+local checkpoint_id = ARGV[1]
+if checkpoint_id == '' then
+    checkpoint_id = redis.call('GET', KEYS[1])
+    if not checkpoint_id then
+        return {false, 0}
+    end
+end
+return {checkpoint_id, redis.call('SCARD', ARGV[2] .. checkpoint_id)}
+"""
+
+
+def _to_str(value: bytes | str) -> str:
+    """Redis 응답(bytes) → str."""
+    return value.decode() if isinstance(value, bytes) else value
+
 
 class PlainAsyncRedisSaver(BaseCheckpointSaver):
     """LangGraph checkpointer using standard Redis commands only.
@@ -56,13 +95,16 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
         self._redis_url = redis_url
         self._ttl_seconds = (ttl.get("default_ttl", 1440) * 60) if ttl else 86400
         self._redis: Optional[Redis] = None
+        self._latest_state_script: Any = None
 
     async def asetup(self) -> None:
-        """Redis 연결 초기화 (RediSearch 불필요)."""
+        """Redis 연결 초기화 (RediSearch 불필요).
+
+        checkpoint/blob을 raw bytes로 저장하므로 decode_responses=False.
+        """
         self._redis = Redis.from_url(
             self._redis_url,
-            encoding="utf-8",
-            decode_responses=True,
+            decode_responses=False,
             max_connections=20,
             socket_timeout=10.0,
             socket_connect_timeout=5.0,
@@ -72,6 +114,31 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
         await self._redis.ping()
         logger.info("PlainAsyncRedisSaver connected (ttl=%ds)", self._ttl_seconds)
 
+    async def aget_latest_id(self, thread_id: str, checkpoint_ns: str = "") -> Optional[str]:
+        """Latest pointer가 가리키는 checkpoint_id 조회 (GET 1회)."""
+        assert self._redis is not None, "Call asetup() first"
+
+        checkpoint_id = await self._redis.get(self._latest_key(thread_id, checkpoint_ns))
+        return _to_str(checkpoint_id) if checkpoint_id else None
+
+    async def aget_latest_state(
+        self, thread_id: str, checkpoint_ns: str = "", checkpoint_id: str | None = None
+    ) -> tuple[Optional[str], int]:
+        """(checkpoint_id, pending writes task 수) 조회 (Lua Script 1회).
+
+        checkpoint_id 미지정 시 latest pointer가 가리키는 checkpoint 기준.
+        인덱스 이전 legacy writes는 세지 않음 (새 aput_writes는 항상 인덱스에 기록).
+        """
+        assert self._redis is not None, "Call asetup() first"
+
+        if self._latest_state_script is None:
+            self._latest_state_script = self._redis.register_script(LATEST_STATE_SCRIPT)
+        resolved_id, writes_count = await self._latest_state_script(
+            keys=[self._latest_key(thread_id, checkpoint_ns)],
+            args=[checkpoint_id or "", self._writes_index_key(thread_id, checkpoint_ns, "")],
+        )
+        return (_to_str(resolved_id) if resolved_id else None), int(writes_count)
+
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Checkpoint 조회 (thread_id + checkpoint_ns 기준 latest).
 
@@ -90,20 +157,37 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
 
         # checkpoint_id가 없으면 latest 조회
         if not checkpoint_id:
-            latest_key = self._latest_key(thread_id, checkpoint_ns)
-            checkpoint_id = await self._redis.get(latest_key)
+            checkpoint_id = await self.aget_latest_id(thread_id, checkpoint_ns)
             if not checkpoint_id:
                 return None
 
         # Checkpoint 데이터 조회
         cp_key = self._checkpoint_key(thread_id, checkpoint_ns, checkpoint_id)
-        data = await self._redis.hgetall(cp_key)
-        if not data:
+        raw = await self._redis.hgetall(cp_key)
+        if not raw:
             return None
+        data = {_to_str(field): value for field, value in raw.items()}
+
+        if data.get(WRITES_INDEXED_FIELD):
+            writes_coro = self._get_pending_writes(thread_id, checkpoint_ns, checkpoint_id)
+        else:
+            writes_coro = self._scan_pending_writes(thread_id, checkpoint_ns, checkpoint_id)
+
+        if _to_str(data.get(FORMAT_FIELD, b"")) == FORMAT_BLOB:
+            checkpoint = self._loads_bin(data["checkpoint"])
+            metadata = self._loads_bin(data["metadata"]) if data.get("metadata") else {}
+            # channel blob + pending writes 동시 조회
+            channel_values, pending_writes = await asyncio.gather(
+                self._load_blobs(thread_id, checkpoint_ns, checkpoint.get("channel_versions", {})),
+                writes_coro,
+            )
+            checkpoint["channel_values"] = channel_values
+        else:
+            checkpoint = self._deserialize(_to_str(data["checkpoint"]))
+            metadata = self._deserialize(_to_str(data["metadata"])) if data.get("metadata") else {}
+            pending_writes = await writes_coro
 
-        checkpoint = self._deserialize(data["checkpoint"])
-        metadata = self._deserialize(data["metadata"]) if data.get("metadata") else {}
-        parent_checkpoint_id = data.get("parent_checkpoint_id")
+        parent_checkpoint_id = _to_str(data.get("parent_checkpoint_id", b""))
 
         # Parent config
         parent_config = None
@@ -116,9 +200,6 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
                 }
             }
 
-        # Pending writes 조회
-        pending_writes = await self._get_pending_writes(thread_id, checkpoint_ns, checkpoint_id)
-
         return CheckpointTuple(
             config={
                 "configurable": {
@@ -140,7 +221,11 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
         metadata: CheckpointMetadata,
         new_versions: ChannelVersions,
     ) -> RunnableConfig:
-        """Checkpoint 저장."""
+        """Checkpoint 저장.
+
+        new_versions에 포함된 channel만 blob으로 기록.
+        new_versions가 비어 있으면 (PG promote 등) 전체 channel 기록.
+        """
         assert self._redis is not None, "Call asetup() first"
 
         configurable = config.get("configurable", {})
@@ -153,18 +238,45 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
         latest_key = self._latest_key(thread_id, checkpoint_ns)
         history_key = self._history_key(thread_id, checkpoint_ns)
 
-        # Checkpoint 데이터 저장
+        channel_values = checkpoint.get("channel_values", {})
+        channel_versions = checkpoint.get("channel_versions", {})
+        changed = new_versions or channel_versions
+        body = {**checkpoint, "channel_values": {}}
+
         pipe = self._redis.pipeline()
+
+        # 1. 변경된 channel blob 저장
+        for channel, version in changed.items():
+            pipe.set(
+                self._blob_key(thread_id, checkpoint_ns, channel, version),
+                self._dumps_channel(channel_values, channel),
+                ex=self._ttl_seconds,
+            )
+
+        # 2. 변경되지 않은 channel blob TTL 연장 (참조 중인 blob이 먼저 만료되지 않도록)
+        unchanged = [
+            (channel, version)
+            for channel, version in channel_versions.items()
+            if channel not in changed
+        ]
+        for channel, version in unchanged:
+            pipe.expire(
+                self._blob_key(thread_id, checkpoint_ns, channel, version), self._ttl_seconds
+            )
+
+        # 3. Checkpoint 본문 저장
         pipe.hset(
             cp_key,
             mapping={
-                "checkpoint": self._serialize(checkpoint),
-                "metadata": self._serialize(metadata),
+                "checkpoint": self._dumps_bin(body),
+                "metadata": self._dumps_bin(metadata),
                 "parent_checkpoint_id": parent_checkpoint_id or "",
                 "thread_id": thread_id,
                 "checkpoint_ns": checkpoint_ns,
                 "checkpoint_id": checkpoint_id,
                 "created_at": str(time.time()),
+                FORMAT_FIELD: FORMAT_BLOB,
+                WRITES_INDEXED_FIELD: "1",
             },
         )
         pipe.expire(cp_key, self._ttl_seconds)
@@ -178,7 +290,21 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
         pipe.zadd(history_key, {checkpoint_id: score})
         pipe.expire(history_key, self._ttl_seconds)
 
-        await pipe.execute()
+        results = await pipe.execute()
+
+        # 이전 checkpoint가 legacy 포맷이면 변경되지 않은 channel blob이 없음 → 보충 기록
+        expired = results[len(changed) : len(changed) + len(unchanged)]
+        missing = [cv for cv, ok in zip(unchanged, expired) if not ok]
+        if missing:
+            pipe = self._redis.pipeline()
+            for channel, version in missing:
+                pipe.set(
+                    self._blob_key(thread_id, checkpoint_ns, channel, version),
+                    self._dumps_channel(channel_values, channel),
+                    ex=self._ttl_seconds,
+                )
+            await pipe.execute()
+            logger.debug("Backfilled %d channel blobs (thread_id=%s)", len(missing), thread_id)
 
         return {
             "configurable": {
@@ -204,15 +330,20 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
         checkpoint_id = configurable.get("checkpoint_id", "")
 
         writes_key = self._writes_key(thread_id, checkpoint_ns, checkpoint_id, task_id)
+        index_key = self._writes_index_key(thread_id, checkpoint_ns, checkpoint_id)
 
         pipe = self._redis.pipeline()
         for idx, (channel, value) in enumerate(writes):
             pipe.hset(
                 writes_key,
                 f"{idx}:{channel}",
-                self._serialize({"channel": channel, "value": value}),
+                self._dumps_bin({"channel": channel, "value": value}),
             )
         pipe.expire(writes_key, self._ttl_seconds)
+
+        # Checkpoint별 task_id 인덱스 (조회 시 keyspace SCAN 불필요)
+        pipe.sadd(index_key, task_id)
+        pipe.expire(index_key, self._ttl_seconds)
         await pipe.execute()
 
     async def alist(
@@ -257,7 +388,7 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
                 "configurable": {
                     "thread_id": thread_id,
                     "checkpoint_ns": checkpoint_ns,
-                    "checkpoint_id": cp_id,
+                    "checkpoint_id": _to_str(cp_id),
                 }
             }
             result = await self.aget_tuple(cp_config)
@@ -279,10 +410,18 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
     def _checkpoint_key(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
         return f"cp:{thread_id}:{checkpoint_ns}:{checkpoint_id}"
 
+    @staticmethod
+    def _blob_key(thread_id: str, checkpoint_ns: str, channel: str, version: Any) -> str:
+        return f"cp:blob:{thread_id}:{checkpoint_ns}:{channel}:{version}"
+
     @staticmethod
     def _writes_key(thread_id: str, checkpoint_ns: str, checkpoint_id: str, task_id: str) -> str:
         return f"cp:writes:{thread_id}:{checkpoint_ns}:{checkpoint_id}:{task_id}"
 
+    @staticmethod
+    def _writes_index_key(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
+        return f"cp:writes_idx:{thread_id}:{checkpoint_ns}:{checkpoint_id}"
+
     @staticmethod
     def _latest_key(thread_id: str, checkpoint_ns: str) -> str:
         return f"cp:latest:{thread_id}:{checkpoint_ns}"
@@ -306,25 +445,44 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
                 return time.time()
         return time.time()
 
-    def _serialize(self, obj: Any) -> str:
-        """객체를 직렬화 (serde로 타입 정보 보존).
+    # ─── Serialization ────────────────────────────────────────────
+
+    def _dumps_bin(self, obj: Any) -> bytes:
+        """객체를 바이너리로 직렬화 (serde로 타입 정보 보존).
 
-        JsonPlusSerializer는 msgpack 바이너리를 반환하므로,
-        Redis string 저장을 위해 base64로 인코딩.
-        포맷: "type_tag:base64_data" (예: "msgpack:xIcF9...")
+        포맷: b"type_tag\\x00raw_data" (예: b"msgpack\\x00\\x84...")
         """
         type_tag, data = self.serde.dumps_typed(obj)
-        encoded = base64.b64encode(data).decode("ascii")
-        return f"{type_tag}:{encoded}"
+        return type_tag.encode() + b"\x00" + data
+
+    def _loads_bin(self, raw: bytes) -> Any:
+        """_dumps_bin 포맷 역직렬화."""
+        type_tag, _, data = raw.partition(b"\x00")
+        return self.serde.loads_typed((type_tag.decode(), data))
+
+    def _dumps_channel(self, channel_values: dict[str, Any], channel: str) -> bytes:
+        """channel 값 blob 직렬화 (값이 없으면 empty 마커)."""
+        if channel not in channel_values:
+            return EMPTY_TYPE.encode() + b"\x00"
+        return self._dumps_bin(channel_values[channel])
+
+    def _loads_value(self, raw: bytes | str) -> Any:
+        """바이너리 포맷과 legacy "type_tag:base64" 포맷 자동 판별."""
+        if isinstance(raw, bytes):
+            # type_tag는 짧은 ASCII → 앞부분에 NUL 구분자가 있으면 바이너리 포맷
+            if b"\x00" in raw[:16]:
+                return self._loads_bin(raw)
+            raw = raw.decode()
+        return self._deserialize(raw)
 
     def _deserialize(self, data: str) -> Any:
-        """직렬화된 문자열을 객체로 역직렬화.
+        """Legacy 직렬화 문자열을 객체로 역직렬화.
 
         포맷 감지:
-        1. "type_tag:base64_data" → serde.loads_typed (현재 포맷)
+        1. "type_tag:base64_data" → serde.loads_typed (format 필드 도입 이전 포맷)
         2. legacy json.loads 폴백 (하위 호환)
         """
-        # 현재 포맷: "type_tag:base64_data"
+        # Legacy 포맷: "type_tag:base64_data"
         if ":" in data:
             type_tag, encoded = data.split(":", 1)
             if type_tag in ("msgpack", "json"):
@@ -340,22 +498,79 @@ class PlainAsyncRedisSaver(BaseCheckpointSaver):
             logger.warning("Checkpoint deserialize fallback to raw string: %s", data[:100])
             return data
 
+    async def _load_blobs(
+        self, thread_id: str, checkpoint_ns: str, channel_versions: dict[str, Any]
+    ) -> dict[str, Any]:
+        """channel_versions 기준 blob MGET → channel_values 재조립."""
+        assert self._redis is not None
+        if not channel_versions:
+            return {}
+
+        channels = list(channel_versions)
+        raws = await self._redis.mget(
+            [self._blob_key(thread_id, checkpoint_ns, ch, channel_versions[ch]) for ch in channels]
+        )
+
+        channel_values: dict[str, Any] = {}
+        for channel, raw in zip(channels, raws):
+            if raw is None:
+                logger.warning(
+                    "Checkpoint blob missing (thread_id=%s, channel=%s)", thread_id, channel
+                )
+                continue
+            if raw.startswith(EMPTY_TYPE.encode() + b"\x00"):
+                continue
+            channel_values[channel] = self._loads_bin(raw)
+        return channel_values
+
     async def _get_pending_writes(
         self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
     ) -> list[tuple[str, str, Any]]:
-        """Pending writes 조회."""
+        """Pending writes 조회 (task_id 인덱스 기반).
+
+        SMEMBERS 1회 + HGETALL pipeline 1회 → 전체 keyspace 크기와 무관하게
+        해당 checkpoint의 writes 수에만 비례.
+        """
+        assert self._redis is not None
+        index_key = self._writes_index_key(thread_id, checkpoint_ns, checkpoint_id)
+        task_ids = sorted(_to_str(t) for t in await self._redis.smembers(index_key))
+        if not task_ids:
+            return []
+
+        pipe = self._redis.pipeline()
+        for task_id in task_ids:
+            pipe.hgetall(self._writes_key(thread_id, checkpoint_ns, checkpoint_id, task_id))
+        results = await pipe.execute()
+
+        writes: list[tuple[str, str, Any]] = []
+        for task_id, data in zip(task_ids, results):
+            writes.extend(self._decode_writes(task_id, data))
+        return writes
+
+    async def _scan_pending_writes(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> list[tuple[str, str, Any]]:
+        """Pending writes 조회 (legacy: 인덱스 이전에 저장된 checkpoint용 SCAN)."""
         assert self._redis is not None
         pattern = self._writes_key(thread_id, checkpoint_ns, checkpoint_id, "*")
         writes: list[tuple[str, str, Any]] = []
 
         async for key in self._redis.scan_iter(match=pattern, count=100):
             # key에서 task_id 추출
-            parts = key.rsplit(":", 1)
+            parts = _to_str(key).rsplit(":", 1)
             task_id = parts[-1] if len(parts) > 1 else ""
 
             data = await self._redis.hgetall(key)
-            for _field, value_json in sorted(data.items()):
-                entry = self._deserialize(value_json)
-                writes.append((task_id, entry["channel"], entry["value"]))
+            writes.extend(self._decode_writes(task_id, data))
+
+        return writes
 
+    def _decode_writes(
+        self, task_id: str, data: dict[bytes | str, bytes | str]
+    ) -> list[tuple[str, str, Any]]:
+        """writes Hash → (task_id, channel, value) 목록."""
+        writes: list[tuple[str, str, Any]] = []
+        for _field, value in sorted(data.items()):
+            entry = self._loads_value(value)
+            writes.append((task_id, entry["channel"], entry["value"]))
         return writes
@@ -10,17 +10,28 @@ Temporal Locality (시간적 지역성) 원리:
 아키텍처:
 ```
 graph.ainvoke() → ReadThroughCheckpointer
-                    ├─ aget_tuple(): Redis hit → 즉시 반환
+                    ├─ aget_tuple(): Local LRU hit (latest + writes 검증) → 즉시 반환
+                    │                Redis hit → 즉시 반환
                     │                Redis miss → PG read → Redis write-back → 반환
-                    ├─ aput(): SyncableRedisSaver (변경 없음)
+                    ├─ aput(): SyncableRedisSaver (+ thread의 local 항목 무효화)
                     └─ alist(): Redis first, PG fallback
 ```
+
+Local LRU (선택, local_cache_max_bytes > 0):
+- 한 턴 동안 같은 thread의 최신 checkpoint를 반복 조회 → 프로세스 내 캐시로 서빙
+- 키: (thread_id, checkpoint_ns, checkpoint_id), 값: serde 직렬화 bytes (호출자 간 공유 객체 없음)
+- pending writes가 없는 checkpoint만 적재
+- 서빙 전 Redis에서 latest pointer + pending writes 인덱스 크기를 함께 검증 (Lua 1회)
+  → 다른 worker의 aput(latest 변경)/aput_writes(같은 checkpoint에 writes 추가) 모두 감지
+  (HGETALL + MGET + pending writes 조회 생략)
+- 직렬화 바이트 합계 기준 LRU eviction
 """
 
 from __future__ import annotations
 
 import logging
 import time
+from collections import OrderedDict
 from typing import Any, AsyncIterator, Optional, Sequence
 
 from langchain_core.runnables import RunnableConfig
@@ -35,6 +46,96 @@ from langgraph.checkpoint.base import (
 logger = logging.getLogger(__name__)
 
 
+class _CheckpointLRU:
+    """직렬화 바이트 합계로 제한되는 checkpoint LRU.
+
+    값은 serde로 직렬화하여 보관 → 조회마다 새 객체로 복원
+    (LangGraph channel이 checkpoint 값을 in-place 변경해도 캐시 오염 없음).
+    """
+
+    def __init__(self, serde: Any, max_bytes: int):
+        self._serde = serde
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str, str], tuple[dict, tuple[str, bytes]]] = (
+            OrderedDict()
+        )
+        self._by_thread: dict[tuple[str, str], set[str]] = {}
+        self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> CheckpointTuple | None:
+        key = (thread_id, checkpoint_ns, checkpoint_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+
+        configs, payload = entry
+        data = self._serde.loads_typed(payload)
+        return CheckpointTuple(
+            config=configs["config"],
+            checkpoint=data["checkpoint"],
+            metadata=data["metadata"],
+            parent_config=configs["parent_config"],
+            pending_writes=[tuple(write) for write in data["pending_writes"]],
+        )
+
+    def put(self, item: CheckpointTuple) -> None:
+        # pending writes는 다른 worker가 추가할 수 있어 적재하지 않음 (빈 인덱스로 검증)
+        if item.pending_writes:
+            return
+        configurable = item.config.get("configurable", {})
+        thread_id = configurable.get("thread_id", "")
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = configurable.get("checkpoint_id") or item.checkpoint.get("id")
+        if not thread_id or not checkpoint_id:
+            return
+
+        payload = self._serde.dumps_typed(
+            {
+                "checkpoint": item.checkpoint,
+                "metadata": item.metadata,
+                "pending_writes": [list(write) for write in item.pending_writes or []],
+            }
+        )
+        size = len(payload[1])
+        if size > self._max_bytes:
+            return
+
+        key = (thread_id, checkpoint_ns, checkpoint_id)
+        self._remove(key)
+        configs = {"config": item.config, "parent_config": item.parent_config}
+        self._entries[key] = (configs, payload)
+        self._by_thread.setdefault((thread_id, checkpoint_ns), set()).add(checkpoint_id)
+        self.size_bytes += size
+
+        while self.size_bytes > self._max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str | None = None
+    ) -> None:
+        """checkpoint_id 지정 시 해당 항목만, 아니면 thread의 전체 항목 제거."""
+        if checkpoint_id is not None:
+            self._remove((thread_id, checkpoint_ns, checkpoint_id))
+            return
+        for cp_id in list(self._by_thread.get((thread_id, checkpoint_ns), ())):
+            self._remove((thread_id, checkpoint_ns, cp_id))
+
+    def _remove(self, key: tuple[str, str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.size_bytes -= len(entry[1][1])
+        ids = self._by_thread.get(key[:2])
+        if ids is not None:
+            ids.discard(key[2])
+            if not ids:
+                del self._by_thread[key[:2]]
+
+
 class ReadThroughCheckpointer(BaseCheckpointSaver):
     """Redis Primary + PostgreSQL Read-Through Checkpointer.
 
@@ -44,29 +145,48 @@ class ReadThroughCheckpointer(BaseCheckpointSaver):
     Worker의 primary checkpointer로 사용.
     PostgreSQL pool은 read-only, 소규모 (max_size=2).
     Cold start (Redis TTL 만료 세션)에만 PG 접근.
+
+    Args:
+        redis_saver: SyncableRedisSaver
+        pg_saver: AsyncPostgresSaver (read-only)
+        local_cache_max_bytes: 프로세스 내 LRU 최대 바이트 (0이면 비활성화)
     """
 
     def __init__(
         self,
         redis_saver: Any,  # SyncableRedisSaver
         pg_saver: Any,  # AsyncPostgresSaver (read-only)
+        local_cache_max_bytes: int = 0,
     ):
         super().__init__()
         self._redis_saver = redis_saver
         self._pg_saver = pg_saver
         self._promote_count = 0
         self._miss_count = 0
+        self._local_cache = (
+            _CheckpointLRU(self.serde, local_cache_max_bytes) if local_cache_max_bytes > 0 else None
+        )
+        self._local_hit_count = 0
+        self._local_miss_count = 0
 
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Checkpoint 조회 (Read-Through with LRU promotion).
 
+        0. Local LRU 조회 (활성화 시, latest pointer 검증)
         1. Redis에서 조회 (hot path, ~1ms)
         2. Redis miss → PostgreSQL에서 조회 (cold start, ~10-50ms)
         3. PG hit → Redis에 promote (write-back, 이후 요청은 Redis에서 서빙)
         """
+        # 0. Local LRU 조회
+        if self._local_cache is not None:
+            cached = await self._aget_tuple_local(config)
+            if cached is not None:
+                return cached
+
         # 1. Redis 조회 (primary)
         result = await self._redis_saver.aget_tuple(config)
         if result is not None:
+            self._cache_put(result)
             return result
 
         # 2. PostgreSQL fallback (cold start) with stale connection retry
@@ -114,8 +234,66 @@ class ReadThroughCheckpointer(BaseCheckpointSaver):
             # Promote 실패해도 PG 결과는 반환 (graceful degradation)
             logger.warning("Failed to promote checkpoint to Redis", exc_info=True)
 
+        self._cache_put(pg_result)
         return pg_result
 
+    async def _aget_tuple_local(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Local LRU 조회.
+
+        Redis에서 checkpoint_id(미지정 시 latest pointer)와 pending writes 수를 함께 검증
+        (다른 worker의 aput/aput_writes로 바뀐 경우 stale 항목 서빙 방지).
+        """
+        configurable = config.get("configurable", {})
+        thread_id = configurable.get("thread_id", "")
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = configurable.get("checkpoint_id")
+        if not thread_id:
+            return None
+
+        try:
+            checkpoint_id, writes_count = await self._redis_saver.aget_latest_state(
+                thread_id, checkpoint_ns, checkpoint_id
+            )
+        except Exception:
+            logger.debug("Failed to read latest checkpoint state", exc_info=True)
+            return None
+        if not checkpoint_id:
+            # Redis 만료 → 일반 경로 (PG fallback)
+            return None
+
+        if writes_count:
+            # 적재 이후 writes가 추가됨 → 항목 폐기, Redis에서 전체 조회
+            self._local_cache.invalidate(thread_id, checkpoint_ns, checkpoint_id)
+            result = None
+        else:
+            result = self._local_cache.get(thread_id, checkpoint_ns, checkpoint_id)
+        if result is None:
+            self._local_miss_count += 1
+            self._record_local_cache("miss")
+        else:
+            self._local_hit_count += 1
+            self._record_local_cache("hit")
+        return result
+
+    def _cache_put(self, item: CheckpointTuple) -> None:
+        """Local LRU 적재 (캐시 실패는 조회 결과에 영향 없음)."""
+        if self._local_cache is None:
+            return
+        try:
+            self._local_cache.put(item)
+        except Exception:
+            logger.debug("Failed to cache checkpoint locally", exc_info=True)
+
+    def _cache_invalidate(self, config: RunnableConfig, checkpoint_id: str | None = None) -> None:
+        if self._local_cache is None:
+            return
+        configurable = config.get("configurable", {})
+        self._local_cache.invalidate(
+            configurable.get("thread_id", ""),
+            configurable.get("checkpoint_ns", ""),
+            checkpoint_id,
+        )
+
     async def _aget_tuple_pg_with_retry(
         self, config: RunnableConfig, max_retries: int = 1
     ) -> Optional[CheckpointTuple]:
@@ -154,7 +332,11 @@ class ReadThroughCheckpointer(BaseCheckpointSaver):
         metadata: CheckpointMetadata,
         new_versions: ChannelVersions,
     ) -> RunnableConfig:
-        """Checkpoint 저장 (SyncableRedisSaver에 위임)."""
+        """Checkpoint 저장 (SyncableRedisSaver에 위임).
+
+        latest가 바뀌므로 thread의 local 항목 전체 무효화.
+        """
+        self._cache_invalidate(config)
         return await self._redis_saver.aput(config, checkpoint, metadata, new_versions)
 
     async def aput_writes(
@@ -164,7 +346,13 @@ class ReadThroughCheckpointer(BaseCheckpointSaver):
         task_id: str,
         task_path: str = "",
     ) -> None:
-        """Channel writes 저장 (SyncableRedisSaver에 위임)."""
+        """Channel writes 저장 (SyncableRedisSaver에 위임).
+
+        해당 checkpoint의 pending_writes가 바뀌므로 local 항목 무효화.
+        """
+        checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
+        if checkpoint_id:
+            self._cache_invalidate(config, checkpoint_id)
         await self._redis_saver.aput_writes(config, writes, task_id, task_path)
 
     async def alist(
@@ -199,10 +387,14 @@ class ReadThroughCheckpointer(BaseCheckpointSaver):
         pass
 
     def get_stats(self) -> dict[str, int]:
-        """Promote/miss 통계 반환 (모니터링용)."""
+        """Promote/miss + local LRU 통계 반환 (모니터링용)."""
         return {
             "promote_count": self._promote_count,
             "miss_count": self._miss_count,
+            "local_hit_count": self._local_hit_count,
+            "local_miss_count": self._local_miss_count,
+            "local_entries": len(self._local_cache) if self._local_cache is not None else 0,
+            "local_bytes": self._local_cache.size_bytes if self._local_cache is not None else 0,
         }
 
     def _record_promote(self, duration: float) -> None:
@@ -218,6 +410,17 @@ class ReadThroughCheckpointer(BaseCheckpointSaver):
         except Exception:
             pass  # 메트릭 실패는 무시
 
+    def _record_local_cache(self, result: str) -> None:
+        """Prometheus local LRU hit/miss 메트릭 기록."""
+        try:
+            from chat_worker.infrastructure.metrics import (
+                CHAT_CHECKPOINT_LOCAL_CACHE_TOTAL,
+            )
+
+            CHAT_CHECKPOINT_LOCAL_CACHE_TOTAL.labels(result=result).inc()
+        except Exception:
+            pass  # 메트릭 실패는 무시
+
     def _record_cold_miss(self) -> None:
         """Prometheus cold miss 메트릭 기록."""
         try:
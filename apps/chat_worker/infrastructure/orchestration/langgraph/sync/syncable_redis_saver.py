@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from typing import Any, Sequence
 
 from langchain_core.runnables import RunnableConfig
@@ -68,6 +69,7 @@ class SyncableRedisSaver(PlainAsyncRedisSaver):
                     "thread_id": thread_id,
                     "checkpoint_ns": checkpoint_ns,
                     "checkpoint_id": checkpoint_id,
+                    "ts": time.time(),  # 큐 적재 시각 (syncer lag 측정)
                 }
             )
             await self._redis.lpush(SYNC_QUEUE_KEY, event)
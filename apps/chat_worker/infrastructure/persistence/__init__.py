@@ -0,0 +1,4 @@
+"""Persistence Infrastructure - 영속 상태 저장 구현체들.
+
+- eval/: Eval Pipeline 결과/상태 저장 (Redis, PostgreSQL)
+"""
@@ -0,0 +1,11 @@
+"""Eval Persistence - Eval Pipeline 저장소 구현체들.
+
+Port 매핑:
+- DriftStateGateway → RedisDriftStateAdapter
+"""
+
+from chat_worker.infrastructure.persistence.eval.redis_drift_state_adapter import (
+    RedisDriftStateAdapter,
+)
+
+__all__ = ["RedisDriftStateAdapter"]
@@ -0,0 +1,97 @@
+"""Redis Drift State Adapter - DriftStateGateway 구현체.
+
+축별 CUSUM 누적합을 Redis Hash 하나에 저장합니다.
+
+- 갱신: Lua Script 1회 (축별 S⁺/S⁻/표본 수 원자적 read-modify-write)
+- 조회: HGETALL 1회 (전체 축)
+- 초기화: DEL
+
+Hash 필드: "{axis}:pos", "{axis}:neg", "{axis}:n"
+
+Port: application/ports/eval/drift_state_gateway.py
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+DRIFT_STATE_KEY = "chat:eval:cusum"
+
+# ARGV[1]: μ₀, ARGV[2]: k, ARGV[3..]: axis, score 쌍
+CUSUM_UPDATE_SCRIPT = """
+local key = KEYS[1]
+local mean = tonumber(ARGV[1])
+local slack = tonumber(ARGV[2])
+for i = 3, #ARGV, 2 do
+    local axis = ARGV[i]
+    local x = tonumber(ARGV[i + 1])
+    local pos = tonumber(redis.call('HGET', key, axis .. ':pos') or '0')
+    local neg = tonumber(redis.call('HGET', key, axis .. ':neg') or '0')
+    pos = math.max(0, pos + (x - mean - slack))
+    neg = math.max(0, neg + (mean - x - slack))
+    redis.call('HSET', key, axis .. ':pos', tostring(pos), axis .. ':neg', tostring(neg))
+    redis.call('HINCRBY', key, axis .. ':n', 1)
+end
+return 1
+"""
+
+_FIELD_NAMES = {"pos": "cusum_positive", "neg": "cusum_negative", "n": "sample_count"}
+
+
+class RedisDriftStateAdapter:
+    """Redis Hash 기반 축별 CUSUM 누적 상태."""
+
+    def __init__(self, redis: "Redis", key: str = DRIFT_STATE_KEY):
+        """초기화.
+
+        Args:
+            redis: Redis 클라이언트 (decode_responses=True)
+            key: 누적 상태 Hash 키
+        """
+        self._redis = redis
+        self._key = key
+        self._update_script: Any = None
+
+    async def update_cusum(
+        self,
+        axis_scores: dict[str, float],
+        expected_mean: float,
+        slack: float,
+    ) -> None:
+        """점수 1건으로 축별 누적합 갱신 (Lua Script 1회)."""
+        if not axis_scores:
+            return
+        if self._update_script is None:
+            self._update_script = self._redis.register_script(CUSUM_UPDATE_SCRIPT)
+        args: list[str] = [repr(float(expected_mean)), repr(float(slack))]
+        for axis, score in axis_scores.items():
+            args.extend((axis, repr(float(score))))
+        await self._update_script(keys=[self._key], args=args)
+
+    async def get_cusum_state(self) -> dict[str, dict[str, float]]:
+        """전체 축 누적 상태 조회 (HGETALL 1회)."""
+        raw = await self._redis.hgetall(self._key)
+        state: dict[str, dict[str, float]] = {}
+        for field, value in (raw or {}).items():
+            axis, _, suffix = field.rpartition(":")
+            name = _FIELD_NAMES.get(suffix)
+            if not axis or name is None:
+                continue
+            try:
+                state.setdefault(axis, {})[name] = float(value)
+            except (TypeError, ValueError):
+                logger.warning("Invalid CUSUM state field", extra={"field": field})
+        return state
+
+    async def reset_cusum(self) -> None:
+        """누적 상태 삭제."""
+        await self._redis.delete(self._key)
+
+
+__all__ = ["DRIFT_STATE_KEY", "CUSUM_UPDATE_SCRIPT", "RedisDriftStateAdapter"]
@@ -0,0 +1,74 @@
+"""Keyword Matcher - 다중 패턴 부분 문자열 매칭 (Aho-Corasick).
+
+패턴 수와 무관하게 텍스트를 한 번만 훑어서 포함된 패턴을 모두 찾습니다.
+`pattern in text`를 패턴마다 반복하는 O(패턴 수 x 텍스트 길이) 루프 대체용.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Generic, Hashable, Iterable, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+class KeywordMatcher(Generic[T]):
+    """Aho-Corasick 오토마톤 (빌드 후 읽기 전용).
+
+    패턴마다 값(value)을 붙여 두고, 텍스트에 부분 문자열로 포함된
+    패턴들의 값 집합을 반환합니다. 같은 값에 여러 패턴(표기 변형)을 붙일 수 있습니다.
+    """
+
+    def __init__(self, patterns: Iterable[tuple[str, T]]) -> None:
+        """초기화.
+
+        Args:
+            patterns: (패턴, 값) 목록. 대소문자 정규화는 호출 측 책임
+        """
+        # 상태 i: 다음 문자 → 상태, 실패 링크, 출력 값 (실패 링크 출력 병합)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[frozenset[T]] = []
+        outputs: list[set[T]] = [set()]
+
+        for pattern, value in patterns:
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = nxt
+            outputs[state].add(value)
+
+        # BFS로 실패 링크 계산 (짧은 상태부터)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                outputs[nxt] |= outputs[self._fail[nxt]]
+
+        self._out = [frozenset(values) for values in outputs]
+
+    def find(self, text: str) -> set[T]:
+        """텍스트에 포함된 패턴의 값 집합을 반환합니다."""
+        goto, fail, out = self._goto, self._fail, self._out
+        # 빈 패턴은 모든 텍스트에 포함 (`"" in text`)
+        found: set[T] = set(out[0])
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found |= out[state]
+        return found
@@ -5,6 +5,11 @@ Anthropic Contextual Retrieval 패턴 적용:
 - situation_tags.yaml: 상황 태그 (약 100개)
 
 참조: docs/foundations/27-rag-evaluation-strategy.md (3.3절 Contextual Retrieval)
+
+초기화 시 인덱스 빌드:
+- 품목명/상황 태그 표기 변형 → Aho-Corasick 매처 (메시지 1회 스캔으로 태그 추출)
+- 규정 문서 → 소문자 JSON 텍스트 (쿼리마다 json.dumps 반복 제거)
+- 태그(품목명 + 상황 태그) → 규정 문서 역색인
 """
 
 from __future__ import annotations
@@ -23,6 +28,7 @@ from chat_worker.application.ports.retrieval import (
     RetrievalContext,
     RetrieverPort,
 )
+from chat_worker.infrastructure.retrieval.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +116,7 @@ class TagBasedRetriever(RetrieverPort):
         self._item_index = _build_item_index()
         self._situation_tags = _load_situation_tags()
         self._load_data()
+        self._build_indexes()
 
         logger.info(
             "TagBasedRetriever initialized",
@@ -137,6 +144,47 @@ class TagBasedRetriever(RetrieverPort):
             except Exception as e:
                 logger.error(f"Failed to load {json_file}: {e}")
 
+    def _build_indexes(self) -> None:
+        """태그 매처, 문서 텍스트, 태그 → 문서 역색인 빌드."""
+        # 품목: 정규화 메시지(공백 제거)에서 검색, 값 = _item_index 순서
+        self._items = list(self._item_index)
+        self._item_matcher: KeywordMatcher[int] = KeywordMatcher(
+            (item, i) for i, item in enumerate(self._items)
+        )
+
+        # 상황 태그: 소문자 메시지에서 표기 변형(언더스코어 → 공백/없음) 검색, 값 = 태그 순서
+        self._situation_matcher: KeywordMatcher[int] = KeywordMatcher(
+            (variant, i)
+            for i, tag in enumerate(self._situation_tags)
+            for variant in {
+                tag.lower(),
+                tag.lower().replace("_", " "),
+                tag.lower().replace("_", ""),
+            }
+        )
+
+        # 규정 문서 소문자 텍스트 (키워드 검색/역색인 미등록 태그용)
+        self._keys_lower = {key: key.lower() for key in self._data}
+        self._texts = {
+            key: json.dumps(data, ensure_ascii=False).lower() for key, data in self._data.items()
+        }
+        self._doc_order = {key: i for i, key in enumerate(self._data)}
+
+        # 태그 → 문서 역색인 (태그 어휘 전체를 문서마다 1회 스캔)
+        vocabulary = set(self._items) | {tag.lower() for tag in self._situation_tags}
+        vocabulary_matcher: KeywordMatcher[str] = KeywordMatcher((t, t) for t in vocabulary)
+        self._tag_docs: dict[str, set[str]] = {tag: set() for tag in vocabulary}
+        for key, text in self._texts.items():
+            for tag in vocabulary_matcher.find(text):
+                self._tag_docs[tag].add(key)
+
+    def _docs_with_tag(self, tag_lower: str) -> set[str]:
+        """태그가 본문에 포함된 규정 문서 키 (어휘 밖 태그는 본문 직접 검색)."""
+        docs = self._tag_docs.get(tag_lower)
+        if docs is None:
+            docs = {key for key, text in self._texts.items() if tag_lower in text}
+        return docs
+
     # ========== RetrieverPort 기본 구현 ==========
 
     def search(
@@ -182,13 +230,10 @@ class TagBasedRetriever(RetrieverPort):
         keyword_lower = keyword.lower()
 
         for key, data in self._data.items():
-            if keyword_lower in key.lower():
-                results.append({"key": key, "data": data})
-                continue
-
-            data_str = json.dumps(data, ensure_ascii=False).lower()
-            if keyword_lower in data_str:
+            if keyword_lower in self._keys_lower[key] or keyword_lower in self._texts[key]:
                 results.append({"key": key, "data": data})
+                if len(results) >= limit:
+                    break
 
         return results[:limit]
 
@@ -210,29 +255,16 @@ class TagBasedRetriever(RetrieverPort):
         message_lower = message.lower()
         message_normalized = self._normalize_message(message)
 
-        # 1. 품목 태그 추출
-        matched_items = []
-        suggested_category = None
-
-        for item, (major, minor) in self._item_index.items():
-            if item in message_normalized:
-                matched_items.append(item)
-                if suggested_category is None:
-                    suggested_category = major
-
-        # 2. 상황 태그 추출
-        matched_situations = []
-        for tag in self._situation_tags:
-            # 태그 정규화 (언더스코어 → 공백/없음)
-            tag_variants = [
-                tag.lower(),
-                tag.lower().replace("_", " "),
-                tag.lower().replace("_", ""),
-            ]
-            for variant in tag_variants:
-                if variant in message_lower:
-                    matched_situations.append(tag)
-                    break
+        # 1. 품목 태그 추출 (분류체계 순서 유지, 첫 품목의 대분류를 추천)
+        matched_items = [
+            self._items[i] for i in sorted(self._item_matcher.find(message_normalized))
+        ]
+        suggested_category = self._item_index[matched_items[0]][0] if matched_items else None
+
+        # 2. 상황 태그 추출 (태그 정규화: 언더스코어 → 공백/없음)
+        matched_situations = [
+            self._situation_tags[i] for i in sorted(self._situation_matcher.find(message_lower))
+        ]
 
         logger.debug(
             "Context extracted",
@@ -277,8 +309,15 @@ class TagBasedRetriever(RetrieverPort):
             # 태그가 없으면 키워드 검색으로 폴백
             return self._fallback_keyword_search(message)
 
-        # 태그에 매칭되는 규정 검색
-        for key, data in self._data.items():
+        # 태그별 매칭 문서 (역색인)
+        tag_docs = [(tag, self._docs_with_tag(tag.lower())) for tag in all_tags]
+        candidates: set[str] = set().union(*(docs for _, docs in tag_docs))
+        if context.suggested_category:
+            candidates.update(key for key in self._data if context.suggested_category in key)
+
+        # 태그에 매칭되는 규정 검색 (후보 문서만, 문서 로딩 순서 유지)
+        for key in sorted(candidates, key=self._doc_order.__getitem__):
+            data = self._data[key]
             matched_tags = []
             relevance = "low"
             quoted_text = ""
@@ -289,11 +328,8 @@ class TagBasedRetriever(RetrieverPort):
                 relevance = "high"
 
             # 규정 내용에서 태그 검색
-            data_str = json.dumps(data, ensure_ascii=False).lower()
-
-            for tag in all_tags:
-                tag_lower = tag.lower()
-                if tag_lower in data_str:
+            for tag, docs in tag_docs:
+                if key in docs:
                     matched_tags.append(tag)
                     if relevance != "high":
                         relevance = "medium"
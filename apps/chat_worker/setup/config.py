@@ -26,6 +26,11 @@ class Settings(BaseSettings):
     # None이면 redis_url 사용 (로컬 개발용)
     redis_streams_url: str | None = None
 
+    # Token 스트리밍 병합 (notify_token_v2)
+    # N ms 경과 또는 M 글자 누적 시 한 엔트리로 발행, 0이면 토큰마다 발행
+    token_coalesce_ms: int = 100
+    token_coalesce_chars: int = 64
+
     # Checkpoint Redis TTL (분 단위, 기본 24시간)
     # Worker는 Redis에만 checkpoint 저장, syncer가 PostgreSQL로 동기화
     checkpoint_ttl_minutes: int = 1440
@@ -36,6 +41,8 @@ class Settings(BaseSettings):
     checkpoint_read_postgres_url: str | None = None
     checkpoint_read_pg_pool_min: int = 1  # cold start만 사용, 최소 pool
     checkpoint_read_pg_pool_max: int = 2  # cold start만 사용, 최대 pool
+    # 프로세스 내 hot-thread checkpoint LRU (0이면 비활성화)
+    checkpoint_local_cache_max_bytes: int = 0
 
     # Checkpoint Syncer 설정 (checkpoint_syncer 프로세스 전용)
     # Worker에서는 사용하지 않음
@@ -44,6 +51,9 @@ class Settings(BaseSettings):
     syncer_pg_pool_max_size: int = 5
     syncer_interval: float = 5.0  # 동기화 주기 (초)
     syncer_batch_size: int = 50  # 배치당 최대 checkpoint 수
+    syncer_bulk_enabled: bool = True  # 동시 fetch + 배치 단일 트랜잭션 쓰기
+    syncer_fetch_concurrency: int = 8  # bulk 모드 Redis 동시 조회 수
+    syncer_metrics_port: int = 0  # Prometheus /metrics 포트 (0이면 비활성화)
 
     # LLM Provider
     default_provider: Literal["openai", "google"] = "openai"
@@ -121,6 +131,24 @@ class Settings(BaseSettings):
     max_summary_tokens: int | None = None  # 동적 계산 (None 권장)
     keep_recent_messages: int | None = None  # 동적 계산 (None 권장)
 
+    # Intent 로컬 분류기 (문자 n-gram 선형 모델, LLM 앞단 fast path)
+    # fast_path=False면 shadow 모드: 로컬 예측은 하되 LLM 항상 호출, 일치율 메트릭만 기록
+    # chat_intent_local_agreement_total로 임계값 튜닝 후 fast_path 활성화
+    intent_local_model_enabled: bool = True
+    intent_local_fast_path: bool = False
+    intent_local_threshold: float = 0.9  # 키워드 신호 반영 후 신뢰도
+    intent_local_shadow_rate: float = 0.05  # fast path 대상 중 LLM으로도 검증할 비율
+
+    # 유사 질문 캐시 (MinHash + LSH, 프로세스 내)
+    # 표기만 다른 질문("버려?"/"버려요")의 Intent, 단일 턴 분리배출 답변 재사용
+    # 규정 에셋(assets/data/source)이 바뀌면 전체 무효화
+    semantic_cache_enabled: bool = True
+    semantic_cache_threshold: float = 0.8  # 최소 문자 3-gram Jaccard 유사도
+    semantic_cache_max_entries: int = 4096
+    # 답변 재사용은 임계값 튜닝 전까지 off (Intent 캐시만 사용)
+    semantic_answer_cache_enabled: bool = False
+    semantic_answer_cache_ttl: int = 1800  # 답변 TTL (Intent는 INTENT_CACHE_TTL)
+
     # Eval Pipeline
     enable_eval_pipeline: bool = True
     eval_mode: str = "async"  # sync, async, shadow
@@ -132,7 +160,19 @@ class Settings(BaseSettings):
     eval_max_tokens: int = 1000
     eval_self_consistency_runs: int = 3
     eval_cusum_check_interval: int = 100
+    eval_drift_status_ttl: float = 10.0  # CUSUM drift 판정 결과 캐시 TTL (초)
     eval_cost_budget_daily_usd: float = 50.0
+    # async/shadow 모드에서도 응답 전에 평가할 intent (쉼표 구분, 예: "waste,bulk_waste")
+    eval_blocking_intents: str = ""
+    eval_job_stream_maxlen: int = 10000  # 비동기 평가 작업 스트림 최대 길이
+
+    # Eval Worker 설정 (eval_worker 프로세스 전용)
+    eval_worker_batch_size: int = 10  # XREADGROUP 1회 최대 작업 수
+    eval_worker_block_ms: int = 5000  # 새 작업 대기 시간 (ms)
+    eval_worker_concurrency: int = 4  # 배치 내 동시 평가 수
+    eval_worker_claim_idle_ms: int = 300000  # 5분 이상 미확인 작업 회수 (0이면 비활성화)
+    eval_worker_claim_interval_seconds: float = 60.0  # 미확인 작업 회수 주기
+    eval_worker_metrics_port: int = 0  # Prometheus /metrics 포트 (0이면 비활성화)
 
     # Eval PostgreSQL (Cold Storage)
     # 빈 문자열이면 PG 미사용 (Redis-only)
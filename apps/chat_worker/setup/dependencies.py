@@ -23,7 +23,7 @@ from __future__ import annotations
 import logging
 import socket
 from functools import lru_cache
-from typing import Literal
+from typing import Any, Literal
 
 from redis.asyncio import Redis
 from redis.exceptions import ConnectionError as RedisConnectionError
@@ -36,9 +36,10 @@ from chat_worker.application.ports import (
     ProgressNotifierPort,
     RetrieverPort,
 )
-from chat_worker.application.ports.cache import CachePort
+from chat_worker.application.ports.cache import CachePort, SemanticCachePort
 from chat_worker.application.ports.character_client import CharacterClientPort
 from chat_worker.application.ports.input_requester import InputRequesterPort
+from chat_worker.application.ports.intent_predictor import IntentPredictorPort
 from chat_worker.application.ports.interaction_state_store import (
     InteractionStateStorePort,
 )
@@ -57,9 +58,12 @@ from chat_worker.application.ports.recyclable_price_client import (
 from chat_worker.application.ports.collection_point_client import (
     CollectionPointClientPort,
 )
+from chat_worker.infrastructure.assets.intent_ngram_model import get_intent_ngram_model
 from chat_worker.infrastructure.assets.prompt_loader import get_prompt_loader
-from chat_worker.infrastructure.cache import RedisCacheAdapter
+from chat_worker.infrastructure.cache import MinHashSemanticCache, RedisCacheAdapter
+from chat_worker.infrastructure.cache.semantic_cache import asset_version
 from chat_worker.infrastructure.events import (
+    RedisEvalJobQueue,
     RedisProgressNotifier,
     RedisStreamDomainEventBus,
 )
@@ -90,6 +94,7 @@ from chat_worker.infrastructure.orchestration.langgraph import create_chat_graph
 
 # Infrastructure Layer
 from chat_worker.infrastructure.retrieval import TagBasedRetriever
+from chat_worker.infrastructure.retrieval.tag_based_retriever import ASSETS_DIR
 from chat_worker.setup.config import get_settings
 
 # Domain Layer
@@ -137,6 +142,7 @@ _openai_async_client = None  # openai.AsyncOpenAI
 _gemini_client = None  # google.genai.Client
 _graph_cache: dict[tuple[str, str | None], object] = {}  # (provider, model) → compiled graph
 _eval_counter = None  # RedisEvalCounter singleton
+_eval_job_queue = None  # RedisEvalJobQueue singleton
 _eval_pg_pool = None  # asyncpg pool for eval cold storage
 
 
@@ -214,8 +220,13 @@ async def get_progress_notifier() -> ProgressNotifierPort:
     """
     global _progress_notifier
     if _progress_notifier is None:
+        settings = get_settings()
         redis = await get_redis_streams()
-        _progress_notifier = RedisProgressNotifier(redis=redis)
+        _progress_notifier = RedisProgressNotifier(
+            redis=redis,
+            coalesce_ms=settings.token_coalesce_ms,
+            coalesce_chars=settings.token_coalesce_chars,
+        )
     return _progress_notifier
 
 
@@ -242,6 +253,34 @@ def get_retriever() -> RetrieverPort:
     return TagBasedRetriever()
 
 
+def get_intent_predictor() -> IntentPredictorPort | None:
+    """로컬 Intent 분류기 (문자 n-gram 모델 싱글톤).
+
+    비활성화되었거나 모델 에셋 로드에 실패하면 None (항상 LLM 분류).
+    """
+    if not get_settings().intent_local_model_enabled:
+        return None
+    return get_intent_ngram_model()
+
+
+@lru_cache
+def get_semantic_cache() -> SemanticCachePort | None:
+    """유사 질문 캐시 싱글톤 (프로세스 내 MinHash + LSH).
+
+    규정 에셋 fingerprint를 버전으로 사용하여 에셋이 바뀌면 전체 무효화.
+    비활성화되었으면 None (정확 일치 캐시만 사용).
+    """
+    settings = get_settings()
+    if not settings.semantic_cache_enabled:
+        return None
+    source_dir = ASSETS_DIR / "source"
+    return MinHashSemanticCache(
+        threshold=settings.semantic_cache_threshold,
+        max_entries=settings.semantic_cache_max_entries,
+        version_provider=lambda: asset_version(source_dir),
+    )
+
+
 # ============================================================
 # Cache Factory (Clean Architecture)
 # ============================================================
@@ -872,6 +911,7 @@ async def get_checkpointer():
                     ttl_minutes=settings.checkpoint_ttl_minutes,
                     pg_pool_min_size=settings.checkpoint_read_pg_pool_min,
                     pg_pool_max_size=settings.checkpoint_read_pg_pool_max,
+                    local_cache_max_bytes=settings.checkpoint_local_cache_max_bytes,
                 )
                 logger.info(
                     "ReadThroughCheckpointer initialized (ttl=%d min, pg_pool_max=%d)",
@@ -924,6 +964,9 @@ def get_eval_config():
         eval_self_consistency_runs=settings.eval_self_consistency_runs,
         eval_cusum_check_interval=settings.eval_cusum_check_interval,
         eval_cost_budget_daily_usd=settings.eval_cost_budget_daily_usd,
+        eval_blocking_intents=frozenset(
+            intent.strip() for intent in settings.eval_blocking_intents.split(",") if intent.strip()
+        ),
     )
 
 
@@ -955,6 +998,125 @@ async def get_eval_counter():
     return _eval_counter
 
 
+async def create_eval_services(eval_config) -> dict[str, Any]:
+    """Eval 서브그래프 서비스 조립 (chat graph / eval_worker 공용).
+
+    Args:
+        eval_config: EvalConfig (None이거나 비활성화면 모두 None)
+
+    Returns:
+        create_chat_graph/create_eval_subgraph 키워드 인자 dict
+        (code_grader, llm_grader, score_aggregator, calibration_monitor, eval_counter)
+    """
+    services: dict[str, Any] = {
+        "code_grader": None,
+        "llm_grader": None,
+        "score_aggregator": None,
+        "calibration_monitor": None,
+        "eval_counter": None,
+    }
+    if eval_config is None or not eval_config.enable_eval_pipeline:
+        return services
+
+    from chat_worker.application.services.eval.code_grader import CodeGraderService
+    from chat_worker.application.services.eval.llm_grader import LLMGraderService
+    from chat_worker.application.services.eval.calibration_monitor import (
+        CalibrationMonitorService,
+    )
+    from chat_worker.application.services.eval.score_aggregator import (
+        ScoreAggregatorService,
+    )
+    from chat_worker.infrastructure.llm.evaluators.bars_evaluator import (
+        OpenAIBARSEvaluator,
+    )
+
+    # L1 Code Grader (순수 로직, 의존성 없음)
+    code_grader = CodeGraderService()
+
+    # Eval Gateway 어댑터
+    eval_query_gw = await get_eval_result_query_gateway()
+    calibration_gw = get_calibration_gateway()
+    eval_counter = await get_eval_counter()
+
+    # L2 LLM Grader (BARSEvaluator 주입)
+    eval_llm = create_llm_client(
+        provider="openai",
+        model=eval_config.eval_model,
+        enable_token_streaming=False,
+    )
+    bars_evaluator = OpenAIBARSEvaluator(
+        llm_client=eval_llm,
+        temperature=eval_config.eval_temperature,
+        max_tokens=eval_config.eval_max_tokens,
+    )
+    llm_grader = LLMGraderService(
+        bars_evaluator=bars_evaluator,
+        eval_config=eval_config,
+    )
+
+    # L3 Calibration Monitor
+    calibration_monitor = CalibrationMonitorService(
+        eval_query_gw=eval_query_gw,
+        calibration_gw=calibration_gw,
+        bars_evaluator=bars_evaluator,
+        drift_state_gw=await get_drift_state_gateway(),
+        status_ttl=get_settings().eval_drift_status_ttl,
+    )
+
+    # Score Aggregator
+    score_aggregator = ScoreAggregatorService()
+
+    logger.info(
+        "Eval pipeline services assembled (mode=%s, sample_rate=%.2f)",
+        eval_config.eval_mode,
+        eval_config.eval_sample_rate,
+    )
+
+    services.update(
+        code_grader=code_grader,
+        llm_grader=llm_grader,
+        score_aggregator=score_aggregator,
+        calibration_monitor=calibration_monitor,
+        eval_counter=eval_counter,
+    )
+    return services
+
+
+async def get_eval_job_queue():
+    """RedisEvalJobQueue 싱글톤 (async/shadow 모드 비동기 평가 작업 큐).
+
+    Returns:
+        RedisEvalJobQueue 또는 None (비활성화/sync 모드)
+    """
+    global _eval_job_queue
+    settings = get_settings()
+    if not settings.enable_eval_pipeline or settings.eval_mode == "sync":
+        return None
+
+    if _eval_job_queue is None:
+        redis = await get_redis()
+        _eval_job_queue = RedisEvalJobQueue(redis, maxlen=settings.eval_job_stream_maxlen)
+        logger.info(
+            "RedisEvalJobQueue created (maxlen=%d)",
+            settings.eval_job_stream_maxlen,
+        )
+    return _eval_job_queue
+
+
+async def get_drift_state_gateway():
+    """RedisDriftStateAdapter 생성 (축별 CUSUM 누적 상태).
+
+    Returns:
+        RedisDriftStateAdapter
+    """
+    from chat_worker.infrastructure.persistence.eval.redis_drift_state_adapter import (
+        RedisDriftStateAdapter,
+    )
+
+    redis = await get_redis()
+    return RedisDriftStateAdapter(redis)
+
+
 def get_calibration_gateway():
     """JsonCalibrationDataAdapter 생성.
 
@@ -1103,6 +1265,7 @@ async def get_chat_graph(
     retriever = get_retriever()
     prompt_loader = get_prompt_loader()  # 프롬프트 로더
     cache = await get_cache()  # P2: Intent 캐싱용 (CachePort)
+    intent_predictor = get_intent_predictor()  # 로컬 Intent 분류기 (LLM fast path)
     progress_notifier = await get_progress_notifier()
     character_client = await get_character_client()
     location_client = await get_location_client()
@@ -1123,64 +1286,8 @@ async def get_chat_graph(
 
     # Eval Pipeline 서비스 조립 (enable_eval_pipeline 조건부)
     eval_config = get_eval_config()
-    code_grader = None
-    llm_grader = None
-    score_aggregator = None
-    calibration_monitor = None
-    eval_counter = None
-
-    if eval_config is not None and eval_config.enable_eval_pipeline:
-        from chat_worker.application.services.eval.code_grader import CodeGraderService
-        from chat_worker.application.services.eval.llm_grader import LLMGraderService
-        from chat_worker.application.services.eval.calibration_monitor import (
-            CalibrationMonitorService,
-        )
-        from chat_worker.application.services.eval.score_aggregator import (
-            ScoreAggregatorService,
-        )
-        from chat_worker.infrastructure.llm.evaluators.bars_evaluator import (
-            OpenAIBARSEvaluator,
-        )
-
-        # L1 Code Grader (순수 로직, 의존성 없음)
-        code_grader = CodeGraderService()
-
-        # Eval Gateway 어댑터
-        eval_query_gw = await get_eval_result_query_gateway()
-        calibration_gw = get_calibration_gateway()
-        eval_counter = await get_eval_counter()
-
-        # L2 LLM Grader (BARSEvaluator 주입)
-        eval_llm = create_llm_client(
-            provider="openai",
-            model=eval_config.eval_model,
-            enable_token_streaming=False,
-        )
-        bars_evaluator = OpenAIBARSEvaluator(
-            llm_client=eval_llm,
-            temperature=eval_config.eval_temperature,
-            max_tokens=eval_config.eval_max_tokens,
-        )
-        llm_grader = LLMGraderService(
-            bars_evaluator=bars_evaluator,
-            eval_config=eval_config,
-        )
-
-        # L3 Calibration Monitor
-        calibration_monitor = CalibrationMonitorService(
-            eval_query_gw=eval_query_gw,
-            calibration_gw=calibration_gw,
-            bars_evaluator=bars_evaluator,
-        )
-
-        # Score Aggregator
-        score_aggregator = ScoreAggregatorService()
-
-        logger.info(
-            "Eval pipeline services assembled (mode=%s, sample_rate=%.2f)",
-            eval_config.eval_mode,
-            eval_config.eval_sample_rate,
-        )
+    eval_services = await create_eval_services(eval_config)
+    eval_job_queue = await get_eval_job_queue() if eval_config is not None else None
 
     graph = create_chat_graph(
         llm=llm,
@@ -1201,6 +1308,14 @@ async def get_chat_graph(
         image_default_size=settings.image_generation_default_size,
         image_default_quality=settings.image_generation_default_quality,
         cache=cache,
+        intent_predictor=intent_predictor,
+        intent_local_fast_path=settings.intent_local_fast_path,
+        intent_local_threshold=settings.intent_local_threshold,
+        intent_local_shadow_rate=settings.intent_local_shadow_rate,
+        semantic_cache=get_semantic_cache(),
+        semantic_answer_cache_enabled=settings.semantic_answer_cache_enabled,
+        semantic_answer_cache_ttl=settings.semantic_answer_cache_ttl,
+        metrics=get_metrics(),
         input_requester=input_requester,
         checkpointer=checkpointer,
         enable_summarization=settings.enable_summarization,
@@ -1215,11 +1330,8 @@ async def get_chat_graph(
         location_agent_provider=settings.default_provider,
         enable_location_agent=True,
         eval_config=eval_config,
-        code_grader=code_grader,
-        llm_grader=llm_grader,
-        score_aggregator=score_aggregator,
-        calibration_monitor=calibration_monitor,
-        eval_counter=eval_counter,
+        eval_job_queue=eval_job_queue,
+        **eval_services,
     )
 
     _graph_cache[cache_key] = graph
@@ -1324,7 +1436,7 @@ async def cleanup():
     """리소스 정리."""
     global _redis, _redis_streams, _character_client, _location_client, _kakao_local_client, _weather_client, _bulk_waste_client, _collection_point_client, _checkpointer
     global _progress_notifier, _domain_event_bus, _interaction_state_store, _input_requester, _image_generator, _image_storage
-    global _graph_cache, _eval_counter, _eval_pg_pool
+    global _graph_cache, _eval_counter, _eval_job_queue, _eval_pg_pool
 
     # Graph 캐시 정리
     _graph_cache.clear()
@@ -9,9 +9,11 @@ from chat_worker.application.commands.classify_intent_command import (
     ClassifyIntentInput,
     ClassifyIntentOutput,
 )
+from chat_worker.application.ports.intent_predictor import IntentPrediction
 from chat_worker.application.services.intent_classifier_service import (
     IntentClassificationSchema,
 )
+from chat_worker.infrastructure.cache.semantic_cache import MinHashSemanticCache
 
 
 class TestClassifyIntentInput:
@@ -347,3 +349,281 @@ class TestClassifyIntentCommandMultiIntent:
         # Multi-Intent 감지 없이 바로 분류
         assert result.intent == "waste"
         assert "multi_intent_candidate" not in result.events
+
+
+class TestClassifyIntentCommandLocalFastPath:
+    """로컬 분류기 fast path / shadow 테스트."""
+
+    @pytest.fixture
+    def mock_llm(self) -> AsyncMock:
+        """LLM 클라이언트 Mock (location 응답)."""
+        llm = AsyncMock()
+        llm.generate_structured = AsyncMock(
+            return_value=IntentClassificationSchema(
+                intent="location",
+                confidence=0.9,
+                reasoning="장소 검색",
+            )
+        )
+        return llm
+
+    @pytest.fixture
+    def mock_prompt_loader(self) -> MagicMock:
+        """프롬프트 로더 Mock."""
+        loader = MagicMock()
+        loader.load = MagicMock(return_value="prompt_template")
+        return loader
+
+    @pytest.fixture
+    def predictor(self) -> MagicMock:
+        """로컬 분류기 Mock (waste 0.95)."""
+        predictor = MagicMock()
+        predictor.predict = MagicMock(
+            return_value=IntentPrediction(intent="waste", probability=0.95)
+        )
+        return predictor
+
+    @pytest.fixture
+    def metrics(self) -> MagicMock:
+        """메트릭 Mock."""
+        return MagicMock()
+
+    def _command(self, mock_llm, mock_prompt_loader, predictor, metrics, **kwargs):
+        return ClassifyIntentCommand(
+            llm=mock_llm,
+            prompt_loader=mock_prompt_loader,
+            cache=None,
+            enable_multi_intent=False,
+            intent_predictor=predictor,
+            metrics=metrics,
+            **kwargs,
+        )
+
+    @pytest.mark.anyio
+    async def test_confident_prediction_skips_llm(
+        self, mock_llm, mock_prompt_loader, predictor, metrics
+    ) -> None:
+        """고신뢰 예측이면 LLM 호출 없이 반환."""
+        command = self._command(
+            mock_llm, mock_prompt_loader, predictor, metrics, enable_local_fast_path=True
+        )
+
+        result = await command.execute(
+            ClassifyIntentInput(job_id="job-1", message="페트병 어떻게 버려?")
+        )
+
+        assert result.intent == "waste"
+        assert result.confidence >= 0.9
+        assert "local_intent_hit" in result.events
+        mock_llm.generate_structured.assert_not_called()
+        metrics.track_intent_path.assert_called_once_with("local")
+        metrics.track_intent_agreement.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_keyword_mismatch_falls_back_to_llm(
+        self, mock_llm, mock_prompt_loader, predictor, metrics
+    ) -> None:
+        """키워드 신호가 예측과 어긋나 임계값 미만이면 LLM 호출 + 일치율 기록."""
+        command = self._command(
+            mock_llm, mock_prompt_loader, predictor, metrics, enable_local_fast_path=True
+        )
+
+        # waste 키워드 없음 → keyword 페널티 (0.95 - 0.1 < 0.9)
+        result = await command.execute(
+            ClassifyIntentInput(job_id="job-1", message="근처 센터 어디 있어?")
+        )
+
+        assert result.intent == "location"
+        assert "local_intent_hit" not in result.events
+        mock_llm.generate_structured.assert_called_once()
+        metrics.track_intent_path.assert_called_once_with("llm")
+        kwargs = metrics.track_intent_agreement.call_args.kwargs
+        assert kwargs["predicted"] == "waste"
+        assert kwargs["actual"] == "location"
+        assert kwargs["confidence"] == pytest.approx(0.85)
+
+    @pytest.mark.anyio
+    async def test_shadow_mode_always_calls_llm(
+        self, mock_llm, mock_prompt_loader, predictor, metrics
+    ) -> None:
+        """fast path 비활성(shadow)이면 고신뢰여도 LLM 결과 사용."""
+        command = self._command(mock_llm, mock_prompt_loader, predictor, metrics)
+
+        result = await command.execute(
+            ClassifyIntentInput(job_id="job-1", message="페트병 어떻게 버려?")
+        )
+
+        assert result.intent == "location"
+        assert "local_intent_shadow" in result.events
+        mock_llm.generate_structured.assert_called_once()
+        metrics.track_intent_agreement.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_shadow_rate_samples_confident_predictions(
+        self, mock_llm, mock_prompt_loader, predictor, metrics
+    ) -> None:
+        """shadow_rate=1.0이면 fast path 대상도 LLM으로 검증."""
+        command = self._command(
+            mock_llm,
+            mock_prompt_loader,
+            predictor,
+            metrics,
+            enable_local_fast_path=True,
+            local_shadow_rate=1.0,
+        )
+
+        result = await command.execute(
+            ClassifyIntentInput(job_id="job-1", message="페트병 어떻게 버려?")
+        )
+
+        assert result.intent == "location"
+        assert "local_intent_shadow" in result.events
+        mock_llm.generate_structured.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_context_bypasses_local_predictor(
+        self, mock_llm, mock_prompt_loader, predictor, metrics
+    ) -> None:
+        """멀티턴 맥락이 있으면 로컬 예측 안 함."""
+        command = self._command(
+            mock_llm, mock_prompt_loader, predictor, metrics, enable_local_fast_path=True
+        )
+
+        result = await command.execute(
+            ClassifyIntentInput(
+                job_id="job-1",
+                message="페트병 어떻게 버려?",
+                previous_intents=["location"],
+            )
+        )
+
+        assert result.intent == "location"
+        predictor.predict.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_predictor_error_falls_back_to_llm(
+        self, mock_llm, mock_prompt_loader, predictor, metrics
+    ) -> None:
+        """로컬 분류기 예외 시 LLM 경로로 진행."""
+        predictor.predict = MagicMock(side_effect=RuntimeError("boom"))
+        command = self._command(
+            mock_llm, mock_prompt_loader, predictor, metrics, enable_local_fast_path=True
+        )
+
+        result = await command.execute(
+            ClassifyIntentInput(job_id="job-1", message="페트병 어떻게 버려?")
+        )
+
+        assert result.intent == "location"
+        metrics.track_intent_agreement.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_cache_hit_records_agreement(
+        self, mock_llm, mock_prompt_loader, predictor, metrics
+    ) -> None:
+        """캐시 적중도 LLM 결과이므로 일치율 기록."""
+        cache = AsyncMock()
+        cache.get = AsyncMock(return_value={"intent": "waste", "confidence": 0.9})
+        command = ClassifyIntentCommand(
+            llm=mock_llm,
+            prompt_loader=mock_prompt_loader,
+            cache=cache,
+            enable_multi_intent=False,
+            intent_predictor=predictor,
+            metrics=metrics,
+        )
+
+        result = await command.execute(
+            ClassifyIntentInput(job_id="job-1", message="페트병 어떻게 버려?")
+        )
+
+        assert "cache_hit" in result.events
+        metrics.track_intent_path.assert_called_once_with("cache")
+        kwargs = metrics.track_intent_agreement.call_args.kwargs
+        assert kwargs["predicted"] == kwargs["actual"] == "waste"
+
+
+class TestClassifyIntentCommandSemanticCache:
+    """유사 질문 캐시 테스트."""
+
+    @pytest.fixture
+    def mock_llm(self) -> AsyncMock:
+        """LLM 클라이언트 Mock (waste 응답)."""
+        llm = AsyncMock()
+        llm.generate_structured = AsyncMock(
+            return_value=IntentClassificationSchema(
+                intent="waste",
+                confidence=0.9,
+                reasoning="분리배출 질문",
+            )
+        )
+        return llm
+
+    @pytest.fixture
+    def command(self, mock_llm: AsyncMock) -> ClassifyIntentCommand:
+        """유사 캐시를 가진 Command."""
+        loader = MagicMock()
+        loader.load = MagicMock(return_value="prompt_template")
+        return ClassifyIntentCommand(
+            llm=mock_llm,
+            prompt_loader=loader,
+            cache=None,
+            enable_multi_intent=False,
+            metrics=MagicMock(),
+            semantic_cache=MinHashSemanticCache(),
+        )
+
+    @pytest.mark.anyio
+    async def test_surface_variant_reuses_llm_result(
+        self, command: ClassifyIntentCommand, mock_llm: AsyncMock
+    ) -> None:
+        """표기만 다른 질문은 LLM 없이 이전 결과 재사용."""
+        first = await command.execute(
+            ClassifyIntentInput(job_id="job-1", message="페트병 어떻게 버려?")
+        )
+        second = await command.execute(
+            ClassifyIntentInput(job_id="job-2", message="페트병 어떻게 버려요")
+        )
+
+        assert "semantic_cache_saved" in first.events
+        assert "semantic_cache_hit" in second.events
+        assert second.intent == "waste"
+        assert mock_llm.generate_structured.await_count == 1
+
+    @pytest.mark.anyio
+    async def test_context_bypasses_semantic_cache(
+        self, command: ClassifyIntentCommand, mock_llm: AsyncMock
+    ) -> None:
+        """멀티턴 맥락이 있으면 유사 캐시를 사용하지 않음."""
+        await command.execute(ClassifyIntentInput(job_id="job-1", message="페트병 어떻게 버려?"))
+        result = await command.execute(
+            ClassifyIntentInput(
+                job_id="job-2",
+                message="페트병 어떻게 버려?",
+                previous_intents=["location"],
+            )
+        )
+
+        assert "semantic_cache_hit" not in result.events
+        assert mock_llm.generate_structured.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_lookup_error_falls_back_to_llm(self, mock_llm: AsyncMock) -> None:
+        """유사 캐시 오류 시 LLM 경로로 진행."""
+        semantic_cache = MagicMock()
+        semantic_cache.lookup = MagicMock(side_effect=RuntimeError("boom"))
+        loader = MagicMock()
+        loader.load = MagicMock(return_value="prompt_template")
+        command = ClassifyIntentCommand(
+            llm=mock_llm,
+            prompt_loader=loader,
+            enable_multi_intent=False,
+            semantic_cache=semantic_cache,
+        )
+
+        result = await command.execute(
+            ClassifyIntentInput(job_id="job-1", message="페트병 어떻게 버려?")
+        )
+
+        assert result.intent == "waste"
+        assert "llm_structured_called" in result.events
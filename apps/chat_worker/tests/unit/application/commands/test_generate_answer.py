@@ -9,6 +9,7 @@ from chat_worker.application.commands.generate_answer_command import (
     GenerateAnswerInput,
     GenerateAnswerOutput,
 )
+from chat_worker.infrastructure.cache.semantic_cache import MinHashSemanticCache
 
 
 class TestGenerateAnswerInput:
@@ -331,3 +332,81 @@ class TestGenerateAnswerCommand:
 
         assert result.answer == "플라스틱은 재활용 가능해요."
         assert "cache_hit" not in result.events
+
+
+class TestGenerateAnswerSemanticCache:
+    """유사 질문 Answer 캐시 테스트 (prepare 경로)."""
+
+    RULES = {"data": {"category": "무색페트병", "rules": ["라벨 제거"]}}
+
+    @pytest.fixture
+    def command(self) -> GenerateAnswerCommand:
+        """유사 캐시를 가진 Command."""
+        builder = MagicMock()
+        builder.build = MagicMock(return_value="system prompt")
+        return GenerateAnswerCommand(
+            llm=AsyncMock(),
+            prompt_builder=builder,
+            semantic_cache=MinHashSemanticCache(),
+        )
+
+    def _input(self, message: str, **kwargs) -> GenerateAnswerInput:
+        params = {
+            "job_id": "job-1",
+            "message": message,
+            "intent": "waste",
+            "disposal_rules": self.RULES,
+            "conversation_history": [{"role": "human", "content": message}],
+        }
+        params.update(kwargs)
+        return GenerateAnswerInput(**params)
+
+    @pytest.mark.anyio
+    async def test_variant_hits_after_save(self, command: GenerateAnswerCommand) -> None:
+        """저장 후 표기만 다른 질문이 같은 답변에 적중."""
+        first = await command.prepare(self._input("페트병 어떻게 버려?"))
+        assert first.cached_answer is None
+        assert first.semantic_namespace is not None
+        command.save_to_semantic_cache(first.semantic_namespace, "페트병 어떻게 버려?", "답변")
+
+        second = await command.prepare(self._input("페트병 어떻게 버려요"))
+
+        assert second.cached_answer == "답변"
+
+    @pytest.mark.anyio
+    async def test_different_rag_context_misses(self, command: GenerateAnswerCommand) -> None:
+        """검색된 규정이 다르면 적중하지 않음."""
+        first = await command.prepare(self._input("페트병 어떻게 버려?"))
+        command.save_to_semantic_cache(first.semantic_namespace, "페트병 어떻게 버려?", "답변")
+
+        other_rules = {"data": {"category": "무색페트병", "rules": ["라벨 제거", "압착"]}}
+        second = await command.prepare(
+            self._input("페트병 어떻게 버려?", disposal_rules=other_rules)
+        )
+
+        assert second.cached_answer is None
+        assert second.semantic_namespace != first.semantic_namespace
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"intent": "general"},
+            {"has_multi_intent": True, "additional_intents": ["location"]},
+            {
+                "conversation_history": [
+                    {"role": "human", "content": "안녕"},
+                    {"role": "ai", "content": "안녕하세요"},
+                    {"role": "human", "content": "페트병 어떻게 버려?"},
+                ]
+            },
+            {"conversation_summary": "이전 대화 요약"},
+            {"classification": {"category": "플라스틱"}},
+            {"character_context": {"name": "페티"}},
+        ],
+    )
+    async def test_not_cacheable(self, command: GenerateAnswerCommand, overrides: dict) -> None:
+        """단일 턴 분리배출 질문이 아니면 유사 캐시 대상 아님."""
+        prepared = await command.prepare(self._input("페트병 어떻게 버려?", **overrides))
+
+        assert prepared.semantic_namespace is None
@@ -0,0 +1,32 @@
+"""EvalConfig 단위 테스트."""
+
+from __future__ import annotations
+
+import pytest
+
+from chat_worker.application.dto.eval_config import EvalConfig
+
+
+@pytest.mark.eval_unit
+class TestIsBlocking:
+    """is_blocking (done 전 동기 평가 여부) 테스트."""
+
+    def test_sync_mode_blocks_every_intent(self) -> None:
+        config = EvalConfig(eval_mode="sync")
+
+        assert config.is_blocking("waste") is True
+        assert config.is_blocking("general") is True
+
+    def test_async_mode_blocks_only_listed_intents(self) -> None:
+        config = EvalConfig(eval_mode="async", eval_blocking_intents=frozenset({"waste"}))
+
+        assert config.is_blocking("waste") is True
+        assert config.is_blocking("general") is False
+
+    def test_async_mode_default_never_blocks(self) -> None:
+        assert EvalConfig(eval_mode="async").is_blocking("waste") is False
+
+    def test_shadow_mode_never_blocks(self) -> None:
+        config = EvalConfig(eval_mode="shadow", eval_blocking_intents=frozenset({"waste"}))
+
+        assert config.is_blocking("waste") is False
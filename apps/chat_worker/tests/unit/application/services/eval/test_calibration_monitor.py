@@ -195,3 +195,133 @@ class TestCalibrationMonitorCheckCoverage:
             "location",
             "waste",
         ]
+
+
+class _InMemoryDriftState:
+    """DriftStateGateway 인메모리 구현 (Redis Lua Script와 같은 점화식)."""
+
+    def __init__(self) -> None:
+        self.state: dict[str, dict[str, float]] = {}
+        self.reads = 0
+
+    async def update_cusum(
+        self, axis_scores: dict[str, float], expected_mean: float, slack: float
+    ) -> None:
+        for axis, x in axis_scores.items():
+            s = self.state.setdefault(
+                axis, {"cusum_positive": 0.0, "cusum_negative": 0.0, "sample_count": 0}
+            )
+            s["cusum_positive"] = max(0.0, s["cusum_positive"] + (x - expected_mean - slack))
+            s["cusum_negative"] = max(0.0, s["cusum_negative"] + (expected_mean - x - slack))
+            s["sample_count"] += 1
+
+    async def get_cusum_state(self) -> dict[str, dict[str, float]]:
+        self.reads += 1
+        return self.state
+
+    async def reset_cusum(self) -> None:
+        self.state = {}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.eval_unit
+class TestCalibrationMonitorIncremental:
+    """DriftStateGateway 주입 시 증분 CUSUM 테스트."""
+
+    def _make(self, drift_state: _InMemoryDriftState, clock: _Clock | None = None):
+        eval_query_gw = AsyncMock()
+        calibration_gw = AsyncMock()
+        calibration_gw.get_calibration_version.return_value = "v1"
+        service = CalibrationMonitorService(
+            eval_query_gw=eval_query_gw,
+            calibration_gw=calibration_gw,
+            bars_evaluator=AsyncMock(),
+            drift_state_gw=drift_state,
+            status_ttl=10.0,
+            clock=clock or _Clock(),
+        )
+        return service, eval_query_gw
+
+    async def test_incremental_matches_batch_cusum(self) -> None:
+        """점수를 하나씩 기록한 누적합 == 같은 순서 배치 재계산."""
+        drift_state = _InMemoryDriftState()
+        service, eval_query_gw = self._make(drift_state)
+        scores = [3.0, 4.5, 4.0, 2.0, 1.0, 1.5, 3.5, 5.0, 4.5, 4.5]
+
+        for score in scores:
+            await service.record_scores({"faithfulness": score})
+
+        result = await service.check_drift()
+
+        expected_pos, expected_neg = CalibrationMonitorService._compute_cusum(scores)
+        detail = result["axes"]["faithfulness"]
+        assert detail["cusum_positive"] == round(expected_pos, 4)
+        assert detail["cusum_negative"] == round(expected_neg, 4)
+        assert detail["sample_count"] == len(scores)
+        assert result["axes"]["relevance"]["sample_count"] == 0
+        eval_query_gw.get_recent_scores.assert_not_called()
+
+    async def test_sustained_high_scores_drift(self) -> None:
+        """지속적인 4.5점 -> CRITICAL, DRIFTING."""
+        drift_state = _InMemoryDriftState()
+        service, _ = self._make(drift_state)
+
+        for _ in range(5):
+            await service.record_scores({"relevance": 4.5, "safety": 3.0})
+
+        result = await service.check_drift()
+
+        assert result["status"] == STATUS_DRIFTING
+        assert result["axes"]["relevance"]["severity"] == "CRITICAL"
+        assert result["axes"]["safety"]["severity"] == "OK"
+
+    async def test_status_cached_within_ttl(self) -> None:
+        """TTL 안에서는 상태 저장소를 다시 읽지 않음."""
+        drift_state = _InMemoryDriftState()
+        clock = _Clock()
+        service, _ = self._make(drift_state, clock)
+
+        first = await service.check_drift()
+        for _ in range(10):
+            await service.record_scores({"relevance": 5.0})
+        clock.now = 5.0
+        cached = await service.check_drift()
+        clock.now = 10.0
+        refreshed = await service.check_drift()
+
+        assert drift_state.reads == 2
+        assert cached is first
+        assert refreshed["status"] == STATUS_DRIFTING
+
+    async def test_record_ignores_unknown_axes_and_errors(self) -> None:
+        """알 수 없는 축은 무시하고, 저장소 오류는 전파하지 않음."""
+        drift_state = AsyncMock()
+        service, _ = self._make(drift_state)
+
+        await service.record_scores({"unknown": 5.0})
+        drift_state.update_cusum.assert_not_called()
+
+        drift_state.update_cusum.side_effect = ConnectionError("redis down")
+        await service.record_scores({"safety": 1.0})
+        drift_state.update_cusum.assert_awaited_once_with(
+            {"safety": 1.0}, expected_mean=3.0, slack=0.5
+        )
+
+    async def test_reset_drift_clears_state_and_cache(self) -> None:
+        """재교정 후 reset_drift -> STABLE."""
+        drift_state = _InMemoryDriftState()
+        service, _ = self._make(drift_state)
+        for _ in range(10):
+            await service.record_scores({"completeness": 1.0})
+        assert (await service.check_drift())["status"] == STATUS_DRIFTING
+
+        await service.reset_drift()
+
+        assert (await service.check_drift())["status"] == STATUS_STABLE
@@ -0,0 +1,114 @@
+"""Char N-gram Intent Model Tests."""
+
+import pytest
+
+from chat_worker.application.ports.intent_predictor import IntentPrediction
+from chat_worker.domain import Intent
+from chat_worker.infrastructure.assets.intent_ngram_model import (
+    DEFAULT_SEED_PATH,
+    CharNgramIntentModel,
+    extract_ngrams,
+    get_intent_ngram_model,
+    load_labeled_jsonl,
+    normalize_message,
+)
+
+SAMPLES = [
+    ("페트병 어떻게 버려?", "waste"),
+    ("유리병 분리수거 방법", "waste"),
+    ("캔 어떻게 버려요", "waste"),
+    ("근처 카페 어디?", "location"),
+    ("가까운 재활용센터 찾아줘", "location"),
+    ("주변 편의점 어디?", "location"),
+    ("고철 시세 얼마?", "recyclable_price"),
+    ("폐지 가격 얼마야", "recyclable_price"),
+]
+
+
+class TestFeatures:
+    """정규화/n-gram 추출 테스트."""
+
+    def test_normalize_strips_punctuation_and_case(self):
+        assert normalize_message("  PET병, 어떻게 버려?!  ") == "pet병 어떻게 버려"
+
+    def test_extract_ngrams_pads_word_boundaries(self):
+        ngrams = extract_ngrams("캔 버려", (1, 2))
+        assert {"캔", " 캔", "캔 ", " 버", "려 "} <= ngrams
+        assert " " not in ngrams
+
+    def test_extract_ngrams_empty(self):
+        assert extract_ngrams("?!") == set()
+
+
+class TestCharNgramIntentModel:
+    """학습/예측/직렬화 테스트."""
+
+    @pytest.fixture(scope="class")
+    def model(self) -> CharNgramIntentModel:
+        return CharNgramIntentModel.train(SAMPLES, epochs=40, seed=1)
+
+    def test_predicts_training_intents(self, model: CharNgramIntentModel):
+        for message, intent in SAMPLES:
+            prediction = model.predict(message)
+            assert prediction is not None
+            assert prediction.intent == intent
+
+    def test_unseen_phrase_with_known_ngrams(self, model: CharNgramIntentModel):
+        prediction = model.predict("유리병 어떻게 버려?")
+        assert prediction is not None
+        assert prediction.intent == "waste"
+        assert 0.0 < prediction.probability <= 1.0
+
+    def test_out_of_distribution_returns_none(self, model: CharNgramIntentModel):
+        assert model.predict("quantum entanglement") is None
+        assert model.predict("") is None
+
+    def test_roundtrip_dict(self, model: CharNgramIntentModel):
+        restored = CharNgramIntentModel.from_dict(model.to_dict())
+        for message, _ in SAMPLES:
+            original = model.predict(message)
+            loaded = restored.predict(message)
+            assert loaded.intent == original.intent
+            assert loaded.probability == pytest.approx(original.probability, abs=1e-3)
+
+    def test_save_and_load(self, model: CharNgramIntentModel, tmp_path):
+        path = tmp_path / "model.json"
+        model.save(path)
+        assert CharNgramIntentModel.load(path).labels == model.labels
+
+    def test_rejects_unknown_version(self, model: CharNgramIntentModel):
+        data = model.to_dict()
+        data["version"] = 999
+        with pytest.raises(ValueError):
+            CharNgramIntentModel.from_dict(data)
+
+    def test_train_requires_samples(self):
+        with pytest.raises(ValueError):
+            CharNgramIntentModel.train([("?!", "waste")])
+
+
+class TestShippedModel:
+    """배포 에셋 테스트."""
+
+    def test_loads_with_all_intents(self):
+        model = get_intent_ngram_model()
+        assert model is not None
+        assert set(model.labels) == {intent.value for intent in Intent}
+
+    def test_seed_labels_are_valid_intents(self):
+        valid = {intent.value for intent in Intent}
+        assert {record["intent"] for record in load_labeled_jsonl(DEFAULT_SEED_PATH)} <= valid
+
+    @pytest.mark.parametrize(
+        "message,intent",
+        [
+            ("페트병 어떻게 버려?", "waste"),
+            ("소파 버리려면?", "bulk_waste"),
+            ("고철 시세 얼마야", "recyclable_price"),
+            ("의류수거함 어디 있어?", "collection_point"),
+        ],
+    )
+    def test_common_questions(self, message: str, intent: str):
+        prediction = get_intent_ngram_model().predict(message)
+        assert isinstance(prediction, IntentPrediction)
+        assert prediction.intent == intent
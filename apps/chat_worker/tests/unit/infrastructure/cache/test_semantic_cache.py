@@ -0,0 +1,140 @@
+"""MinHash Semantic Cache Tests."""
+
+import pytest
+
+from chat_worker.application.ports.cache import SemanticCacheHit
+from chat_worker.infrastructure.cache.semantic_cache import (
+    MinHashSemanticCache,
+    asset_version,
+    extract_shingles,
+    normalize_query,
+)
+
+
+class FakeClock:
+    """수동 시각."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> MinHashSemanticCache:
+    return MinHashSemanticCache(threshold=0.6, default_ttl=60, max_entries=3, clock=clock)
+
+
+class TestNormalization:
+    """정규화/shingle 테스트."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "페트병 어떻게 버려?",
+            "페트병 어떻게 버려요",
+            "페트병어떻게 버려!!",
+            "  페트병 어떻게버려요?",
+        ],
+    )
+    def test_surface_variants_normalize_equal(self, text: str):
+        assert normalize_query(text) == "페트병어떻게버려"
+
+    def test_single_polite_ending_kept(self):
+        assert normalize_query("요") == "요"
+
+    def test_short_text_single_shingle(self):
+        assert extract_shingles("캔") == frozenset(["캔"])
+        assert extract_shingles("") == frozenset()
+
+
+class TestMinHashSemanticCache:
+    """조회/저장/만료/무효화 테스트."""
+
+    def test_exact_variant_hit(self, cache: MinHashSemanticCache):
+        cache.store("intent", "페트병 어떻게 버려?", {"intent": "waste"})
+        hit = cache.lookup("intent", "페트병 어떻게 버려요")
+        assert isinstance(hit, SemanticCacheHit)
+        assert hit.value == {"intent": "waste"}
+        assert hit.similarity == 1.0
+        assert hit.matched_text == "페트병 어떻게 버려?"
+
+    def test_near_duplicate_hit(self, cache: MinHashSemanticCache):
+        cache.store("intent", "페트병 분리수거 방법 알려줘", {"intent": "waste"})
+        hit = cache.lookup("intent", "페트병 분리수거 방법 좀 알려줘")
+        assert hit is not None
+        assert 0.6 <= hit.similarity < 1.0
+
+    def test_different_item_misses(self, cache: MinHashSemanticCache):
+        cache.store("answer", "페트병 어떻게 버려?", {"answer": "라벨 제거"})
+        assert cache.lookup("answer", "유리병 어떻게 버려?") is None
+
+    def test_different_numbers_miss(self, cache: MinHashSemanticCache):
+        cache.store("answer", "2리터 페트병 어떻게 버려?", {"answer": "a"})
+        assert cache.lookup("answer", "5리터 페트병 어떻게 버려?") is None
+
+    def test_negated_question_misses(self, cache: MinHashSemanticCache):
+        """부정 표지가 다르면 유사도가 높아도 적중하지 않음."""
+        base = "아파트 분리수거장에 스티로폼 박스 테이프 붙은 채로 버려도"
+        cache.store("answer", f"{base} 되나요", {"answer": "a"})
+
+        assert cache.lookup("answer", f"{base} 안 되나요") is None
+        assert cache.lookup("answer", f"{base} 되나") is not None
+
+    def test_namespaces_isolated(self, cache: MinHashSemanticCache):
+        cache.store("answer:a", "페트병 어떻게 버려?", {"answer": "a"})
+        assert cache.lookup("answer:b", "페트병 어떻게 버려?") is None
+
+    def test_ttl_expiry(self, cache: MinHashSemanticCache, clock: FakeClock):
+        cache.store("intent", "페트병 어떻게 버려?", {"intent": "waste"}, ttl=10)
+        clock.now = 11
+        assert cache.lookup("intent", "페트병 어떻게 버려?") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, cache: MinHashSemanticCache):
+        for text in ["페트병 버려", "유리병 버려", "캔 버려"]:
+            cache.store("intent", text, {"text": text})
+        cache.lookup("intent", "페트병 버려")  # 최근 사용
+        cache.store("intent", "종이팩 버려", {"text": "종이팩"})
+        assert len(cache) == 3
+        assert cache.lookup("intent", "유리병 버려") is None
+        assert cache.lookup("intent", "페트병 버려") is not None
+
+    def test_version_change_invalidates(self, clock: FakeClock):
+        version = {"value": "v1"}
+        cache = MinHashSemanticCache(
+            version_provider=lambda: version["value"],
+            version_check_interval=30,
+            clock=clock,
+        )
+        cache.store("intent", "페트병 어떻게 버려?", {"intent": "waste"})
+        version["value"] = "v2"
+        clock.now = 10  # 확인 주기 전에는 유지
+        assert cache.lookup("intent", "페트병 어떻게 버려?") is not None
+        clock.now = 31
+        assert cache.lookup("intent", "페트병 어떻게 버려?") is None
+        assert cache.version == "v2"
+        assert cache.stats()["invalidations"] == 1
+
+    def test_rejects_invalid_bands(self):
+        with pytest.raises(ValueError):
+            MinHashSemanticCache(num_perm=64, bands=7)
+
+
+class TestAssetVersion:
+    """에셋 fingerprint 테스트."""
+
+    def test_changes_with_content(self, tmp_path):
+        (tmp_path / "a.json").write_text("{}", encoding="utf-8")
+        before = asset_version(tmp_path)
+        (tmp_path / "a.json").write_text('{"x": 1}', encoding="utf-8")
+        assert asset_version(tmp_path) != before
+
+    def test_missing_directory(self, tmp_path):
+        assert asset_version(tmp_path / "missing") == ""
@@ -0,0 +1,126 @@
+"""RedisEvalJobQueue 단위 테스트."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from chat_worker.infrastructure.events.redis_eval_job_queue import (
+    EVAL_JOB_GROUP,
+    EVAL_JOB_STREAM,
+    RedisEvalJobQueue,
+)
+
+
+@pytest.fixture
+def redis() -> AsyncMock:
+    return AsyncMock()
+
+
+class TestEnqueue:
+    """적재 테스트."""
+
+    async def test_enqueue_xadds_payload_with_maxlen(self, redis: AsyncMock):
+        """작업을 JSON payload로 XADD (근사 트림)."""
+        queue = RedisEvalJobQueue(redis, maxlen=500)
+
+        assert await queue.enqueue({"job_id": "job-1", "message": "페트병"}) is True
+
+        args, kwargs = redis.xadd.call_args
+        assert args[0] == EVAL_JOB_STREAM
+        payload = json.loads(args[1]["payload"])
+        assert payload["job_id"] == "job-1"
+        assert payload["message"] == "페트병"
+        assert isinstance(payload["enqueued_at"], float)
+        assert kwargs == {"maxlen": 500, "approximate": True}
+
+    async def test_enqueue_returns_false_on_error(self, redis: AsyncMock):
+        """Redis 오류는 전파하지 않고 False."""
+        redis.xadd.side_effect = ConnectionError("down")
+        queue = RedisEvalJobQueue(redis)
+
+        assert await queue.enqueue({"job_id": "job-1"}) is False
+
+
+class TestConsume:
+    """소비 테스트."""
+
+    async def test_ensure_group_ignores_busygroup(self, redis: AsyncMock):
+        """이미 있는 Consumer Group은 무시."""
+        redis.xgroup_create.side_effect = Exception("BUSYGROUP Consumer Group name already exists")
+        queue = RedisEvalJobQueue(redis)
+
+        await queue.ensure_group()
+
+        redis.xgroup_create.assert_awaited_once_with(
+            EVAL_JOB_STREAM, EVAL_JOB_GROUP, id="0", mkstream=True
+        )
+
+    async def test_ensure_group_raises_other_errors(self, redis: AsyncMock):
+        """그 외 오류는 전파."""
+        redis.xgroup_create.side_effect = Exception("NOAUTH")
+        queue = RedisEvalJobQueue(redis)
+
+        with pytest.raises(Exception, match="NOAUTH"):
+            await queue.ensure_group()
+
+    async def test_read_new_jobs(self, redis: AsyncMock):
+        """새 작업은 ">"로 block 읽기, 깨진 payload는 빈 dict."""
+        redis.xreadgroup.return_value = [
+            (
+                EVAL_JOB_STREAM,
+                [
+                    ("1-0", {"payload": json.dumps({"job_id": "job-1"})}),
+                    ("2-0", {"payload": "not-json"}),
+                ],
+            )
+        ]
+        queue = RedisEvalJobQueue(redis)
+
+        jobs = await queue.read("worker-a", count=5, block_ms=100)
+
+        assert jobs == [("1-0", {"job_id": "job-1"}), ("2-0", {})]
+        redis.xreadgroup.assert_awaited_once_with(
+            EVAL_JOB_GROUP, "worker-a", {EVAL_JOB_STREAM: ">"}, count=5, block=100
+        )
+
+    async def test_read_pending_jobs_does_not_block(self, redis: AsyncMock):
+        """pending=True면 "0"부터 읽고 block하지 않음."""
+        redis.xreadgroup.return_value = []
+        queue = RedisEvalJobQueue(redis)
+
+        assert await queue.read("worker-a", pending=True) == []
+        assert redis.xreadgroup.call_args.args[2] == {EVAL_JOB_STREAM: "0"}
+        assert redis.xreadgroup.call_args.kwargs["block"] is None
+
+    async def test_claim_idle_jobs(self, redis: AsyncMock):
+        """오래 미확인인 작업을 XAUTOCLAIM으로 회수."""
+        redis.xautoclaim.return_value = [
+            "0-0",
+            [("1-0", {"payload": json.dumps({"job_id": "job-1"})})],
+            ["0-1"],
+        ]
+        queue = RedisEvalJobQueue(redis)
+
+        jobs = await queue.claim_idle("worker-b", min_idle_ms=60000, count=5)
+
+        assert jobs == [("1-0", {"job_id": "job-1"})]
+        redis.xautoclaim.assert_awaited_once_with(
+            EVAL_JOB_STREAM,
+            EVAL_JOB_GROUP,
+            "worker-b",
+            min_idle_time=60000,
+            start_id="0-0",
+            count=5,
+        )
+
+    async def test_ack_skips_empty(self, redis: AsyncMock):
+        """빈 목록은 XACK 생략."""
+        queue = RedisEvalJobQueue(redis)
+
+        await queue.ack([])
+        await queue.ack(["1-0", "2-0"])
+
+        redis.xack.assert_awaited_once_with(EVAL_JOB_STREAM, EVAL_JOB_GROUP, "1-0", "2-0")
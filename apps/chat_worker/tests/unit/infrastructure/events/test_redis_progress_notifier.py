@@ -5,11 +5,15 @@ Lua Script 기반 멱등성 발행 테스트.
 
 from __future__ import annotations
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from chat_worker.infrastructure.events.redis_progress_notifier import (
+    TOKEN_SEQ_START,
+    TOKEN_STATE_SAVE_INTERVAL,
     RedisProgressNotifier,
     _get_shard_for_job,
     _get_stream_key,
@@ -276,3 +280,205 @@ class TestRedisProgressNotifier:
 
         # 20개 job_id면 여러 shard에 분산
         assert len(shards) >= 2
+
+
+class TestTokenCoalescing:
+    """notify_token_v2 토큰 병합 테스트."""
+
+    @pytest.fixture
+    def token_calls(self) -> list[dict]:
+        """TOKEN_XADD_V2_SCRIPT 호출 기록."""
+        return []
+
+    @pytest.fixture
+    def mock_redis(self, token_calls: list[dict]) -> AsyncMock:
+        """Token v2 Script 호출을 기록하는 Mock Redis."""
+        redis = AsyncMock()
+
+        async def mock_token_v2_script(keys, args):
+            token_calls.append({"keys": keys, "args": args})
+            n = len(token_calls)
+            return [f"{n}-0".encode(), f"{n}-1".encode()]
+
+        script = MagicMock(side_effect=mock_token_v2_script)
+        redis.register_script = MagicMock(return_value=script)
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, 1])
+        redis.pipeline = MagicMock(return_value=pipe)
+        return redis
+
+    def _notifier(self, redis: AsyncMock, **kwargs) -> RedisProgressNotifier:
+        return RedisProgressNotifier(redis=redis, shard_count=4, maxlen=500, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_first_token_published_immediately(
+        self, mock_redis: AsyncMock, token_calls: list[dict]
+    ):
+        """첫 토큰은 TTFT 유지를 위해 즉시 발행."""
+        notifier = self._notifier(mock_redis, coalesce_ms=10_000, coalesce_chars=1000)
+
+        msg_id = await notifier.notify_token_v2(task_id="job-1", content="안", node="answer")
+        buffered = await notifier.notify_token_v2(task_id="job-1", content="녕", node="answer")
+
+        assert msg_id == "1-0"
+        assert buffered == ""
+        assert len(token_calls) == 1
+        assert token_calls[0]["args"][2] == "안"
+
+        notifier.clear_token_counter("job-1")
+
+    @pytest.mark.asyncio
+    async def test_flush_on_char_threshold(self, mock_redis: AsyncMock, token_calls: list[dict]):
+        """버퍼가 coalesce_chars에 도달하면 한 엔트리로 발행."""
+        notifier = self._notifier(mock_redis, coalesce_ms=10_000, coalesce_chars=6)
+
+        for token in ["a", "bc", "de", "fg", "h"]:
+            await notifier.notify_token_v2(task_id="job-2", content=token, node="answer")
+
+        # "a" (첫 토큰) + "bcdefg" (6글자 도달)
+        assert [c["args"][2] for c in token_calls] == ["a", "bcdefg"]
+        # seq는 엔트리 단위로 단조증가
+        assert [int(c["args"][1]) for c in token_calls] == [
+            TOKEN_SEQ_START + 1,
+            TOKEN_SEQ_START + 2,
+        ]
+        assert notifier._pending_parts["job-2"] == ["h"]
+
+        notifier.clear_token_counter("job-2")
+
+    @pytest.mark.asyncio
+    async def test_timer_flushes_idle_buffer(self, mock_redis: AsyncMock, token_calls: list[dict]):
+        """토큰이 끊겨도 coalesce_ms 후 버퍼 발행."""
+        notifier = self._notifier(mock_redis, coalesce_ms=20, coalesce_chars=1000)
+
+        await notifier.notify_token_v2(task_id="job-3", content="a", node="answer")
+        await notifier.notify_token_v2(task_id="job-3", content="b", node="answer")
+        await notifier.notify_token_v2(task_id="job-3", content="c", node="answer")
+        assert len(token_calls) == 1
+
+        await asyncio.sleep(0.1)
+
+        assert [c["args"][2] for c in token_calls] == ["a", "bc"]
+        assert "job-3" not in notifier._pending_parts
+
+        notifier.clear_token_counter("job-3")
+
+    @pytest.mark.asyncio
+    async def test_node_change_flushes_previous_buffer(
+        self, mock_redis: AsyncMock, token_calls: list[dict]
+    ):
+        """노드가 바뀌면 이전 노드 버퍼를 먼저 발행."""
+        notifier = self._notifier(mock_redis, coalesce_ms=10_000, coalesce_chars=1000)
+
+        await notifier.notify_token_v2(task_id="job-4", content="a", node="summarize")
+        await notifier.notify_token_v2(task_id="job-4", content="b", node="summarize")
+        await notifier.notify_token_v2(task_id="job-4", content="c", node="answer")
+
+        assert [(c["args"][2], c["args"][8]) for c in token_calls] == [
+            ("a", "summarize"),
+            ("b", "summarize"),
+        ]
+        assert notifier._pending_node["job-4"] == "answer"
+
+        notifier.clear_token_counter("job-4")
+
+    @pytest.mark.asyncio
+    async def test_finalize_flushes_remaining_buffer(
+        self, mock_redis: AsyncMock, token_calls: list[dict]
+    ):
+        """finalize_token_stream은 남은 버퍼를 발행한 뒤 최종 State 저장."""
+        notifier = self._notifier(mock_redis, coalesce_ms=10_000, coalesce_chars=1000)
+
+        for token in ["안녕", "하세", "요"]:
+            await notifier.notify_token_v2(task_id="job-5", content=token, node="answer")
+        await notifier.finalize_token_stream("job-5")
+
+        assert [c["args"][2] for c in token_calls] == ["안녕", "하세요"]
+
+        # finalize: 증분 Text 키를 State 하나로 병합
+        pipe = mock_redis.pipeline.return_value
+        state = json.loads(pipe.setex.call_args.args[2])
+        pipe.delete.assert_called_once_with("chat:token_text:job-5")
+        assert state["accumulated"] == "안녕하세요"
+        assert state["last_seq"] == TOKEN_SEQ_START + 2
+        assert state["completed"] is True
+        assert "job-5" not in notifier._pending_parts
+        assert "job-5" not in notifier._flush_timers
+
+    @pytest.mark.asyncio
+    async def test_coalescing_disabled_publishes_every_token(
+        self, mock_redis: AsyncMock, token_calls: list[dict]
+    ):
+        """coalesce_ms=0이면 토큰마다 발행 (기존 동작)."""
+        notifier = self._notifier(mock_redis, coalesce_ms=0, coalesce_chars=0)
+
+        for token in ["a", "b", "c"]:
+            msg_id = await notifier.notify_token_v2(task_id="job-6", content=token)
+            assert msg_id != ""
+
+        assert len(token_calls) == 3
+
+        notifier.clear_token_counter("job-6")
+
+
+class TestIncrementalTokenState:
+    """Token State 증분 저장 테스트 (전체 누적 텍스트 재전송 없음)."""
+
+    @pytest.fixture
+    def token_calls(self) -> list[dict]:
+        return []
+
+    @pytest.fixture
+    def notifier(self, token_calls: list[dict]) -> RedisProgressNotifier:
+        redis = AsyncMock()
+
+        async def mock_token_v2_script(keys, args):
+            token_calls.append({"keys": keys, "args": args})
+            return [b"1-0", b"1-1"]
+
+        redis.register_script = MagicMock(return_value=MagicMock(side_effect=mock_token_v2_script))
+        return RedisProgressNotifier(redis=redis, coalesce_ms=0, coalesce_chars=0)
+
+    @pytest.mark.asyncio
+    async def test_text_chunk_sent_only_on_state_save(
+        self, notifier: RedisProgressNotifier, token_calls: list[dict]
+    ):
+        """State 저장 시점에만 마지막 저장 이후 조각을 APPEND용으로 전달."""
+        for i in range(TOKEN_STATE_SAVE_INTERVAL * 2):
+            await notifier.notify_token_v2(task_id="job-inc", content=str(i % 10))
+
+        chunks = [c["args"][4] for c in token_calls]
+        save_flags = [c["args"][5] for c in token_calls]
+
+        assert save_flags.count("1") == 2
+        assert chunks[TOKEN_STATE_SAVE_INTERVAL - 1] == "0123456789"
+        assert chunks[TOKEN_STATE_SAVE_INTERVAL * 2 - 1] == "0123456789"
+        assert all(chunk == "" for chunk, flag in zip(chunks, save_flags) if flag == "0")
+        assert token_calls[0]["keys"][3] == "chat:token_text:job-inc"
+
+        notifier.clear_token_counter("job-inc")
+
+    @pytest.mark.asyncio
+    async def test_failed_state_save_retries_chunk(
+        self, notifier: RedisProgressNotifier, token_calls: list[dict]
+    ):
+        """State 저장 실패 시 미반영 조각은 다음 저장에 함께 전달."""
+        script = notifier._redis.register_script.return_value
+        original = script.side_effect
+
+        async def flaky(keys, args):
+            if args[5] == "1" and not getattr(flaky, "failed", False):
+                flaky.failed = True
+                raise ConnectionError("redis down")
+            return await original(keys, args)
+
+        script.side_effect = flaky
+
+        for _ in range(TOKEN_STATE_SAVE_INTERVAL * 2):
+            await notifier.notify_token_v2(task_id="job-retry", content="a")
+
+        saved = [c["args"][4] for c in token_calls if c["args"][5] == "1"]
+        assert saved == ["a" * TOKEN_STATE_SAVE_INTERVAL * 2]
+
+        notifier.clear_token_counter("job-retry")
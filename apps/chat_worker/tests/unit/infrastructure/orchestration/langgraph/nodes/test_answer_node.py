@@ -5,8 +5,11 @@ P2: Multi-Intent Policy 조합 주입
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+
 import pytest
 
+from chat_worker.infrastructure.cache.semantic_cache import MinHashSemanticCache
 from chat_worker.infrastructure.orchestration.langgraph.nodes.answer_node import (
     create_answer_node,
 )
@@ -155,6 +158,33 @@ class TestMultiIntentAnswer:
         assert mock_llm.call_count == 1
 
 
+class TestAnswerNodeSemanticCache:
+    """유사 질문 Answer 캐시 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_variant_question_served_from_cache(self):
+        """단일 턴 분리배출 질문은 표기만 달라도 캐시 답변을 발행 (LLM 생략)."""
+        mock_llm = MockLLMClient()
+        mock_llm.set_responses(["라벨을 떼고 버려요."])
+        publisher = AsyncMock()
+        node = create_answer_node(
+            mock_llm, event_publisher=publisher, semantic_cache=MinHashSemanticCache()
+        )
+        rules = {"data": {"category": "무색페트병"}}
+
+        state = {"intent": "waste", "disposal_rules": rules}
+
+        first = await node({**state, "job_id": "job-1", "message": "페트병 어떻게 버려?"})
+        second = await node({**state, "job_id": "job-2", "message": "페트병 어떻게 버려요"})
+
+        assert second["answer"] == first["answer"] == "라벨을 떼고 버려요."
+        assert mock_llm.call_count == 1
+        publisher.notify_token_v2.assert_any_await(
+            task_id="job-2", content="라벨을 떼고 버려요.", node="answer"
+        )
+        publisher.finalize_token_stream.assert_any_await("job-2")
+
+
 class TestAnswerNodeErrorHandling:
     """Answer Node 에러 처리 테스트."""
 
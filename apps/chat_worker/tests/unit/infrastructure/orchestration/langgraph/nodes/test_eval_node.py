@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+
 import pytest
 
 from chat_worker.application.dto.eval_config import EvalConfig
 from chat_worker.infrastructure.orchestration.langgraph.nodes.eval_node import (
     _make_failed_eval_result,
+    build_eval_job,
+    create_eval_dispatch_node,
     create_eval_entry_node,
 )
 
@@ -105,3 +109,68 @@ class TestMakeFailedEvalResult:
         assert result["eval_improvement_hints"] == []
         assert result["eval_retry_count"] == 0
         assert result["_prev_eval_score"] is None
+
+
+@pytest.mark.eval_unit
+class TestEvalDispatchNode:
+    """eval_dispatch 노드 테스트 (async/shadow 모드)."""
+
+    def test_build_eval_job_keeps_eval_inputs_only(self) -> None:
+        """평가 입력 키만 남기고 None 제거."""
+        job = build_eval_job(
+            {
+                "job_id": "job-1",
+                "message": "페트병 버리는 법",
+                "intent": "waste",
+                "answer": "라벨을 떼고 버려요.",
+                "disposal_rules": None,
+                "user_location": {"lat": 37.5},
+            }
+        )
+
+        assert job == {
+            "job_id": "job-1",
+            "message": "페트병 버리는 법",
+            "intent": "waste",
+            "answer": "라벨을 떼고 버려요.",
+        }
+
+    def test_build_eval_job_stringifies_non_json_values(self) -> None:
+        """JSON 직렬화 불가 값은 문자열로 변환."""
+
+        class Rule:
+            def __str__(self) -> str:
+                return "rule"
+
+        job = build_eval_job({"disposal_rules": {"items": [Rule()]}})
+
+        assert job == {"disposal_rules": {"items": ["rule"]}}
+
+    async def test_dispatch_enqueues_job_without_state_update(self) -> None:
+        """작업 적재 후 state 변경 없이 반환."""
+        queue = AsyncMock()
+        queue.enqueue.return_value = True
+        node = create_eval_dispatch_node(EvalConfig(eval_sample_rate=1.0), queue)
+
+        result = await node({"job_id": "job-1", "intent": "waste", "answer": "답변"})
+
+        assert result == {}
+        queue.enqueue.assert_awaited_once_with(
+            {"job_id": "job-1", "intent": "waste", "answer": "답변"}
+        )
+
+    async def test_dispatch_respects_sample_rate(self) -> None:
+        """eval_sample_rate=0이면 적재하지 않음."""
+        queue = AsyncMock()
+        node = create_eval_dispatch_node(EvalConfig(eval_sample_rate=0.0), queue)
+
+        assert await node({"job_id": "job-1"}) == {}
+        queue.enqueue.assert_not_awaited()
+
+    async def test_dispatch_swallows_queue_errors(self) -> None:
+        """큐 장애가 답변 흐름을 막지 않음."""
+        queue = AsyncMock()
+        queue.enqueue.side_effect = ConnectionError("redis down")
+        node = create_eval_dispatch_node(EvalConfig(), queue)
+
+        assert await node({"job_id": "job-1"}) == {}
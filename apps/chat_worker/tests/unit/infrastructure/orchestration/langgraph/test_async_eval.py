@@ -0,0 +1,166 @@
+"""비동기 평가 경로 테스트 (route_after_answer, 그래프 배선, EvalWorkerService)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from chat_worker.application.dto.eval_config import EvalConfig
+from chat_worker.application.dto.eval_result import EvalResult
+from chat_worker.infrastructure.orchestration.langgraph.eval_graph_factory import (
+    create_route_after_answer,
+)
+from chat_worker.infrastructure.orchestration.langgraph.eval_worker_service import (
+    EvalWorkerService,
+)
+from chat_worker.infrastructure.orchestration.langgraph.factory import create_chat_graph
+
+
+def _build_graph(eval_config: EvalConfig, eval_job_queue=None):
+    return create_chat_graph(
+        llm=MagicMock(),
+        retriever=MagicMock(),
+        event_publisher=AsyncMock(),
+        prompt_loader=MagicMock(),
+        eval_config=eval_config,
+        eval_job_queue=eval_job_queue,
+    )
+
+
+@pytest.mark.eval_unit
+class TestRouteAfterAnswer:
+    """route_after_answer 테스트."""
+
+    def test_blocking_intent_routes_to_eval(self) -> None:
+        route = create_route_after_answer(
+            EvalConfig(eval_mode="async", eval_blocking_intents=frozenset({"waste"}))
+        )
+
+        assert route({"intent": "waste"}) == "eval"
+        assert route({"intent": "general"}) == "dispatch"
+        assert route({}) == "dispatch"
+
+
+@pytest.mark.eval_unit
+class TestChatGraphEvalWiring:
+    """create_chat_graph eval 배선 테스트."""
+
+    def test_async_mode_adds_dispatch_branch(self) -> None:
+        graph = _build_graph(
+            EvalConfig(enable_eval_pipeline=True, eval_mode="async"), eval_job_queue=AsyncMock()
+        )
+
+        assert "eval_dispatch" in graph.builder.nodes
+        assert "answer" in graph.builder.branches
+        assert ("eval_dispatch", "__end__") in graph.builder.edges
+        assert ("answer", "eval") not in graph.builder.edges
+
+    def test_sync_mode_keeps_blocking_eval(self) -> None:
+        graph = _build_graph(
+            EvalConfig(enable_eval_pipeline=True, eval_mode="sync"), eval_job_queue=AsyncMock()
+        )
+
+        assert "eval_dispatch" not in graph.builder.nodes
+        assert ("answer", "eval") in graph.builder.edges
+
+    def test_async_mode_without_queue_falls_back_to_blocking_eval(self) -> None:
+        graph = _build_graph(EvalConfig(enable_eval_pipeline=True, eval_mode="async"))
+
+        assert "eval_dispatch" not in graph.builder.nodes
+        assert ("answer", "eval") in graph.builder.edges
+
+
+def _eval_result() -> dict:
+    return EvalResult.failed("test").to_dict()
+
+
+@pytest.mark.eval_unit
+class TestEvalWorkerService:
+    """EvalWorkerService.process_batch 테스트."""
+
+    @pytest.fixture
+    def queue(self) -> AsyncMock:
+        queue = AsyncMock()
+        queue.read.side_effect = [
+            [],  # pending 없음
+            [("1-0", {"job_id": "job-1", "intent": "waste", "enqueued_at": 0.0}), ("2-0", {})],
+        ]
+        queue.claim_idle.return_value = []
+        return queue
+
+    async def test_process_batch_evaluates_saves_and_acks(self, queue: AsyncMock) -> None:
+        subgraph = AsyncMock()
+        subgraph.ainvoke.return_value = {"eval_result": _eval_result(), "eval_grade": "B"}
+        gateway = AsyncMock()
+        service = EvalWorkerService(queue, subgraph, result_gateway=gateway, consumer_name="w1")
+
+        assert await service.process_batch() == 2
+
+        assert queue.read.call_args_list[0].kwargs["pending"] is True
+        subgraph.ainvoke.assert_awaited_once_with({"job_id": "job-1", "intent": "waste"})
+        saved = gateway.save_result.call_args.args[0]
+        assert isinstance(saved, EvalResult)
+        assert saved.grade == "B"
+        queue.ack.assert_awaited_once_with(["1-0", "2-0"])
+
+    async def test_pending_jobs_are_processed_first(self) -> None:
+        queue = AsyncMock()
+        queue.read.side_effect = [[("1-0", {"job_id": "job-1"})], [], []]
+        queue.claim_idle.return_value = []
+        subgraph = AsyncMock()
+        subgraph.ainvoke.return_value = {}
+        service = EvalWorkerService(queue, subgraph)
+
+        assert await service.process_batch() == 1
+        assert await service.process_batch() == 0
+
+        pending_flags = [c.kwargs.get("pending", False) for c in queue.read.call_args_list]
+        assert pending_flags == [True, True, False]
+
+    async def test_idle_jobs_are_reclaimed_before_new_jobs(self) -> None:
+        queue = AsyncMock()
+        queue.read.side_effect = [[], [], []]
+        queue.claim_idle.side_effect = [[("1-0", {"job_id": "job-1"})]]
+        subgraph = AsyncMock()
+        subgraph.ainvoke.return_value = {}
+        service = EvalWorkerService(
+            queue, subgraph, consumer_name="w1", claim_idle_ms=1000, claim_interval_seconds=60
+        )
+
+        assert await service.process_batch() == 1
+        assert await service.process_batch() == 0
+
+        # 회수 주기 전에는 다시 XAUTOCLAIM 하지 않음
+        queue.claim_idle.assert_awaited_once_with("w1", 1000, count=10)
+        queue.ack.assert_awaited_once_with(["1-0"])
+
+    async def test_claim_disabled(self, queue: AsyncMock) -> None:
+        subgraph = AsyncMock()
+        subgraph.ainvoke.return_value = {}
+        service = EvalWorkerService(queue, subgraph, claim_idle_ms=0)
+
+        assert await service.process_batch() == 2
+
+        queue.claim_idle.assert_not_awaited()
+
+    async def test_failed_eval_is_still_acked(self, queue: AsyncMock) -> None:
+        subgraph = AsyncMock()
+        subgraph.ainvoke.side_effect = RuntimeError("grader down")
+        gateway = AsyncMock()
+        service = EvalWorkerService(queue, subgraph, result_gateway=gateway)
+
+        assert await service.process_batch() == 2
+
+        gateway.save_result.assert_not_awaited()
+        queue.ack.assert_awaited_once_with(["1-0", "2-0"])
+
+    async def test_degraded_result_is_not_saved(self, queue: AsyncMock) -> None:
+        subgraph = AsyncMock()
+        subgraph.ainvoke.return_value = {"eval_result": {"degraded": True}}
+        gateway = AsyncMock()
+        service = EvalWorkerService(queue, subgraph, result_gateway=gateway)
+
+        await service.process_batch()
+
+        gateway.save_result.assert_not_awaited()
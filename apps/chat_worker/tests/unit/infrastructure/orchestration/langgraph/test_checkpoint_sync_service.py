@@ -0,0 +1,204 @@
+"""CheckpointSyncService 단위 테스트.
+
+배치 drain (RPOP count), bulk 동기화 (동시 fetch + 단일 트랜잭션),
+트랜잭션 실패 시 건별 fallback/DLQ, queue lag 메트릭 검증.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langgraph.checkpoint.base import CheckpointTuple
+
+
+def _event(thread_id: str, checkpoint_id: str = "cp-1", **extra) -> dict:
+    return {"thread_id": thread_id, "checkpoint_ns": "", "checkpoint_id": checkpoint_id, **extra}
+
+
+def _tuple(thread_id: str, pending_writes: list | None = None) -> CheckpointTuple:
+    return CheckpointTuple(
+        config={
+            "configurable": {"thread_id": thread_id, "checkpoint_ns": "", "checkpoint_id": "cp-1"}
+        },
+        checkpoint={
+            "v": 1,
+            "id": "cp-1",
+            "ts": "2026-01-24T00:00:00+00:00",
+            "channel_values": {"messages": ["hi"]},
+            "channel_versions": {"messages": "2"},
+        },
+        metadata={"step": 1},
+        pending_writes=pending_writes or [],
+        parent_config=None,
+    )
+
+
+@pytest.fixture
+def mock_redis():
+    redis = AsyncMock()
+    redis.pipeline = MagicMock()
+    return redis
+
+
+@pytest.fixture
+def mock_redis_saver():
+    saver = AsyncMock()
+    saver.aget_tuple = AsyncMock(
+        side_effect=lambda config: _tuple(config["configurable"]["thread_id"])
+    )
+    return saver
+
+
+@pytest.fixture
+def mock_pg_saver():
+    saver = AsyncMock()
+    saver.conn = MagicMock()  # 단일 연결 (pool 아님)
+    return saver
+
+
+def _service(mock_redis, mock_redis_saver, mock_pg_saver, **kwargs):
+    from chat_worker.infrastructure.orchestration.langgraph.sync import (
+        CheckpointSyncService,
+    )
+
+    return CheckpointSyncService(
+        redis=mock_redis,
+        redis_saver=mock_redis_saver,
+        pg_saver=mock_pg_saver,
+        **kwargs,
+    )
+
+
+class TestCollectBatch:
+    """BRPOP 후 RPOP count로 일괄 drain."""
+
+    async def test_drains_with_count_pop(self, mock_redis, mock_redis_saver, mock_pg_saver):
+        service = _service(mock_redis, mock_redis_saver, mock_pg_saver, batch_size=5)
+        mock_redis.brpop = AsyncMock(return_value=("q", json.dumps(_event("t0"))))
+        mock_redis.rpop = AsyncMock(
+            side_effect=[[json.dumps(_event("t1")), json.dumps(_event("t2"))], None]
+        )
+
+        batch = await service._collect_batch(asyncio.Event())
+
+        assert [e["thread_id"] for e in batch] == ["t0", "t1", "t2"]
+        # 남은 자리만큼 count 지정
+        assert mock_redis.rpop.await_args_list[0].args[1] == 4
+        assert mock_redis.rpop.await_args_list[1].args[1] == 2
+
+
+class TestBulkSync:
+    """bulk 모드: 동시 fetch + 배치 단일 트랜잭션."""
+
+    async def test_fetch_concurrency_bounded(self, mock_redis, mock_redis_saver, mock_pg_saver):
+        service = _service(mock_redis, mock_redis_saver, mock_pg_saver, fetch_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def slow_get(config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _tuple(config["configurable"]["thread_id"])
+
+        mock_redis_saver.aget_tuple = AsyncMock(side_effect=slow_get)
+
+        synced = await service._sync_batch([_event(f"t{i}") for i in range(6)])
+
+        assert synced == 6
+        assert peak == 2
+        assert mock_pg_saver.aput.await_count == 6
+        mock_pg_saver.conn.transaction.assert_called_once()
+
+    async def test_dedupes_by_thread(self, mock_redis, mock_redis_saver, mock_pg_saver):
+        service = _service(mock_redis, mock_redis_saver, mock_pg_saver)
+
+        synced = await service._sync_batch([_event("t1", "cp-1"), _event("t1", "cp-2")])
+
+        assert synced == 1
+        mock_redis_saver.aget_tuple.assert_awaited_once()
+
+    async def test_writes_channel_blobs_and_grouped_writes(
+        self, mock_redis, mock_redis_saver, mock_pg_saver
+    ):
+        """new_versions=channel_versions로 blob 저장, writes는 task 단위로 묶어서 기록."""
+        mock_redis_saver.aget_tuple = AsyncMock(
+            return_value=_tuple("t1", [("task-a", "x", 1), ("task-a", "y", 2), ("task-b", "z", 3)])
+        )
+        service = _service(mock_redis, mock_redis_saver, mock_pg_saver)
+
+        await service._sync_batch([_event("t1")])
+
+        assert mock_pg_saver.aput.await_args.kwargs["new_versions"] == {"messages": "2"}
+        calls = {
+            c.kwargs["task_id"]: c.kwargs["writes"]
+            for c in mock_pg_saver.aput_writes.await_args_list
+        }
+        assert calls == {"task-a": [("x", 1), ("y", 2)], "task-b": [("z", 3)]}
+
+    async def test_transaction_failure_falls_back_per_checkpoint(
+        self, mock_redis, mock_redis_saver, mock_pg_saver
+    ):
+        service = _service(mock_redis, mock_redis_saver, mock_pg_saver)
+        service._write_bulk = AsyncMock(side_effect=RuntimeError("tx aborted"))
+
+        async def aput(config, **kwargs):
+            if config["configurable"]["thread_id"] == "bad":
+                raise RuntimeError("bad row")
+
+        mock_pg_saver.aput = AsyncMock(side_effect=aput)
+
+        synced = await service._sync_batch([_event("t1"), _event("bad"), _event("t2")])
+
+        assert synced == 2
+        dlq_events = [json.loads(c.args[1]) for c in mock_redis.lpush.await_args_list]
+        assert [e["thread_id"] for e in dlq_events] == ["bad"]
+
+    async def test_fetch_error_sent_to_dlq(self, mock_redis, mock_redis_saver, mock_pg_saver):
+        async def get(config):
+            if config["configurable"]["thread_id"] == "bad":
+                raise ConnectionError("redis down")
+            return _tuple(config["configurable"]["thread_id"])
+
+        mock_redis_saver.aget_tuple = AsyncMock(side_effect=get)
+        service = _service(mock_redis, mock_redis_saver, mock_pg_saver)
+
+        synced = await service._sync_batch([_event("bad"), _event("t1")])
+
+        assert synced == 1
+        mock_redis.lpush.assert_awaited_once()
+
+    async def test_serial_mode(self, mock_redis, mock_redis_saver, mock_pg_saver):
+        service = _service(mock_redis, mock_redis_saver, mock_pg_saver, bulk=False)
+
+        synced = await service._sync_batch([_event("t1"), _event("t2")])
+
+        assert synced == 2
+        mock_pg_saver.conn.transaction.assert_not_called()
+
+
+class TestQueueLag:
+    """가장 오래된 이벤트 ts 기반 lag 메트릭."""
+
+    async def test_records_depth_and_lag(self, mock_redis, mock_redis_saver, mock_pg_saver):
+        from chat_worker.infrastructure.metrics import (
+            CHAT_CHECKPOINT_SYNC_LAG_SECONDS,
+            CHAT_CHECKPOINT_SYNC_QUEUE_DEPTH,
+        )
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[7, json.dumps(_event("t1", ts=time.time() - 30))])
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+        service = _service(mock_redis, mock_redis_saver, mock_pg_saver)
+
+        await service._record_queue_lag()
+
+        pipe.lindex.assert_called_once_with("checkpoint:sync:queue", -1)
+        assert CHAT_CHECKPOINT_SYNC_QUEUE_DEPTH._value.get() == 7
+        assert 29 <= CHAT_CHECKPOINT_SYNC_LAG_SECONDS._value.get() < 40
@@ -0,0 +1,259 @@
+"""PlainAsyncRedisSaver 단위 테스트.
+
+Pending writes 인덱스 (SCAN 없는 조회), 바이너리 blob 저장 포맷 검증.
+"""
+
+from __future__ import annotations
+
+import base64
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def saver():
+    from chat_worker.infrastructure.orchestration.langgraph.sync import (
+        PlainAsyncRedisSaver,
+    )
+
+    saver = PlainAsyncRedisSaver(redis_url="redis://localhost:6379/0")
+    saver._redis = MagicMock()
+    return saver
+
+
+def _mock_pipeline(results: list | None = None) -> MagicMock:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=results or [])
+    return pipe
+
+
+def _legacy(saver, obj) -> str:
+    """format 필드 도입 이전 포맷: "type_tag:base64"."""
+    type_tag, data = saver.serde.dumps_typed(obj)
+    return f"{type_tag}:{base64.b64encode(data).decode()}"
+
+
+def _cp_config(checkpoint_id: str = "cp-1") -> dict:
+    return {
+        "configurable": {
+            "thread_id": "t1",
+            "checkpoint_ns": "",
+            "checkpoint_id": checkpoint_id,
+        }
+    }
+
+
+class TestPendingWritesIndex:
+    """aput_writes가 task_id 인덱스를 유지하고 조회는 인덱스만 사용."""
+
+    async def test_latest_state_reads_pointer_and_writes_count(self, saver):
+        script = AsyncMock(return_value=[b"cp-3", 2])
+        saver._redis.register_script = MagicMock(return_value=script)
+
+        assert await saver.aget_latest_state("t1") == ("cp-3", 2)
+
+        script.assert_awaited_once_with(keys=["cp:latest:t1:"], args=["", "cp:writes_idx:t1::"])
+
+    async def test_latest_state_expired_pointer(self, saver):
+        saver._redis.register_script = MagicMock(return_value=AsyncMock(return_value=[None, 0]))
+
+        assert await saver.aget_latest_state("t1", "", "cp-1") == (None, 0)
+
+    async def test_aput_writes_adds_task_to_index(self, saver):
+        pipe = _mock_pipeline()
+        saver._redis.pipeline = MagicMock(return_value=pipe)
+
+        await saver.aput_writes(_cp_config(), [("messages", "hi")], task_id="task-a")
+
+        pipe.sadd.assert_called_once_with("cp:writes_idx:t1::cp-1", "task-a")
+        pipe.expire.assert_any_call("cp:writes_idx:t1::cp-1", saver._ttl_seconds)
+
+    async def test_aput_marks_checkpoint_indexed(self, saver):
+        from chat_worker.infrastructure.orchestration.langgraph.sync.plain_redis_saver import (
+            WRITES_INDEXED_FIELD,
+        )
+
+        pipe = _mock_pipeline()
+        saver._redis.pipeline = MagicMock(return_value=pipe)
+
+        await saver.aput(
+            {"configurable": {"thread_id": "t1", "checkpoint_ns": ""}},
+            {"id": "cp-1", "ts": "2026-01-24T00:00:00+00:00"},
+            {"step": 1},
+            {},
+        )
+
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        assert mapping[WRITES_INDEXED_FIELD] == "1"
+
+    async def test_get_pending_writes_uses_index_without_scan(self, saver):
+        hashes = [
+            {"0:y": saver._dumps_bin({"channel": "y", "value": 2})},
+            {
+                "0:messages": saver._dumps_bin({"channel": "messages", "value": "hi"}),
+                "1:x": saver._dumps_bin({"channel": "x", "value": 1}),
+            },
+        ]
+        pipe = _mock_pipeline(hashes)
+        saver._redis.pipeline = MagicMock(return_value=pipe)
+        saver._redis.smembers = AsyncMock(return_value={"task-b", "task-a"})
+        saver._redis.scan_iter = MagicMock()
+
+        writes = await saver._get_pending_writes("t1", "", "cp-1")
+
+        assert writes == [
+            ("task-a", "y", 2),
+            ("task-b", "messages", "hi"),
+            ("task-b", "x", 1),
+        ]
+        assert [c.args[0] for c in pipe.hgetall.call_args_list] == [
+            "cp:writes:t1::cp-1:task-a",
+            "cp:writes:t1::cp-1:task-b",
+        ]
+        saver._redis.scan_iter.assert_not_called()
+
+    async def test_get_pending_writes_empty_index(self, saver):
+        saver._redis.smembers = AsyncMock(return_value=set())
+        saver._redis.pipeline = MagicMock()
+
+        writes = await saver._get_pending_writes("t1", "", "cp-1")
+
+        assert writes == []
+        saver._redis.pipeline.assert_not_called()
+
+    async def test_legacy_checkpoint_falls_back_to_scan(self, saver):
+        """인덱스 플래그가 없는 checkpoint는 SCAN 경로로 조회."""
+        saver._redis.hgetall = AsyncMock(
+            return_value={
+                b"checkpoint": _legacy(saver, {"id": "cp-1"}).encode(),
+                b"metadata": _legacy(saver, {}).encode(),
+                b"parent_checkpoint_id": b"",
+            }
+        )
+        saver._scan_pending_writes = AsyncMock(return_value=[])
+        saver._get_pending_writes = AsyncMock(return_value=[])
+
+        await saver.aget_tuple(_cp_config())
+
+        saver._scan_pending_writes.assert_awaited_once_with("t1", "", "cp-1")
+        saver._get_pending_writes.assert_not_called()
+
+
+class TestBlobFormat:
+    """channel 값 blob 분리 저장 + 바이너리 포맷."""
+
+    @staticmethod
+    def _checkpoint() -> dict:
+        return {
+            "v": 1,
+            "id": "cp-2",
+            "ts": "2026-01-24T00:00:00+00:00",
+            "channel_values": {"messages": ["hi", "hello"], "intent": "waste"},
+            "channel_versions": {"messages": "3", "intent": "1", "__start__": "2"},
+            "versions_seen": {},
+        }
+
+    async def test_aput_writes_only_changed_channels(self, saver):
+        from chat_worker.infrastructure.orchestration.langgraph.sync.plain_redis_saver import (
+            FORMAT_BLOB,
+            FORMAT_FIELD,
+        )
+
+        pipe = _mock_pipeline([True] * 20)
+        saver._redis.pipeline = MagicMock(return_value=pipe)
+
+        await saver.aput(_cp_config("cp-1"), self._checkpoint(), {"step": 2}, {"messages": "3"})
+
+        blob_sets = [c for c in pipe.set.call_args_list if c.args[0].startswith("cp:blob:")]
+        assert [c.args[0] for c in blob_sets] == ["cp:blob:t1::messages:3"]
+        assert saver._loads_bin(blob_sets[0].args[1]) == ["hi", "hello"]
+        # 변경되지 않은 channel은 TTL만 연장
+        expired = [c.args[0] for c in pipe.expire.call_args_list]
+        assert "cp:blob:t1::intent:1" in expired
+        assert "cp:blob:t1::__start__:2" in expired
+
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        assert mapping[FORMAT_FIELD] == FORMAT_BLOB
+        body = saver._loads_bin(mapping["checkpoint"])
+        assert body["channel_values"] == {}
+        assert isinstance(mapping["checkpoint"], bytes)
+
+    async def test_aput_empty_new_versions_writes_all_channels(self, saver):
+        """PG promote처럼 new_versions={}이면 전체 channel 기록 (빈 channel은 empty 마커)."""
+        pipe = _mock_pipeline([True] * 20)
+        saver._redis.pipeline = MagicMock(return_value=pipe)
+
+        await saver.aput(_cp_config("cp-1"), self._checkpoint(), {}, {})
+
+        blobs = {
+            c.args[0]: c.args[1]
+            for c in pipe.set.call_args_list
+            if c.args[0].startswith("cp:blob:")
+        }
+        assert set(blobs) == {
+            "cp:blob:t1::messages:3",
+            "cp:blob:t1::intent:1",
+            "cp:blob:t1::__start__:2",
+        }
+        assert blobs["cp:blob:t1::__start__:2"] == b"empty\x00"
+
+    async def test_aget_tuple_reassembles_channel_values(self, saver):
+        checkpoint = self._checkpoint()
+        body = {**checkpoint, "channel_values": {}}
+        saver._redis.hgetall = AsyncMock(
+            return_value={
+                b"checkpoint": saver._dumps_bin(body),
+                b"metadata": saver._dumps_bin({"step": 2}),
+                b"parent_checkpoint_id": b"cp-1",
+                b"format": b"2",
+                b"writes_indexed": b"1",
+            }
+        )
+        saver._redis.mget = AsyncMock(
+            return_value=[
+                saver._dumps_bin(["hi", "hello"]),
+                saver._dumps_bin("waste"),
+                b"empty\x00",
+            ]
+        )
+        saver._redis.smembers = AsyncMock(return_value=set())
+
+        result = await saver.aget_tuple(_cp_config("cp-2"))
+
+        assert result.checkpoint["channel_values"] == checkpoint["channel_values"]
+        assert result.metadata == {"step": 2}
+        assert result.parent_config["configurable"]["checkpoint_id"] == "cp-1"
+        saver._redis.mget.assert_awaited_once_with(
+            ["cp:blob:t1::messages:3", "cp:blob:t1::intent:1", "cp:blob:t1::__start__:2"]
+        )
+
+    async def test_legacy_checkpoint_readable(self, saver):
+        checkpoint = self._checkpoint()
+        saver._redis.hgetall = AsyncMock(
+            return_value={
+                b"checkpoint": _legacy(saver, checkpoint).encode(),
+                b"metadata": _legacy(saver, {"step": 1}).encode(),
+                b"parent_checkpoint_id": b"",
+            }
+        )
+        saver._redis.scan_iter = MagicMock(return_value=_aiter([]))
+        saver._redis.mget = AsyncMock()
+
+        result = await saver.aget_tuple(_cp_config("cp-2"))
+
+        assert result.checkpoint["channel_values"] == checkpoint["channel_values"]
+        assert result.metadata == {"step": 1}
+        saver._redis.mget.assert_not_called()
+
+    def test_loads_value_accepts_both_formats(self, saver):
+        entry = {"channel": "messages", "value": "hi"}
+
+        assert saver._loads_value(saver._dumps_bin(entry)) == entry
+        assert saver._loads_value(_legacy(saver, entry).encode()) == entry
+        assert saver._loads_value(_legacy(saver, entry)) == entry
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
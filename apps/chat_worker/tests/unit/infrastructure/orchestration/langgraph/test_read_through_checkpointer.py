@@ -337,3 +337,143 @@ class TestStats:
         stats = checkpointer.get_stats()
         assert stats["promote_count"] == 1
         assert stats["miss_count"] == 1
+
+
+class TestLocalCache:
+    """프로세스 내 LRU (latest/writes 검증, 무효화, 바이트 기반 eviction)."""
+
+    @pytest.fixture
+    def cached(self, mock_redis_saver, mock_pg_saver):
+        from chat_worker.infrastructure.orchestration.langgraph.sync import (
+            ReadThroughCheckpointer,
+        )
+
+        return ReadThroughCheckpointer(
+            redis_saver=mock_redis_saver,
+            pg_saver=mock_pg_saver,
+            local_cache_max_bytes=1024 * 1024,
+        )
+
+    @staticmethod
+    def _tuple(
+        thread_id: str, checkpoint_id: str, payload: str = "", pending_writes: list | None = None
+    ) -> CheckpointTuple:
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": "",
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={
+                "v": 1,
+                "id": checkpoint_id,
+                "ts": "2026-01-24T00:00:00+00:00",
+                "channel_values": {"messages": ["hi"], "payload": payload},
+                "channel_versions": {"messages": "2"},
+                "versions_seen": {},
+            },
+            metadata={"step": 1},
+            pending_writes=pending_writes or [],
+            parent_config=None,
+        )
+
+    async def test_hit_skips_redis_read(self, cached, mock_redis_saver, sample_config):
+        mock_redis_saver.aget_tuple = AsyncMock(return_value=self._tuple("session-123", "cp-1"))
+        mock_redis_saver.aget_latest_state = AsyncMock(return_value=("cp-1", 0))
+
+        first = await cached.aget_tuple(sample_config)
+        second = await cached.aget_tuple(sample_config)
+
+        assert mock_redis_saver.aget_tuple.await_count == 1
+        assert second.checkpoint == first.checkpoint
+        assert second.pending_writes == []
+        # 호출자 간 객체 공유 없음
+        assert second.checkpoint["channel_values"]["messages"] is not (
+            first.checkpoint["channel_values"]["messages"]
+        )
+        stats = cached.get_stats()
+        assert stats["local_hit_count"] == 1
+        assert stats["local_miss_count"] == 1
+        assert stats["local_entries"] == 1
+        assert stats["local_bytes"] > 0
+
+    async def test_stale_latest_pointer_reads_redis(self, cached, mock_redis_saver, sample_config):
+        mock_redis_saver.aget_tuple = AsyncMock(return_value=self._tuple("session-123", "cp-1"))
+        mock_redis_saver.aget_latest_state = AsyncMock(return_value=("cp-1", 0))
+        await cached.aget_tuple(sample_config)
+
+        # 다른 worker가 cp-2를 저장
+        mock_redis_saver.aget_latest_state = AsyncMock(return_value=("cp-2", 0))
+        mock_redis_saver.aget_tuple = AsyncMock(return_value=self._tuple("session-123", "cp-2"))
+
+        result = await cached.aget_tuple(sample_config)
+
+        assert result.checkpoint["id"] == "cp-2"
+        mock_redis_saver.aget_tuple.assert_awaited_once()
+
+    async def test_writes_from_other_worker_reads_redis(
+        self, cached, mock_redis_saver, sample_config
+    ):
+        mock_redis_saver.aget_tuple = AsyncMock(return_value=self._tuple("session-123", "cp-1"))
+        mock_redis_saver.aget_latest_state = AsyncMock(return_value=("cp-1", 0))
+        await cached.aget_tuple(sample_config)
+
+        # 다른 worker가 같은 cp-1에 aput_writes (latest pointer 그대로)
+        writes = [("task-b", "messages", "x")]
+        mock_redis_saver.aget_latest_state = AsyncMock(return_value=("cp-1", 1))
+        mock_redis_saver.aget_tuple = AsyncMock(
+            return_value=self._tuple("session-123", "cp-1", pending_writes=writes)
+        )
+
+        result = await cached.aget_tuple(sample_config)
+
+        assert result.pending_writes == writes
+        mock_redis_saver.aget_tuple.assert_awaited_once()
+        assert cached.get_stats()["local_entries"] == 0
+
+    async def test_tuple_with_pending_writes_not_cached(self, cached, mock_redis_saver):
+        item = self._tuple("session-123", "cp-1", pending_writes=[("task-a", "messages", "hi")])
+        mock_redis_saver.aget_tuple = AsyncMock(return_value=item)
+
+        await cached.aget_tuple(item.config)
+
+        assert cached.get_stats()["local_entries"] == 0
+
+    async def test_aput_and_aput_writes_invalidate(self, cached, mock_redis_saver):
+        config = self._tuple("session-123", "cp-1").config
+        mock_redis_saver.aget_tuple = AsyncMock(return_value=self._tuple("session-123", "cp-1"))
+        await cached.aget_tuple(config)
+        assert cached.get_stats()["local_entries"] == 1
+
+        await cached.aput_writes(config, [("messages", "x")], task_id="task-b")
+        assert cached.get_stats()["local_entries"] == 0
+
+        await cached.aget_tuple(config)
+        await cached.aput(config, {"id": "cp-2"}, {}, {})
+        assert cached.get_stats()["local_entries"] == 0
+
+    async def test_evicts_by_bytes(self, mock_redis_saver, mock_pg_saver):
+        from chat_worker.infrastructure.orchestration.langgraph.sync import (
+            ReadThroughCheckpointer,
+        )
+
+        cached = ReadThroughCheckpointer(
+            redis_saver=mock_redis_saver,
+            pg_saver=mock_pg_saver,
+            local_cache_max_bytes=2500,
+        )
+        for i in range(3):
+            item = self._tuple(f"t{i}", "cp-1", payload="x" * 1000)
+            mock_redis_saver.aget_tuple = AsyncMock(return_value=item)
+            await cached.aget_tuple(item.config)
+
+        stats = cached.get_stats()
+        assert stats["local_entries"] == 2
+        assert stats["local_bytes"] <= 2500
+
+        # 가장 오래된 t0는 evict → Redis 재조회
+        mock_redis_saver.aget_tuple = AsyncMock(return_value=self._tuple("t0", "cp-1"))
+        await cached.aget_tuple(self._tuple("t0", "cp-1").config)
+        mock_redis_saver.aget_tuple.assert_awaited_once()
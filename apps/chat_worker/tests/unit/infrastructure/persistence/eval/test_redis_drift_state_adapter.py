@@ -0,0 +1,80 @@
+"""RedisDriftStateAdapter 단위 테스트."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from chat_worker.infrastructure.persistence.eval.redis_drift_state_adapter import (
+    CUSUM_UPDATE_SCRIPT,
+    DRIFT_STATE_KEY,
+    RedisDriftStateAdapter,
+)
+
+
+@pytest.fixture
+def redis() -> MagicMock:
+    redis = MagicMock()
+    redis.register_script.return_value = AsyncMock()
+    redis.hgetall = AsyncMock()
+    redis.delete = AsyncMock()
+    return redis
+
+
+@pytest.mark.eval_unit
+class TestRedisDriftStateAdapter:
+    """Redis Hash 기반 CUSUM 상태 테스트."""
+
+    async def test_update_runs_script_once_with_axis_pairs(self, redis: MagicMock):
+        """축 수와 무관하게 Lua Script 1회 호출."""
+        adapter = RedisDriftStateAdapter(redis)
+
+        await adapter.update_cusum({"faithfulness": 4, "safety": 2.5}, 3.0, 0.5)
+        await adapter.update_cusum({"relevance": 3}, 3.0, 0.5)
+
+        redis.register_script.assert_called_once_with(CUSUM_UPDATE_SCRIPT)
+        script = redis.register_script.return_value
+        assert script.await_count == 2
+        assert script.await_args_list[0].kwargs == {
+            "keys": [DRIFT_STATE_KEY],
+            "args": ["3.0", "0.5", "faithfulness", "4.0", "safety", "2.5"],
+        }
+
+    async def test_update_skips_empty(self, redis: MagicMock):
+        adapter = RedisDriftStateAdapter(redis)
+
+        await adapter.update_cusum({}, 3.0, 0.5)
+
+        redis.register_script.assert_not_called()
+
+    async def test_get_state_parses_hash(self, redis: MagicMock):
+        """HGETALL 1회로 축별 상태 복원, 깨진 필드는 무시."""
+        redis.hgetall.return_value = {
+            "faithfulness:pos": "1.5",
+            "faithfulness:neg": "0",
+            "faithfulness:n": "12",
+            "safety:neg": "2.25",
+            "safety:n": "3",
+            "garbage": "1",
+            "relevance:pos": "nan?",
+        }
+        adapter = RedisDriftStateAdapter(redis)
+
+        state = await adapter.get_cusum_state()
+
+        redis.hgetall.assert_awaited_once_with(DRIFT_STATE_KEY)
+        assert state["faithfulness"] == {
+            "cusum_positive": 1.5,
+            "cusum_negative": 0.0,
+            "sample_count": 12.0,
+        }
+        assert state["safety"] == {"cusum_negative": 2.25, "sample_count": 3.0}
+        assert "relevance" not in state
+
+    async def test_reset_deletes_key(self, redis: MagicMock):
+        adapter = RedisDriftStateAdapter(redis)
+
+        await adapter.reset_cusum()
+
+        redis.delete.assert_awaited_once_with(DRIFT_STATE_KEY)
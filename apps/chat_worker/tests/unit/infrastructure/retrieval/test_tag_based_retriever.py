@@ -0,0 +1,126 @@
+"""TagBasedRetriever / KeywordMatcher 단위 테스트."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from chat_worker.application.ports.retrieval import RetrievalContext
+from chat_worker.infrastructure.retrieval.keyword_matcher import KeywordMatcher
+from chat_worker.infrastructure.retrieval.tag_based_retriever import TagBasedRetriever
+
+
+class TestKeywordMatcher:
+    """KeywordMatcher (Aho-Corasick) 테스트 스위트."""
+
+    def test_overlapping_patterns(self):
+        """겹치는/접미사 패턴 모두 검출 (실패 링크 출력 병합)."""
+        matcher = KeywordMatcher((p, p) for p in ["he", "she", "his", "hers"])
+
+        assert matcher.find("ushers") == {"he", "she", "hers"}
+        assert matcher.find("ahishe") == {"his", "she", "he"}
+        assert matcher.find("xyz") == set()
+
+    def test_matches_naive_substring(self):
+        """패턴별 `in` 검사와 결과 동일."""
+        patterns = ["페트병", "무색페트병", "병", "내용물 있음", "내용물있음", "캔", "알루미늄캔"]
+        matcher = KeywordMatcher((p, i) for i, p in enumerate(patterns))
+
+        for text in ["무색페트병이랑 알루미늄캔", "내용물 있음", "유리병", "아무거나", ""]:
+            expected = {i for i, p in enumerate(patterns) if p in text}
+            assert matcher.find(text) == expected
+
+    def test_multiple_patterns_same_value(self):
+        """같은 값의 표기 변형은 값 1개로 합쳐짐."""
+        matcher = KeywordMatcher([("세척_필요", 0), ("세척 필요", 0), ("세척필요", 0)])
+
+        assert matcher.find("세척 필요한가요") == {0}
+
+    def test_empty_pattern_always_matches(self):
+        """빈 패턴은 `"" in text`와 같이 항상 포함."""
+        matcher = KeywordMatcher([("", "empty"), ("a", "a")])
+
+        assert matcher.find("") == {"empty"}
+        assert matcher.find("ba") == {"empty", "a"}
+
+
+class TestTagBasedRetriever:
+    """TagBasedRetriever 테스트 스위트 (실제 분류체계/상황 태그 + 임시 규정 문서)."""
+
+    @pytest.fixture
+    def temp_assets_dir(self) -> Path:
+        """임시 규정 문서 디렉토리."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            assets_path = Path(tmpdir)
+            documents = {
+                "재활용폐기물_종이팩": {
+                    "category": "재활용폐기물",
+                    "대상_설명": ["우유팩, 두유팩 등 종이팩"],
+                    "배출방법_공통": ["내용물을 비우고 물로 헹군 뒤 펼쳐서 배출", "세척_필요"],
+                },
+                "재활용폐기물_유리병": {
+                    "category": "재활용폐기물",
+                    "배출방법_공통": ["소주병, 맥주병은 빈용기보증금 반환"],
+                },
+                "일반종량제폐기물": {
+                    "category": "일반종량제폐기물",
+                    "배출방법_공통": ["오염이 심한 우유팩은 종량제 봉투로"],
+                },
+            }
+            for key, data in documents.items():
+                with open(assets_path / f"{key}.json", "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+            yield assets_path
+
+    @pytest.fixture
+    def retriever(self, temp_assets_dir: Path) -> TagBasedRetriever:
+        """테스트용 Retriever."""
+        return TagBasedRetriever(assets_path=temp_assets_dir)
+
+    def test_extract_context_items_and_situations(self, retriever: TagBasedRetriever):
+        """품목(공백 무시)/상황 태그(표기 변형) 추출, 분류체계 순서 유지."""
+        context = retriever.extract_context("소주 병이랑 우유팩 세척 필요해요?")
+
+        items_order = list(retriever._item_index)
+        assert context.matched_items == sorted(["소주병", "우유팩"], key=items_order.index)
+        assert context.suggested_category == "재활용폐기물"
+        assert "세척_필요" in context.matched_situations
+
+    def test_extract_context_no_match(self, retriever: TagBasedRetriever):
+        """태그 없음."""
+        context = retriever.extract_context("안녕하세요")
+
+        assert context.matched_items == []
+        assert context.matched_situations == []
+        assert context.suggested_category is None
+
+    def test_search_with_context_uses_tag_index(self, retriever: TagBasedRetriever):
+        """역색인 기반 문서 매칭 + relevance 정렬."""
+        results = retriever.search_with_context("우유팩 세척 필요해요?")
+
+        by_key = {r.chunk_id: r for r in results}
+        assert by_key["재활용폐기물_종이팩"].matched_tags == ["재활용폐기물", "우유팩", "세척_필요"]
+        assert by_key["일반종량제폐기물"].relevance == "medium"
+        assert by_key["일반종량제폐기물"].matched_tags == ["우유팩"]
+        assert [r.relevance for r in results][-1] == "medium"
+
+    def test_search_with_context_unknown_tag(self, retriever: TagBasedRetriever):
+        """어휘 밖 태그(외부 컨텍스트)는 본문 직접 검색."""
+        context = RetrievalContext(matched_items=["빈용기보증금"], matched_situations=[])
+
+        results = retriever.search_with_context("", context=context)
+
+        assert [r.chunk_id for r in results] == ["재활용폐기물_유리병"]
+        assert results[0].matched_tags == ["빈용기보증금"]
+
+    def test_search_by_keyword_limit(self, retriever: TagBasedRetriever):
+        """키/본문 검색 + 결과 제한."""
+        assert len(retriever.search_by_keyword("재활용", limit=1)) == 1
+        assert {r["key"] for r in retriever.search_by_keyword("우유팩")} == {
+            "재활용폐기물_종이팩",
+            "일반종량제폐기물",
+        }
+        assert retriever.search_by_keyword("우유팩", limit=0) == []
@@ -7,6 +7,8 @@
 - POD_NAME: Pod 이름 (Consumer 이름으로 사용)
 - SHARD_COUNT: scan 도메인 Shard 수 (default: 4)
 - CHAT_SHARD_COUNT: chat 도메인 Shard 수 (default: 4)
+- PUBSUB_ROUTING_MODE: Pub/Sub 라우팅 모드 (shard | job, default: shard)
+- CONSUMER_MODE: Consumer 동시성 모드 (single | per_shard, default: single)
 - LOG_LEVEL: 로그 레벨 (default: INFO)
 
 Redis 역할 분리:
@@ -76,7 +78,17 @@ class Settings(BaseSettings):
     # Consumer 설정
     xread_block_ms: int = 5000  # XREADGROUP 블로킹 시간
     xread_count: int = 100  # 한 번에 읽을 최대 메시지 수
-    batch_size: int = 50  # 배치 처리 크기
+    batch_size: int = 50  # 배치 처리 크기 (pipeline 1회당 최대 이벤트 수)
+    # 배치 처리: State Lua/PUBLISH를 pipeline으로 묶고 multi-ID XACK
+    # False면 이벤트별 처리 (EVALSHA → PUBLISH → XACK 순차)
+    batch_processing_enabled: bool = True
+
+    # Consumer 동시성 모드
+    # - single: 모든 shard를 XREADGROUP 1개로 읽고 순차 처리
+    # - per_shard: shard(스트림)별 독립 reader, job별 순서는 shard 단위로 보장
+    consumer_mode: str = "single"
+    # per_shard 모드에서 동시에 처리 중인 lane 수 제한 (0=제한 없음)
+    max_inflight_lanes: int = 0
 
     # Reclaimer 설정
     reclaim_min_idle_ms: int = 300000  # 5분 이상 Pending인 메시지 재할당
@@ -85,6 +97,12 @@ class Settings(BaseSettings):
     # Pub/Sub 설정
     pubsub_channel_prefix: str = "sse:events"
 
+    # Pub/Sub 라우팅 모드 (SSE Gateway와 일치 필요)
+    # - shard: sse:events:{shard}로 발행, 모든 Gateway Pod가 모든 shard 구독
+    # - job: sse:route:{job_id} 레지스트리를 조회하여 구독자를 가진 Pod 채널로만 발행
+    pubsub_routing_mode: str = "shard"
+    pubsub_route_prefix: str = "sse:route"
+
     # State 설정 (도메인별 자동 결정: scan:events → scan:state)
     router_published_prefix: str = "router:published"
     state_ttl: int = 3600  # 1시간
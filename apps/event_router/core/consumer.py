@@ -19,7 +19,11 @@ if TYPE_CHECKING:
 
 from event_router.metrics import (
     EVENT_ROUTER_ACTIVE_SHARDS,
+    EVENT_ROUTER_BATCH_LATENCY,
     EVENT_ROUTER_CONSUMER_STATUS,
+    EVENT_ROUTER_LANE_INFLIGHT,
+    EVENT_ROUTER_LANE_LAG_SECONDS,
+    EVENT_ROUTER_LANE_PROCESS_LATENCY,
     EVENT_ROUTER_XACK_TOTAL,
     EVENT_ROUTER_XREADGROUP_BATCH_SIZE,
     EVENT_ROUTER_XREADGROUP_LATENCY,
@@ -31,6 +35,17 @@ from .processor import EventProcessor
 logger = logging.getLogger(__name__)
 
 
+def _stream_id_age_seconds(msg_id: bytes | str) -> float:
+    """Redis Stream ID ({ms}-{seq})의 발행 후 경과 시간 (초)."""
+    if isinstance(msg_id, bytes):
+        msg_id = msg_id.decode()
+    try:
+        published_ms = int(msg_id.split("-", 1)[0])
+    except ValueError:
+        return 0.0
+    return max(0.0, time.time() - published_ms / 1000)
+
+
 class StreamConsumer:
     """Redis Streams Consumer.
 
@@ -48,6 +63,10 @@ class StreamConsumer:
         stream_configs: list[tuple[str, int]] | None = None,
         block_ms: int = 5000,
         count: int = 100,
+        batch_size: int = 50,
+        batch_enabled: bool = True,
+        mode: str = "single",
+        max_inflight_lanes: int = 0,
     ) -> None:
         """초기화.
 
@@ -60,6 +79,10 @@ class StreamConsumer:
                 예: [("scan:events", 4), ("chat:events", 4)]
             block_ms: XREADGROUP 블로킹 시간
             count: 한 번에 읽을 최대 메시지 수
+            batch_size: pipeline 1회당 최대 이벤트 수 (배치 처리 시)
+            batch_enabled: 배치 처리 (pipeline + multi-ID XACK) 사용 여부
+            mode: Consumer 모드 (single | per_shard)
+            max_inflight_lanes: per_shard 모드에서 동시 처리 lane 수 제한 (0=제한 없음)
         """
         self._redis = redis_client
         self._processor = processor
@@ -69,6 +92,11 @@ class StreamConsumer:
         self._stream_configs = stream_configs or [("scan:events", 4)]
         self._block_ms = block_ms
         self._count = count
+        self._batch_size = max(1, batch_size)
+        self._batch_enabled = batch_enabled
+        self._mode = mode
+        self._max_inflight_lanes = max_inflight_lanes
+        self._lane_semaphore: asyncio.Semaphore | None = None
         self._shutdown = False
         self._streams: dict[str, str] = {}
         self._total_shards = sum(count for _, count in self._stream_configs)
@@ -126,6 +154,12 @@ class StreamConsumer:
         """메인 Consumer 루프.
 
         멀티 도메인: scan:events, chat:events 동시 소비.
+
+        consumer_mode:
+        - single: 모든 shard를 하나의 XREADGROUP으로 읽고 순차 처리
+        - per_shard: shard(스트림)별 독립 reader (lane)
+          같은 job은 항상 같은 shard로 발행되므로 lane 내 순차 처리 = job별 순서 보장,
+          서로 다른 shard의 job은 병렬 진행 (느린 Redis 호출이 다른 shard를 막지 않음)
         """
         logger.info(
             "consumer_started",
@@ -134,20 +168,58 @@ class StreamConsumer:
                 "consumer_name": self._consumer_name,
                 "stream_configs": self._stream_configs,
                 "total_shards": self._total_shards,
+                "consumer_mode": self._mode,
+                "max_inflight_lanes": self._max_inflight_lanes,
             },
         )
 
         EVENT_ROUTER_CONSUMER_STATUS.set(1)
         EVENT_ROUTER_ACTIVE_SHARDS.set(self._total_shards)
 
+        try:
+            if self._mode == "per_shard":
+                await self._consume_lanes()
+            else:
+                await self._read_loop(self._streams)
+        finally:
+            EVENT_ROUTER_CONSUMER_STATUS.set(0)
+            logger.info("consumer_stopped")
+
+    async def _consume_lanes(self) -> None:
+        """shard(스트림)별 독립 reader 실행.
+
+        in-flight 제한: 동시에 처리 중인 lane 수를 max_inflight_lanes로 제한
+        (0이면 lane 수만큼 = 제한 없음). XREADGROUP 대기는 제한 대상 아님.
+        """
+        if self._max_inflight_lanes > 0:
+            self._lane_semaphore = asyncio.Semaphore(self._max_inflight_lanes)
+
+        tasks = [
+            asyncio.create_task(self._read_loop({stream_key: ">"}, lane=stream_key))
+            for stream_key in self._streams
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _read_loop(self, streams: dict[str, str], lane: str | None = None) -> None:
+        """XREADGROUP 루프.
+
+        Args:
+            streams: XREADGROUP 대상 {stream_key: ">"}
+            lane: per_shard 모드의 lane 이름 (로그용, single 모드는 None)
+        """
         while not self._shutdown:
             try:
-                # XREADGROUP: 모든 shard에서 읽기
+                # XREADGROUP: 대상 shard에서 읽기
                 start_time = time.perf_counter()
                 events = await self._redis.xreadgroup(
                     groupname=self._consumer_group,
                     consumername=self._consumer_name,
-                    streams=self._streams,
+                    streams=streams,
                     count=self._count,
                     block=self._block_ms,
                 )
@@ -175,87 +247,212 @@ class StreamConsumer:
                         },
                     )
 
-                    for msg_id, data in messages:
-                        if isinstance(msg_id, bytes):
-                            msg_id = msg_id.decode()
-
-                        # 이벤트 파싱
-                        event = self._parse_event(data)
-
-                        # Stream ID를 이벤트에 추가 (단조 증가 보장)
-                        # SSE Gateway에서 중복 필터링에 사용
-                        event["stream_id"] = msg_id
-
-                        # 개별 이벤트 수신 로깅
-                        logger.info(
-                            "event_received",
-                            extra={
-                                "stream": stream_name,
-                                "msg_id": msg_id,
-                                "job_id": event.get("job_id"),
-                                "stage": event.get("stage"),
-                                "seq": event.get("seq"),
-                            },
-                        )
-
-                        # 이벤트 처리 (stream_name 전달하여 도메인별 state prefix 결정)
-                        # 실패 시 ACK 하지 않음 → PEL에 유지 → Reclaimer가 재처리
-                        try:
-                            success = await self._processor.process_event(
-                                event, stream_name=stream_name
-                            )
-                            if not success:
-                                # Pub/Sub 발행 실패 - PEL에 유지하여 reclaimer가 재시도
-                                logger.warning(
-                                    "process_event_pubsub_failed",
-                                    extra={
-                                        "stream": stream_name,
-                                        "msg_id": msg_id,
-                                        "job_id": event.get("job_id"),
-                                    },
-                                )
-                                continue  # ACK 스킵
-                        except Exception as e:
-                            logger.error(
-                                "process_event_error",
-                                extra={
-                                    "stream": stream_name,
-                                    "msg_id": msg_id,
-                                    "error": str(e),
-                                },
-                            )
-                            # 처리 실패 - PEL에 유지하여 reclaimer가 재할당
-                            continue  # ACK 스킵
-
-                        # 성공한 경우만 ACK
-                        try:
-                            await self._redis.xack(
-                                stream_name,
-                                self._consumer_group,
-                                msg_id,
-                            )
-                            EVENT_ROUTER_XACK_TOTAL.labels(result="success").inc()
-                        except Exception as e:
-                            EVENT_ROUTER_XACK_TOTAL.labels(result="error").inc()
-                            logger.error(
-                                "xack_error",
-                                extra={
-                                    "stream": stream_name,
-                                    "msg_id": msg_id,
-                                    "error": str(e),
-                                },
-                            )
+                    if self._lane_semaphore is None:
+                        await self._handle_messages(stream_name, messages)
+                    else:
+                        async with self._lane_semaphore:
+                            await self._handle_messages(stream_name, messages)
 
             except asyncio.CancelledError:
-                logger.info("consumer_cancelled")
+                logger.info("consumer_cancelled", extra={"lane": lane})
                 break
             except Exception as e:
                 EVENT_ROUTER_XREADGROUP_TOTAL.labels(result="error").inc()
-                logger.error("consumer_error", extra={"error": str(e)})
+                logger.error("consumer_error", extra={"lane": lane, "error": str(e)})
                 await asyncio.sleep(1)
 
-        EVENT_ROUTER_CONSUMER_STATUS.set(0)
-        logger.info("consumer_stopped")
+    async def _handle_messages(
+        self,
+        stream_name: str,
+        messages: list[tuple[bytes | str, dict[bytes | str, bytes | str]]],
+    ) -> None:
+        """한 스트림의 XREADGROUP 결과 처리 (lane 메트릭 포함)."""
+        if not messages:
+            return
+
+        EVENT_ROUTER_LANE_LAG_SECONDS.labels(stream=stream_name).set(
+            _stream_id_age_seconds(messages[0][0])
+        )
+        EVENT_ROUTER_LANE_INFLIGHT.labels(stream=stream_name).set(len(messages))
+        start_time = time.perf_counter()
+        try:
+            if self._batch_enabled:
+                await self._process_messages_batch(stream_name, messages)
+            else:
+                await self._process_messages(stream_name, messages)
+        finally:
+            EVENT_ROUTER_LANE_INFLIGHT.labels(stream=stream_name).set(0)
+            EVENT_ROUTER_LANE_PROCESS_LATENCY.labels(stream=stream_name).observe(
+                time.perf_counter() - start_time
+            )
+
+    async def _process_messages(
+        self,
+        stream_name: str,
+        messages: list[tuple[bytes | str, dict[bytes | str, bytes | str]]],
+    ) -> None:
+        """메시지별 순차 처리 (EVALSHA → PUBLISH → XACK)."""
+        for msg_id, data in messages:
+            if isinstance(msg_id, bytes):
+                msg_id = msg_id.decode()
+
+            # 이벤트 파싱
+            event = self._parse_event(data)
+
+            # Stream ID를 이벤트에 추가 (단조 증가 보장)
+            # SSE Gateway에서 중복 필터링에 사용
+            event["stream_id"] = msg_id
+
+            # 개별 이벤트 수신 로깅
+            logger.info(
+                "event_received",
+                extra={
+                    "stream": stream_name,
+                    "msg_id": msg_id,
+                    "job_id": event.get("job_id"),
+                    "stage": event.get("stage"),
+                    "seq": event.get("seq"),
+                },
+            )
+
+            # 이벤트 처리 (stream_name 전달하여 도메인별 state prefix 결정)
+            # 실패 시 ACK 하지 않음 → PEL에 유지 → Reclaimer가 재처리
+            try:
+                success = await self._processor.process_event(event, stream_name=stream_name)
+                if not success:
+                    # Pub/Sub 발행 실패 - PEL에 유지하여 reclaimer가 재시도
+                    logger.warning(
+                        "process_event_pubsub_failed",
+                        extra={
+                            "stream": stream_name,
+                            "msg_id": msg_id,
+                            "job_id": event.get("job_id"),
+                        },
+                    )
+                    continue  # ACK 스킵
+            except Exception as e:
+                logger.error(
+                    "process_event_error",
+                    extra={
+                        "stream": stream_name,
+                        "msg_id": msg_id,
+                        "error": str(e),
+                    },
+                )
+                # 처리 실패 - PEL에 유지하여 reclaimer가 재할당
+                continue  # ACK 스킵
+
+            # 성공한 경우만 ACK
+            try:
+                await self._redis.xack(
+                    stream_name,
+                    self._consumer_group,
+                    msg_id,
+                )
+                EVENT_ROUTER_XACK_TOTAL.labels(result="success").inc()
+            except Exception as e:
+                EVENT_ROUTER_XACK_TOTAL.labels(result="error").inc()
+                logger.error(
+                    "xack_error",
+                    extra={
+                        "stream": stream_name,
+                        "msg_id": msg_id,
+                        "error": str(e),
+                    },
+                )
+
+    async def _process_messages_batch(
+        self,
+        stream_name: str,
+        messages: list[tuple[bytes | str, dict[bytes | str, bytes | str]]],
+    ) -> None:
+        """XREADGROUP 배치 처리 (pipeline + multi-ID XACK).
+
+        batch_size 단위로 processor.process_batch 호출 후
+        성공한 메시지 ID만 XACK 1회로 ACK.
+        실패한 메시지는 PEL에 유지 → Reclaimer가 재처리 (at-least-once).
+        실패가 난 job의 뒤 메시지는 이후 chunk에서 처리하지 않고 PEL에 유지
+        (실패 이벤트보다 뒤 이벤트가 먼저 발행되지 않도록 job 내 순서 보장).
+
+        Args:
+            stream_name: 스트림 이름 ({domain}:events:{shard})
+            messages: [(msg_id, data), ...]
+        """
+        failed_jobs: set[str] = set()
+        for offset in range(0, len(messages), self._batch_size):
+            chunk = messages[offset : offset + self._batch_size]
+
+            msg_ids: list[str] = []
+            events: list[dict[str, Any]] = []
+            for msg_id, data in chunk:
+                if isinstance(msg_id, bytes):
+                    msg_id = msg_id.decode()
+
+                event = self._parse_event(data)
+                if event.get("job_id") in failed_jobs:
+                    continue
+                # Stream ID를 이벤트에 추가 (SSE Gateway 중복 필터링용)
+                event["stream_id"] = msg_id
+                msg_ids.append(msg_id)
+                events.append(event)
+
+            if not events:
+                continue
+
+            try:
+                results = await self._processor.process_batch(events, stream_name=stream_name)
+            except Exception as e:
+                # 처리 실패 - 배치 전체 PEL에 유지하여 reclaimer가 재할당
+                logger.error(
+                    "process_batch_error",
+                    extra={
+                        "stream": stream_name,
+                        "message_count": len(msg_ids),
+                        "error": str(e),
+                    },
+                )
+                failed_jobs.update(event["job_id"] for event in events if event.get("job_id"))
+                continue
+
+            failed_jobs.update(
+                event["job_id"]
+                for event, success in zip(events, results)
+                if not success and event.get("job_id")
+            )
+            ack_ids = [msg_id for msg_id, success in zip(msg_ids, results) if success]
+            failed_count = len(msg_ids) - len(ack_ids)
+            if failed_count:
+                logger.warning(
+                    "process_batch_partial_failure",
+                    extra={
+                        "stream": stream_name,
+                        "failed_count": failed_count,
+                        "message_count": len(msg_ids),
+                    },
+                )
+
+            if not ack_ids:
+                continue
+
+            # 성공한 경우만 ACK (multi-ID XACK 1회)
+            start_time = time.perf_counter()
+            try:
+                await self._redis.xack(stream_name, self._consumer_group, *ack_ids)
+                EVENT_ROUTER_XACK_TOTAL.labels(result="success").inc(len(ack_ids))
+            except Exception as e:
+                EVENT_ROUTER_XACK_TOTAL.labels(result="error").inc(len(ack_ids))
+                logger.error(
+                    "xack_error",
+                    extra={
+                        "stream": stream_name,
+                        "message_count": len(ack_ids),
+                        "error": str(e),
+                    },
+                )
+            finally:
+                EVENT_ROUTER_BATCH_LATENCY.labels(phase="xack").observe(
+                    time.perf_counter() - start_time
+                )
 
     def _parse_event(self, data: dict[bytes | str, bytes | str]) -> dict[str, Any]:
         """Redis 메시지 파싱."""
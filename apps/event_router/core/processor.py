@@ -13,6 +13,11 @@ Shard 기반 Pub/Sub (연결 최적화):
 - 현재: sse:events:{shard} (4개 채널, 4개 연결)
 - SSE Gateway에서 job_id로 필터링하여 라우팅
 
+Job-affinity 라우팅 (routing_mode="job"):
+- SSE Gateway Pod가 구독자를 가진 job을 sse:route:{job_id} (ZSET)에 등록
+- Event Router는 레지스트리를 조회하여 sse:events:pod:{pod}로만 발행
+- Pod별 수신량이 전체 이벤트가 아닌 자기 구독자 이벤트에 비례
+
 분산 트레이싱 통합:
 - Redis Streams 메시지에서 trace context 추출 (trace_id, span_id, traceparent)
 - linked span 생성하여 Worker와 연결
@@ -21,6 +26,7 @@ Shard 기반 Pub/Sub (연결 최적화):
 
 Lua Script는 Streams Redis에서만 실행 (State + 발행 마킹)
 Pub/Sub는 별도 Redis로 PUBLISH
+(배치 발행 시 같은 job 이벤트는 순서 발행 Script로 묶어 첫 실패에서 중단 → job 내 순서 보장)
 
 참조: docs/blogs/async/53-sse-pubsub-connection-optimization.md
 """
@@ -33,12 +39,14 @@ import json
 import logging
 import os
 import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import redis.asyncio as aioredis
 
 from event_router.metrics import (
+    EVENT_ROUTER_BATCH_LATENCY,
     EVENT_ROUTER_EVENTS_PROCESSED,
     EVENT_ROUTER_EVENTS_SKIPPED,
     EVENT_ROUTER_PROCESS_ERRORS,
@@ -47,6 +55,7 @@ from event_router.metrics import (
     EVENT_ROUTER_PUBSUB_PUBLISH_ERRORS,
     EVENT_ROUTER_PUBSUB_PUBLISH_LATENCY,
     EVENT_ROUTER_PUBSUB_PUBLISHED,
+    EVENT_ROUTER_PUBSUB_ROUTED_PODS,
     EVENT_ROUTER_STATE_UPDATES,
 )
 
@@ -105,6 +114,81 @@ return 1
 """
 
 
+# ─────────────────────────────────────────────────────────────────
+# Job-affinity 라우팅 Lua Script (Pub/Sub Redis에서 실행)
+# ─────────────────────────────────────────────────────────────────
+
+# 라우팅 레지스트리 조회 + Pod 채널 발행 (1 RTT)
+# - route_key: ZSET (member=pod_id, score=만료 시각 epoch 초)
+# - 만료되지 않은 Pod만 발행 대상 (Pod 장애 시 자연 소멸)
+# - 구독 Pod가 없으면 0 반환 (재접속 시 State/Streams catch-up으로 복구)
+ROUTE_PUBLISH_SCRIPT = """
+local route_key = KEYS[1]      -- sse:route:{job_id}
+
+local channel_prefix = ARGV[1] -- sse:events:pod:
+local event_data = ARGV[2]     -- JSON 이벤트 데이터
+local now = tonumber(ARGV[3])
+
+local pods = redis.call('ZRANGEBYSCORE', route_key, now, '+inf')
+for _, pod in ipairs(pods) do
+    redis.call('PUBLISH', channel_prefix .. pod, event_data)
+end
+
+return #pods
+"""
+
+# 같은 job의 이벤트 여러 건을 순서대로 발행, 첫 실패에서 중단 (1 RTT)
+# - 앞 이벤트가 실패하면 뒤 이벤트는 발행하지 않음 → 재시도해도 job 내 순서 유지
+# - 반환: {발행 성공 수, 오류 메시지 ('' = 전부 성공), 라우팅 Pod 수}
+ORDERED_PUBLISH_SCRIPT = """
+local channel = ARGV[1]        -- sse:events:{shard}
+
+for i = 2, #ARGV do
+    local reply = redis.pcall('PUBLISH', channel, ARGV[i])
+    if type(reply) == 'table' and reply.err then
+        return {i - 2, reply.err, 0}
+    end
+end
+
+return {#ARGV - 1, '', 0}
+"""
+
+# ROUTE_PUBLISH_SCRIPT의 순서 발행 버전 (레지스트리 조회 1회)
+ORDERED_ROUTE_PUBLISH_SCRIPT = """
+local route_key = KEYS[1]      -- sse:route:{job_id}
+
+local channel_prefix = ARGV[1] -- sse:events:pod:
+local now = tonumber(ARGV[2])
+
+local pods = redis.call('ZRANGEBYSCORE', route_key, now, '+inf')
+for i = 3, #ARGV do
+    for _, pod in ipairs(pods) do
+        local reply = redis.pcall('PUBLISH', channel_prefix .. pod, ARGV[i])
+        if type(reply) == 'table' and reply.err then
+            return {i - 3, reply.err, #pods}
+        end
+    end
+end
+
+return {#ARGV - 2, '', #pods}
+"""
+
+
+@dataclass(slots=True)
+class _BatchItem:
+    """process_batch 내부 처리 단위."""
+
+    index: int
+    job_id: str
+    seq: int
+    stage: str
+    channel: str
+    event_data: str
+    traceparent: str = ""
+    republish: bool = False
+    error: str = ""
+
+
 class EventProcessor:
     """이벤트 처리기.
 
@@ -128,6 +212,8 @@ class EventProcessor:
         state_ttl: int = 3600,
         published_ttl: int = 7200,
         shard_count: int | None = None,
+        routing_mode: str = "shard",
+        route_key_prefix: str = "sse:route",
     ) -> None:
         """초기화.
 
@@ -135,6 +221,8 @@ class EventProcessor:
             streams_client: Streams Redis (State KV + 발행 마킹)
             pubsub_client: Pub/Sub Redis (PUBLISH only)
             shard_count: Pub/Sub 샤드 수 (기본: 환경변수 SHARD_COUNT 또는 4)
+            routing_mode: Pub/Sub 라우팅 모드 (shard | job)
+            route_key_prefix: Job-affinity 라우팅 레지스트리 접두사
         """
         self._streams_redis = streams_client
         self._pubsub_redis = pubsub_client
@@ -145,6 +233,11 @@ class EventProcessor:
         self._script: Any = None
         # Shard 설정 (SSE Gateway와 동일해야 함)
         self._shard_count = shard_count or int(os.getenv("SHARD_COUNT", "4"))
+        # Job-affinity 라우팅 (SSE Gateway와 동일 모드여야 함)
+        self._routing_mode = routing_mode
+        self._route_key_prefix = route_key_prefix
+        self._route_script: Any = None
+        self._ordered_publish_script: Any = None
 
     def _get_shard_for_job(self, job_id: str) -> int:
         """job_id에서 shard 계산.
@@ -180,6 +273,124 @@ class EventProcessor:
         if self._script is None:
             self._script = self._streams_redis.register_script(UPDATE_STATE_SCRIPT)
 
+    async def _publish(self, job_id: str, channel: str, event_data: str) -> None:
+        """Pub/Sub 발행 (라우팅 모드별).
+
+        - shard: sse:events:{shard} 채널로 PUBLISH
+        - job: 라우팅 레지스트리에 등록된 Pod 채널로만 PUBLISH (Lua, 1 RTT)
+
+        Args:
+            job_id: 작업 ID
+            channel: shard 채널 (shard 모드에서 사용)
+            event_data: JSON 이벤트 데이터
+        """
+        if self._routing_mode != "job":
+            await self._pubsub_redis.publish(channel, event_data)
+            return
+
+        if self._route_script is None:
+            self._route_script = self._pubsub_redis.register_script(ROUTE_PUBLISH_SCRIPT)
+
+        routed = await self._route_script(
+            keys=[f"{self._route_key_prefix}:{job_id}"],
+            args=[f"{self._pubsub_channel_prefix}:pod:", event_data, int(time.time())],
+        )
+        EVENT_ROUTER_PUBSUB_ROUTED_PODS.observe(int(routed or 0))
+
+    @staticmethod
+    def _build_trace_link(traceparent: str) -> Any:
+        """W3C traceparent → OTEL Link (Worker span 연결용).
+
+        Args:
+            traceparent: 00-{trace_id}-{span_id}-{trace_flags}
+
+        Returns:
+            Link 또는 None (traceparent 없음/형식 오류)
+        """
+        if not traceparent:
+            return None
+
+        from opentelemetry.trace import Link, SpanContext, TraceFlags
+
+        parts = traceparent.split("-")
+        if len(parts) != 4:
+            return None
+
+        parent_ctx = SpanContext(
+            trace_id=int(parts[1], 16),
+            span_id=int(parts[2], 16),
+            is_remote=True,
+            trace_flags=TraceFlags(int(parts[3], 16)),
+        )
+        return Link(parent_ctx)
+
+    async def _queue_publish(self, pipe: Any, job_id: str, channel: str, event_data: str) -> None:
+        """Pub/Sub 발행을 pipeline에 적재 (라우팅 모드별, _publish와 동일 규칙).
+
+        Args:
+            pipe: Pub/Sub Redis pipeline
+            job_id: 작업 ID
+            channel: shard 채널 (shard 모드에서 사용)
+            event_data: JSON 이벤트 데이터
+        """
+        if self._routing_mode != "job":
+            pipe.publish(channel, event_data)
+            return
+
+        if self._route_script is None:
+            self._route_script = self._pubsub_redis.register_script(ROUTE_PUBLISH_SCRIPT)
+
+        await self._route_script(
+            keys=[f"{self._route_key_prefix}:{job_id}"],
+            args=[f"{self._pubsub_channel_prefix}:pod:", event_data, int(time.time())],
+            client=pipe,
+        )
+
+    async def _queue_publish_ordered(self, pipe: Any, items: list[_BatchItem]) -> None:
+        """같은 job의 발행 대상을 pipeline에 적재 (2건 이상이면 순서 발행 Script 1회).
+
+        Args:
+            pipe: Pub/Sub Redis pipeline
+            items: 같은 job의 발행 대상 (스트림 순서)
+        """
+        first = items[0]
+        if len(items) == 1:
+            await self._queue_publish(pipe, first.job_id, first.channel, first.event_data)
+            return
+
+        events = [item.event_data for item in items]
+        if self._routing_mode == "job":
+            source = ORDERED_ROUTE_PUBLISH_SCRIPT
+            keys = [f"{self._route_key_prefix}:{first.job_id}"]
+            args = [f"{self._pubsub_channel_prefix}:pod:", int(time.time()), *events]
+        else:
+            source = ORDERED_PUBLISH_SCRIPT
+            keys = []
+            args = [first.channel, *events]
+
+        if self._ordered_publish_script is None:
+            self._ordered_publish_script = self._pubsub_redis.register_script(source)
+        await self._ordered_publish_script(keys=keys, args=args, client=pipe)
+
+    @staticmethod
+    def _split_ordered_result(items: list[_BatchItem], result: Any) -> list[Any]:
+        """_queue_publish_ordered 결과 → 이벤트별 결과 (실패는 Exception)."""
+        if isinstance(result, Exception) or len(items) == 1:
+            return [result] * len(items)
+
+        published, error, routed = result
+        published = int(published)
+        if isinstance(error, bytes):
+            error = error.decode()
+        failed: list[Any] = []
+        if published < len(items):
+            failed.append(RuntimeError(error or "publish failed"))
+            failed.extend(
+                RuntimeError("not published: preceding event of the job failed")
+                for _ in items[published + 1 :]
+            )
+        return [routed] * published + failed
+
     async def process_event(self, event: dict[str, Any], stream_name: str | None = None) -> bool:
         """이벤트 처리 (멱등성 보장).
 
@@ -221,27 +432,9 @@ class EventProcessor:
         if OTEL_ENABLED:
             try:
                 from opentelemetry import trace
-                from opentelemetry.trace import SpanContext, TraceFlags, Link
 
                 # 이벤트에서 traceparent 추출 및 파싱
-                traceparent = event.get("traceparent", "")
-                link = None
-
-                if traceparent:
-                    # W3C TraceContext: 00-{trace_id}-{span_id}-{trace_flags}
-                    parts = traceparent.split("-")
-                    if len(parts) == 4:
-                        trace_id = int(parts[1], 16)
-                        span_id = int(parts[2], 16)
-                        trace_flags = int(parts[3], 16)
-
-                        parent_ctx = SpanContext(
-                            trace_id=trace_id,
-                            span_id=span_id,
-                            is_remote=True,
-                            trace_flags=TraceFlags(trace_flags),
-                        )
-                        link = Link(parent_ctx)
+                link = self._build_trace_link(event.get("traceparent", ""))
 
                 # linked span 생성 (Worker span과 연결)
                 tracer = trace.get_tracer(__name__)
@@ -313,7 +506,7 @@ class EventProcessor:
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    await self._pubsub_redis.publish(channel, event_data)
+                    await self._publish(job_id, channel, event_data)
                     EVENT_ROUTER_PUBSUB_PUBLISHED.labels(stage=stage).inc()
                     EVENT_ROUTER_PUBSUB_PUBLISH_LATENCY.observe(time.perf_counter() - start_time)
                     logger.info(
@@ -375,7 +568,7 @@ class EventProcessor:
 
             for attempt in range(max_retries):
                 try:
-                    await self._pubsub_redis.publish(channel, event_data)
+                    await self._publish(job_id, channel, event_data)
                     EVENT_ROUTER_PUBSUB_PUBLISHED.labels(stage=stage).inc()
                     EVENT_ROUTER_PUBSUB_PUBLISH_LATENCY.observe(time.perf_counter() - publish_start)
                     publish_success = True
@@ -437,7 +630,7 @@ class EventProcessor:
             # 터미널 이벤트(done/error)는 Pub/Sub 재발행 시도 (이전 발행 실패 복구)
             if stage in ("done", "error"):
                 try:
-                    await self._pubsub_redis.publish(channel, event_data)
+                    await self._publish(job_id, channel, event_data)
                     logger.info(
                         "terminal_event_republished",
                         extra={
@@ -474,26 +667,229 @@ class EventProcessor:
             )
             return True  # 이미 처리됨 = ACK 가능
 
-    async def process_batch(self, events: list[dict[str, Any]]) -> int:
-        """배치 이벤트 처리.
+    async def process_batch(
+        self, events: list[dict[str, Any]], stream_name: str | None = None
+    ) -> list[bool]:
+        """배치 이벤트 처리 (pipeline).
+
+        XREADGROUP 배치 단위로 Redis 왕복을 묶음:
+        1. Streams Redis: State 갱신 Lua Script 전체를 하나의 pipeline으로 실행
+        2. Pub/Sub Redis: 발행 대상 전체를 하나의 pipeline으로 PUBLISH (실패분만 재시도)
+
+        이벤트별 결과는 process_event와 동일한 의미:
+        - True: ACK 가능 (발행 성공 또는 이미 처리됨)
+        - False: ACK 스킵 → PEL 유지 → Reclaimer 재처리
+        pipeline 내 명령 순서 = 입력 순서이므로 같은 job의 이벤트 순서 유지.
 
         Args:
-            events: 이벤트 목록
+            events: 이벤트 목록 (같은 스트림에서 읽은 순서)
+            stream_name: 이벤트가 온 스트림 이름 (도메인별 state prefix 결정용)
+
+        Returns:
+            이벤트별 ACK 가능 여부 (입력과 같은 순서)
+        """
+        results = [False] * len(events)
+        if not events:
+            return results
+
+        await self._ensure_script()
+        state_prefix = self._get_state_prefix(stream_name or "scan:events:0")
+
+        items: list[_BatchItem] = []
+        for index, event in enumerate(events):
+            job_id = event.get("job_id")
+            if not job_id:
+                logger.warning("process_event_missing_job_id", extra={"event": event})
+                EVENT_ROUTER_EVENTS_SKIPPED.labels(reason="missing_job_id").inc()
+                continue
+
+            try:
+                seq = int(event.get("seq", 0))
+            except (ValueError, TypeError):
+                seq = 0
+
+            items.append(
+                _BatchItem(
+                    index=index,
+                    job_id=job_id,
+                    seq=seq,
+                    stage=event.get("stage", "unknown"),
+                    channel=f"{self._pubsub_channel_prefix}:{self._get_shard_for_job(job_id)}",
+                    event_data=json.dumps(event, ensure_ascii=False),
+                    traceparent=event.get("traceparent", ""),
+                )
+            )
+
+        span_context_manager = None
+        if OTEL_ENABLED and items:
+            try:
+                from opentelemetry import trace
+
+                links = [
+                    link
+                    for link in (self._build_trace_link(item.traceparent) for item in items)
+                    if link
+                ]
+                span_context_manager = trace.get_tracer(__name__).start_as_current_span(
+                    "event_router.process_batch",
+                    links=links,
+                    attributes={"batch.size": len(items), "stream.name": stream_name or ""},
+                )
+            except ImportError:
+                pass
+            except Exception as e:
+                logger.debug(f"Failed to create batch span: {e}")
+
+        if span_context_manager:
+            span_context_manager.__enter__()
+
+        try:
+            to_publish = await self._apply_state_batch(items, state_prefix, results)
+            await self._publish_batch(to_publish, results)
+        finally:
+            if span_context_manager:
+                span_context_manager.__exit__(None, None, None)
+
+        return results
+
+    async def _apply_state_batch(
+        self, items: list[_BatchItem], state_prefix: str, results: list[bool]
+    ) -> list[_BatchItem]:
+        """State 갱신 Lua Script를 하나의 pipeline으로 실행.
+
+        Token 이벤트는 State 갱신 없이 바로 발행 대상 (process_event와 동일).
 
         Returns:
-            처리된 이벤트 수
+            Pub/Sub 발행 대상 (입력 순서 유지)
         """
-        processed_count = 0
-        for event in events:
+        state_items = [item for item in items if item.stage != "token"]
+        state_results: list[Any] = []
+
+        if state_items:
+            start_time = time.perf_counter()
             try:
-                if await self.process_event(event):
-                    processed_count += 1
+                async with self._streams_redis.pipeline(transaction=False) as pipe:
+                    for item in state_items:
+                        await self._script(
+                            keys=[
+                                f"{state_prefix}:{item.job_id}",
+                                f"{self._published_key_prefix}:{item.job_id}:{item.seq}",
+                            ],
+                            args=[item.event_data, item.seq, self._state_ttl, self._published_ttl],
+                            client=pipe,
+                        )
+                    state_results = await pipe.execute(raise_on_error=False)
             except Exception as e:
+                # pipeline 전체 실패 → State 이벤트 모두 ACK 스킵 (Reclaimer 재처리)
+                state_results = [e] * len(state_items)
+            finally:
+                EVENT_ROUTER_BATCH_LATENCY.labels(phase="state").observe(
+                    time.perf_counter() - start_time
+                )
+
+        state_result_by_index = {
+            item.index: result for item, result in zip(state_items, state_results)
+        }
+
+        to_publish: list[_BatchItem] = []
+        for item in items:
+            if item.stage == "token":
+                to_publish.append(item)
+                continue
+
+            result = state_result_by_index.get(item.index)
+            if isinstance(result, Exception):
+                EVENT_ROUTER_PROCESS_ERRORS.labels(error_type="lua_script").inc()
                 logger.error(
                     "process_event_error",
+                    extra={"job_id": item.job_id, "seq": item.seq, "error": str(result)},
+                )
+            elif result == 1:
+                EVENT_ROUTER_STATE_UPDATES.labels(stage=item.stage).inc()
+                EVENT_ROUTER_PUBLISHED_MARKERS.inc()
+                to_publish.append(item)
+            else:
+                # 중복 이벤트: 이미 처리됨 = ACK 가능
+                # 터미널 이벤트(done/error)는 Pub/Sub 재발행 시도 (이전 발행 실패 복구)
+                EVENT_ROUTER_EVENTS_SKIPPED.labels(reason="duplicate_or_out_of_order").inc()
+                results[item.index] = True
+                if item.stage in ("done", "error"):
+                    item.republish = True
+                    to_publish.append(item)
+
+        return to_publish
+
+    async def _publish_batch(self, items: list[_BatchItem], results: list[bool]) -> None:
+        """발행 대상을 하나의 pipeline으로 PUBLISH (실패분만 최대 3회 재시도).
+
+        같은 job의 이벤트는 순서 발행 1회로 묶어 첫 실패에서 중단
+        → 실패한 이벤트가 재시도되기 전에 같은 job의 뒤 이벤트가 먼저 발행되지 않음
+        (SSE Gateway는 stream_id가 역행한 이벤트를 버림).
+        재발행(중복 터미널 이벤트)은 실패해도 ACK 가능 상태 유지.
+        """
+        if not items:
+            return
+
+        max_retries = 3
+        pending = items
+        for attempt in range(max_retries):
+            by_job: dict[str, list[_BatchItem]] = {}
+            for item in pending:
+                by_job.setdefault(item.job_id, []).append(item)
+
+            start_time = time.perf_counter()
+            try:
+                async with self._pubsub_redis.pipeline(transaction=False) as pipe:
+                    for job_items in by_job.values():
+                        await self._queue_publish_ordered(pipe, job_items)
+                    job_results = await pipe.execute(raise_on_error=False)
+            except Exception as e:
+                job_results = [e] * len(by_job)
+            EVENT_ROUTER_BATCH_LATENCY.labels(phase="publish").observe(
+                time.perf_counter() - start_time
+            )
+
+            failed: list[_BatchItem] = []
+            for job_items, job_result in zip(by_job.values(), job_results):
+                item_results = self._split_ordered_result(job_items, job_result)
+                for item, result in zip(job_items, item_results):
+                    if isinstance(result, Exception):
+                        item.error = str(result)
+                        failed.append(item)
+                        continue
+
+                    results[item.index] = True
+                    if item.republish:
+                        continue
+                    EVENT_ROUTER_PUBSUB_PUBLISHED.labels(stage=item.stage).inc()
+                    EVENT_ROUTER_EVENTS_PROCESSED.labels(stage=item.stage).inc()
+                    if self._routing_mode == "job":
+                        EVENT_ROUTER_PUBSUB_ROUTED_PODS.observe(int(result or 0))
+
+            if not failed:
+                break
+
+            pending = failed
+            if attempt < max_retries - 1:
+                # 재시도 대기 (exponential backoff)
+                await asyncio.sleep(0.1 * (attempt + 1))
+        else:
+            for item in pending:
+                if item.republish:
+                    logger.warning(
+                        "terminal_event_republish_failed",
+                        extra={"job_id": item.job_id, "stage": item.stage, "seq": item.seq},
+                    )
+                    continue
+                EVENT_ROUTER_PUBSUB_PUBLISH_ERRORS.inc()
+                logger.error(
+                    "pubsub_publish_failed",
                     extra={
-                        "job_id": event.get("job_id"),
-                        "error": str(e),
+                        "job_id": item.job_id,
+                        "stage": item.stage,
+                        "seq": item.seq,
+                        "channel": item.channel,
+                        "error": item.error,
+                        "attempts": max_retries,
                     },
                 )
-        return processed_count
@@ -123,6 +123,8 @@ async def startup() -> None:
         pubsub_channel_prefix=settings.pubsub_channel_prefix,
         state_ttl=settings.state_ttl,
         published_ttl=settings.published_ttl,
+        routing_mode=settings.pubsub_routing_mode,
+        route_key_prefix=settings.pubsub_route_prefix,
     )
 
     # Consumer 초기화 (멀티 도메인 지원)
@@ -134,6 +136,10 @@ async def startup() -> None:
         stream_configs=stream_configs,
         block_ms=settings.xread_block_ms,
         count=settings.xread_count,
+        batch_size=settings.batch_size,
+        batch_enabled=settings.batch_processing_enabled,
+        mode=settings.consumer_mode,
+        max_inflight_lanes=settings.max_inflight_lanes,
     )
 
     # Reclaimer 초기화 (멀티 도메인 지원)
@@ -271,5 +277,7 @@ async def info() -> JSONResponse:
             "stream_prefixes": settings.stream_prefixes,
             "shard_count": settings.shard_count,
             "chat_shard_count": settings.chat_shard_count,
+            "pubsub_routing_mode": settings.pubsub_routing_mode,
+            "consumer_mode": settings.consumer_mode,
         }
     )
@@ -153,6 +153,14 @@ EVENT_ROUTER_PROCESS_LATENCY = Histogram(
     buckets=PROCESS_LATENCY_BUCKETS,
 )
 
+EVENT_ROUTER_BATCH_LATENCY = Histogram(
+    "event_router_batch_latency_seconds",
+    "Pipelined batch processing latency per phase",
+    labelnames=["phase"],  # state, publish, xack
+    registry=REGISTRY,
+    buckets=PROCESS_LATENCY_BUCKETS,
+)
+
 EVENT_ROUTER_PROCESS_ERRORS = Counter(
     "event_router_process_errors_total",
     "Total event processing errors",
@@ -185,6 +193,13 @@ EVENT_ROUTER_PUBSUB_PUBLISH_ERRORS = Counter(
     registry=REGISTRY,
 )
 
+EVENT_ROUTER_PUBSUB_ROUTED_PODS = Histogram(
+    "event_router_pubsub_routed_pods",
+    "Number of SSE Gateway pods an event was routed to (job routing mode)",
+    registry=REGISTRY,
+    buckets=(0, 1, 2, 3, 5, 10),
+)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 5. Reclaimer 메트릭
@@ -247,3 +262,30 @@ EVENT_ROUTER_ACTIVE_SHARDS = Gauge(
     "Number of active shards being consumed",
     registry=REGISTRY,
 )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 8. Lane (shard별 reader) 메트릭
+# ─────────────────────────────────────────────────────────────────────────────
+
+EVENT_ROUTER_LANE_LAG_SECONDS = Gauge(
+    "event_router_lane_lag_seconds",
+    "Age of the oldest message in the latest batch read by a lane",
+    labelnames=["stream"],
+    registry=REGISTRY,
+)
+
+EVENT_ROUTER_LANE_INFLIGHT = Gauge(
+    "event_router_lane_inflight",
+    "Messages currently being processed by a lane",
+    labelnames=["stream"],
+    registry=REGISTRY,
+)
+
+EVENT_ROUTER_LANE_PROCESS_LATENCY = Histogram(
+    "event_router_lane_process_latency_seconds",
+    "Time to process one XREADGROUP batch per lane",
+    labelnames=["stream"],
+    registry=REGISTRY,
+    buckets=XREADGROUP_LATENCY_BUCKETS,
+)
@@ -0,0 +1,189 @@
+"""Consumer 모듈 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class TestBatchConsume:
+    """StreamConsumer 배치 처리 테스트."""
+
+    @pytest.fixture
+    def redis_client(self):
+        mock = AsyncMock()
+        mock.xack = AsyncMock(return_value=2)
+        return mock
+
+    def _make_consumer(self, redis_client, processor, batch_size=50):
+        from core.consumer import StreamConsumer
+
+        return StreamConsumer(
+            redis_client=redis_client,
+            processor=processor,
+            consumer_group="eventrouter",
+            consumer_name="consumer-0",
+            batch_size=batch_size,
+        )
+
+    @pytest.mark.asyncio
+    async def test_multi_id_xack_only_successful(self, redis_client):
+        """성공한 메시지 ID만 XACK 1회로 ACK."""
+        processor = MagicMock()
+        processor.process_batch = AsyncMock(return_value=[True, False, True])
+        consumer = self._make_consumer(redis_client, processor)
+
+        messages = [
+            (b"1-0", {b"job_id": b"job-1", b"stage": b"vision", b"seq": b"1"}),
+            (b"1-1", {b"job_id": b"job-1", b"stage": b"rule", b"seq": b"2"}),
+            (b"1-2", {b"job_id": b"job-2", b"stage": b"vision", b"seq": b"1"}),
+        ]
+
+        await consumer._process_messages_batch("scan:events:0", messages)
+
+        events = processor.process_batch.await_args.args[0]
+        assert [e["stream_id"] for e in events] == ["1-0", "1-1", "1-2"]
+        assert events[0]["seq"] == 1
+        redis_client.xack.assert_awaited_once_with("scan:events:0", "eventrouter", "1-0", "1-2")
+
+    @pytest.mark.asyncio
+    async def test_batch_error_skips_ack(self, redis_client):
+        """배치 처리 예외 시 ACK 하지 않음 (PEL 유지)."""
+        processor = MagicMock()
+        processor.process_batch = AsyncMock(side_effect=ConnectionError("down"))
+        consumer = self._make_consumer(redis_client, processor)
+
+        await consumer._process_messages_batch(
+            "scan:events:0", [("1-0", {"job_id": "job-1", "stage": "vision", "seq": "1"})]
+        )
+
+        redis_client.xack.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_chunked_by_batch_size(self, redis_client):
+        """batch_size 단위로 pipeline 분할."""
+        processor = MagicMock()
+        processor.process_batch = AsyncMock(side_effect=lambda events, **_: [True] * len(events))
+        consumer = self._make_consumer(redis_client, processor, batch_size=2)
+
+        messages = [(f"1-{i}", {"job_id": "job-1", "seq": str(i)}) for i in range(5)]
+        await consumer._process_messages_batch("chat:events:0", messages)
+
+        assert processor.process_batch.await_count == 3
+        assert redis_client.xack.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_job_skipped_in_later_chunks(self, redis_client):
+        """앞 chunk에서 실패한 job의 뒤 메시지는 처리하지 않고 PEL 유지."""
+        processor = MagicMock()
+        processor.process_batch = AsyncMock(
+            side_effect=[[False, True], [True]],
+        )
+        consumer = self._make_consumer(redis_client, processor, batch_size=2)
+
+        messages = [
+            ("1-0", {"job_id": "job-1", "seq": "1"}),
+            ("1-1", {"job_id": "job-2", "seq": "1"}),
+            ("1-2", {"job_id": "job-1", "seq": "2"}),
+            ("1-3", {"job_id": "job-2", "seq": "2"}),
+        ]
+        await consumer._process_messages_batch("chat:events:0", messages)
+
+        second_chunk = processor.process_batch.await_args_list[1].args[0]
+        assert [e["stream_id"] for e in second_chunk] == ["1-3"]
+        acked = [c.args[2:] for c in redis_client.xack.await_args_list]
+        assert acked == [("1-1",), ("1-3",)]
+
+
+class TestPerShardLanes:
+    """per_shard 모드 (shard별 독립 reader) 테스트."""
+
+    @staticmethod
+    def _make_consumer(redis_client, processor, max_inflight_lanes=0):
+        from core.consumer import StreamConsumer
+
+        consumer = StreamConsumer(
+            redis_client=redis_client,
+            processor=processor,
+            consumer_group="eventrouter",
+            consumer_name="consumer-0",
+            stream_configs=[("scan:events", 2)],
+            block_ms=10,
+            mode="per_shard",
+            max_inflight_lanes=max_inflight_lanes,
+        )
+        consumer._streams = {"scan:events:0": ">", "scan:events:1": ">"}
+        return consumer
+
+    @staticmethod
+    def _redis_serving_once():
+        """스트림별 메시지를 1회만 반환하는 XREADGROUP."""
+        served: set[str] = set()
+
+        async def xreadgroup(groupname, consumername, streams, count, block):
+            (stream_key,) = streams
+            if stream_key in served:
+                await asyncio.sleep(0.01)
+                return []
+            served.add(stream_key)
+            return [(stream_key, [("1-0", {"job_id": f"job-{stream_key}", "seq": "1"})])]
+
+        redis_client = AsyncMock()
+        redis_client.xreadgroup = xreadgroup
+        return redis_client
+
+    @pytest.mark.asyncio
+    async def test_slow_lane_does_not_block_other_shard(self):
+        """한 shard 처리가 멈춰도 다른 shard는 진행."""
+        release = asyncio.Event()
+        processed: list[str] = []
+
+        async def process_batch(events, stream_name=None):
+            if stream_name == "scan:events:0":
+                await release.wait()
+            processed.append(stream_name)
+            return [True] * len(events)
+
+        processor = MagicMock()
+        processor.process_batch = process_batch
+        consumer = self._make_consumer(self._redis_serving_once(), processor)
+
+        task = asyncio.create_task(consumer.consume())
+        await asyncio.sleep(0.05)
+        assert processed == ["scan:events:1"]
+
+        release.set()
+        await asyncio.sleep(0.05)
+        await consumer.shutdown()
+        await asyncio.wait_for(task, timeout=1)
+        assert processed == ["scan:events:1", "scan:events:0"]
+
+    @pytest.mark.asyncio
+    async def test_max_inflight_lanes_limits_concurrency(self):
+        """max_inflight_lanes=1이면 lane 처리가 직렬화."""
+        active = 0
+        peak = 0
+
+        async def process_batch(events, stream_name=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return [True] * len(events)
+
+        processor = MagicMock()
+        processor.process_batch = process_batch
+        consumer = self._make_consumer(self._redis_serving_once(), processor, max_inflight_lanes=1)
+
+        task = asyncio.create_task(consumer.consume())
+        await asyncio.sleep(0.1)
+        await consumer.shutdown()
+        await asyncio.wait_for(task, timeout=1)
+        assert peak == 1
@@ -56,6 +56,210 @@ class TestEventProcessor:
         result = await processor.process_event(event)
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_publish_shard_mode_uses_shard_channel(self, processor, mock_pubsub_redis):
+        """shard 모드: shard 채널로 PUBLISH."""
+        await processor._publish("job-1", "sse:events:2", "{}")
+
+        mock_pubsub_redis.publish.assert_awaited_once_with("sse:events:2", "{}")
+
+    @pytest.mark.asyncio
+    async def test_publish_job_mode_routes_via_registry(self, mock_streams_redis):
+        """job 모드: 라우팅 레지스트리 Lua Script로 Pod 채널에만 발행."""
+        from core.processor import ROUTE_PUBLISH_SCRIPT, EventProcessor
+
+        route_script = AsyncMock(return_value=1)
+        pubsub = AsyncMock()
+        registered: list[str] = []
+
+        def register_script(script):
+            registered.append(script)
+            return route_script
+
+        pubsub.register_script = register_script
+        processor = EventProcessor(
+            streams_client=mock_streams_redis,
+            pubsub_client=pubsub,
+            routing_mode="job",
+        )
+
+        await processor._publish("job-1", "sse:events:2", '{"job_id": "job-1"}')
+        await processor._publish("job-1", "sse:events:2", '{"job_id": "job-1"}')
+
+        assert registered == [ROUTE_PUBLISH_SCRIPT]  # 1회만 등록
+        pubsub.publish.assert_not_called()
+        kwargs = route_script.await_args.kwargs
+        assert kwargs["keys"] == ["sse:route:job-1"]
+        assert kwargs["args"][0] == "sse:events:pod:"
+        assert kwargs["args"][1] == '{"job_id": "job-1"}'
+
+
+class FakePipeline:
+    """명령을 기록하고 execute 시 결과를 반환하는 pipeline."""
+
+    def __init__(self, resolve):
+        self.commands: list[tuple] = []
+        self._resolve = resolve
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    def publish(self, channel, data):
+        self.commands.append(("publish", channel, data))
+        return self
+
+    async def execute(self, raise_on_error=True):
+        return [self._resolve(cmd) for cmd in self.commands]
+
+
+class TestProcessBatch:
+    """EventProcessor.process_batch (pipeline) 테스트."""
+
+    @staticmethod
+    def _make_processor(state_resolve, publish_resolve):
+        from core.processor import EventProcessor
+
+        pipelines: dict[str, list[FakePipeline]] = {"state": [], "publish": []}
+
+        async def script(keys=None, args=None, client=None):
+            client.commands.append(("evalsha", keys, args))
+            return client
+
+        streams = AsyncMock()
+        streams.register_script = lambda _: script
+
+        def streams_pipeline(transaction=True):
+            pipe = FakePipeline(state_resolve)
+            pipelines["state"].append(pipe)
+            return pipe
+
+        def pubsub_pipeline(transaction=True):
+            pipe = FakePipeline(publish_resolve)
+            pipelines["publish"].append(pipe)
+            return pipe
+
+        streams.pipeline = streams_pipeline
+        pubsub = AsyncMock()
+        pubsub.pipeline = pubsub_pipeline
+        pubsub.register_script = lambda _: script
+
+        processor = EventProcessor(streams_client=streams, pubsub_client=pubsub, shard_count=4)
+        return processor, pipelines
+
+    @pytest.mark.asyncio
+    async def test_single_pipeline_per_phase(self):
+        """State Lua / PUBLISH 각각 pipeline 1회, 입력 순서 유지."""
+        # seq=2는 중복 (Lua 0 반환)
+        processor, pipelines = self._make_processor(
+            state_resolve=lambda cmd: 0 if cmd[2][1] == 2 else 1,
+            publish_resolve=lambda cmd: [len(cmd[2]) - 1, "", 0],
+        )
+        events = [
+            {"job_id": "job-1", "stage": "vision", "seq": 1},
+            {"job_id": "job-1", "stage": "vision", "seq": 2},
+            {"job_id": "job-1", "stage": "token", "seq": 1001},
+            {"job_id": "job-1", "stage": "rule", "seq": 3},
+        ]
+
+        results = await processor.process_batch(events, stream_name="chat:events:1")
+
+        assert results == [True, True, True, True]
+        assert len(pipelines["state"]) == 1
+        assert len(pipelines["publish"]) == 1
+        state_cmds = pipelines["state"][0].commands
+        assert [cmd[1][0] for cmd in state_cmds] == ["chat:state:job-1"] * 3
+        # 같은 job은 순서 발행 Script 1회
+        (command,) = pipelines["publish"][0].commands
+        assert command[0] == "evalsha"
+        assert command[2][0] == "sse:events:" + str(processor._get_shard_for_job("job-1"))
+        published = [json.loads(data)["seq"] for data in command[2][1:]]
+        assert published == [1, 1001, 3]  # 중복(seq=2)은 발행 안 함
+
+    @pytest.mark.asyncio
+    async def test_job_events_stop_at_first_failure(self):
+        """같은 job의 앞 이벤트가 실패하면 뒤 이벤트는 그 재시도와 함께 순서대로 발행."""
+        attempts: list[list[int]] = []
+
+        def publish_resolve(cmd):
+            seqs = [json.loads(data)["seq"] for data in cmd[2][1:]]
+            attempts.append(seqs)
+            if len(attempts) == 1:
+                return [1, "ERR busy", 0]  # seq=2 실패 → seq=3 미발행
+            return [len(seqs), "", 0]
+
+        processor, _ = self._make_processor(
+            state_resolve=lambda cmd: 1, publish_resolve=publish_resolve
+        )
+        events = [{"job_id": "job-1", "stage": "token", "seq": seq} for seq in (1, 2, 3)]
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("core.processor.asyncio.sleep", AsyncMock())
+            results = await processor.process_batch(events)
+
+        assert results == [True, True, True]
+        assert attempts == [[1, 2, 3], [2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_job_events_after_exhausted_failure_not_ackable(self):
+        """재시도 소진 시 실패 이벤트와 같은 job의 뒤 이벤트 모두 PEL 유지."""
+        processor, _ = self._make_processor(
+            state_resolve=lambda cmd: 1,
+            publish_resolve=lambda cmd: [0, "ERR busy", 0],
+        )
+        events = [{"job_id": "job-1", "stage": "token", "seq": seq} for seq in (1, 2)]
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("core.processor.asyncio.sleep", AsyncMock())
+            results = await processor.process_batch(events)
+
+        assert results == [False, False]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_ackable(self):
+        """Lua 실패/발행 실패 이벤트는 False (PEL 유지)."""
+        processor, pipelines = self._make_processor(
+            state_resolve=lambda cmd: Exception("NOSCRIPT") if cmd[2][1] == 1 else 1,
+            publish_resolve=lambda cmd: (
+                ConnectionError("down") if json.loads(cmd[2])["seq"] == 3 else 1
+            ),
+        )
+        processor_sleep = AsyncMock()
+        events = [
+            {"job_id": "job-1", "stage": "vision", "seq": 1},
+            {"job_id": "job-2", "stage": "vision", "seq": 2},
+            {"job_id": "job-3", "stage": "vision", "seq": 3},
+            {"stage": "vision", "seq": 4},  # job_id 없음
+        ]
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("core.processor.asyncio.sleep", processor_sleep)
+            results = await processor.process_batch(events)
+
+        assert results == [False, True, False, False]
+        # 실패분만 재시도 (3회)
+        assert len(pipelines["publish"]) == 3
+        assert len(pipelines["publish"][1].commands) == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_terminal_event_republished(self):
+        """중복 done 이벤트는 재발행 시도, 실패해도 ACK 가능."""
+        processor, pipelines = self._make_processor(
+            state_resolve=lambda cmd: 0,
+            publish_resolve=lambda cmd: ConnectionError("down"),
+        )
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("core.processor.asyncio.sleep", AsyncMock())
+            results = await processor.process_batch(
+                [{"job_id": "job-1", "stage": "done", "seq": 99}]
+            )
+
+        assert results == [True]
+        assert pipelines["publish"][0].commands[0][0] == "publish"
+
 
 class TestStateSnapshot:
     """State 스냅샷 생성 테스트."""
@@ -1,20 +1,32 @@
 """Nearby Location Application Layer."""
 
-from location.application.nearby.dto import LocationEntryDTO, SearchRequest
-from location.application.nearby.ports import LocationReader
-from location.application.nearby.queries import GetNearbyCentersQuery
+from location.application.nearby.dto import (
+    ClusterEntryDTO,
+    ClusterResultDTO,
+    LocationEntryDTO,
+    SearchRequest,
+)
+from location.application.nearby.ports import ClusterReader, ClusterTileCache, LocationReader
+from location.application.nearby.queries import GetClusteredCentersQuery, GetNearbyCentersQuery
 from location.application.nearby.services import (
     CategoryClassifierService,
+    ClusterPolicyService,
     LocationEntryBuilder,
     ZoomPolicyService,
 )
 
 __all__ = [
+    "ClusterEntryDTO",
+    "ClusterResultDTO",
     "LocationEntryDTO",
     "SearchRequest",
+    "ClusterReader",
+    "ClusterTileCache",
     "LocationReader",
+    "GetClusteredCentersQuery",
     "GetNearbyCentersQuery",
     "ZoomPolicyService",
     "CategoryClassifierService",
+    "ClusterPolicyService",
     "LocationEntryBuilder",
 ]
@@ -1,8 +1,16 @@
 """Application DTOs."""
 
+from location.application.nearby.dto.cluster_entry import ClusterEntryDTO, ClusterResultDTO
 from location.application.nearby.dto.location_detail import LocationDetailDTO
 from location.application.nearby.dto.location_entry import LocationEntryDTO
 from location.application.nearby.dto.search_request import SearchRequest
 from location.application.nearby.dto.suggest_entry import SuggestEntryDTO
 
-__all__ = ["LocationDetailDTO", "LocationEntryDTO", "SearchRequest", "SuggestEntryDTO"]
+__all__ = [
+    "ClusterEntryDTO",
+    "ClusterResultDTO",
+    "LocationDetailDTO",
+    "LocationEntryDTO",
+    "SearchRequest",
+    "SuggestEntryDTO",
+]
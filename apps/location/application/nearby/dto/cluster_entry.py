@@ -0,0 +1,30 @@
+"""Cluster Entry DTO."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ClusterEntryDTO:
+    """격자 cell 1개의 클러스터 (사이트 수 + 무게중심)."""
+
+    cell_id: str
+    latitude: float
+    longitude: float
+    count: int
+
+
+@dataclass
+class ClusterResultDTO:
+    """클러스터 조회 결과 DTO."""
+
+    zoom: int
+    cell_deg: float
+    tile_keys: list[str] = field(default_factory=list)
+    clusters: list[ClusterEntryDTO] = field(default_factory=list)
+
+    @property
+    def total_count(self) -> int:
+        """클러스터에 포함된 전체 사이트 수."""
+        return sum(c.count for c in self.clusters)
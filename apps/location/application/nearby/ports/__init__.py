@@ -1,5 +1,7 @@
 """Nearby Application Ports."""
 
+from location.application.nearby.ports.cluster_reader import ClusterReader
+from location.application.nearby.ports.cluster_tile_cache import ClusterTileCache
 from location.application.nearby.ports.location_reader import LocationReader
 
-__all__ = ["LocationReader"]
+__all__ = ["ClusterReader", "ClusterTileCache", "LocationReader"]
@@ -0,0 +1,52 @@
+"""Cluster Reader Port."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from location.application.nearby.dto import ClusterEntryDTO
+from location.domain.enums import PickupCategory, StoreCategory
+
+Cell = tuple[int, int]
+
+
+class ClusterReader(ABC):
+    """격자 cell 집계 조회 포트.
+
+    Infrastructure Layer에서 구현합니다.
+    cell (i, j)는 위도 [i * cell_deg, (i + 1) * cell_deg), 경도 [j * cell_deg, (j + 1) * cell_deg)
+    범위입니다.
+    """
+
+    @abstractmethod
+    async def aggregate_cells(
+        self,
+        cell_deg: float,
+        min_cell: Cell,
+        max_cell: Cell,
+        store_filter: set[StoreCategory] | None = None,
+        pickup_filter: set[PickupCategory] | None = None,
+    ) -> Sequence[ClusterEntryDTO]:
+        """cell 범위(양 끝 포함) 안의 사이트를 cell별 수/무게중심으로 집계합니다.
+
+        Args:
+            cell_deg: cell 한 변 크기 (도)
+            min_cell: 최소 (위도 index, 경도 index)
+            max_cell: 최대 (위도 index, 경도 index)
+            store_filter: 매장 카테고리 필터 (하나라도 일치)
+            pickup_filter: 수거 품목 필터 (하나라도 겹치면 일치)
+
+        Returns:
+            사이트가 1개 이상인 cell의 ClusterEntryDTO 목록
+        """
+        ...
+
+    @abstractmethod
+    def snapshot_version(self) -> str | None:
+        """집계 대상 데이터 스냅샷 버전.
+
+        타일 캐시 키에 포함되어 데이터가 바뀌면 이전 타일을 무효화합니다.
+        스냅샷이 없는 구현(DB 직접 조회)은 None을 반환하고 캐시 TTL로만 만료됩니다.
+        """
+        ...
@@ -0,0 +1,25 @@
+"""Cluster Tile Cache Port."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from location.application.nearby.dto import ClusterEntryDTO
+
+
+class ClusterTileCache(ABC):
+    """클러스터 타일 캐시 포트.
+
+    Infrastructure Layer에서 구현합니다.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Sequence[ClusterEntryDTO] | None:
+        """타일 클러스터를 조회합니다 (미스/만료 시 None)."""
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, clusters: Sequence[ClusterEntryDTO]) -> None:
+        """타일 클러스터를 저장합니다."""
+        ...
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from typing import Sequence
 
 from location.domain.entities import NormalizedSite
+from location.domain.enums import PickupCategory, StoreCategory
 
 
 class LocationReader(ABC):
@@ -21,14 +22,20 @@ class LocationReader(ABC):
         longitude: float,
         radius_km: float,
         limit: int,
+        store_filter: set[StoreCategory] | None = None,
+        pickup_filter: set[PickupCategory] | None = None,
     ) -> Sequence[tuple[NormalizedSite, float]]:
         """주어진 좌표에서 반경 내 위치를 조회합니다.
 
+        카테고리 필터는 limit 적용 전에 반영합니다.
+
         Args:
             latitude: 위도
             longitude: 경도
             radius_km: 반경 (km)
             limit: 최대 결과 수
+            store_filter: 매장 카테고리 필터 (하나라도 일치)
+            pickup_filter: 수거 품목 필터 (하나라도 겹치면 일치)
 
         Returns:
             (NormalizedSite, 거리_km) 튜플 목록
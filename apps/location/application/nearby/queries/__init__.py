@@ -1,6 +1,9 @@
 """Application Queries."""
 
 from location.application.nearby.queries.get_center_detail import GetCenterDetailQuery
+from location.application.nearby.queries.get_clustered_centers import (
+    GetClusteredCentersQuery,
+)
 from location.application.nearby.queries.get_nearby_centers import (
     GetNearbyCentersQuery,
 )
@@ -9,6 +12,7 @@ from location.application.nearby.queries.suggest_places import SuggestPlacesQuer
 
 __all__ = [
     "GetCenterDetailQuery",
+    "GetClusteredCentersQuery",
     "GetNearbyCentersQuery",
     "SearchByKeywordQuery",
     "SuggestPlacesQuery",
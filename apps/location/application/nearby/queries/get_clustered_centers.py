@@ -0,0 +1,101 @@
+"""Get Clustered Centers Query.
+
+지도 광역 줌에서 사이트를 격자 cell별 수/무게중심으로 묶어 조회하는 Query입니다.
+타일 단위로 집계하고 캐시하므로, 지도 이동 시 겹치는 타일은 거리 계산 없이 응답합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from location.application.nearby.dto import ClusterResultDTO, SearchRequest
+from location.application.nearby.services import ClusterPolicyService, ZoomPolicyService
+from location.application.nearby.services.cluster_policy import CLUSTER_MIN_ZOOM_LEVEL
+
+if TYPE_CHECKING:
+    from location.application.nearby.ports import ClusterReader, ClusterTileCache
+
+logger = logging.getLogger(__name__)
+
+
+class GetClusteredCentersQuery:
+    """주변 재활용 센터 클러스터 조회 Query.
+
+    Workflow:
+        1. 줌 정책에 따른 반경, 클러스터 정책에 따른 격자 줌/타일 결정 (Service)
+        2. 타일별 캐시 조회 (Port)
+        3. 캐시 미스 타일만 cell 집계 후 캐시 저장 (Port)
+    """
+
+    def __init__(
+        self,
+        cluster_reader: "ClusterReader",
+        tile_cache: "ClusterTileCache",
+    ) -> None:
+        """Initialize.
+
+        Args:
+            cluster_reader: cell 집계 조회 Port
+            tile_cache: 타일 캐시 Port
+        """
+        self._reader = cluster_reader
+        self._cache = tile_cache
+
+    async def execute(self, request: SearchRequest) -> ClusterResultDTO:
+        """요청 영역을 덮는 타일의 클러스터를 조회합니다.
+
+        Args:
+            request: 검색 요청 DTO (zoom 생략 시 CLUSTER_MIN_ZOOM_LEVEL)
+
+        Returns:
+            클러스터 조회 결과 DTO (요청 영역을 덮는 타일 전체의 cell)
+        """
+        # 1. 반경/격자 줌/타일 결정
+        zoom = request.zoom if request.zoom is not None else CLUSTER_MIN_ZOOM_LEVEL
+        radius_km = (request.radius or ZoomPolicyService.radius_from_zoom(zoom)) / 1000
+        grid_zoom = ClusterPolicyService.grid_zoom(
+            request.latitude, request.longitude, radius_km, zoom
+        )
+        cell_deg = ClusterPolicyService.cell_deg_from_zoom(grid_zoom)
+        tiles = ClusterPolicyService.tiles_for_area(
+            request.latitude, request.longitude, radius_km, grid_zoom
+        )
+        version = self._reader.snapshot_version()
+
+        result = ClusterResultDTO(zoom=grid_zoom, cell_deg=cell_deg)
+        misses = 0
+        for tile in tiles:
+            tile_key = ClusterPolicyService.tile_key(grid_zoom, tile)
+            cache_key = ClusterPolicyService.cache_key(
+                tile_key, request.store_filter, request.pickup_filter, version
+            )
+            result.tile_keys.append(tile_key)
+
+            # 2. 타일 캐시 조회
+            clusters = await self._cache.get(cache_key)
+            if clusters is None:
+                # 3. cell 집계 + 캐시 저장
+                misses += 1
+                min_cell, max_cell = ClusterPolicyService.tile_cell_range(tile)
+                clusters = await self._reader.aggregate_cells(
+                    cell_deg,
+                    min_cell,
+                    max_cell,
+                    store_filter=request.store_filter,
+                    pickup_filter=request.pickup_filter,
+                )
+                await self._cache.set(cache_key, clusters)
+            result.clusters.extend(clusters)
+
+        logger.info(
+            "Location clusters completed",
+            extra={
+                "zoom": zoom,
+                "grid_zoom": grid_zoom,
+                "tiles": len(tiles),
+                "tile_misses": misses,
+                "clusters": len(result.clusters),
+            },
+        )
+        return result
@@ -27,8 +27,8 @@ class GetNearbyCentersQuery:
 
     Workflow:
         1. 줌 정책에 따른 반경/제한 결정 (Service)
-        2. 위치 데이터 조회 (Port)
-        3. 카테고리 분류 및 필터링 (Service)
+        2. 위치 데이터 조회 - 카테고리 필터는 limit 이전에 적용 (Port)
+        3. 카테고리 분류 및 필터링 - 미계산 행 보정 (Service)
         4. DTO 변환 (Service)
     """
 
@@ -69,13 +69,15 @@ class GetNearbyCentersQuery:
             longitude=request.longitude,
             radius_km=effective_radius / 1000,
             limit=limit,
+            store_filter=request.store_filter,
+            pickup_filter=request.pickup_filter,
         )
 
-        # 3. 카테고리 분류 및 필터링, 4. DTO 변환
+        # 3. 카테고리 분류 및 필터링 (카테고리 미계산 행 보정), 4. DTO 변환
         entries: list[LocationEntryDTO] = []
         for site, distance in rows:
             metadata = site.metadata or {}
-            store_category, pickup_categories = CategoryClassifierService.classify(site, metadata)
+            store_category, pickup_categories = CategoryClassifierService.resolve(site)
 
             # 필터링
             if request.store_filter and store_category not in request.store_filter:
@@ -3,9 +3,15 @@
 from location.application.nearby.services.category_classifier import (
     CategoryClassifierService,
 )
+from location.application.nearby.services.cluster_policy import ClusterPolicyService
 from location.application.nearby.services.location_entry_builder import (
     LocationEntryBuilder,
 )
 from location.application.nearby.services.zoom_policy import ZoomPolicyService
 
-__all__ = ["ZoomPolicyService", "CategoryClassifierService", "LocationEntryBuilder"]
+__all__ = [
+    "ZoomPolicyService",
+    "CategoryClassifierService",
+    "ClusterPolicyService",
+    "LocationEntryBuilder",
+]
@@ -118,6 +118,13 @@ class CategoryClassifierService:
         pickup_categories = CategoryClassifierService._classify_pickup_categories(meta)
         return store_category, pickup_categories
 
+    @staticmethod
+    def resolve(site: NormalizedSite) -> tuple[StoreCategory, list[PickupCategory]]:
+        """사전 계산된 카테고리가 있으면 사용하고, 없으면 분류합니다."""
+        if site.store_category is not None and site.pickup_categories is not None:
+            return site.store_category, list(site.pickup_categories)
+        return CategoryClassifierService.classify(site, site.metadata or {})
+
     @staticmethod
     def _classify_store_category(
         site: NormalizedSite,
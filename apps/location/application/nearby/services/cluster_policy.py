@@ -0,0 +1,133 @@
+"""Cluster Policy Service.
+
+줌 레벨에 따른 클러스터 격자 크기와 타일 키를 결정합니다.
+Port 의존성이 없는 순수 로직입니다.
+
+- 카카오맵 줌 레벨이 1 오를 때마다 지도 축척이 2배 → cell 한 변도 2배
+- 타일 = TILE_CELLS x TILE_CELLS cell 묶음. 같은 줌에서 타일 경계가 고정되므로
+  지도 이동(pan) 시 이전 요청과 겹치는 타일은 캐시에서 재사용합니다.
+"""
+
+from __future__ import annotations
+
+import math
+
+from location.application.nearby.services.zoom_policy import (
+    KAKAO_MAX_ZOOM_LEVEL,
+    KAKAO_MIN_ZOOM_LEVEL,
+)
+from location.domain.enums import PickupCategory, StoreCategory
+
+# 줌 1(street)에서 cell 한 변 ≈ 22m (마커 1개 크기)
+CLUSTER_CELL_DEG_AT_MIN_ZOOM = 0.0002
+# 반경이 80km까지 넓어지는 광역 줌. 이 레벨 이상에서 클러스터 응답 사용 권장
+CLUSTER_MIN_ZOOM_LEVEL = 8
+TILE_CELLS = 16
+# 요청 영역이 축마다 이 타일 수를 넘으면 더 넓은 줌의 격자로 올림
+MAX_TILE_SPAN = 4
+
+KM_PER_DEGREE_LAT = math.pi * 6371.0 / 180
+
+Tile = tuple[int, int]
+Cell = tuple[int, int]
+
+
+class ClusterPolicyService:
+    """클러스터 정책 서비스.
+
+    줌 레벨별 cell 크기, 요청 영역을 덮는 타일, 타일 캐시 키를 결정합니다.
+    """
+
+    @staticmethod
+    def cell_deg_from_zoom(zoom: int) -> float:
+        """줌 레벨(카카오맵)에 따른 cell 한 변 크기(도)를 반환합니다."""
+        clamped = max(KAKAO_MIN_ZOOM_LEVEL, min(zoom, KAKAO_MAX_ZOOM_LEVEL))
+        return CLUSTER_CELL_DEG_AT_MIN_ZOOM * 2 ** (clamped - KAKAO_MIN_ZOOM_LEVEL)
+
+    @staticmethod
+    def cell_degs() -> list[float]:
+        """전체 줌 레벨의 cell 크기 목록 (집계 사전 계산용)."""
+        return [
+            ClusterPolicyService.cell_deg_from_zoom(zoom)
+            for zoom in range(KAKAO_MIN_ZOOM_LEVEL, KAKAO_MAX_ZOOM_LEVEL + 1)
+        ]
+
+    @staticmethod
+    def grid_zoom(latitude: float, longitude: float, radius_km: float, zoom: int) -> int:
+        """타일 수가 MAX_TILE_SPAN을 넘지 않는 가장 가까운 줌 레벨을 반환합니다."""
+        grid_zoom = max(KAKAO_MIN_ZOOM_LEVEL, min(zoom, KAKAO_MAX_ZOOM_LEVEL))
+        while grid_zoom < KAKAO_MAX_ZOOM_LEVEL:
+            min_tile, max_tile = ClusterPolicyService._tile_bounds(
+                latitude, longitude, radius_km, grid_zoom
+            )
+            span = max(max_tile[0] - min_tile[0], max_tile[1] - min_tile[1]) + 1
+            if span <= MAX_TILE_SPAN:
+                break
+            grid_zoom += 1
+        return grid_zoom
+
+    @staticmethod
+    def tiles_for_area(
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        zoom: int,
+    ) -> list[Tile]:
+        """중심 좌표/반경의 bounding box를 덮는 타일 목록을 반환합니다."""
+        min_tile, max_tile = ClusterPolicyService._tile_bounds(latitude, longitude, radius_km, zoom)
+        return [
+            (ti, tj)
+            for ti in range(min_tile[0], max_tile[0] + 1)
+            for tj in range(min_tile[1], max_tile[1] + 1)
+        ]
+
+    @staticmethod
+    def tile_cell_range(tile: Tile) -> tuple[Cell, Cell]:
+        """타일이 덮는 cell 범위 (양 끝 포함)."""
+        ti, tj = tile
+        return (
+            (ti * TILE_CELLS, tj * TILE_CELLS),
+            (ti * TILE_CELLS + TILE_CELLS - 1, tj * TILE_CELLS + TILE_CELLS - 1),
+        )
+
+    @staticmethod
+    def tile_key(zoom: int, tile: Tile) -> str:
+        """클라이언트에 노출하는 타일 키 ("{zoom}/{위도 index}/{경도 index}")."""
+        return f"{zoom}/{tile[0]}/{tile[1]}"
+
+    @staticmethod
+    def cache_key(
+        tile_key: str,
+        store_filter: set[StoreCategory] | None,
+        pickup_filter: set[PickupCategory] | None,
+        version: str | None,
+    ) -> str:
+        """타일 캐시 키 (타일 + 카테고리 필터 + 데이터 버전)."""
+        store = ",".join(sorted(c.value for c in store_filter)) if store_filter else "all"
+        pickup = ",".join(sorted(c.value for c in pickup_filter)) if pickup_filter else "all"
+        return f"{tile_key}|s={store}|p={pickup}|v={version or '-'}"
+
+    @staticmethod
+    def _tile_bounds(
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        zoom: int,
+    ) -> tuple[Tile, Tile]:
+        cell_deg = ClusterPolicyService.cell_deg_from_zoom(zoom)
+        dlat = radius_km / KM_PER_DEGREE_LAT
+        cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+        dlon = min(radius_km / (KM_PER_DEGREE_LAT * cos_lat), 180.0)
+        min_lat = max(latitude - dlat, -90.0)
+        max_lat = min(latitude + dlat, 90.0)
+        # 타일 index는 cell index에서 계산 (Reader의 cell 경계와 같은 부동소수 연산)
+        return (
+            (
+                math.floor(min_lat / cell_deg) // TILE_CELLS,
+                math.floor((longitude - dlon) / cell_deg) // TILE_CELLS,
+            ),
+            (
+                math.floor(max_lat / cell_deg) // TILE_CELLS,
+                math.floor((longitude + dlon) / cell_deg) // TILE_CELLS,
+            ),
+        )
@@ -0,0 +1,45 @@
+"""Location Category Backfill.
+
+정규화 사이트의 store_category / pickup_categories 컬럼을 계산하여 저장.
+사이트 데이터 적재 후 1회 실행 (V005 마이그레이션 이후).
+
+실행:
+    python -m location.category_backfill
+    python -m location.category_backfill --recompute   # 분류 규칙 변경 시 전체 재계산
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+
+
+async def main(recompute: bool, batch_size: int) -> None:
+    """카테고리 컬럼 backfill."""
+    from location.infrastructure.persistence_postgres import SqlaLocationReader
+    from location.setup.database import async_session_factory, engine
+
+    logger = logging.getLogger(__name__)
+    async with async_session_factory() as session:
+        updated = await SqlaLocationReader(session).backfill_categories(
+            batch_size=batch_size,
+            recompute=recompute,
+        )
+    await engine.dispose()
+    logger.info("Category backfill completed", extra={"updated": updated})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Location category backfill")
+    parser.add_argument("--recompute", action="store_true", help="이미 계산된 행도 재계산")
+    parser.add_argument("--batch-size", type=int, default=500, help="커밋 단위 행 수")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        stream=sys.stdout,
+    )
+    asyncio.run(main(args.recompute, args.batch_size))
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+from location.domain.enums import PickupCategory, StoreCategory
 from location.domain.value_objects import Coordinates
 
 
@@ -40,6 +41,9 @@ class NormalizedSite:
     tmpr_lhldy_cn: str | None = None
     clct_item_cn: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    # 사전 계산된 카테고리 (None이면 요청 시 분류)
+    store_category: StoreCategory | None = None
+    pickup_categories: tuple[PickupCategory, ...] | None = None
 
     def coordinates(self) -> Coordinates | None:
         """좌표 Value Object를 반환합니다."""
@@ -0,0 +1,5 @@
+"""In-Process Cache Infrastructure."""
+
+from location.infrastructure.cache.cluster_tile_cache import InMemoryClusterTileCache
+
+__all__ = ["InMemoryClusterTileCache"]
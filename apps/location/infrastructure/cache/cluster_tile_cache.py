@@ -0,0 +1,67 @@
+"""In-Memory Cluster Tile Cache.
+
+프로세스 메모리 LRU + TTL 타일 캐시입니다.
+캐시 키에 인덱스 데이터 버전이 포함되므로 인덱스가 다시 빌드되면 이전 타일은
+더 이상 조회되지 않고 LRU 순서로 밀려납니다. TTL은 SQL 경로(버전 없음)의 만료용입니다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable, Sequence
+
+from location.application.nearby.dto import ClusterEntryDTO
+from location.application.nearby.ports import ClusterTileCache
+
+DEFAULT_MAX_TILES = 4096
+DEFAULT_TILE_TTL_SECONDS = 300.0
+
+
+class InMemoryClusterTileCache(ClusterTileCache):
+    """프로세스 메모리 기반 클러스터 타일 캐시.
+
+    ClusterTileCache Port를 구현합니다.
+    이벤트 루프 스레드에서만 접근하므로 락을 사용하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_tiles: int = DEFAULT_MAX_TILES,
+        ttl_seconds: float = DEFAULT_TILE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            max_tiles: 최대 타일 수 (초과 시 가장 오래 사용되지 않은 타일 삭제)
+            ttl_seconds: 타일 TTL (초)
+            clock: 시각 함수 (테스트 주입용)
+        """
+        self._max_tiles = max_tiles
+        self._ttl = ttl_seconds
+        self._clock = clock
+        # key → (만료 시각, 클러스터)
+        self._tiles: OrderedDict[str, tuple[float, tuple[ClusterEntryDTO, ...]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    async def get(self, key: str) -> Sequence[ClusterEntryDTO] | None:
+        """타일 클러스터를 조회합니다 (미스/만료 시 None)."""
+        entry = self._tiles.get(key)
+        if entry is None:
+            return None
+        expires_at, clusters = entry
+        if expires_at <= self._clock():
+            del self._tiles[key]
+            return None
+        self._tiles.move_to_end(key)
+        return clusters
+
+    async def set(self, key: str, clusters: Sequence[ClusterEntryDTO]) -> None:
+        """타일 클러스터를 저장합니다."""
+        self._tiles[key] = (self._clock() + self._ttl, tuple(clusters))
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self._max_tiles:
+            self._tiles.popitem(last=False)
@@ -5,20 +5,25 @@ from __future__ import annotations
 import json
 from typing import Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import func, literal_column, or_, select, update
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from location.application.nearby.ports import LocationReader
+from location.application.nearby.dto import ClusterEntryDTO
+from location.application.nearby.ports import ClusterReader, LocationReader
+from location.application.nearby.services import CategoryClassifierService
 from location.domain.entities import NormalizedSite
+from location.domain.enums import PickupCategory, StoreCategory
 from location.infrastructure.persistence_postgres.models import NormalizedLocationSite
 
 
-class SqlaLocationReader(LocationReader):
+class SqlaLocationReader(LocationReader, ClusterReader):
     """SQLAlchemy 기반 위치 Reader.
 
-    LocationReader Port를 구현합니다.
+    LocationReader, ClusterReader Port를 구현합니다.
     PostGIS earth_distance 또는 Haversine fallback을 사용합니다.
+    카테고리 필터는 적재 시 계산된 store_category/pickup_categories 컬럼으로
+    WHERE 절에서 적용합니다 (LIMIT 이전).
     """
 
     def __init__(self, session: AsyncSession) -> None:
@@ -35,14 +40,17 @@ class SqlaLocationReader(LocationReader):
         longitude: float,
         radius_km: float,
         limit: int,
+        store_filter: set[StoreCategory] | None = None,
+        pickup_filter: set[PickupCategory] | None = None,
     ) -> Sequence[tuple[NormalizedSite, float]]:
         """주어진 좌표에서 반경 내 위치를 조회합니다."""
+        filters = self._category_filters(store_filter, pickup_filter)
         try:
             distance_expr = self._earthdistance_expr(latitude, longitude)
-            return await self._execute_distance_query(distance_expr, radius_km, limit)
+            return await self._execute_distance_query(distance_expr, radius_km, limit, filters)
         except DBAPIError:
             distance_expr = self._haversine_expr(latitude, longitude)
-            return await self._execute_distance_query(distance_expr, radius_km, limit)
+            return await self._execute_distance_query(distance_expr, radius_km, limit, filters)
 
     async def find_by_id(self, site_id: int) -> NormalizedSite | None:
         """ID로 사이트를 조회합니다."""
@@ -60,11 +68,102 @@ class SqlaLocationReader(LocationReader):
         )
         return int(result.scalar_one())
 
+    async def aggregate_cells(
+        self,
+        cell_deg: float,
+        min_cell: tuple[int, int],
+        max_cell: tuple[int, int],
+        store_filter: set[StoreCategory] | None = None,
+        pickup_filter: set[PickupCategory] | None = None,
+    ) -> Sequence[ClusterEntryDTO]:
+        """cell 범위 안의 사이트를 GROUP BY로 cell별 수/무게중심 집계합니다.
+
+        카테고리 미계산(NULL) 행은 필터를 통과하므로 필터 집계 수는 상한값입니다.
+        """
+        result = await self._session.execute(
+            self._aggregate_query(
+                cell_deg,
+                min_cell,
+                max_cell,
+                self._category_filters(store_filter, pickup_filter),
+            )
+        )
+        return [
+            ClusterEntryDTO(
+                cell_id=f"{int(ci)}:{int(cj)}",
+                latitude=float(lat),
+                longitude=float(lon),
+                count=int(count),
+            )
+            for ci, cj, count, lat, lon in result.all()
+        ]
+
+    def snapshot_version(self) -> str | None:
+        """DB 직접 조회는 스냅샷이 없으므로 None (타일 캐시는 TTL로만 만료)."""
+        return None
+
+    async def backfill_categories(self, batch_size: int = 500, recompute: bool = False) -> int:
+        """카테고리 컬럼을 계산하여 저장합니다 (적재 후 1회 실행).
+
+        Args:
+            batch_size: 커밋 단위 행 수
+            recompute: True면 이미 계산된 행도 다시 계산
+
+        Returns:
+            갱신한 행 수
+        """
+        query = select(NormalizedLocationSite).order_by(NormalizedLocationSite.positn_sn)
+        if not recompute:
+            query = query.where(NormalizedLocationSite.store_category.is_(None))
+        result = await self._session.execute(query)
+
+        updated = 0
+        for site in result.scalars():
+            domain = self._to_domain(site)
+            store_category, pickup_categories = CategoryClassifierService.classify(
+                domain, domain.metadata
+            )
+            await self._session.execute(
+                update(NormalizedLocationSite)
+                .where(NormalizedLocationSite.positn_sn == site.positn_sn)
+                .values(
+                    store_category=store_category.value,
+                    pickup_categories=sorted(c.value for c in pickup_categories),
+                )
+            )
+            updated += 1
+            if updated % batch_size == 0:
+                await self._session.commit()
+        await self._session.commit()
+        return updated
+
+    async def load_all_sites(self) -> list[NormalizedSite]:
+        """전체 사이트를 로딩합니다 (인메모리 인덱스 빌드용)."""
+        result = await self._session.execute(
+            select(NormalizedLocationSite).order_by(NormalizedLocationSite.positn_sn)
+        )
+        return [self._to_domain(site) for site in result.scalars()]
+
+    async def data_version(self) -> tuple[int, int]:
+        """데이터 버전 (행 수, 전체 행 해시 합).
+
+        행 추가/삭제/수정 시 값이 바뀌므로 인덱스 갱신 여부 판단에 사용합니다.
+        """
+        row_hash = literal_column("hashtext(location_normalized_sites::text)::bigint")
+        result = await self._session.execute(
+            select(func.count(), func.coalesce(func.sum(row_hash), 0)).select_from(
+                NormalizedLocationSite
+            )
+        )
+        count, checksum = result.one()
+        return int(count), int(checksum)
+
     async def _execute_distance_query(
         self,
         distance_expr,
         radius_km: float,
         limit: int,
+        filters: list,
     ) -> list[tuple[NormalizedSite, float]]:
         """거리 쿼리를 실행합니다."""
         query = (
@@ -73,6 +172,7 @@ class SqlaLocationReader(LocationReader):
                 NormalizedLocationSite.positn_pstn_lat.is_not(None),
                 NormalizedLocationSite.positn_pstn_lot.is_not(None),
                 distance_expr <= radius_km,
+                *filters,
             )
             .order_by(distance_expr.asc())
             .limit(limit)
@@ -85,6 +185,30 @@ class SqlaLocationReader(LocationReader):
             rows.append((self._to_domain(site), float(distance_km)))
         return rows
 
+    @staticmethod
+    def _aggregate_query(
+        cell_deg: float,
+        min_cell: tuple[int, int],
+        max_cell: tuple[int, int],
+        filters: list,
+    ):
+        """cell 집계 쿼리 (위경도 범위 조건 + floor(좌표 / cell_deg) GROUP BY)."""
+        lat = NormalizedLocationSite.positn_pstn_lat
+        lon = NormalizedLocationSite.positn_pstn_lot
+        cell_i = func.floor(lat / cell_deg).label("cell_i")
+        cell_j = func.floor(lon / cell_deg).label("cell_j")
+        return (
+            select(cell_i, cell_j, func.count(), func.avg(lat), func.avg(lon))
+            .where(
+                lat >= min_cell[0] * cell_deg,
+                lat < (max_cell[0] + 1) * cell_deg,
+                lon >= min_cell[1] * cell_deg,
+                lon < (max_cell[1] + 1) * cell_deg,
+                *filters,
+            )
+            .group_by(cell_i, cell_j)
+        )
+
     def _to_domain(self, site: NormalizedLocationSite) -> NormalizedSite:
         """ORM 모델을 도메인 엔티티로 변환합니다."""
         metadata = {}
@@ -118,8 +242,58 @@ class SqlaLocationReader(LocationReader):
             tmpr_lhldy_cn=site.tmpr_lhldy_cn,
             clct_item_cn=site.clct_item_cn,
             metadata=metadata,
+            store_category=self._to_store_category(site.store_category),
+            pickup_categories=self._to_pickup_categories(site.pickup_categories),
         )
 
+    @staticmethod
+    def _category_filters(
+        store_filter: set[StoreCategory] | None,
+        pickup_filter: set[PickupCategory] | None,
+    ) -> list:
+        """카테고리 필터 WHERE 조건.
+
+        카테고리 미계산(NULL) 행은 조건을 통과시키고 Query의 재분류 필터에 맡깁니다.
+        """
+        filters = []
+        if store_filter:
+            filters.append(
+                or_(
+                    NormalizedLocationSite.store_category.is_(None),
+                    NormalizedLocationSite.store_category.in_(
+                        sorted(c.value for c in store_filter)
+                    ),
+                )
+            )
+        if pickup_filter:
+            filters.append(
+                or_(
+                    NormalizedLocationSite.pickup_categories.is_(None),
+                    NormalizedLocationSite.pickup_categories.overlap(
+                        sorted(c.value for c in pickup_filter)
+                    ),
+                )
+            )
+        return filters
+
+    @staticmethod
+    def _to_store_category(value: str | None) -> StoreCategory | None:
+        if value is None:
+            return None
+        try:
+            return StoreCategory(value)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _to_pickup_categories(values: list[str] | None) -> tuple[PickupCategory, ...] | None:
+        if values is None:
+            return None
+        try:
+            return tuple(PickupCategory(value) for value in values)
+        except ValueError:
+            return None
+
     @staticmethod
     def _earthdistance_expr(latitude: float, longitude: float):
         """PostGIS earth_distance 표현식."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from sqlalchemy import BigInteger, Float, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -57,3 +58,6 @@ class NormalizedLocationSite(Base):
     clct_item_cn: Mapped[str | None] = mapped_column(Text)
     etc_mttr_cn: Mapped[str | None] = mapped_column(Text)
     source_metadata: Mapped[str | None] = mapped_column(Text)
+    # 적재 시 CategoryClassifierService로 계산 (V005, python -m location.category_backfill)
+    store_category: Mapped[str | None] = mapped_column(String(32))
+    pickup_categories: Mapped[list[str] | None] = mapped_column(ARRAY(String(32)))
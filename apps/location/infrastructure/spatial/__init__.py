@@ -0,0 +1,7 @@
+"""In-Memory Spatial Index Infrastructure."""
+
+from location.infrastructure.spatial.index_reader import InMemoryLocationReader
+from location.infrastructure.spatial.refresher import SiteIndexRefresher
+from location.infrastructure.spatial.site_index import GridSiteIndex
+
+__all__ = ["GridSiteIndex", "InMemoryLocationReader", "SiteIndexRefresher"]
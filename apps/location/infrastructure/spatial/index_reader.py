@@ -0,0 +1,70 @@
+"""In-Memory Location Reader Implementation."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from location.application.nearby.dto import ClusterEntryDTO
+from location.application.nearby.ports import ClusterReader, LocationReader
+from location.domain.entities import NormalizedSite
+from location.domain.enums import PickupCategory, StoreCategory
+from location.infrastructure.spatial.site_index import GridSiteIndex
+
+
+class InMemoryLocationReader(LocationReader, ClusterReader):
+    """인메모리 격자 인덱스 기반 위치 Reader.
+
+    LocationReader, ClusterReader Port를 구현합니다.
+    DB 왕복, metadata JSON 파싱, 요청별 카테고리 분류 없이 응답합니다.
+    """
+
+    def __init__(self, index: GridSiteIndex) -> None:
+        """Initialize.
+
+        Args:
+            index: 요청 시점의 사이트 인덱스 스냅샷
+        """
+        self._index = index
+
+    async def find_within_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int,
+        store_filter: set[StoreCategory] | None = None,
+        pickup_filter: set[PickupCategory] | None = None,
+    ) -> Sequence[tuple[NormalizedSite, float]]:
+        """주어진 좌표에서 반경 내 위치를 조회합니다."""
+        return self._index.find_within_radius(
+            latitude, longitude, radius_km, limit, store_filter, pickup_filter
+        )
+
+    async def find_by_id(self, site_id: int) -> NormalizedSite | None:
+        """ID로 사이트를 조회합니다."""
+        return self._index.get(site_id)
+
+    async def count_sites(self) -> int:
+        """전체 사이트 수를 반환합니다."""
+        return len(self._index)
+
+    async def aggregate_cells(
+        self,
+        cell_deg: float,
+        min_cell: tuple[int, int],
+        max_cell: tuple[int, int],
+        store_filter: set[StoreCategory] | None = None,
+        pickup_filter: set[PickupCategory] | None = None,
+    ) -> Sequence[ClusterEntryDTO]:
+        """cell 범위 안의 사이트를 cell별 수/무게중심으로 집계합니다."""
+        return [
+            ClusterEntryDTO(cell_id=f"{ci}:{cj}", latitude=lat, longitude=lon, count=count)
+            for ci, cj, count, lat, lon in self._index.aggregate_cells(
+                cell_deg, min_cell, max_cell, store_filter, pickup_filter
+            )
+        ]
+
+    def snapshot_version(self) -> str | None:
+        """인덱스 데이터 버전 (인덱스가 다시 빌드되면 바뀜)."""
+        version = self._index.version
+        return None if version is None else str(version)
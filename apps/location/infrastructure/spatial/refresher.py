@@ -0,0 +1,107 @@
+"""Site Index Refresher.
+
+DB에서 정규화된 사이트를 읽어 GridSiteIndex를 빌드하고,
+주기적으로 데이터 버전을 확인하여 바뀌었을 때만 다시 빌드합니다.
+빌드가 끝난 인덱스는 참조 교체로 반영되므로 요청 처리 중에는 락이 필요 없습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from location.application.nearby.services import ClusterPolicyService
+from location.domain.entities import NormalizedSite
+from location.infrastructure.persistence_postgres import SqlaLocationReader
+from location.infrastructure.spatial.site_index import DEFAULT_CELL_DEG, GridSiteIndex
+
+logger = logging.getLogger(__name__)
+
+
+class SiteIndexRefresher:
+    """사이트 인덱스 로딩 및 주기적 갱신."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        refresh_interval_seconds: float = 300.0,
+        cell_deg: float = DEFAULT_CELL_DEG,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            session_factory: DB 세션 팩토리
+            refresh_interval_seconds: 데이터 버전 확인 주기 (초)
+            cell_deg: 격자 한 변 크기 (도)
+        """
+        self._session_factory = session_factory
+        self._interval = refresh_interval_seconds
+        self._cell_deg = cell_deg
+        self._index: GridSiteIndex | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def index(self) -> GridSiteIndex | None:
+        """현재 인덱스 스냅샷 (로딩 전이면 None)."""
+        return self._index
+
+    async def refresh(self, force: bool = False) -> bool:
+        """데이터 버전이 바뀌었으면 인덱스를 다시 빌드합니다.
+
+        Returns:
+            다시 빌드했으면 True
+        """
+        async with self._session_factory() as session:
+            reader = SqlaLocationReader(session)
+            version = await reader.data_version()
+            if not force and self._index is not None and self._index.version == version:
+                return False
+            start = time.perf_counter()
+            sites = await reader.load_all_sites()
+
+        # 카테고리 분류/클러스터 집계가 포함된 CPU 작업 → 이벤트 루프 블로킹 방지
+        index = await asyncio.to_thread(self._build, sites, version)
+        self._index = index
+        logger.info(
+            "Site index built",
+            extra={
+                "sites": len(index),
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            },
+        )
+        return True
+
+    def _build(self, sites: list[NormalizedSite], version: object) -> GridSiteIndex:
+        index = GridSiteIndex(sites, self._cell_deg, version)
+        index.precompute_clusters(ClusterPolicyService.cell_degs())
+        return index
+
+    async def start(self) -> None:
+        """초기 로딩 후 백그라운드 갱신 루프를 시작합니다."""
+        try:
+            await self.refresh(force=True)
+        except Exception:
+            logger.exception("Initial site index load failed, falling back to SQL reader")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 루프를 중지합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Site index refresh failed, keeping previous index")
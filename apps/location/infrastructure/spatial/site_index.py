@@ -0,0 +1,248 @@
+"""Grid Spatial Index.
+
+정규화된 사이트를 위경도 격자(cell)에 나눠 담는 불변 인메모리 인덱스입니다.
+반경 검색은 반경의 bounding box에 걸치는 cell 후보만 Haversine으로 계산합니다.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import defaultdict
+from dataclasses import replace
+from typing import Iterable, Sequence
+
+from location.application.nearby.services import CategoryClassifierService
+from location.domain.entities import NormalizedSite
+from location.domain.enums import PickupCategory, StoreCategory
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_KM / 180
+
+# 0.05도 ≈ 위도 5.5km (한국 위도에서 경도 ≈ 4.4km)
+DEFAULT_CELL_DEG = 0.05
+
+Cell = tuple[int, int]
+# (위도, 경도, cos(위도 rad), site)
+IndexedSite = tuple[float, float, float, NormalizedSite]
+# (위도 index, 경도 index, 사이트 수, 무게중심 위도, 무게중심 경도)
+CellAggregate = tuple[int, int, int, float, float]
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 좌표 사이 대원 거리 (km). SQL Haversine fallback과 같은 반경 사용."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GridSiteIndex:
+    """위경도 격자 기반 사이트 인덱스 (빌드 후 읽기 전용).
+
+    빌드 시 카테고리를 사전 계산하여 사이트 엔티티에 담아 둡니다.
+    클러스터용 cell 집계(필터 없음)는 cell 크기별로 1회 계산하여 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        sites: Iterable[NormalizedSite],
+        cell_deg: float = DEFAULT_CELL_DEG,
+        version: object = None,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            sites: 인덱싱할 사이트 (metadata 파싱 완료 상태)
+            cell_deg: 격자 한 변 크기 (도)
+            version: 원본 데이터 버전 (갱신 판단용)
+        """
+        self._cell_deg = cell_deg
+        self.version = version
+        self._cells: dict[Cell, list[IndexedSite]] = defaultdict(list)
+        self._by_id: dict[int, NormalizedSite] = {}
+        # cell_deg → {cell: CellAggregate}
+        self._cluster_grids: dict[float, dict[Cell, CellAggregate]] = {}
+
+        for site in sites:
+            site = self._with_categories(site)
+            self._by_id[site.id] = site
+            lat, lon = site.positn_pstn_lat, site.positn_pstn_lot
+            if lat is None or lon is None:
+                continue
+            self._cells[self._cell_of(lat, lon)].append(
+                (lat, lon, math.cos(math.radians(lat)), site)
+            )
+        self._cells = dict(self._cells)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get(self, site_id: int) -> NormalizedSite | None:
+        """ID로 사이트를 조회합니다."""
+        return self._by_id.get(site_id)
+
+    def find_within_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int,
+        store_filter: set[StoreCategory] | None = None,
+        pickup_filter: set[PickupCategory] | None = None,
+    ) -> Sequence[tuple[NormalizedSite, float]]:
+        """반경/카테고리 조건을 만족하는 사이트를 거리 오름차순으로 최대 limit개 반환합니다."""
+        if limit <= 0 or radius_km <= 0:
+            return []
+
+        dlat = radius_km / KM_PER_DEGREE_LAT
+        cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+        dlon = min(radius_km / (KM_PER_DEGREE_LAT * cos_lat), 180.0)
+        min_cell = self._cell_of(latitude - dlat, longitude - dlon)
+        max_cell = self._cell_of(latitude + dlat, longitude + dlon)
+
+        phi = math.radians(latitude)
+        cos_phi = math.cos(phi)
+        lmb = math.radians(longitude)
+        # hav(d/R) 비교로 반경 판정 (asin은 결과 후보에만 적용)
+        hav_limit = math.sin(min(radius_km / EARTH_RADIUS_KM, math.pi) / 2) ** 2
+
+        candidates: list[tuple[float, int, NormalizedSite]] = []
+        cells = self._cells
+        for ci in range(min_cell[0], max_cell[0] + 1):
+            for cj in range(min_cell[1], max_cell[1] + 1):
+                bucket = cells.get((ci, cj))
+                if not bucket:
+                    continue
+                for lat, lon, cos_site, site in bucket:
+                    if store_filter and site.store_category not in store_filter:
+                        continue
+                    if pickup_filter and pickup_filter.isdisjoint(site.pickup_categories):
+                        continue
+                    hav = (
+                        math.sin((math.radians(lat) - phi) / 2) ** 2
+                        + cos_phi * cos_site * math.sin((math.radians(lon) - lmb) / 2) ** 2
+                    )
+                    if hav <= hav_limit:
+                        candidates.append((hav, site.id, site))
+
+        nearest = heapq.nsmallest(limit, candidates)
+        return [
+            (site, 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(hav))))
+            for hav, _, site in nearest
+        ]
+
+    def precompute_clusters(self, cell_degs: Iterable[float]) -> None:
+        """cell 크기별 집계를 미리 계산합니다 (빌드 스레드에서 호출)."""
+        for cell_deg in cell_degs:
+            self._cluster_grid(cell_deg)
+
+    def aggregate_cells(
+        self,
+        cell_deg: float,
+        min_cell: Cell,
+        max_cell: Cell,
+        store_filter: set[StoreCategory] | None = None,
+        pickup_filter: set[PickupCategory] | None = None,
+    ) -> list[CellAggregate]:
+        """cell 범위(양 끝 포함) 안의 사이트를 cell별 수/무게중심으로 집계합니다."""
+        if store_filter or pickup_filter:
+            grid = self._aggregate(
+                self._sites_in_range(cell_deg, min_cell, max_cell),
+                cell_deg,
+                store_filter,
+                pickup_filter,
+            )
+        else:
+            grid = self._cluster_grid(cell_deg)
+        span = (max_cell[0] - min_cell[0] + 1) * (max_cell[1] - min_cell[1] + 1)
+        if span > len(grid):
+            return [
+                aggregate
+                for (ci, cj), aggregate in grid.items()
+                if min_cell[0] <= ci <= max_cell[0] and min_cell[1] <= cj <= max_cell[1]
+            ]
+        return [
+            grid[(ci, cj)]
+            for ci in range(min_cell[0], max_cell[0] + 1)
+            for cj in range(min_cell[1], max_cell[1] + 1)
+            if (ci, cj) in grid
+        ]
+
+    def _cluster_grid(self, cell_deg: float) -> dict[Cell, CellAggregate]:
+        grid = self._cluster_grids.get(cell_deg)
+        if grid is None:
+            sites = (entry for bucket in self._cells.values() for entry in bucket)
+            grid = self._aggregate(sites, cell_deg)
+            self._cluster_grids[cell_deg] = grid
+        return grid
+
+    def _sites_in_range(self, cell_deg: float, min_cell: Cell, max_cell: Cell):
+        """집계 cell 범위와 겹치는 인덱스 cell의 사이트."""
+        min_base = self._cell_of(min_cell[0] * cell_deg, min_cell[1] * cell_deg)
+        max_base = self._cell_of((max_cell[0] + 1) * cell_deg, (max_cell[1] + 1) * cell_deg)
+        span = (max_base[0] - min_base[0] + 1) * (max_base[1] - min_base[1] + 1)
+        if span > len(self._cells):
+            # 광역 타일: 범위 순회보다 채워진 cell 순회가 적음
+            buckets = [
+                bucket
+                for (ci, cj), bucket in self._cells.items()
+                if min_base[0] <= ci <= max_base[0] and min_base[1] <= cj <= max_base[1]
+            ]
+        else:
+            buckets = [
+                self._cells[(ci, cj)]
+                for ci in range(min_base[0], max_base[0] + 1)
+                for cj in range(min_base[1], max_base[1] + 1)
+                if (ci, cj) in self._cells
+            ]
+        return (entry for bucket in buckets for entry in bucket)
+
+    @staticmethod
+    def _aggregate(
+        sites: Iterable[IndexedSite],
+        cell_deg: float,
+        store_filter: set[StoreCategory] | None = None,
+        pickup_filter: set[PickupCategory] | None = None,
+    ) -> dict[Cell, CellAggregate]:
+        # cell → [사이트 수, 위도 합, 경도 합]
+        sums: dict[Cell, list] = {}
+        for lat, lon, _, site in sites:
+            if store_filter and site.store_category not in store_filter:
+                continue
+            if pickup_filter and pickup_filter.isdisjoint(site.pickup_categories):
+                continue
+            cell = (math.floor(lat / cell_deg), math.floor(lon / cell_deg))
+            acc = sums.get(cell)
+            if acc is None:
+                sums[cell] = [1, lat, lon]
+            else:
+                acc[0] += 1
+                acc[1] += lat
+                acc[2] += lon
+        return {
+            cell: (cell[0], cell[1], count, lat_sum / count, lon_sum / count)
+            for cell, (count, lat_sum, lon_sum) in sums.items()
+        }
+
+    def _cell_of(self, latitude: float, longitude: float) -> Cell:
+        return (
+            math.floor(latitude / self._cell_deg),
+            math.floor(longitude / self._cell_deg),
+        )
+
+    @staticmethod
+    def _with_categories(site: NormalizedSite) -> NormalizedSite:
+        """카테고리 사전 계산 (이미 있으면 그대로)."""
+        if site.store_category is not None and site.pickup_categories is not None:
+            return site
+        store_category, pickup_categories = CategoryClassifierService.classify(
+            site, site.metadata or {}
+        )
+        return replace(
+            site,
+            store_category=store_category,
+            pickup_categories=tuple(pickup_categories),
+        )
@@ -41,8 +41,17 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         instrument_httpx()
         instrument_redis()
 
+    from location.setup.dependencies import get_site_index_refresher
+
+    site_index = get_site_index_refresher()
+    if site_index is not None:
+        await site_index.start()
+
     yield
 
+    if site_index is not None:
+        await site_index.stop()
+
     logger.info(f"Shutting down {settings.service_name}")
 
     from location.setup.dependencies import get_kakao_client
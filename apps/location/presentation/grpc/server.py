@@ -20,7 +20,11 @@ import grpc
 from location.presentation.grpc.servicers import LocationServicer
 from location.proto import location_pb2_grpc
 from location.setup.config import get_settings
-from location.setup.dependencies import get_nearby_centers_query
+from location.setup.dependencies import (
+    get_cluster_tile_cache,
+    get_site_index_refresher,
+    location_reader_scope,
+)
 
 if TYPE_CHECKING:
     pass
@@ -30,14 +34,21 @@ logger = logging.getLogger(__name__)
 
 async def create_servicer() -> LocationServicer:
     """Servicer 생성 (의존성 주입)."""
-    query = await get_nearby_centers_query()
-    return LocationServicer(nearby_query=query)
+    return LocationServicer(
+        reader_scope=location_reader_scope,
+        tile_cache=get_cluster_tile_cache(),
+    )
 
 
 async def serve() -> None:
     """gRPC 서버를 시작합니다."""
     settings = get_settings()
 
+    # 인메모리 인덱스 (활성화 시)
+    site_index = get_site_index_refresher()
+    if site_index is not None:
+        await site_index.start()
+
     # Servicer 생성
     servicer = await create_servicer()
 
@@ -71,6 +82,9 @@ async def serve() -> None:
         logger.info("Stopping Location gRPC server gracefully")
         await server.stop(5)
         logger.info("Location gRPC server stopped")
+    finally:
+        if site_index is not None:
+            await site_index.stop()
 
 
 if __name__ == "__main__":
@@ -4,19 +4,26 @@ gRPC 요청을 처리하고 Clean Architecture의 Application 계층을 호출
 
 RPC Methods:
 - SearchNearby: 주변 재활용 센터 검색 (Chat Worker용)
+- SearchClusters: 광역 줌 지도 클러스터 (타일 캐시)
 """
 
 import logging
-from typing import TYPE_CHECKING
+from contextlib import AbstractAsyncContextManager
+from typing import Any, Callable
 
 import grpc
 
-from location.application.nearby import GetNearbyCentersQuery, SearchRequest
+from location.application.nearby import (
+    ClusterTileCache,
+    GetClusteredCentersQuery,
+    GetNearbyCentersQuery,
+    SearchRequest,
+)
 from location.domain.enums import PickupCategory, StoreCategory
 from location.proto import location_pb2, location_pb2_grpc
 
-if TYPE_CHECKING:
-    pass
+# 요청 단위 Reader 컨텍스트 (LocationReader/ClusterReader 구현체)
+ReaderScope = Callable[[], AbstractAsyncContextManager[Any]]
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +32,18 @@ class LocationServicer(location_pb2_grpc.LocationServiceServicer):
     """Location gRPC Servicer.
 
     Clean Architecture의 Application 계층과 연결됩니다.
+    DB 세션 수명이 요청 단위이므로 Query는 요청마다 Reader와 함께 생성합니다.
     """
 
-    def __init__(self, nearby_query: GetNearbyCentersQuery) -> None:
+    def __init__(self, reader_scope: ReaderScope, tile_cache: ClusterTileCache) -> None:
         """Initialize.
 
         Args:
-            nearby_query: 주변 센터 검색 Query
+            reader_scope: 요청 단위 Reader 컨텍스트 팩토리
+            tile_cache: 클러스터 타일 캐시 (프로세스 공유)
         """
-        self._nearby_query = nearby_query
+        self._reader_scope = reader_scope
+        self._tile_cache = tile_cache
 
     async def SearchNearby(
         self,
@@ -59,7 +69,8 @@ class LocationServicer(location_pb2_grpc.LocationServiceServicer):
                 pickup_filter=pickup_filter,
             )
 
-            entries = await self._nearby_query.execute(search_request)
+            async with self._reader_scope() as reader:
+                entries = await GetNearbyCentersQuery(reader).execute(search_request)
 
             # 3. limit 적용
             limit = request.limit if request.limit > 0 else 10
@@ -107,6 +118,56 @@ class LocationServicer(location_pb2_grpc.LocationServiceServicer):
             )
             await context.abort(grpc.StatusCode.INTERNAL, "Internal server error")
 
+    async def SearchClusters(
+        self,
+        request: location_pb2.SearchClustersRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> location_pb2.SearchClustersResponse:
+        """광역 줌 지도 클러스터를 조회합니다.
+
+        지도 이동 시 겹치는 타일은 캐시에서 응답합니다.
+        """
+        try:
+            search_request = SearchRequest(
+                latitude=request.latitude,
+                longitude=request.longitude,
+                radius=request.radius if request.radius > 0 else None,
+                zoom=request.zoom if request.zoom > 0 else None,
+                store_filter=self._parse_store_category(request.store_category),
+                pickup_filter=self._parse_pickup_category(request.pickup_category),
+            )
+
+            async with self._reader_scope() as reader:
+                query = GetClusteredCentersQuery(reader, self._tile_cache)
+                result = await query.execute(search_request)
+
+            return location_pb2.SearchClustersResponse(
+                clusters=[
+                    location_pb2.LocationCluster(
+                        cell_id=c.cell_id,
+                        latitude=c.latitude,
+                        longitude=c.longitude,
+                        count=c.count,
+                    )
+                    for c in result.clusters
+                ],
+                tile_keys=result.tile_keys,
+                zoom=result.zoom,
+                cell_deg=result.cell_deg,
+                total_count=result.total_count,
+            )
+
+        except Exception:
+            logger.exception(
+                "Internal error in SearchClusters",
+                extra={
+                    "lat": request.latitude,
+                    "lon": request.longitude,
+                    "zoom": request.zoom,
+                },
+            )
+            await context.abort(grpc.StatusCode.INTERNAL, "Internal server error")
+
     def _parse_store_category(self, raw: str) -> set[StoreCategory] | None:
         """store_category 파라미터를 파싱합니다."""
         if not raw or raw.lower() == "all":
@@ -11,13 +11,24 @@ from location.application.common.exceptions.validation import (
     InvalidStoreCategoryError,
     KakaoApiUnavailableError,
 )
-from location.application.nearby import GetNearbyCentersQuery, SearchRequest
+from location.application.nearby import (
+    GetClusteredCentersQuery,
+    GetNearbyCentersQuery,
+    SearchRequest,
+)
 from location.application.nearby.queries.search_by_keyword import SearchByKeywordQuery
 from location.domain.enums import PickupCategory, StoreCategory
 from location.domain.exceptions.location import LocationNotFoundError
-from location.presentation.http.schemas import LocationDetail, LocationEntry, SuggestEntry
+from location.presentation.http.schemas import (
+    ClusterEntry,
+    ClusterResponse,
+    LocationDetail,
+    LocationEntry,
+    SuggestEntry,
+)
 from location.setup.dependencies import (
     get_center_detail_query,
+    get_clustered_centers_query,
     get_nearby_centers_query,
     get_search_by_keyword_query,
     get_suggest_places_query,
@@ -89,6 +100,61 @@ async def centers(
     ]
 
 
+@router.get("/clusters", response_model=ClusterResponse, summary="Cluster recycling centers")
+async def clusters(
+    query: Annotated[GetClusteredCentersQuery, Depends(get_clustered_centers_query)],
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    zoom: int = Query(
+        ...,
+        ge=1,
+        le=14,
+        description="Kakao map zoom level (1=street, 14=world). Recommended for zoom >= 8.",
+    ),
+    radius: int | None = Query(
+        None,
+        ge=100,
+        le=100000,
+        description="Optional radius in meters (overrides auto radius from zoom)",
+    ),
+    store_category: str = Query(
+        "all",
+        description="Comma-separated StoreCategory values. Use 'all' (default) for no filtering.",
+    ),
+    pickup_category: str = Query(
+        "all",
+        description="Comma-separated PickupCategory values. Use 'all' (default) for no filtering.",
+    ),
+) -> ClusterResponse:
+    """광역 줌에서 재활용 센터를 격자 cell별 수/무게중심으로 조회합니다."""
+    request = SearchRequest(
+        latitude=lat,
+        longitude=lon,
+        radius=radius,
+        zoom=zoom,
+        store_filter=_parse_store_category_param(store_category),
+        pickup_filter=_parse_pickup_category_param(pickup_category),
+    )
+
+    result = await query.execute(request)
+
+    return ClusterResponse(
+        zoom=result.zoom,
+        cell_deg=result.cell_deg,
+        tile_keys=result.tile_keys,
+        total_count=result.total_count,
+        clusters=[
+            ClusterEntry(
+                cell_id=c.cell_id,
+                latitude=c.latitude,
+                longitude=c.longitude,
+                count=c.count,
+            )
+            for c in result.clusters
+        ],
+    )
+
+
 @router.get("/search", response_model=list[LocationEntry], summary="Search locations by keyword")
 async def search(
     search_query: Annotated[SearchByKeywordQuery | None, Depends(get_search_by_keyword_query)],
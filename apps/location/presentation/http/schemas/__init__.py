@@ -1,9 +1,17 @@
 """HTTP Schemas."""
 
 from location.presentation.http.schemas.location import (
+    ClusterEntry,
+    ClusterResponse,
     LocationDetail,
     LocationEntry,
     SuggestEntry,
 )
 
-__all__ = ["LocationDetail", "LocationEntry", "SuggestEntry"]
+__all__ = [
+    "ClusterEntry",
+    "ClusterResponse",
+    "LocationDetail",
+    "LocationEntry",
+    "SuggestEntry",
+]
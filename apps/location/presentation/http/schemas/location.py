@@ -56,3 +56,22 @@ class LocationDetail(BaseModel):
     kakao_place_id: str | None = None
     collection_items: str | None = None
     introduction: str | None = None
+
+
+class ClusterEntry(BaseModel):
+    """격자 cell 클러스터 스키마."""
+
+    cell_id: str
+    latitude: float
+    longitude: float
+    count: int
+
+
+class ClusterResponse(BaseModel):
+    """클러스터 조회 응답 스키마."""
+
+    zoom: int
+    cell_deg: float
+    tile_keys: list[str]
+    total_count: int
+    clusters: list[ClusterEntry]
@@ -19,7 +19,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x0elocation.proto\x12\x0blocation.v1"\x8a\x01\n\x13SearchNearbyRequest\x12\x10\n\x08latitude\x18\x01 \x01(\x01\x12\x11\n\tlongitude\x18\x02 \x01(\x01\x12\x0e\n\x06radius\x18\x03 \x01(\x05\x12\r\n\x05limit\x18\x04 \x01(\x05\x12\x16\n\x0estore_category\x18\x05 \x01(\t\x12\x17\n\x0fpickup_category\x18\x06 \x01(\t"X\n\x14SearchNearbyResponse\x12+\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x1a.location.v1.LocationEntry\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05"\xe3\x01\n\rLocationEntry\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0croad_address\x18\x03 \x01(\t\x12\x10\n\x08latitude\x18\x04 \x01(\x01\x12\x11\n\tlongitude\x18\x05 \x01(\x01\x12\x13\n\x0b\x64istance_km\x18\x06 \x01(\x01\x12\x15\n\rdistance_text\x18\x07 \x01(\t\x12\x16\n\x0estore_category\x18\x08 \x01(\t\x12\x19\n\x11pickup_categories\x18\t \x03(\t\x12\x0f\n\x07is_open\x18\n \x01(\x08\x12\r\n\x05phone\x18\x0b \x01(\t2h\n\x0fLocationService\x12U\n\x0cSearchNearby\x12 .location.v1.SearchNearbyRequest\x1a!.location.v1.SearchNearbyResponse"\x00\x62\x06proto3'
+    b'\n\x0elocation.proto\x12\x0blocation.v1"\x8a\x01\n\x13SearchNearbyRequest\x12\x10\n\x08latitude\x18\x01 \x01(\x01\x12\x11\n\tlongitude\x18\x02 \x01(\x01\x12\x0e\n\x06radius\x18\x03 \x01(\x05\x12\r\n\x05limit\x18\x04 \x01(\x05\x12\x16\n\x0estore_category\x18\x05 \x01(\t\x12\x17\n\x0fpickup_category\x18\x06 \x01(\t"X\n\x14SearchNearbyResponse\x12+\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x1a.location.v1.LocationEntry\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05"\xe3\x01\n\rLocationEntry\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0croad_address\x18\x03 \x01(\t\x12\x10\n\x08latitude\x18\x04 \x01(\x01\x12\x11\n\tlongitude\x18\x05 \x01(\x01\x12\x13\n\x0b\x64istance_km\x18\x06 \x01(\x01\x12\x15\n\rdistance_text\x18\x07 \x01(\t\x12\x16\n\x0estore_category\x18\x08 \x01(\t\x12\x19\n\x11pickup_categories\x18\t \x03(\t\x12\x0f\n\x07is_open\x18\n \x01(\x08\x12\r\n\x05phone\x18\x0b \x01(\t"\x8b\x01\n\x15SearchClustersRequest\x12\x10\n\x08latitude\x18\x01 \x01(\x01\x12\x11\n\tlongitude\x18\x02 \x01(\x01\x12\x0c\n\x04zoom\x18\x03 \x01(\x05\x12\x0e\n\x06radius\x18\x04 \x01(\x05\x12\x16\n\x0estore_category\x18\x05 \x01(\t\x12\x17\n\x0fpickup_category\x18\x06 \x01(\t"\x90\x01\n\x16SearchClustersResponse\x12.\n\x08\x63lusters\x18\x01 \x03(\x0b\x32\x1c.location.v1.LocationCluster\x12\x11\n\ttile_keys\x18\x02 \x03(\t\x12\x0c\n\x04zoom\x18\x03 \x01(\x05\x12\x10\n\x08\x63\x65ll_deg\x18\x04 \x01(\x01\x12\x13\n\x0btotal_count\x18\x05 \x01(\x05"V\n\x0fLocationCluster\x12\x0f\n\x07\x63\x65ll_id\x18\x01 \x01(\t\x12\x10\n\x08latitude\x18\x02 \x01(\x01\x12\x11\n\tlongitude\x18\x03 \x01(\x01\x12\r\n\x05\x63ount\x18\x04 \x01(\x05\x32\xc5\x01\n\x0fLocationService\x12U\n\x0cSearchNearby\x12 .location.v1.SearchNearbyRequest\x1a!.location.v1.SearchNearbyResponse"\x00\x12[\n\x0eSearchClusters\x12".location.v1.SearchClustersRequest\x1a#.location.v1.SearchClustersResponse"\x00\x62\x06proto3'
 )
 
 _globals = globals()
@@ -33,6 +33,12 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_SEARCHNEARBYRESPONSE"]._serialized_end = 260
     _globals["_LOCATIONENTRY"]._serialized_start = 263
     _globals["_LOCATIONENTRY"]._serialized_end = 490
-    _globals["_LOCATIONSERVICE"]._serialized_start = 492
-    _globals["_LOCATIONSERVICE"]._serialized_end = 596
+    _globals["_SEARCHCLUSTERSREQUEST"]._serialized_start = 493
+    _globals["_SEARCHCLUSTERSREQUEST"]._serialized_end = 632
+    _globals["_SEARCHCLUSTERSRESPONSE"]._serialized_start = 635
+    _globals["_SEARCHCLUSTERSRESPONSE"]._serialized_end = 779
+    _globals["_LOCATIONCLUSTER"]._serialized_start = 781
+    _globals["_LOCATIONCLUSTER"]._serialized_end = 867
+    _globals["_LOCATIONSERVICE"]._serialized_start = 870
+    _globals["_LOCATIONSERVICE"]._serialized_end = 1067
 # @@protoc_insertion_point(module_scope)
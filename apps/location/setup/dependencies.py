@@ -3,24 +3,29 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 from typing import Annotated, AsyncIterator
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from location.application.nearby import GetNearbyCentersQuery
-from location.application.nearby.ports import LocationReader
+from location.application.nearby import GetClusteredCentersQuery, GetNearbyCentersQuery
+from location.application.nearby.ports import ClusterReader, ClusterTileCache, LocationReader
 from location.application.nearby.queries.get_center_detail import GetCenterDetailQuery
 from location.application.nearby.queries.search_by_keyword import SearchByKeywordQuery
 from location.application.nearby.queries.suggest_places import SuggestPlacesQuery
 from location.application.ports.kakao_local_client import KakaoLocalClientPort
+from location.infrastructure.cache import InMemoryClusterTileCache
 from location.infrastructure.persistence_postgres import SqlaLocationReader
+from location.infrastructure.spatial import InMemoryLocationReader, SiteIndexRefresher
 from location.setup.config import get_settings
 from location.setup.database import async_session_factory
 
 logger = logging.getLogger(__name__)
 
 _kakao_client: KakaoLocalClientPort | None = None
+_site_index_refresher: SiteIndexRefresher | None = None
+_cluster_tile_cache: ClusterTileCache | None = None
 
 
 def get_kakao_client() -> KakaoLocalClientPort | None:
@@ -41,6 +46,46 @@ def get_kakao_client() -> KakaoLocalClientPort | None:
     return _kakao_client
 
 
+def get_site_index_refresher() -> SiteIndexRefresher | None:
+    """Site Index Refresher 싱글톤을 반환합니다 (비활성화 시 None)."""
+    global _site_index_refresher  # noqa: PLW0603
+    if _site_index_refresher is None:
+        settings = get_settings()
+        if settings.nearby_index_enabled:
+            _site_index_refresher = SiteIndexRefresher(
+                session_factory=async_session_factory,
+                refresh_interval_seconds=settings.nearby_index_refresh_seconds,
+                cell_deg=settings.nearby_index_cell_deg,
+            )
+    return _site_index_refresher
+
+
+def get_cluster_tile_cache() -> ClusterTileCache:
+    """Cluster Tile Cache 싱글톤을 반환합니다."""
+    global _cluster_tile_cache  # noqa: PLW0603
+    if _cluster_tile_cache is None:
+        settings = get_settings()
+        _cluster_tile_cache = InMemoryClusterTileCache(
+            max_tiles=settings.cluster_tile_cache_size,
+            ttl_seconds=settings.cluster_tile_ttl_seconds,
+        )
+    return _cluster_tile_cache
+
+
+@asynccontextmanager
+async def location_reader_scope() -> AsyncIterator[SqlaLocationReader | InMemoryLocationReader]:
+    """요청 단위 Reader (FastAPI 외부 진입점용, 예: gRPC).
+
+    반환 Reader는 LocationReader/ClusterReader Port를 모두 구현합니다.
+    """
+    refresher = get_site_index_refresher()
+    if refresher is not None and refresher.index is not None:
+        yield InMemoryLocationReader(refresher.index)
+        return
+    async with async_session_factory() as session:
+        yield SqlaLocationReader(session)
+
+
 async def get_db_session() -> AsyncIterator[AsyncSession]:
     """DB 세션을 주입합니다."""
     async with async_session_factory() as session:
@@ -53,7 +98,23 @@ async def get_db_session() -> AsyncIterator[AsyncSession]:
 async def get_location_reader(
     session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> LocationReader:
-    """Location Reader를 주입합니다."""
+    """Location Reader를 주입합니다.
+
+    인메모리 인덱스가 로딩되어 있으면 인덱스 Reader, 아니면 SQL Reader.
+    """
+    refresher = get_site_index_refresher()
+    if refresher is not None and refresher.index is not None:
+        return InMemoryLocationReader(refresher.index)
+    return SqlaLocationReader(session)
+
+
+async def get_cluster_reader(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> ClusterReader:
+    """Cluster Reader를 주입합니다 (인덱스 로딩 시 인메모리 집계)."""
+    refresher = get_site_index_refresher()
+    if refresher is not None and refresher.index is not None:
+        return InMemoryLocationReader(refresher.index)
     return SqlaLocationReader(session)
 
 
@@ -64,6 +125,13 @@ async def get_nearby_centers_query(
     return GetNearbyCentersQuery(reader)
 
 
+async def get_clustered_centers_query(
+    reader: Annotated[ClusterReader, Depends(get_cluster_reader)],
+) -> GetClusteredCentersQuery:
+    """GetClusteredCentersQuery를 주입합니다."""
+    return GetClusteredCentersQuery(cluster_reader=reader, tile_cache=get_cluster_tile_cache())
+
+
 async def get_search_by_keyword_query(
     reader: Annotated[LocationReader, Depends(get_location_reader)],
 ) -> SearchByKeywordQuery | None:
@@ -0,0 +1,261 @@
+"""지도 클러스터 (격자 cell 집계 + 타일 캐시) 단위 테스트."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from location.application.nearby import GetClusteredCentersQuery, SearchRequest
+from location.application.nearby.services import ClusterPolicyService
+from location.application.nearby.services.cluster_policy import MAX_TILE_SPAN, TILE_CELLS
+from location.domain.entities import NormalizedSite
+from location.domain.enums import PickupCategory, StoreCategory
+from location.infrastructure.cache import InMemoryClusterTileCache
+from location.infrastructure.persistence_postgres import SqlaLocationReader
+from location.infrastructure.spatial import GridSiteIndex, InMemoryLocationReader
+
+SEOUL = (37.5665, 126.978)
+
+
+def _sites(count: int, seed: int = 11) -> list[NormalizedSite]:
+    rng = random.Random(seed)
+    stores = [StoreCategory.REFILL_ZERO, StoreCategory.CAFE_BAKERY]
+    return [
+        NormalizedSite(
+            id=i,
+            source="keco",
+            source_key=f"KECO-{i}",
+            positn_pstn_lat=SEOUL[0] + rng.uniform(-1.0, 1.0),
+            positn_pstn_lot=SEOUL[1] + rng.uniform(-1.0, 1.0),
+            store_category=stores[i % 2],
+            pickup_categories=(PickupCategory.CAN,),
+        )
+        for i in range(count)
+    ]
+
+
+def _expected(sites, cell_deg, min_cell, max_cell, store_filter=None) -> dict:
+    """전체 스캔 기준 cell별 (수, 위도 평균, 경도 평균)."""
+    cells: dict[str, list] = {}
+    for s in sites:
+        if store_filter and s.store_category not in store_filter:
+            continue
+        ci = math.floor(s.positn_pstn_lat / cell_deg)
+        cj = math.floor(s.positn_pstn_lot / cell_deg)
+        if min_cell[0] <= ci <= max_cell[0] and min_cell[1] <= cj <= max_cell[1]:
+            cells.setdefault(f"{ci}:{cj}", []).append(s)
+    return {
+        key: (
+            len(group),
+            sum(s.positn_pstn_lat for s in group) / len(group),
+            sum(s.positn_pstn_lot for s in group) / len(group),
+        )
+        for key, group in cells.items()
+    }
+
+
+class RecordingCache(InMemoryClusterTileCache):
+    """get 결과 기록용 캐시."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hits = 0
+
+    async def get(self, key):
+        clusters = await super().get(key)
+        self.hits += clusters is not None
+        return clusters
+
+
+class TestClusterPolicyService:
+    """ClusterPolicyService 테스트."""
+
+    def test_cell_deg_doubles_per_zoom(self) -> None:
+        assert ClusterPolicyService.cell_deg_from_zoom(9) == pytest.approx(
+            ClusterPolicyService.cell_deg_from_zoom(8) * 2
+        )
+        max_deg = ClusterPolicyService.cell_deg_from_zoom(14)
+        assert ClusterPolicyService.cell_deg_from_zoom(99) == max_deg
+        assert len(ClusterPolicyService.cell_degs()) == 14
+
+    def test_tiles_cover_area(self) -> None:
+        zoom, radius_km = 8, 20.0
+        cell_deg = ClusterPolicyService.cell_deg_from_zoom(zoom)
+        tiles = ClusterPolicyService.tiles_for_area(*SEOUL, radius_km, zoom)
+
+        tile_deg = cell_deg * TILE_CELLS
+        for lat, lon in [(SEOUL[0] + 0.17, SEOUL[1] - 0.2), (SEOUL[0] - 0.17, SEOUL[1] + 0.2)]:
+            cell = (math.floor(lat / cell_deg), math.floor(lon / cell_deg))
+            assert (cell[0] // TILE_CELLS, cell[1] // TILE_CELLS) in tiles
+        assert all(isinstance(t[0], int) for t in tiles)
+        assert len(tiles) <= (math.ceil(0.36 / tile_deg) + 1) * (math.ceil(0.46 / tile_deg) + 1)
+
+    def test_grid_zoom_caps_tile_span(self) -> None:
+        grid_zoom = ClusterPolicyService.grid_zoom(*SEOUL, radius_km=80.0, zoom=1)
+        tiles = ClusterPolicyService.tiles_for_area(*SEOUL, 80.0, grid_zoom)
+
+        assert grid_zoom > 1
+        assert len(tiles) <= MAX_TILE_SPAN**2
+        assert ClusterPolicyService.grid_zoom(*SEOUL, radius_km=4.5, zoom=10) == 10
+
+    def test_cache_key_includes_filters_and_version(self) -> None:
+        key = ClusterPolicyService.tile_key(8, (3, -2))
+        plain = ClusterPolicyService.cache_key(key, None, None, None)
+        filtered = ClusterPolicyService.cache_key(
+            key, {StoreCategory.REFILL_ZERO, StoreCategory.CAFE_BAKERY}, None, "v1"
+        )
+
+        assert key == "8/3/-2"
+        assert plain == "8/3/-2|s=all|p=all|v=-"
+        assert filtered == "8/3/-2|s=cafe_bakery,refill_zero|p=all|v=v1"
+
+
+class TestGridSiteIndexClusters:
+    """GridSiteIndex cell 집계 테스트."""
+
+    @pytest.mark.parametrize("zoom", [6, 9, 12])
+    def test_matches_full_scan(self, zoom: int) -> None:
+        sites = _sites(3000)
+        index = GridSiteIndex(sites, cell_deg=0.05)
+        cell_deg = ClusterPolicyService.cell_deg_from_zoom(zoom)
+        tile = ClusterPolicyService.tiles_for_area(*SEOUL, 10.0, zoom)[0]
+        min_cell, max_cell = ClusterPolicyService.tile_cell_range(tile)
+
+        result = index.aggregate_cells(cell_deg, min_cell, max_cell)
+
+        expected = _expected(sites, cell_deg, min_cell, max_cell)
+        assert {f"{ci}:{cj}": count for ci, cj, count, _, _ in result} == {
+            key: count for key, (count, _, _) in expected.items()
+        }
+        for ci, cj, _, lat, lon in result:
+            assert lat == pytest.approx(expected[f"{ci}:{cj}"][1])
+            assert lon == pytest.approx(expected[f"{ci}:{cj}"][2])
+
+    def test_filtered_matches_full_scan(self) -> None:
+        sites = _sites(3000)
+        index = GridSiteIndex(sites, cell_deg=0.05)
+        cell_deg = ClusterPolicyService.cell_deg_from_zoom(12)
+        min_cell, max_cell = ClusterPolicyService.tile_cell_range(
+            ClusterPolicyService.tiles_for_area(*SEOUL, 10.0, 12)[0]
+        )
+        store_filter = {StoreCategory.REFILL_ZERO}
+
+        result = index.aggregate_cells(cell_deg, min_cell, max_cell, store_filter=store_filter)
+
+        expected = _expected(sites, cell_deg, min_cell, max_cell, store_filter)
+        assert {f"{ci}:{cj}": count for ci, cj, count, _, _ in result} == {
+            key: count for key, (count, _, _) in expected.items()
+        }
+
+    def test_precompute_clusters_reused(self) -> None:
+        index = GridSiteIndex(_sites(100), cell_deg=0.05)
+        index.precompute_clusters(ClusterPolicyService.cell_degs())
+        grid = index._cluster_grid(ClusterPolicyService.cell_deg_from_zoom(10))
+
+        assert index._cluster_grid(ClusterPolicyService.cell_deg_from_zoom(10)) is grid
+        assert sum(count for _, _, count, _, _ in grid.values()) == 100
+
+
+class TestInMemoryClusterTileCache:
+    """InMemoryClusterTileCache 테스트."""
+
+    async def test_lru_eviction(self) -> None:
+        cache = InMemoryClusterTileCache(max_tiles=2)
+        await cache.set("a", [])
+        await cache.set("b", [])
+        await cache.get("a")
+        await cache.set("c", [])
+
+        assert await cache.get("a") == ()
+        assert await cache.get("b") is None
+        assert len(cache) == 2
+
+    async def test_ttl_expiry(self) -> None:
+        now = [100.0]
+        cache = InMemoryClusterTileCache(ttl_seconds=10, clock=lambda: now[0])
+        await cache.set("a", [])
+
+        now[0] = 109.0
+        assert await cache.get("a") == ()
+        now[0] = 110.0
+        assert await cache.get("a") is None
+
+
+class TestGetClusteredCentersQuery:
+    """GetClusteredCentersQuery 테스트."""
+
+    async def test_clusters_cover_area_and_pan_hits_cache(self) -> None:
+        sites = _sites(2000)
+        reader = InMemoryLocationReader(GridSiteIndex(sites, cell_deg=0.05, version=(2000, 1)))
+        cache = RecordingCache()
+        query = GetClusteredCentersQuery(reader, cache)
+
+        first = await query.execute(SearchRequest(latitude=SEOUL[0], longitude=SEOUL[1], zoom=9))
+        panned = await query.execute(
+            SearchRequest(latitude=SEOUL[0] + 0.001, longitude=SEOUL[1] + 0.001, zoom=9)
+        )
+
+        assert first.zoom == 9
+        assert first.tile_keys and all(key.startswith("9/") for key in first.tile_keys)
+        assert first.total_count == sum(c.count for c in first.clusters) > 0
+        assert cache.hits == len(set(first.tile_keys) & set(panned.tile_keys)) > 0
+
+    async def test_version_change_invalidates_tiles(self) -> None:
+        sites = _sites(500)
+        cache = RecordingCache()
+        request = SearchRequest(latitude=SEOUL[0], longitude=SEOUL[1], zoom=10)
+
+        await GetClusteredCentersQuery(
+            InMemoryLocationReader(GridSiteIndex(sites, version=(500, 1))), cache
+        ).execute(request)
+        await GetClusteredCentersQuery(
+            InMemoryLocationReader(GridSiteIndex(sites[:10], version=(10, 2))), cache
+        ).execute(request)
+
+        assert cache.hits == 0
+
+    async def test_filters_are_passed_to_reader(self) -> None:
+        sites = _sites(1000)
+        query = GetClusteredCentersQuery(
+            InMemoryLocationReader(GridSiteIndex(sites)), InMemoryClusterTileCache()
+        )
+
+        everything = await query.execute(
+            SearchRequest(latitude=SEOUL[0], longitude=SEOUL[1], zoom=12)
+        )
+        refill = await query.execute(
+            SearchRequest(
+                latitude=SEOUL[0],
+                longitude=SEOUL[1],
+                zoom=12,
+                store_filter={StoreCategory.REFILL_ZERO},
+            )
+        )
+
+        assert 0 < refill.total_count < everything.total_count
+
+
+class TestSqlaClusterQuery:
+    """SqlaLocationReader cell 집계 쿼리."""
+
+    def test_group_by_cell_with_bounds_and_filters(self) -> None:
+        stmt = SqlaLocationReader._aggregate_query(
+            0.5,
+            (10, 20),
+            (11, 21),
+            SqlaLocationReader._category_filters({StoreCategory.REFILL_ZERO}, None),
+        )
+
+        sql = str(
+            stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+        )
+        column = "location.location_normalized_sites.positn_pstn_lat"
+        assert f"floor({column} / CAST(0.5 AS FLOAT)) AS cell_i" in sql
+        assert "positn_pstn_lat >= 5.0" in sql
+        assert "positn_pstn_lat < 6.0" in sql
+        assert "positn_pstn_lot < 11.0" in sql
+        assert "store_category IN ('refill_zero')" in sql
+        assert "GROUP BY floor(" in sql
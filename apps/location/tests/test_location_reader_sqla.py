@@ -0,0 +1,65 @@
+"""SqlaLocationReader 단위 테스트 (DB 없이 SQL 조건/매핑 검증)."""
+
+from __future__ import annotations
+
+from sqlalchemy.dialects import postgresql
+
+from location.domain.enums import PickupCategory, StoreCategory
+from location.infrastructure.persistence_postgres import (
+    NormalizedLocationSite,
+    SqlaLocationReader,
+)
+
+
+def _compile(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class TestCategoryFilters:
+    """카테고리 필터 WHERE 조건."""
+
+    def test_no_filters(self) -> None:
+        assert SqlaLocationReader._category_filters(None, None) == []
+        assert SqlaLocationReader._category_filters(set(), set()) == []
+
+    def test_store_filter_uses_in_and_keeps_unclassified(self) -> None:
+        (clause,) = SqlaLocationReader._category_filters(
+            {StoreCategory.VEGAN_DINING, StoreCategory.CAFE_BAKERY}, None
+        )
+
+        sql = _compile(clause)
+        assert "store_category IS NULL" in sql
+        assert "store_category IN ('cafe_bakery', 'vegan_dining')" in sql
+
+    def test_pickup_filter_uses_array_overlap(self) -> None:
+        (clause,) = SqlaLocationReader._category_filters(None, {PickupCategory.CAN})
+
+        sql = _compile(clause)
+        assert "pickup_categories IS NULL" in sql
+        assert "pickup_categories && ARRAY['can']" in sql
+
+
+class TestToDomain:
+    """ORM → 도메인 카테고리 매핑."""
+
+    def _row(self, **kwargs) -> NormalizedLocationSite:
+        return NormalizedLocationSite(positn_sn=1, source="keco", source_pk="K-1", **kwargs)
+
+    def test_maps_persisted_categories(self) -> None:
+        site = SqlaLocationReader(session=None)._to_domain(
+            self._row(store_category="refill_zero", pickup_categories=["can", "paper"])
+        )
+
+        assert site.store_category == StoreCategory.REFILL_ZERO
+        assert site.pickup_categories == (PickupCategory.CAN, PickupCategory.PAPER)
+
+    def test_unclassified_or_unknown_values_are_none(self) -> None:
+        reader = SqlaLocationReader(session=None)
+
+        unclassified = reader._to_domain(self._row())
+        unknown = reader._to_domain(self._row(store_category="legacy", pickup_categories=["x"]))
+
+        assert unclassified.store_category is None
+        assert unclassified.pickup_categories is None
+        assert unknown.store_category is None
+        assert unknown.pickup_categories is None
@@ -109,6 +109,21 @@ class TestGetNearbyCentersQuery:
         result = await query.execute(request)
         assert len(result) == 0
 
+    async def test_execute_passes_filters_to_reader(self, mock_location_reader: AsyncMock) -> None:
+        """카테고리 필터는 Reader에 전달되어 limit 이전에 적용."""
+        query = GetNearbyCentersQuery(mock_location_reader)
+        request = SearchRequest(
+            latitude=37.5665,
+            longitude=126.978,
+            store_filter={StoreCategory.CAFE_BAKERY},
+            pickup_filter={PickupCategory.CAN},
+        )
+        await query.execute(request)
+
+        call_kwargs = mock_location_reader.find_within_radius.call_args.kwargs
+        assert call_kwargs["store_filter"] == {StoreCategory.CAFE_BAKERY}
+        assert call_kwargs["pickup_filter"] == {PickupCategory.CAN}
+
     async def test_execute_no_filter_returns_all(
         self, mock_location_reader: AsyncMock, sample_site: NormalizedSite
     ) -> None:
@@ -0,0 +1,181 @@
+"""In-Memory Spatial Index 단위 테스트."""
+
+from __future__ import annotations
+
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from location.application.nearby.services import CategoryClassifierService
+from location.domain.entities import NormalizedSite
+from location.domain.enums import PickupCategory, StoreCategory
+from location.infrastructure.spatial import (
+    GridSiteIndex,
+    InMemoryLocationReader,
+    SiteIndexRefresher,
+)
+from location.infrastructure.spatial.site_index import haversine_km
+
+SEOUL = (37.5665, 126.978)
+
+
+def _site(site_id: int, lat: float | None, lon: float | None, **kwargs) -> NormalizedSite:
+    return NormalizedSite(
+        id=site_id,
+        source="keco",
+        source_key=f"KECO-{site_id}",
+        positn_pstn_lat=lat,
+        positn_pstn_lot=lon,
+        **kwargs,
+    )
+
+
+def _random_sites(count: int, seed: int = 7) -> list[NormalizedSite]:
+    rng = random.Random(seed)
+    return [
+        _site(i, SEOUL[0] + rng.uniform(-0.5, 0.5), SEOUL[1] + rng.uniform(-0.5, 0.5))
+        for i in range(count)
+    ]
+
+
+class TestGridSiteIndex:
+    """GridSiteIndex 테스트."""
+
+    @pytest.mark.parametrize("radius_km", [0.5, 3.0, 20.0, 80.0])
+    def test_matches_full_scan(self, radius_km: float) -> None:
+        """격자 후보 검색 결과가 전체 Haversine 스캔과 동일."""
+        sites = _random_sites(2000)
+        index = GridSiteIndex(sites, cell_deg=0.05)
+
+        result = index.find_within_radius(*SEOUL, radius_km=radius_km, limit=50)
+
+        expected = sorted(
+            (haversine_km(*SEOUL, s.positn_pstn_lat, s.positn_pstn_lot), s.id) for s in sites
+        )
+        expected = [site_id for dist, site_id in expected if dist <= radius_km][:50]
+        assert [site.id for site, _ in result] == expected
+        for site, distance in result:
+            assert distance == pytest.approx(
+                haversine_km(*SEOUL, site.positn_pstn_lat, site.positn_pstn_lot)
+            )
+
+    def test_limit_and_order(self) -> None:
+        sites = [_site(i, SEOUL[0] + i * 0.001, SEOUL[1]) for i in range(10)]
+        index = GridSiteIndex(sites)
+
+        result = index.find_within_radius(*SEOUL, radius_km=5, limit=3)
+
+        assert [site.id for site, _ in result] == [0, 1, 2]
+        assert result[0][1] == pytest.approx(0.0)
+
+    def test_category_filters_applied_before_limit(self) -> None:
+        """필터 일치 사이트가 멀리 있어도 limit 안에 포함."""
+        near = [
+            _site(
+                i,
+                SEOUL[0] + i * 0.001,
+                SEOUL[1],
+                store_category=StoreCategory.GENERAL,
+                pickup_categories=(PickupCategory.PAPER,),
+            )
+            for i in range(10)
+        ]
+        far = _site(
+            99,
+            SEOUL[0] + 0.05,
+            SEOUL[1],
+            store_category=StoreCategory.CAFE_BAKERY,
+            pickup_categories=(PickupCategory.CAN, PickupCategory.PAPER),
+        )
+        index = GridSiteIndex([*near, far])
+
+        by_store = index.find_within_radius(
+            *SEOUL, radius_km=10, limit=3, store_filter={StoreCategory.CAFE_BAKERY}
+        )
+        by_pickup = index.find_within_radius(
+            *SEOUL, radius_km=10, limit=3, pickup_filter={PickupCategory.CAN}
+        )
+
+        assert [s.id for s, _ in by_store] == [99]
+        assert [s.id for s, _ in by_pickup] == [99]
+
+    def test_sites_without_coordinates_only_by_id(self) -> None:
+        index = GridSiteIndex([_site(1, None, None), _site(2, *SEOUL)])
+
+        assert len(index) == 2
+        assert index.get(1) is not None
+        assert [s.id for s, _ in index.find_within_radius(*SEOUL, 100, 10)] == [2]
+
+    def test_precomputes_categories(self, sample_site: NormalizedSite) -> None:
+        """빌드 시 카테고리를 사전 계산하여 요청 시 분류를 생략."""
+        index = GridSiteIndex([sample_site])
+
+        indexed = index.get(sample_site.id)
+
+        expected_store, expected_pickups = CategoryClassifierService.classify(
+            sample_site, sample_site.metadata
+        )
+        assert indexed.store_category == expected_store
+        assert set(indexed.pickup_categories) == set(expected_pickups)
+        with patch.object(CategoryClassifierService, "classify") as classify:
+            assert CategoryClassifierService.resolve(indexed)[0] == expected_store
+            classify.assert_not_called()
+
+    def test_keeps_existing_categories(self) -> None:
+        site = _site(
+            1,
+            *SEOUL,
+            store_category=StoreCategory.VEGAN_DINING,
+            pickup_categories=(PickupCategory.CAN,),
+        )
+
+        indexed = GridSiteIndex([site]).get(1)
+
+        assert indexed.store_category == StoreCategory.VEGAN_DINING
+        assert indexed.pickup_categories == (PickupCategory.CAN,)
+
+
+@pytest.mark.asyncio
+class TestInMemoryLocationReader:
+    """InMemoryLocationReader 테스트."""
+
+    async def test_port_methods(self) -> None:
+        reader = InMemoryLocationReader(GridSiteIndex(_random_sites(100)))
+
+        rows = await reader.find_within_radius(*SEOUL, radius_km=50, limit=5)
+
+        assert len(rows) == 5
+        assert (await reader.find_by_id(rows[0][0].id)) is rows[0][0]
+        assert await reader.find_by_id(9999) is None
+        assert await reader.count_sites() == 100
+
+
+@pytest.mark.asyncio
+class TestSiteIndexRefresher:
+    """SiteIndexRefresher 테스트."""
+
+    def _refresher(self, versions: list[tuple[int, int]]):
+        reader = MagicMock()
+        reader.data_version = AsyncMock(side_effect=versions)
+        reader.load_all_sites = AsyncMock(return_value=_random_sites(10))
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock()
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        return SiteIndexRefresher(session_factory), reader
+
+    async def test_rebuilds_only_on_version_change(self) -> None:
+        refresher, reader = self._refresher([(10, 1), (10, 1), (11, 5)])
+        with patch(
+            "location.infrastructure.spatial.refresher.SqlaLocationReader",
+            return_value=reader,
+        ):
+            assert await refresher.refresh() is True
+            first = refresher.index
+            assert await refresher.refresh() is False
+            assert refresher.index is first
+            assert await refresher.refresh() is True
+
+        assert refresher.index is not first
+        assert refresher.index.version == (11, 5)
+        assert reader.load_all_sites.await_count == 2
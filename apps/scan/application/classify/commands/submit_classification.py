@@ -32,6 +32,10 @@ TRACEPARENT_HEADER = "traceparent"
 # Idempotency key TTL (1시간)
 IDEMPOTENCY_TTL = 3600
 
+# 파이프라인 발행 방식
+PIPELINE_MODE_CHAINED = "chained"
+PIPELINE_MODE_FUSED = "fused"
+
 
 @dataclass
 class SubmitClassificationRequest:
@@ -59,6 +63,10 @@ class SubmitClassificationCommand:
 
     Celery Chain을 발행하고 job_id를 반환합니다.
     X-Idempotency-Key로 중복 제출을 방지합니다.
+
+    pipeline_mode:
+    - chained: scan.vision → scan.rule → scan.answer → scan.reward (Step별 Task)
+    - fused: scan.pipeline 단일 Task (Step 간 브로커 왕복 없음)
     """
 
     def __init__(
@@ -67,6 +75,7 @@ class SubmitClassificationCommand:
         idempotency_cache: IdempotencyCache,
         celery_app: "Celery",
         idempotency_ttl: int = IDEMPOTENCY_TTL,
+        pipeline_mode: str = PIPELINE_MODE_CHAINED,
     ):
         """초기화.
 
@@ -75,11 +84,13 @@ class SubmitClassificationCommand:
             idempotency_cache: 멱등성 캐시
             celery_app: Celery 앱 인스턴스
             idempotency_ttl: 멱등성 키 TTL (초)
+            pipeline_mode: 파이프라인 발행 방식 (chained | fused)
         """
         self._event_publisher = event_publisher
         self._idempotency_cache = idempotency_cache
         self._celery_app = celery_app
         self._idempotency_ttl = idempotency_ttl
+        self._pipeline_mode = pipeline_mode
 
     def _get_trace_headers(self) -> dict[str, str]:
         """현재 trace context를 Celery headers로 추출.
@@ -165,19 +176,29 @@ class SubmitClassificationCommand:
         # 4. Celery Chain 발행
         user_input = request.user_input or "이 폐기물을 어떻게 분리배출해야 하나요?"
         model = request.model
+        args = [job_id, request.user_id, request.image_url, user_input]
 
         # ⚠️ routing_key만 사용 (queue 선언 X) - Topology CR과 arguments 충돌 방지
-        pipeline = chain(
-            self._celery_app.signature(
-                "scan.vision",
-                args=[job_id, request.user_id, request.image_url, user_input],
+        if self._pipeline_mode == PIPELINE_MODE_FUSED:
+            # 진입 큐(scan.vision) 공유 → Topology CR/KEDA 변경 없음
+            pipeline = self._celery_app.signature(
+                "scan.pipeline",
+                args=args,
                 kwargs={"model": model},
                 options={"routing_key": "scan.vision"},
-            ),
-            self._celery_app.signature("scan.rule", options={"routing_key": "scan.rule"}),
-            self._celery_app.signature("scan.answer", options={"routing_key": "scan.answer"}),
-            self._celery_app.signature("scan.reward", options={"routing_key": "scan.reward"}),
-        )
+            )
+        else:
+            pipeline = chain(
+                self._celery_app.signature(
+                    "scan.vision",
+                    args=args,
+                    kwargs={"model": model},
+                    options={"routing_key": "scan.vision"},
+                ),
+                self._celery_app.signature("scan.rule", options={"routing_key": "scan.rule"}),
+                self._celery_app.signature("scan.answer", options={"routing_key": "scan.answer"}),
+                self._celery_app.signature("scan.reward", options={"routing_key": "scan.reward"}),
+            )
 
         # Trace context를 Celery headers로 전파
         celery_headers = self._get_trace_headers()
@@ -190,6 +211,7 @@ class SubmitClassificationCommand:
                 "user_id": request.user_id,
                 "image_url": request.image_url,
                 "model": model,
+                "pipeline_mode": self._pipeline_mode,
                 "idempotency_key": request.idempotency_key,
             },
         )
@@ -48,6 +48,8 @@ celery_app.conf.update(
         "scan.rule": {"queue": "scan.rule"},
         "scan.answer": {"queue": "scan.answer"},
         "scan.reward": {"queue": "scan.reward"},
+        # fused 모드: 진입 큐(scan.vision) 공유
+        "scan.pipeline": {"queue": "scan.vision"},
     },
     # AMQP default exchange 사용 (큐 이름 = routing key)
     task_default_queue="celery",
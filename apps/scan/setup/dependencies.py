@@ -60,6 +60,7 @@ def get_submit_command(
         event_publisher=event_publisher,
         idempotency_cache=idempotency_cache,
         celery_app=celery_app,
+        pipeline_mode=get_settings().scan_pipeline_mode,
     )
 
 
@@ -177,6 +177,38 @@ class TestSubmitClassificationCommand:
         assert response.stream_url == f"/api/v1/scan/{response.job_id}/events"
         assert response.result_url == f"/api/v1/scan/{response.job_id}/result"
 
+    @pytest.mark.anyio
+    async def test_execute_fused_mode_publishes_single_task(
+        self,
+        mock_event_publisher,
+        mock_idempotency_cache,
+        mock_celery_app,
+        mock_celery_chain,
+    ):
+        """fused 모드는 chain 없이 scan.pipeline Task 1개를 scan.vision 큐로 발행."""
+        command = SubmitClassificationCommand(
+            event_publisher=mock_event_publisher,
+            idempotency_cache=mock_idempotency_cache,
+            celery_app=mock_celery_app,
+            pipeline_mode="fused",
+        )
+        request = SubmitClassificationRequest(
+            user_id="user-1",
+            image_url="https://example.com/image.jpg",
+            model="gemini-2.5-flash",
+        )
+
+        response = await command.execute(request)
+
+        mock_celery_app.signature.assert_called_once()
+        call = mock_celery_app.signature.call_args
+        assert call.args[0] == "scan.pipeline"
+        assert call.kwargs["args"][0] == response.job_id
+        assert call.kwargs["kwargs"]["model"] == "gemini-2.5-flash"
+        assert call.kwargs["options"]["routing_key"] == "scan.vision"
+        mock_celery_chain.assert_not_called()
+        mock_celery_app.signature.return_value.apply_async.assert_called_once()
+
 
 class TestIdempotency:
     """멱등성(Idempotency) 테스트."""
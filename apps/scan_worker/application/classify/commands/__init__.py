@@ -5,10 +5,12 @@ Application Layer에서 유스케이스 조합 담당.
 
 from scan_worker.application.classify.commands.execute_pipeline import (
     ClassifyPipeline,
+    FusedPipelineRunner,
     SingleStepRunner,
 )
 
 __all__ = [
     "ClassifyPipeline",
+    "FusedPipelineRunner",
     "SingleStepRunner",
 ]
@@ -7,12 +7,15 @@ Application Layer에서 유스케이스 조합 담당.
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from scan_worker.application.classify.ports.event_publisher import (
     EventPublisherPort,
 )
-from scan_worker.application.common.step_interface import Step
+from scan_worker.application.common.step_interface import SpeculativeStep, Step
 
 if TYPE_CHECKING:
     from scan_worker.application.classify.dto.classify_context import (
@@ -24,6 +27,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# speculative prefetch 동시 실행 수 (gevent pool에서는 greenlet으로 동작)
+PREFETCH_MAX_WORKERS = 16
+
+
+@lru_cache
+def _prefetch_executor() -> ThreadPoolExecutor:
+    """prefetch 전용 Executor (프로세스 공유)."""
+    return ThreadPoolExecutor(
+        max_workers=PREFETCH_MAX_WORKERS,
+        thread_name_prefix="scan-prefetch",
+    )
+
 
 class ClassifyPipeline:
     """Classify 파이프라인 - 단계 조합(순서, fallback, retry).
@@ -315,3 +330,191 @@ class CheckpointingStepRunner:
             task_id: 작업 ID
         """
         self._store.clear_checkpoints(task_id)
+
+
+class FusedPipelineRunner:
+    """단일 Task에서 전체 Step을 실행하는 Runner (fused 모드).
+
+    Step 간 Context는 메모리로 전달 (to_dict/브로커 왕복 없음).
+    체크포인트는 재시도 시 다시 하기 비싼 Step 경계(기본: vision, answer)에만 저장.
+    재시도 시 최신 체크포인트(HGETALL 1회) 이후 Step부터 재개.
+
+    이벤트(started/completed/failed)는 Chain 모드와 동일하게 Step마다 발행.
+
+    speculative=True이면 prefetch_after Step 완료 직후 이후 SpeculativeStep의
+    prefetch()를 백그라운드로 시작 (예: answer LLM 호출 동안 reward 캐릭터 매칭).
+    이벤트 순서와 Step 실행 순서는 그대로 유지.
+    """
+
+    def __init__(
+        self,
+        event_publisher: EventPublisherPort,
+        context_store: "ContextStorePort",
+        checkpoint_steps: frozenset[str] | None = None,
+        speculative: bool = False,
+        prefetch_after: str = "vision",
+    ):
+        """초기화.
+
+        Args:
+            event_publisher: 이벤트 발행 Port
+            context_store: Context 저장소 Port (체크포인팅)
+            checkpoint_steps: 체크포인트를 저장할 Step 이름 (None이면 전체)
+            speculative: SpeculativeStep 선행 실행 여부
+            prefetch_after: prefetch를 시작할 Step 이름 (이 Step 결과만 사용)
+        """
+        self._events = event_publisher
+        self._store = context_store
+        self._checkpoint_steps = checkpoint_steps
+        self._speculative = speculative
+        self._prefetch_after = prefetch_after
+
+    def run(
+        self,
+        steps: list[tuple[str, Step]],
+        ctx: "ClassifyContext",
+        resume: bool = False,
+    ) -> "ClassifyContext":
+        """전체 Step 실행.
+
+        Args:
+            steps: [(name, step), ...] 실행 순서
+            ctx: 입력 Context
+            resume: True면 최신 체크포인트 이후 Step부터 실행 (재시도)
+
+        Returns:
+            최종 Context
+
+        Raises:
+            Exception: Step 실패 시 (failed 이벤트 발행 후 재발생 → Task 재시도)
+        """
+        start_index = 0
+        if resume:
+            ctx, start_index = self._resume(steps, ctx)
+
+        names = [name for name, _ in steps]
+        prefetches: dict[str, tuple[Future, float]] = {}
+        if (
+            self._speculative
+            and self._prefetch_after in names
+            and start_index > names.index(self._prefetch_after)
+        ):
+            # 재개 지점이 prefetch_after 이후면 복원된 Context로 바로 시작
+            prefetches = self._start_prefetches(steps[start_index:], ctx)
+
+        for name, step in steps[start_index:]:
+            try:
+                self._events.publish_stage_event(
+                    task_id=ctx.task_id,
+                    stage=name,
+                    status="started",
+                    progress=ctx.progress,
+                )
+
+                if name in prefetches:
+                    ctx = self._run_prefetched(step, name, ctx, *prefetches.pop(name))
+                else:
+                    ctx = step.run(ctx)
+
+                if self._checkpoint_steps is None or name in self._checkpoint_steps:
+                    self._store.save_checkpoint(ctx.task_id, name, ctx.to_dict())
+
+                self._events.publish_stage_event(
+                    task_id=ctx.task_id,
+                    stage=name,
+                    status="completed",
+                    progress=ctx.progress,
+                )
+
+                if self._speculative and name == self._prefetch_after:
+                    index = names.index(name) + 1
+                    prefetches = self._start_prefetches(steps[index:], ctx)
+
+            except Exception as e:
+                ctx.error = str(e)
+                self._events.publish_stage_event(
+                    task_id=ctx.task_id,
+                    stage=name,
+                    status="failed",
+                    progress=ctx.progress,
+                    result={"error": str(e)},
+                )
+                raise
+
+        return ctx
+
+    @staticmethod
+    def _start_prefetches(
+        steps: list[tuple[str, Step]],
+        ctx: "ClassifyContext",
+    ) -> dict[str, tuple[Future, float]]:
+        """이후 SpeculativeStep의 prefetch를 백그라운드로 시작 (Step별 Context 사본)."""
+        from scan_worker.application.classify.dto.classify_context import (
+            ClassifyContext,
+        )
+
+        prefetches: dict[str, tuple[Future, float]] = {}
+        for name, step in steps:
+            if isinstance(step, SpeculativeStep):
+                snapshot = ClassifyContext.from_dict(ctx.to_dict())
+                future = _prefetch_executor().submit(step.prefetch, snapshot)
+                prefetches[name] = (future, time.perf_counter())
+        return prefetches
+
+    @staticmethod
+    def _run_prefetched(
+        step: Step,
+        name: str,
+        ctx: "ClassifyContext",
+        future: Future,
+        started_at: float,
+    ) -> "ClassifyContext":
+        """prefetch 결과로 Step 실행 (prefetch 실패 시 일반 실행)."""
+        wait_start = time.perf_counter()
+        try:
+            prefetched = future.result()
+        except Exception as e:
+            logger.warning(
+                "Speculative prefetch failed, running step normally",
+                extra={"task_id": ctx.task_id, "step": name, "error": str(e)},
+            )
+            return step.run(ctx)
+
+        waited_ms = (time.perf_counter() - wait_start) * 1000
+        overlapped_ms = (wait_start - started_at) * 1000
+        ctx.latencies[f"duration_{name}_prefetch_wait_ms"] = waited_ms
+        logger.info(
+            "Speculative prefetch used",
+            extra={
+                "task_id": ctx.task_id,
+                "step": name,
+                "waited_ms": waited_ms,
+                "overlapped_ms": overlapped_ms,
+            },
+        )
+        return step.run_prefetched(ctx, prefetched)
+
+    def _resume(
+        self,
+        steps: list[tuple[str, Step]],
+        ctx: "ClassifyContext",
+    ) -> tuple["ClassifyContext", int]:
+        """최신 체크포인트에서 Context와 다음 Step 위치 복원."""
+        from scan_worker.application.classify.dto.classify_context import (
+            ClassifyContext,
+        )
+
+        latest = self._store.get_latest_checkpoint(ctx.task_id)
+        if latest is None:
+            return ctx, 0
+
+        step_name, ctx_dict = latest
+        names = [name for name, _ in steps]
+        if step_name not in names:
+            return ctx, 0
+
+        logger.info(
+            "Resuming fused pipeline from checkpoint",
+            extra={"task_id": ctx.task_id, "step": step_name},
+        )
+        return ClassifyContext.from_dict(ctx_dict), names.index(step_name) + 1
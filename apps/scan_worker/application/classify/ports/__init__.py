@@ -4,6 +4,9 @@ Clean Architecture의 Port 정의.
 Infrastructure 레이어에서 구현체를 제공.
 """
 
+from scan_worker.application.classify.ports.character_matcher import (
+    CharacterMatcherPort,
+)
 from scan_worker.application.classify.ports.context_store import ContextStorePort
 from scan_worker.application.classify.ports.event_publisher import (
     EventPublisherPort,
@@ -14,9 +17,14 @@ from scan_worker.application.classify.ports.prompt_repository import (
 )
 from scan_worker.application.classify.ports.result_cache import ResultCachePort
 from scan_worker.application.classify.ports.retriever import RetrieverPort
+from scan_worker.application.classify.ports.vision_cache import (
+    VisionCacheHit,
+    VisionCachePort,
+)
 from scan_worker.application.classify.ports.vision_model import VisionModelPort
 
 __all__ = [
+    "CharacterMatcherPort",
     "ContextStorePort",
     "VisionModelPort",
     "LLMPort",
@@ -24,4 +32,6 @@ __all__ = [
     "PromptRepositoryPort",
     "EventPublisherPort",
     "ResultCachePort",
+    "VisionCacheHit",
+    "VisionCachePort",
 ]
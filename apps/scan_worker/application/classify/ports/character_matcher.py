@@ -0,0 +1,35 @@
+"""Character Matcher Port - 로컬 캐릭터 매칭 추상화."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class CharacterMatcherPort(ABC):
+    """캐릭터 매칭 포트 - match_label(중분류) → 캐릭터 조회.
+
+    character.match RPC 없이 프로세스 내에서 매칭하기 위한 인덱스.
+    판단할 수 없으면 None을 반환하고 호출자는 RPC로 fallback.
+    """
+
+    @abstractmethod
+    def match(self, match_label: str) -> dict[str, Any] | None:
+        """매칭 라벨로 캐릭터 조회.
+
+        Args:
+            match_label: 폐기물 중분류 (예: "무색페트병")
+
+        Returns:
+            캐릭터 정보 dict (id, code, name, type_label, dialog)
+            인덱스로 판단할 수 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    def remember(self, match_label: str, reward: dict[str, Any]) -> None:
+        """RPC 매칭 결과를 인덱스에 반영.
+
+        Args:
+            match_label: 폐기물 중분류
+            reward: character.match 응답
+        """
+        pass
@@ -3,6 +3,25 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+import yaml
+
+
+def render_prompt_template(template: str, schema: dict, tags: dict) -> str:
+    """프롬프트 템플릿 렌더링 (순수 함수).
+
+    분류체계/상황 태그 YAML을 문자열로 변환하여 placeholder 치환.
+
+    Args:
+        template: 프롬프트 템플릿
+        schema: 분류체계 YAML
+        tags: 상황 태그 YAML
+
+    Returns:
+        렌더링된 프롬프트
+    """
+    prompt = template.replace("{{ITEM_CLASS_YAML}}", yaml.dump(schema, allow_unicode=True))
+    return prompt.replace("{{SITUATION_TAG_YAML}}", yaml.dump(tags, allow_unicode=True))
+
 
 class PromptRepositoryPort(ABC):
     """프롬프트 리포지토리 포트 - 리소스 접근 추상화.
@@ -42,3 +61,21 @@ class PromptRepositoryPort(ABC):
             situation_tags.yaml 내용 (dict)
         """
         pass
+
+    def get_rendered_prompt(self, name: str) -> str:
+        """분류체계/상황 태그가 치환된 프롬프트 반환.
+
+        요청과 무관한 정적 프롬프트이므로 구현체에서 에셋 버전 기준
+        캐시 권장. 기본 구현은 매 호출 렌더링.
+
+        Args:
+            name: 프롬프트 이름 (확장자 제외)
+
+        Returns:
+            렌더링된 프롬프트 문자열
+        """
+        return render_prompt_template(
+            self.get_prompt(name),
+            self.get_classification_schema(),
+            self.get_situation_tags(),
+        )
@@ -0,0 +1,59 @@
+"""Vision Cache Port - 이미지 지문 기반 Vision 결과 캐싱 추상화."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class VisionCacheHit:
+    """캐시 적중 결과.
+
+    Attributes:
+        result: 캐싱된 Vision 분류 결과
+        match: 적중 방식 ("exact": 바이트 동일, "near": perceptual hash 근접)
+        elapsed_ms: 원본 Vision 호출 소요 시간 (절감 지연 계산용)
+    """
+
+    result: dict[str, Any]
+    match: str
+    elapsed_ms: float
+
+
+class VisionCachePort(ABC):
+    """Vision 결과 캐시 포트.
+
+    같은 이미지(또는 거의 같은 사진)를 같은 모델/프롬프트로 다시 분류할 때
+    Vision 모델 호출을 건너뛰기 위한 캐시.
+    """
+
+    @abstractmethod
+    def lookup(self, image_bytes: bytes, scope: str) -> VisionCacheHit | None:
+        """이미지 지문으로 캐시 조회.
+
+        Args:
+            image_bytes: 원본 이미지 바이트
+            scope: 모델/프롬프트/사용자 입력 조합 키 (다르면 별도 캐시)
+
+        Returns:
+            적중 시 VisionCacheHit, 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    def store(
+        self,
+        image_bytes: bytes,
+        scope: str,
+        result: dict[str, Any],
+        elapsed_ms: float,
+    ) -> None:
+        """Vision 결과 저장.
+
+        Args:
+            image_bytes: 원본 이미지 바이트
+            scope: 모델/프롬프트/사용자 입력 조합 키
+            result: Vision 분류 결과
+            elapsed_ms: Vision 호출 소요 시간
+        """
+        pass
@@ -16,6 +16,9 @@ class VisionModelPort(ABC):
         prompt: str,
         image_url: str,
         user_input: str | None = None,
+        *,
+        image_bytes: bytes | None = None,
+        mime_type: str | None = None,
     ) -> dict[str, Any]:
         """이미지 분석 후 분류 결과 반환.
 
@@ -23,6 +26,8 @@ class VisionModelPort(ABC):
             prompt: 시스템 프롬프트 (분류체계, 상황태그 포함)
             image_url: 분석할 이미지 URL
             user_input: 사용자 입력 텍스트 (기본: "이 폐기물을 분류해주세요.")
+            image_bytes: 이미 다운로드한 이미지 (있으면 URL 재다운로드 안 함)
+            mime_type: image_bytes의 MIME 타입
 
         Returns:
             분류 결과 dict:
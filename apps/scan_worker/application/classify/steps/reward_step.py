@@ -1,6 +1,8 @@
 """Reward Step - 보상 처리 단계.
 
 Stage 4: 캐릭터 매칭 + DB 저장 Task 발행 + 결과 캐싱.
+캐릭터 매칭은 로컬 인덱스(CharacterMatcherPort) 우선, 판단 불가 시 character.match RPC.
+캐릭터 매칭은 분류 결과만 필요하므로 fused 모드에서는 answer와 병렬로 선행 실행(prefetch).
 Celery를 통해 character-worker, users-worker에 Task 발행.
 """
 
@@ -14,11 +16,14 @@ from typing import TYPE_CHECKING, Any
 from celery import Celery
 from celery.exceptions import TimeoutError as CeleryTimeoutError
 
+from scan_worker.application.classify.ports.character_matcher import (
+    CharacterMatcherPort,
+)
 from scan_worker.application.classify.ports.event_publisher import (
     EventPublisherPort,
 )
 from scan_worker.application.classify.ports.result_cache import ResultCachePort
-from scan_worker.application.common.step_interface import Step
+from scan_worker.application.common.step_interface import SpeculativeStep
 
 if TYPE_CHECKING:
     from scan_worker.application.classify.dto.classify_context import (
@@ -30,11 +35,14 @@ logger = logging.getLogger(__name__)
 # 매칭 결과 대기 타임아웃 (초)
 MATCH_TIMEOUT = int(os.getenv("CHARACTER_MATCH_TIMEOUT", "10"))
 
+# prefetch 결과 없음 (None은 "매칭 없음" 결과이므로 구분)
+_NOT_PREFETCHED = object()
+
 
-class RewardStep(Step):
+class RewardStep(SpeculativeStep):
     """보상 처리 Step - Celery Task 발행.
 
-    1. character.match 호출 (동기 대기)
+    1. 캐릭터 매칭 (로컬 인덱스 → character.match RPC fallback)
     2. character.save_ownership 발행 (Fire & Forget)
     3. users.save_character 발행 (Fire & Forget)
     4. 결과 캐시 저장
@@ -48,6 +56,7 @@ class RewardStep(Step):
         celery_app: Celery,
         event_publisher: EventPublisherPort,
         result_cache: ResultCachePort,
+        character_matcher: CharacterMatcherPort | None = None,
     ):
         """초기화.
 
@@ -55,10 +64,12 @@ class RewardStep(Step):
             celery_app: Celery 앱 인스턴스
             event_publisher: 이벤트 발행 Port
             result_cache: 결과 캐시 Port
+            character_matcher: 로컬 캐릭터 매칭 Port (None이면 항상 RPC)
         """
         self._celery = celery_app
         self._events = event_publisher
         self._cache = result_cache
+        self._matcher = character_matcher
 
     def run(self, ctx: "ClassifyContext") -> "ClassifyContext":
         """Step 실행.
@@ -69,6 +80,41 @@ class RewardStep(Step):
         Returns:
             업데이트된 Context (reward 필드 채워짐)
         """
+        return self._run(ctx, _NOT_PREFETCHED)
+
+    def prefetch(self, ctx: "ClassifyContext") -> dict[str, Any] | None:
+        """캐릭터 매칭 선행 실행 (분류 결과만 사용, 저장 Task 발행 없음).
+
+        보상 후보가 아니면 매칭하지 않음. 최종 지급 여부는 run_prefetched에서
+        배출 규정/미흡항목까지 확인 후 결정.
+
+        Args:
+            ctx: vision 완료 시점 Context 사본
+
+        Returns:
+            매칭 결과 (매칭 없음/후보 아님이면 None)
+        """
+        if not self._is_reward_candidate(ctx):
+            return None
+        return self._match_character(ctx)
+
+    def run_prefetched(
+        self,
+        ctx: "ClassifyContext",
+        prefetched: dict[str, Any] | None,
+    ) -> "ClassifyContext":
+        """prefetch된 매칭 결과로 Step 실행 (character.match 대기 없음).
+
+        Args:
+            ctx: 입력 Context (모든 이전 단계 결과 필요)
+            prefetched: prefetch() 매칭 결과
+
+        Returns:
+            업데이트된 Context (reward 필드 채워짐)
+        """
+        return self._run(ctx, prefetched)
+
+    def _run(self, ctx: "ClassifyContext", prefetched: Any) -> "ClassifyContext":
         start = time.perf_counter()
 
         logger.info(
@@ -79,8 +125,11 @@ class RewardStep(Step):
         # 1. 보상 조건 확인
         reward = None
         if self._should_attempt_reward(ctx):
-            # 2. character.match 호출 (동기 대기)
-            reward = self._dispatch_character_match(ctx)
+            # 2. 캐릭터 매칭 (prefetch 결과 → 로컬 → RPC fallback)
+            if prefetched is _NOT_PREFETCHED:
+                reward = self._match_character(ctx)
+            else:
+                reward = prefetched
 
             # 3. DB 저장 Task 발행 (Fire & Forget)
             if reward and reward.get("received") and reward.get("character_id"):
@@ -142,6 +191,26 @@ class RewardStep(Step):
 
     def _should_attempt_reward(self, ctx: "ClassifyContext") -> bool:
         """보상 평가 조건 확인."""
+        if not self._is_reward_candidate(ctx):
+            return False
+
+        if not ctx.disposal_rules:
+            return False
+
+        # 미흡항목이 있으면 보상 불가
+        if ctx.final_answer:
+            insufficiencies = ctx.final_answer.get("insufficiencies", [])
+            for entry in insufficiencies:
+                if isinstance(entry, str) and entry.strip():
+                    return False
+                elif entry:
+                    return False
+
+        return True
+
+    @staticmethod
+    def _is_reward_candidate(ctx: "ClassifyContext") -> bool:
+        """분류 결과만으로 판단 가능한 보상 조건 (prefetch 여부 결정에도 사용)."""
         reward_enabled = os.getenv("REWARD_FEATURE_ENABLED", "true").lower() == "true"
         if not reward_enabled:
             return False
@@ -156,22 +225,41 @@ class RewardStep(Step):
         if not major or not middle:
             return False
 
-        if major != "재활용폐기물":
-            return False
+        return major == "재활용폐기물"
 
-        if not ctx.disposal_rules:
-            return False
+    def _match_character(self, ctx: "ClassifyContext") -> dict[str, Any] | None:
+        """캐릭터 매칭 (character-worker match_task와 동일한 응답 형식).
 
-        # 미흡항목이 있으면 보상 불가
-        if ctx.final_answer:
-            insufficiencies = ctx.final_answer.get("insufficiencies", [])
-            for entry in insufficiencies:
-                if isinstance(entry, str) and entry.strip():
-                    return False
-                elif entry:
-                    return False
+        로컬 인덱스로 판단할 수 있으면 broker 왕복 없이 즉시 반환.
+        판단할 수 없으면 character.match RPC 호출 후 결과를 인덱스에 학습.
+        """
+        classification = (ctx.classification or {}).get("classification", {})
+        middle = (classification.get("middle_category") or "").strip()
+        minor = (classification.get("minor_category") or "").strip()
 
-        return True
+        if self._matcher is None or not middle:
+            return self._dispatch_character_match(ctx)
+
+        character = self._matcher.match(middle)
+        if character is not None:
+            logger.info(
+                "Character matched locally",
+                extra={"task_id": ctx.task_id, "character_name": character.get("name")},
+            )
+            return {
+                "name": character.get("name"),
+                "dialog": character.get("dialog"),
+                "match_reason": f"{middle}>{minor}" if minor else middle,
+                "type": character.get("type_label"),
+                "character_id": character.get("id"),
+                "character_code": character.get("code"),
+                "received": True,
+            }
+
+        reward = self._dispatch_character_match(ctx)
+        if reward:
+            self._matcher.remember(middle, reward)
+        return reward
 
     def _dispatch_character_match(self, ctx: "ClassifyContext") -> dict[str, Any] | None:
         """character.match Task 호출 (동기 대기).
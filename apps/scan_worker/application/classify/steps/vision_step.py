@@ -10,11 +10,7 @@ import logging
 import time
 from typing import TYPE_CHECKING
 
-import yaml
-
-from scan_worker.application.classify.ports.prompt_repository import (
-    PromptRepositoryPort,
-)
+from scan_worker.application.classify.ports.prompt_repository import PromptRepositoryPort
 from scan_worker.application.classify.ports.vision_model import VisionModelPort
 from scan_worker.application.common.step_interface import Step
 
@@ -63,15 +59,10 @@ class VisionStep(Step):
             extra={"task_id": ctx.task_id, "user_id": ctx.user_id},
         )
 
-        # 1. 프롬프트 로딩 (Port 통해 추상화)
-        prompt_template = self._prompts.get_prompt("vision_classification_prompt")
-        schema = self._prompts.get_classification_schema()
-        tags = self._prompts.get_situation_tags()
-
-        # 2. 프롬프트 렌더링 (순수 로직)
-        prompt = self._render_prompt(prompt_template, schema, tags, ctx.user_input)
+        # 1. 렌더링된 프롬프트 로딩 (요청 무관 정적 프롬프트 → 리포지토리 캐시)
+        prompt = self._prompts.get_rendered_prompt("vision_classification_prompt")
 
-        # 3. Vision 모델 호출 (Port 통해 추상화)
+        # 2. Vision 모델 호출 (Port 통해 추상화)
         result = self._vision.analyze_image(
             prompt=prompt,
             image_url=ctx.image_url,
@@ -80,7 +71,7 @@ class VisionStep(Step):
 
         elapsed = (time.perf_counter() - start) * 1000
 
-        # 4. Context 업데이트
+        # 3. Context 업데이트
         ctx.classification = result
         ctx.latencies["duration_vision_ms"] = elapsed
         ctx.progress = 25
@@ -95,31 +86,3 @@ class VisionStep(Step):
         )
 
         return ctx
-
-    def _render_prompt(
-        self,
-        template: str,
-        schema: dict,
-        tags: dict,
-        user_input: str | None,
-    ) -> str:
-        """프롬프트 렌더링 (순수 함수).
-
-        Args:
-            template: 프롬프트 템플릿
-            schema: 분류체계 YAML
-            tags: 상황 태그 YAML
-            user_input: 사용자 입력
-
-        Returns:
-            렌더링된 프롬프트
-        """
-        # YAML을 문자열로 변환
-        schema_text = yaml.dump(schema, allow_unicode=True)
-        tags_text = yaml.dump(tags, allow_unicode=True)
-
-        # 템플릿 치환
-        prompt = template.replace("{{ITEM_CLASS_YAML}}", schema_text)
-        prompt = prompt.replace("{{SITUATION_TAG_YAML}}", tags_text)
-
-        return prompt
@@ -2,8 +2,9 @@
 
 공통 인터페이스 및 유틸리티:
 - Step: 파이프라인 단계 인터페이스 (Stateless Reducer 패턴)
+- SpeculativeStep: 선행 실행(prefetch) 가능한 Step
 """
 
-from scan_worker.application.common.step_interface import Step
+from scan_worker.application.common.step_interface import SpeculativeStep, Step
 
-__all__ = ["Step"]
+__all__ = ["SpeculativeStep", "Step"]
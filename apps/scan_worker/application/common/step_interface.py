@@ -1,7 +1,7 @@
 """Step Interface - 파이프라인 단계 추상화."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     from scan_worker.application.classify.dto.classify_context import (
@@ -34,3 +34,37 @@ class Step(ABC):
             업데이트된 Context
         """
         pass
+
+
+class SpeculativeStep(Step):
+    """선행 Step 결과 일부만으로 작업을 미리 시작할 수 있는 Step.
+
+    fused 모드에서 Runner가 앞 Step(vision) 완료 직후 prefetch()를 백그라운드로
+    실행하고, 해당 Step 차례에 run_prefetched()로 결과를 넘김.
+    prefetch()는 부작용이 없어야 함 (결과가 버려질 수 있음).
+    """
+
+    @abstractmethod
+    def prefetch(self, ctx: T) -> Any:
+        """미리 실행 가능한 작업 수행.
+
+        Args:
+            ctx: 선행 Step 시점 Context 사본
+
+        Returns:
+            run_prefetched()에 전달할 결과
+        """
+        pass
+
+    @abstractmethod
+    def run_prefetched(self, ctx: T, prefetched: Any) -> T:
+        """prefetch 결과를 사용해 Step 실행.
+
+        Args:
+            ctx: 입력 Context
+            prefetched: prefetch() 반환값
+
+        Returns:
+            업데이트된 Context
+        """
+        pass
@@ -2,6 +2,11 @@
 
 domains/_shared/waste_pipeline/utils.py 로직 이전.
 파일 시스템 기반 프롬프트/YAML 로딩.
+
+캐시:
+- 원본 파일(프롬프트/YAML)과 렌더링된 프롬프트를 모두 프로세스 메모리에 캐시
+- 에셋 버전 = 파일 (mtime_ns, size). 파일이 바뀌면 다음 호출에서 다시 로딩
+- 렌더링 캐시 키 = (프롬프트 이름, 관련 에셋 버전 전체)
 """
 
 from __future__ import annotations
@@ -9,16 +14,20 @@ from __future__ import annotations
 import hashlib
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 
 from scan_worker.application.classify.ports.prompt_repository import (
     PromptRepositoryPort,
+    render_prompt_template,
 )
+from scan_worker.infrastructure.metrics import SCAN_PROMPT_RENDER_CACHE
 
 logger = logging.getLogger(__name__)
 
+AssetVersion = tuple[int, int]
+
 
 class FilePromptRepository(PromptRepositoryPort):
     """파일 시스템 기반 프롬프트 리포지토리.
@@ -35,7 +44,8 @@ class FilePromptRepository(PromptRepositoryPort):
         self._assets_path = Path(assets_path)
         self._prompts_dir = self._assets_path / "prompts"
         self._data_dir = self._assets_path / "data"
-        self._cache: dict[str, Any] = {}
+        # cache_key → (에셋 버전, 값)
+        self._cache: dict[str, tuple[Any, Any]] = {}
         logger.info(
             "FilePromptRepository initialized (path=%s)",
             self._assets_path,
@@ -50,28 +60,7 @@ class FilePromptRepository(PromptRepositoryPort):
         Returns:
             프롬프트 템플릿 문자열
         """
-        cache_key = f"prompt:{name}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        filepath = self._prompts_dir / f"{name}.txt"
-        if not filepath.exists():
-            raise FileNotFoundError(f"Prompt not found: {filepath}")
-
-        with filepath.open("r", encoding="utf-8") as f:
-            content = f.read()
-
-        # SHA1 해시로 로딩 검증
-        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
-        logger.info(
-            "Prompt loaded (path=%s, len=%d, sha1=%s)",
-            filepath,
-            len(content),
-            digest,
-        )
-
-        self._cache[cache_key] = content
-        return content
+        return self._load(f"prompt:{name}", self._prompt_path(name), self._read_prompt)
 
     def get_classification_schema(self) -> dict[str, Any]:
         """분류체계 YAML 로딩.
@@ -79,20 +68,7 @@ class FilePromptRepository(PromptRepositoryPort):
         Returns:
             item_class_list.yaml 내용 (dict)
         """
-        cache_key = "schema:classification"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        filepath = self._data_dir / "item_class_list.yaml"
-        if not filepath.exists():
-            raise FileNotFoundError(f"Classification schema not found: {filepath}")
-
-        with filepath.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
-        logger.info("Classification schema loaded (path=%s)", filepath)
-        self._cache[cache_key] = data
-        return data
+        return self._load("schema:classification", self._schema_path, self._read_yaml)
 
     def get_situation_tags(self) -> dict[str, Any]:
         """상황 태그 YAML 로딩.
@@ -100,17 +76,100 @@ class FilePromptRepository(PromptRepositoryPort):
         Returns:
             situation_tags.yaml 내용 (dict)
         """
-        cache_key = "schema:situation_tags"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        return self._load("schema:situation_tags", self._tags_path, self._read_yaml)
 
-        filepath = self._data_dir / "situation_tags.yaml"
-        if not filepath.exists():
-            raise FileNotFoundError(f"Situation tags not found: {filepath}")
+    def get_rendered_prompt(self, name: str) -> str:
+        """분류체계/상황 태그가 치환된 프롬프트 반환 (에셋 버전 기준 캐시).
+
+        yaml.dump + 템플릿 치환은 요청마다 결과가 같으므로 1회만 수행.
+        프롬프트/YAML 파일 중 하나라도 바뀌면 다시 렌더링.
+
+        Args:
+            name: 프롬프트 이름 (확장자 제외)
+
+        Returns:
+            렌더링된 프롬프트 문자열
+        """
+        cache_key = f"rendered:{name}"
+        version = (
+            self._asset_version(self._prompt_path(name)),
+            self._asset_version(self._schema_path),
+            self._asset_version(self._tags_path),
+        )
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == version:
+            SCAN_PROMPT_RENDER_CACHE.labels(result="hit").inc()
+            return cached[1]
+
+        SCAN_PROMPT_RENDER_CACHE.labels(result="miss" if cached is None else "invalidated").inc()
+        rendered = render_prompt_template(
+            self.get_prompt(name),
+            self.get_classification_schema(),
+            self.get_situation_tags(),
+        )
+        logger.info(
+            "Prompt rendered (name=%s, len=%d, sha1=%s)",
+            name,
+            len(rendered),
+            hashlib.sha1(rendered.encode("utf-8")).hexdigest(),
+        )
+        self._cache[cache_key] = (version, rendered)
+        return rendered
+
+    # ==========================================
+    # Internal
+    # ==========================================
+
+    @property
+    def _schema_path(self) -> Path:
+        return self._data_dir / "item_class_list.yaml"
+
+    @property
+    def _tags_path(self) -> Path:
+        return self._data_dir / "situation_tags.yaml"
+
+    def _prompt_path(self, name: str) -> Path:
+        return self._prompts_dir / f"{name}.txt"
+
+    @staticmethod
+    def _asset_version(filepath: Path) -> AssetVersion:
+        """에셋 버전 (mtime_ns, size). 파일이 없으면 FileNotFoundError."""
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Asset not found: {filepath}") from None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self, cache_key: str, filepath: Path, reader: Callable[[Path], Any]) -> Any:
+        """에셋 버전이 같으면 캐시, 다르면 파일 다시 로딩."""
+        version = self._asset_version(filepath)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        value = reader(filepath)
+        self._cache[cache_key] = (version, value)
+        return value
+
+    @staticmethod
+    def _read_prompt(filepath: Path) -> str:
+        with filepath.open("r", encoding="utf-8") as f:
+            content = f.read()
+
+        # SHA1 해시로 로딩 검증
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        logger.info(
+            "Prompt loaded (path=%s, len=%d, sha1=%s)",
+            filepath,
+            len(content),
+            digest,
+        )
+        return content
 
+    @staticmethod
+    def _read_yaml(filepath: Path) -> dict[str, Any]:
         with filepath.open("r", encoding="utf-8") as f:
             data = yaml.safe_load(f)
 
-        logger.info("Situation tags loaded (path=%s)", filepath)
-        self._cache[cache_key] = data
+        logger.info("YAML asset loaded (path=%s)", filepath)
         return data
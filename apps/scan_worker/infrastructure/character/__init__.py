@@ -0,0 +1,19 @@
+"""Character Infrastructure - 로컬 캐릭터 매칭 인덱스.
+
+character.cache fanout 이벤트로 동기화되는 match_label 인덱스.
+RewardStep의 character.match RPC를 프로세스 내 조회로 대체.
+"""
+
+from .cache_consumer import (
+    CharacterCacheConsumerThread,
+    start_character_cache_consumer,
+    stop_character_cache_consumer,
+)
+from .match_index import CharacterMatchIndex
+
+__all__ = [
+    "CharacterCacheConsumerThread",
+    "CharacterMatchIndex",
+    "start_character_cache_consumer",
+    "stop_character_cache_consumer",
+]
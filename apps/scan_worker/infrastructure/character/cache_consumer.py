@@ -0,0 +1,148 @@
+"""character.cache fanout Consumer - CharacterMatchIndex 동기화.
+
+character API의 CacheUpdateConsumer와 같은 exchange/이벤트 포맷을 사용:
+- fanout exchange: 모든 scan_worker 인스턴스가 동일한 이벤트 수신
+- exclusive queue: 인스턴스마다 고유한 임시 큐
+- daemon thread: gevent pool에서는 monkey patch로 greenlet으로 동작
+"""
+
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from kombu import Connection, Exchange, Queue
+from kombu.mixins import ConsumerMixin
+
+from scan_worker.infrastructure.character.match_index import CharacterMatchIndex
+
+if TYPE_CHECKING:
+    from kombu.transport.base import Message
+
+logger = logging.getLogger(__name__)
+
+CACHE_EXCHANGE = Exchange(
+    "character.cache",
+    type="fanout",
+    durable=True,
+)
+
+
+class CharacterCacheConsumer(ConsumerMixin):
+    """character.cache 이벤트 → CharacterMatchIndex 반영."""
+
+    def __init__(self, connection: Connection, index: CharacterMatchIndex) -> None:
+        self.connection = connection
+        self.index = index
+        self.queue = Queue(
+            name="",
+            exchange=CACHE_EXCHANGE,
+            exclusive=True,
+            auto_delete=True,
+        )
+
+    def get_consumers(self, Consumer: type, channel: Any) -> list:
+        return [
+            Consumer(
+                queues=[self.queue],
+                callbacks=[self.on_message],
+                accept=["json"],
+            )
+        ]
+
+    def on_message(self, body: dict[str, Any], message: "Message") -> None:
+        try:
+            if not self.index.apply_event(body):
+                logger.warning(
+                    "character_cache_event_unknown",
+                    extra={"event_type": body.get("type")},
+                )
+            message.ack()
+        except Exception as e:
+            logger.exception("character_cache_event_error", extra={"error": str(e)})
+            message.reject(requeue=False)
+
+
+class CharacterCacheConsumerThread(threading.Thread):
+    """CharacterCacheConsumer 백그라운드 실행 (연결 끊김 시 재접속)."""
+
+    def __init__(self, broker_url: str, index: CharacterMatchIndex) -> None:
+        super().__init__(daemon=True, name="CharacterCacheConsumerThread")
+        self.broker_url = broker_url
+        self.index = index
+        self._stop_event = threading.Event()
+        self._consumer: CharacterCacheConsumer | None = None
+
+    def run(self) -> None:
+        logger.info("character_cache_consumer_starting")
+
+        while not self._stop_event.is_set():
+            try:
+                with Connection(self.broker_url, heartbeat=60) as connection:
+                    self._consumer = CharacterCacheConsumer(connection, self.index)
+                    logger.info("character_cache_consumer_connected")
+                    self._consumer.run()
+
+            except (socket.timeout, TimeoutError, OSError) as e:
+                if self._stop_event.is_set():
+                    break
+                logger.debug("character_cache_consumer_timeout", extra={"error": str(e)})
+                time.sleep(1)
+
+            except Exception as e:
+                if self._stop_event.is_set():
+                    break
+                logger.warning("character_cache_consumer_error", extra={"error": str(e)})
+                time.sleep(5)
+
+        logger.info("character_cache_consumer_stopped")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._consumer:
+            self._consumer.should_stop = True
+
+
+_consumer_thread: CharacterCacheConsumerThread | None = None
+_thread_lock = threading.Lock()
+
+
+def start_character_cache_consumer(
+    broker_url: str,
+    index: CharacterMatchIndex,
+) -> CharacterCacheConsumerThread | None:
+    """Consumer 스레드 시작 (싱글톤).
+
+    Args:
+        broker_url: RabbitMQ broker URL
+        index: 동기화 대상 인덱스
+
+    Returns:
+        실행 중인 스레드 또는 None (URL 없으면)
+    """
+    global _consumer_thread
+
+    if not broker_url:
+        logger.warning("character_cache_consumer_skipped: no broker_url")
+        return None
+
+    with _thread_lock:
+        if _consumer_thread is None or not _consumer_thread.is_alive():
+            _consumer_thread = CharacterCacheConsumerThread(broker_url, index)
+            _consumer_thread.start()
+
+    return _consumer_thread
+
+
+def stop_character_cache_consumer() -> None:
+    """Consumer 스레드 중지."""
+    global _consumer_thread
+
+    with _thread_lock:
+        if _consumer_thread is not None:
+            _consumer_thread.stop()
+            _consumer_thread.join(timeout=5)
+            _consumer_thread = None
@@ -0,0 +1,165 @@
+"""Character Match Index - CharacterMatcherPort 구현체.
+
+match_label(중분류) → 캐릭터 인덱스 (프로세스 메모리).
+
+데이터 출처:
+- character.cache 이벤트 (full_refresh / upsert / delete): 만료 없음
+- character.match RPC 응답 (remember): learned_ttl 후 만료 → RPC로 재확인
+
+full_refresh를 한 번이라도 받으면 인덱스가 전체 목록을 가지므로
+없는 라벨은 character-worker와 동일하게 기본 캐릭터로 매칭.
+그 전에는 모르는 라벨을 None으로 반환하여 RPC fallback.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from threading import Lock
+from typing import Any
+
+from scan_worker.application.classify.ports.character_matcher import (
+    CharacterMatcherPort,
+)
+from scan_worker.infrastructure.metrics import SCAN_CHARACTER_MATCH_LOCAL
+
+logger = logging.getLogger(__name__)
+
+CHARACTER_FIELDS = ("id", "code", "name", "type_label", "dialog")
+
+
+def _to_character(data: dict[str, Any]) -> dict[str, Any]:
+    """이벤트 payload → 인덱스 항목 (매칭에 필요한 필드만)."""
+    character = {field: data.get(field) for field in CHARACTER_FIELDS}
+    character["id"] = str(character["id"]) if character["id"] else None
+    return character
+
+
+class CharacterMatchIndex(CharacterMatcherPort):
+    """Thread-safe match_label 인덱스."""
+
+    def __init__(self, default_code: str = "char-eco", learned_ttl: float = 600.0):
+        """초기화.
+
+        Args:
+            default_code: 매칭 라벨이 없을 때 사용할 기본 캐릭터 코드
+            learned_ttl: RPC 응답으로 학습한 항목 유효 시간 (초)
+        """
+        self._default_code = default_code
+        self._learned_ttl = learned_ttl
+        self._lock = Lock()
+        # match_label → (캐릭터, 만료 시각 | None)
+        self._by_label: dict[str, tuple[dict[str, Any], float | None]] = {}
+        self._default: dict[str, Any] | None = None
+        self._authoritative = False
+
+    @property
+    def is_authoritative(self) -> bool:
+        """full_refresh 수신 여부 (전체 목록 보유)."""
+        return self._authoritative
+
+    def match(self, match_label: str) -> dict[str, Any] | None:
+        """매칭 라벨로 캐릭터 조회 (판단 불가 시 None)."""
+        with self._lock:
+            entry = self._by_label.get(match_label)
+            if entry is not None:
+                character, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    SCAN_CHARACTER_MATCH_LOCAL.labels(result="hit").inc()
+                    return character
+                del self._by_label[match_label]
+
+            if self._authoritative and self._default is not None:
+                SCAN_CHARACTER_MATCH_LOCAL.labels(result="default").inc()
+                return self._default
+
+        SCAN_CHARACTER_MATCH_LOCAL.labels(result="miss").inc()
+        return None
+
+    def remember(self, match_label: str, reward: dict[str, Any]) -> None:
+        """RPC 응답 학습 (이벤트로 받은 항목은 덮어쓰지 않음)."""
+        if not reward or not reward.get("character_id"):
+            return
+        character = {
+            "id": reward.get("character_id"),
+            "code": reward.get("character_code"),
+            "name": reward.get("name"),
+            "type_label": reward.get("type"),
+            "dialog": reward.get("dialog"),
+        }
+        with self._lock:
+            existing = self._by_label.get(match_label)
+            if existing is not None and existing[1] is None:
+                return
+            self._by_label[match_label] = (character, time.monotonic() + self._learned_ttl)
+
+    # ==========================================
+    # character.cache 이벤트 반영
+    # ==========================================
+
+    def apply_event(self, body: dict[str, Any]) -> bool:
+        """character.cache 이벤트 반영.
+
+        Returns:
+            처리한 이벤트 타입이면 True
+        """
+        event_type = body.get("type")
+        if event_type == "full_refresh":
+            self.full_refresh(body.get("characters", []))
+        elif event_type == "upsert":
+            if body.get("character"):
+                self.upsert(body["character"])
+        elif event_type == "delete":
+            if body.get("character_id"):
+                self.delete(str(body["character_id"]))
+        else:
+            return False
+        return True
+
+    def full_refresh(self, characters: list[dict[str, Any]]) -> None:
+        """전체 인덱스 교체."""
+        by_label: dict[str, tuple[dict[str, Any], float | None]] = {}
+        default = None
+        for data in characters:
+            character = _to_character(data)
+            if data.get("match_label"):
+                by_label[data["match_label"]] = (character, None)
+            if character["code"] == self._default_code:
+                default = character
+
+        with self._lock:
+            self._by_label = by_label
+            self._default = default
+            self._authoritative = True
+        logger.info(
+            "Character match index refreshed (labels=%d, has_default=%s)",
+            len(by_label),
+            default is not None,
+        )
+
+    def upsert(self, data: dict[str, Any]) -> None:
+        """단일 캐릭터 추가/수정 (match_label 변경 시 이전 라벨 제거)."""
+        character = _to_character(data)
+        with self._lock:
+            self._remove_character(character["id"])
+            if data.get("match_label"):
+                self._by_label[data["match_label"]] = (character, None)
+            if character["code"] == self._default_code:
+                self._default = character
+
+    def delete(self, character_id: str) -> None:
+        """단일 캐릭터 삭제."""
+        with self._lock:
+            self._remove_character(character_id)
+            if self._default is not None and self._default["id"] == character_id:
+                self._default = None
+
+    def _remove_character(self, character_id: str | None) -> None:
+        """해당 캐릭터를 가리키는 라벨 제거 (RPC 학습 항목 포함). lock 보유 상태에서 호출."""
+        stale = [
+            label
+            for label, (character, _) in self._by_label.items()
+            if character["id"] == character_id
+        ]
+        for label in stale:
+            del self._by_label[label]
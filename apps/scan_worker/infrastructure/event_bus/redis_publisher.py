@@ -7,6 +7,10 @@ Event Router + SSE Gateway 아키텍처:
 - Event Router → Streams 소비 → Pub/Sub 발행
 - SSE Gateway → Pub/Sub 구독 → 클라이언트 전달
 
+Job별 Stage 인덱스 (scan:progress:{job_id}):
+- shard Stream XADD와 같은 Script에서 job 전용 소형 Stream에도 기록
+- SSE Gateway 재연결 catch-up이 shard 부하와 무관하게 범위 읽기 1회로 끝남
+
 분산 트레이싱 통합:
 - XADD 시 trace context 포함 (trace_id, span_id, traceparent)
 - Event Router가 trace context를 Pub/Sub에 전파
@@ -40,6 +44,11 @@ PUBLISHED_KEY_PREFIX = "published:"
 STREAM_MAXLEN = 10000
 PUBLISHED_TTL = 7200  # 2시간
 
+# Job별 Stage 인덱스 (SSE 재연결 catch-up용)
+PROGRESS_STREAM_PREFIX = "scan:progress"
+PROGRESS_STREAM_MAXLEN = 100
+PROGRESS_STREAM_TTL = 3600  # 1시간
+
 # Stage 순서 (단조증가 seq)
 STAGE_ORDER = {
     "queued": 0,
@@ -62,6 +71,7 @@ DEFAULT_SHARD_COUNT = int(os.environ.get("SSE_SHARD_COUNT", "4"))
 IDEMPOTENT_XADD_SCRIPT = """
 local publish_key = KEYS[1]  -- published:{job_id}:{stage}:{seq}
 local stream_key = KEYS[2]   -- scan:events:{shard}
+local progress_stream = KEYS[3]  -- scan:progress:{job_id} (job별 catch-up 인덱스)
 
 -- 이미 발행했는지 체크
 if redis.call('EXISTS', publish_key) == 1 then
@@ -85,6 +95,19 @@ local msg_id = redis.call('XADD', stream_key, 'MAXLEN', '~', ARGV[1],
     'traceparent', ARGV[12]
 )
 
+-- job별 Stage 인덱스에도 저장 (shard Stream ID를 stream_id로 보존)
+-- ARGV[13]: progress_maxlen, ARGV[14]: progress_ttl
+redis.call('XADD', progress_stream, 'MAXLEN', '~', ARGV[13], '*',
+    'stage', ARGV[3],
+    'status', ARGV[4],
+    'seq', ARGV[5],
+    'ts', ARGV[6],
+    'progress', ARGV[7],
+    'result', ARGV[8],
+    'stream_id', msg_id
+)
+redis.call('EXPIRE', progress_stream, tonumber(ARGV[14]))
+
 -- 발행 마킹 (TTL: 2시간)
 redis.call('SETEX', publish_key, ARGV[9], msg_id)
 
@@ -211,6 +234,7 @@ class RedisEventPublisher(EventPublisherPort):
 
         # 멱등성 키
         publish_key = f"{PUBLISHED_KEY_PREFIX}{task_id}:{stage}:{seq}"
+        progress_stream_key = f"{PROGRESS_STREAM_PREFIX}:{task_id}"
 
         # 이벤트 데이터
         ts = str(time.time())
@@ -223,7 +247,7 @@ class RedisEventPublisher(EventPublisherPort):
         # Lua Script 실행
         script = client.register_script(IDEMPOTENT_XADD_SCRIPT)
         result_tuple = script(
-            keys=[publish_key, stream_key],
+            keys=[publish_key, stream_key, progress_stream_key],
             args=[
                 str(STREAM_MAXLEN),  # ARGV[1]
                 task_id,  # ARGV[2]
@@ -237,6 +261,8 @@ class RedisEventPublisher(EventPublisherPort):
                 trace_id,  # ARGV[10]
                 span_id,  # ARGV[11]
                 traceparent,  # ARGV[12]
+                str(PROGRESS_STREAM_MAXLEN),  # ARGV[13]
+                str(PROGRESS_STREAM_TTL),  # ARGV[14]
             ],
         )
 
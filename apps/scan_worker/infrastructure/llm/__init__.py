@@ -3,8 +3,10 @@
 모델 패밀리별 LLM 구현체:
 - gpt/: GPT 모델 (gpt-5.1, gpt-5.2)
 - gemini/: Gemini 모델 (gemini-3-flash-preview)
+- cached_vision: Vision 결과 캐시 데코레이터
 """
 
+from scan_worker.infrastructure.llm.cached_vision import CachedVisionAdapter
 from scan_worker.infrastructure.llm.gemini import (
     GeminiLLMAdapter,
     GeminiVisionAdapter,
@@ -15,6 +17,8 @@ from scan_worker.infrastructure.llm.gpt import (
 )
 
 __all__ = [
+    # Cache
+    "CachedVisionAdapter",
     # GPT
     "GPTLLMAdapter",
     "GPTVisionAdapter",
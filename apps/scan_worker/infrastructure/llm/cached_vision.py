@@ -0,0 +1,140 @@
+"""Cached Vision Adapter - VisionModelPort 데코레이터.
+
+이미지 지문 캐시(VisionCachePort)를 Vision 모델 앞에 두어
+같은/거의 같은 이미지 재분류 시 LLM 호출을 건너뜀.
+
+캐시 범위(scope) = 모델 + 렌더링 프롬프트 + 사용자 입력.
+프롬프트/분류체계가 바뀌면 scope가 달라져 이전 결과를 재사용하지 않음.
+
+지문 계산을 위해 받은 이미지 바이트는 miss 시 원본 어댑터에 그대로 넘겨
+같은 URL을 두 번 다운로드하지 않음.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from functools import lru_cache
+from typing import Any
+
+import httpx
+
+from scan_worker.application.classify.ports.vision_cache import VisionCachePort
+from scan_worker.application.classify.ports.vision_model import VisionModelPort
+from scan_worker.infrastructure.metrics import (
+    SCAN_VISION_CACHE_SAVED_SECONDS,
+    SCAN_VISION_CACHE_TOTAL,
+)
+
+logger = logging.getLogger(__name__)
+
+IMAGE_FETCH_TIMEOUT = httpx.Timeout(connect=3.0, read=10.0, write=10.0, pool=3.0)
+
+
+@lru_cache
+def _shared_http_client() -> httpx.Client:
+    """이미지 다운로드용 공유 클라이언트 (어댑터는 요청마다 생성되므로 연결 풀 재사용)."""
+    return httpx.Client(timeout=IMAGE_FETCH_TIMEOUT)
+
+
+class CachedVisionAdapter(VisionModelPort):
+    """Vision 결과 캐시 데코레이터.
+
+    캐시/이미지 다운로드 실패는 캐시 미사용으로 간주하고 원본 모델 호출.
+    """
+
+    def __init__(
+        self,
+        inner: VisionModelPort,
+        cache: VisionCachePort,
+        model: str,
+        http_client: httpx.Client | None = None,
+    ):
+        """초기화.
+
+        Args:
+            inner: 실제 Vision 모델 어댑터
+            cache: Vision 결과 캐시
+            model: 모델명 (scope/메트릭 라벨)
+            http_client: 이미지 다운로드용 HTTP 클라이언트
+        """
+        self._inner = inner
+        self._cache = cache
+        self._model = model
+        self._http_client = http_client or _shared_http_client()
+
+    def analyze_image(
+        self,
+        prompt: str,
+        image_url: str,
+        user_input: str | None = None,
+        *,
+        image_bytes: bytes | None = None,
+        mime_type: str | None = None,
+    ) -> dict[str, Any]:
+        """캐시 조회 후 miss면 원본 Vision 모델 호출 및 저장."""
+        if image_bytes is None:
+            image_bytes, mime_type = self._fetch_image(image_url)
+        scope = self._scope(prompt, user_input)
+
+        if image_bytes is not None:
+            try:
+                hit = self._cache.lookup(image_bytes, scope)
+            except Exception as e:
+                logger.warning("Vision cache lookup failed: %s", e)
+                SCAN_VISION_CACHE_TOTAL.labels(model=self._model, result="error").inc()
+                hit = None
+            else:
+                if hit is not None:
+                    SCAN_VISION_CACHE_TOTAL.labels(model=self._model, result=hit.match).inc()
+                    SCAN_VISION_CACHE_SAVED_SECONDS.labels(model=self._model).inc(
+                        hit.elapsed_ms / 1000
+                    )
+                    logger.info(
+                        "Vision cache hit (model=%s, match=%s, saved_ms=%.0f)",
+                        self._model,
+                        hit.match,
+                        hit.elapsed_ms,
+                    )
+                    return hit.result
+                SCAN_VISION_CACHE_TOTAL.labels(model=self._model, result="miss").inc()
+
+        start = time.perf_counter()
+        result = self._inner.analyze_image(
+            prompt=prompt,
+            image_url=image_url,
+            user_input=user_input,
+            image_bytes=image_bytes,
+            mime_type=mime_type,
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if image_bytes is not None:
+            try:
+                self._cache.store(image_bytes, scope, result, elapsed_ms)
+            except Exception as e:
+                logger.warning("Vision cache store failed: %s", e)
+
+        return result
+
+    def _fetch_image(self, image_url: str) -> tuple[bytes | None, str | None]:
+        """지문 계산용 이미지 다운로드.
+
+        Returns:
+            (이미지 바이트, MIME 타입). 실패 시 (None, None) → 캐시 우회,
+            원본 어댑터가 직접 다운로드.
+        """
+        try:
+            response = self._http_client.get(image_url)
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning("Vision cache image fetch failed: %s", e)
+            SCAN_VISION_CACHE_TOTAL.labels(model=self._model, result="error").inc()
+            return None, None
+        content_type = response.headers.get("content-type", "image/jpeg")
+        return response.content, content_type.split(";")[0].strip()
+
+    def _scope(self, prompt: str, user_input: str | None) -> str:
+        key = "\0".join((self._model, prompt, user_input or ""))
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
@@ -19,6 +19,7 @@ from scan_worker.infrastructure.llm.gemini.config import (
     MAX_OUTPUT_TOKENS,
     TEMPERATURE,
 )
+from scan_worker.infrastructure.metrics import record_gemini_usage
 
 logger = logging.getLogger(__name__)
 
@@ -117,10 +118,8 @@ class GeminiLLMAdapter(LLMPort):
         )
         rag_json = json.dumps(disposal_rules, ensure_ascii=False, indent=2)
 
-        # Gemini는 시스템 프롬프트를 별도로 지원하지 않으므로 앞에 추가
-        full_prompt = f"""{system_prompt}
-
-<context id="classification">
+        # 시스템 프롬프트는 system_instruction으로 분리 (요청 간 동일 prefix → implicit caching)
+        full_prompt = f"""<context id="classification">
 {classification_json}
 </context>
 
@@ -144,6 +143,7 @@ class GeminiLLMAdapter(LLMPort):
             model=self._model,
             contents=full_prompt,
             config={
+                "system_instruction": system_prompt,
                 "response_mime_type": "application/json",
                 "response_schema": AnswerResult,
                 "max_output_tokens": MAX_OUTPUT_TOKENS,
@@ -151,6 +151,8 @@ class GeminiLLMAdapter(LLMPort):
             },
         )
 
+        record_gemini_usage(self._model, "answer", getattr(response, "usage_metadata", None))
+
         # JSON 파싱 및 Pydantic 검증
         try:
             parsed = AnswerResult.model_validate_json(response.text)
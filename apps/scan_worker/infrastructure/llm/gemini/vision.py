@@ -22,6 +22,7 @@ from scan_worker.infrastructure.llm.gemini.config import (
     MAX_OUTPUT_TOKENS,
     TEMPERATURE,
 )
+from scan_worker.infrastructure.metrics import record_gemini_usage
 
 logger = logging.getLogger(__name__)
 
@@ -114,6 +115,9 @@ class GeminiVisionAdapter(VisionModelPort):
         prompt: str,
         image_url: str,
         user_input: str | None = None,
+        *,
+        image_bytes: bytes | None = None,
+        mime_type: str | None = None,
     ) -> dict[str, Any]:
         """이미지 분석 후 분류 결과 반환.
 
@@ -121,6 +125,8 @@ class GeminiVisionAdapter(VisionModelPort):
             prompt: 시스템 프롬프트 (분류체계, 상황태그 포함)
             image_url: 분석할 이미지 URL
             user_input: 사용자 입력 텍스트 (기본: "이 폐기물을 분류해주세요.")
+            image_bytes: 이미 다운로드한 이미지 (있으면 재다운로드 안 함)
+            mime_type: image_bytes의 MIME 타입
 
         Returns:
             분류 결과 dict
@@ -130,13 +136,16 @@ class GeminiVisionAdapter(VisionModelPort):
 
         logger.debug("Vision API call starting (model=%s)", self._model)
 
-        # 이미지 다운로드
-        image_bytes, mime_type = self._fetch_image_bytes(image_url)
+        # 이미지 다운로드 (캐시 데코레이터가 이미 받은 바이트가 있으면 재사용)
+        if image_bytes is None:
+            image_bytes, mime_type = self._fetch_image_bytes(image_url)
+        mime_type = mime_type or "image/jpeg"
 
-        # 콘텐츠 구성 (이미지 + 프롬프트 + 사용자 입력)
+        # 콘텐츠 구성 (이미지 + 사용자 입력)
+        # 정적 프롬프트는 system_instruction으로 분리하여 요청 prefix 고정 (implicit caching)
         contents = [
             types.Part.from_bytes(data=image_bytes, mime_type=mime_type),
-            f"{prompt}\n\n{input_text}",
+            input_text,
         ]
 
         # Gemini 3 API 호출 (구조화 출력)
@@ -144,6 +153,7 @@ class GeminiVisionAdapter(VisionModelPort):
             model=self._model,
             contents=contents,
             config={
+                "system_instruction": prompt,
                 "response_mime_type": "application/json",
                 "response_schema": VisionResult,
                 "max_output_tokens": MAX_OUTPUT_TOKENS,
@@ -151,6 +161,8 @@ class GeminiVisionAdapter(VisionModelPort):
             },
         )
 
+        record_gemini_usage(self._model, "vision", getattr(response, "usage_metadata", None))
+
         # JSON 파싱 및 Pydantic 검증
         try:
             parsed = VisionResult.model_validate_json(response.text)
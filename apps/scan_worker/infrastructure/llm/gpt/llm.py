@@ -19,6 +19,7 @@ from scan_worker.infrastructure.llm.gpt.config import (
     OPENAI_LIMITS,
     OPENAI_TIMEOUT,
 )
+from scan_worker.infrastructure.metrics import record_openai_usage
 
 logger = logging.getLogger(__name__)
 
@@ -147,6 +148,7 @@ class GPTLLMAdapter(LLMPort):
             ],
             response_format=AnswerResult,
         )
+        record_openai_usage(self._model, "answer", getattr(response, "usage", None))
 
         parsed = response.choices[0].message.parsed
         result = parsed.model_dump()
@@ -5,6 +5,7 @@ OpenAI responses.parse API 사용 (gpt-5.1/5.2).
 
 from __future__ import annotations
 
+import base64
 import logging
 from typing import Any, List, Optional
 
@@ -18,6 +19,7 @@ from scan_worker.infrastructure.llm.gpt.config import (
     OPENAI_LIMITS,
     OPENAI_TIMEOUT,
 )
+from scan_worker.infrastructure.metrics import record_openai_usage
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +88,9 @@ class GPTVisionAdapter(VisionModelPort):
         prompt: str,
         image_url: str,
         user_input: str | None = None,
+        *,
+        image_bytes: bytes | None = None,
+        mime_type: str | None = None,
     ) -> dict[str, Any]:
         """이미지 분석 후 분류 결과 반환.
 
@@ -93,6 +98,8 @@ class GPTVisionAdapter(VisionModelPort):
             prompt: 시스템 프롬프트 (분류체계, 상황태그 포함)
             image_url: 분석할 이미지 URL
             user_input: 사용자 입력 텍스트 (기본: "이 폐기물을 분류해주세요.")
+            image_bytes: 이미 다운로드한 이미지 (있으면 data URL로 전달, OpenAI 재다운로드 없음)
+            mime_type: image_bytes의 MIME 타입
 
         Returns:
             분류 결과 dict
@@ -100,9 +107,13 @@ class GPTVisionAdapter(VisionModelPort):
         # 사용자 입력 결정
         input_text = user_input or "이 폐기물을 분류해주세요."
 
-        # 시스템 메시지 구성
+        # 시스템 메시지 구성 (요청 무관 정적 prefix → prompt caching 대상)
         system_items = [{"type": "input_text", "text": prompt}]
 
+        if image_bytes is not None:
+            encoded = base64.b64encode(image_bytes).decode("ascii")
+            image_url = f"data:{mime_type or 'image/jpeg'};base64,{encoded}"
+
         # 사용자 메시지 구성 (이미지 + 텍스트)
         content_items = [
             {"type": "input_text", "text": input_text},
@@ -113,14 +124,16 @@ class GPTVisionAdapter(VisionModelPort):
         logger.debug("Vision API call starting (model=%s)", self._model)
 
         # Vision API 호출 (responses.parse)
+        # 시스템 메시지를 맨 앞에 두어야 요청 간 prefix가 일치하여 캐시 적중
         response = self._client.responses.parse(
             model=self._model,
             input=[
-                {"role": "user", "content": content_items},
                 {"role": "system", "content": system_items},
+                {"role": "user", "content": content_items},
             ],
             text_format=VisionResult,
         )
+        record_openai_usage(self._model, "vision", getattr(response, "usage", None))
 
         parsed = response.output_parsed
         result = parsed.model_dump()
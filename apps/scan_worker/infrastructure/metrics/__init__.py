@@ -0,0 +1,25 @@
+"""Scan Worker Metrics - Prometheus 메트릭."""
+
+from .metrics import (
+    SCAN_CHARACTER_MATCH_LOCAL,
+    SCAN_LLM_CACHED_TOKEN_RATIO,
+    SCAN_LLM_CACHED_TOKENS,
+    SCAN_LLM_INPUT_TOKENS,
+    SCAN_PROMPT_RENDER_CACHE,
+    SCAN_VISION_CACHE_SAVED_SECONDS,
+    SCAN_VISION_CACHE_TOTAL,
+    record_gemini_usage,
+    record_openai_usage,
+)
+
+__all__ = [
+    "SCAN_CHARACTER_MATCH_LOCAL",
+    "SCAN_LLM_CACHED_TOKEN_RATIO",
+    "SCAN_LLM_CACHED_TOKENS",
+    "SCAN_LLM_INPUT_TOKENS",
+    "SCAN_PROMPT_RENDER_CACHE",
+    "SCAN_VISION_CACHE_SAVED_SECONDS",
+    "SCAN_VISION_CACHE_TOTAL",
+    "record_gemini_usage",
+    "record_openai_usage",
+]
@@ -0,0 +1,130 @@
+"""Scan Worker Metrics - Prometheus 메트릭 정의.
+
+라벨:
+- model: LLM 모델명 (gpt-5.2, gemini-3-flash-preview, ...)
+- stage: 파이프라인 단계 (vision, answer)
+
+Prompt caching:
+- 정적 시스템 프롬프트를 요청 앞쪽(prefix)에 두면 provider가 입력 토큰을 캐시
+- cached_tokens / input_tokens 비율로 prefix 재사용 여부 확인
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from prometheus_client import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Prompt Metrics
+# ============================================================
+
+SCAN_PROMPT_RENDER_CACHE = Counter(
+    "scan_prompt_render_cache_total",
+    "Rendered prompt cache lookups",
+    ["result"],  # hit, miss, invalidated
+)
+
+# ============================================================
+# LLM Token Metrics (Prompt Caching)
+# ============================================================
+
+SCAN_LLM_INPUT_TOKENS = Counter(
+    "scan_llm_input_tokens_total",
+    "Total LLM input tokens",
+    ["model", "stage"],
+)
+
+SCAN_LLM_CACHED_TOKENS = Counter(
+    "scan_llm_cached_input_tokens_total",
+    "LLM input tokens served from provider prompt cache",
+    ["model", "stage"],
+)
+
+SCAN_LLM_CACHED_TOKEN_RATIO = Histogram(
+    "scan_llm_cached_token_ratio",
+    "Per-call ratio of cached input tokens to input tokens",
+    ["model", "stage"],
+    buckets=(0.0, 0.1, 0.25, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0),
+)
+
+
+# ============================================================
+# Vision Result Cache Metrics
+# ============================================================
+
+SCAN_VISION_CACHE_TOTAL = Counter(
+    "scan_vision_cache_total",
+    "Vision result cache lookups",
+    ["model", "result"],  # exact, near, miss, error
+)
+
+SCAN_VISION_CACHE_SAVED_SECONDS = Counter(
+    "scan_vision_cache_saved_seconds_total",
+    "Vision model latency saved by cache hits (original call duration)",
+    ["model"],
+)
+
+
+# ============================================================
+# Character Match Metrics
+# ============================================================
+
+SCAN_CHARACTER_MATCH_LOCAL = Counter(
+    "scan_character_match_local_total",
+    "In-process character match index lookups",
+    ["result"],  # hit, default, miss (→ character.match RPC fallback)
+)
+
+
+def record_prompt_cache_usage(
+    model: str,
+    stage: str,
+    input_tokens: int,
+    cached_tokens: int,
+) -> None:
+    """입력/캐시 토큰 수 기록."""
+    if input_tokens <= 0:
+        return
+    SCAN_LLM_INPUT_TOKENS.labels(model=model, stage=stage).inc(input_tokens)
+    if cached_tokens > 0:
+        SCAN_LLM_CACHED_TOKENS.labels(model=model, stage=stage).inc(cached_tokens)
+    SCAN_LLM_CACHED_TOKEN_RATIO.labels(model=model, stage=stage).observe(
+        min(cached_tokens / input_tokens, 1.0)
+    )
+
+
+def record_openai_usage(model: str, stage: str, usage: Any) -> None:
+    """OpenAI usage 기록.
+
+    responses API: input_tokens / input_tokens_details.cached_tokens
+    chat.completions API: prompt_tokens / prompt_tokens_details.cached_tokens
+    """
+    if usage is None:
+        return
+    try:
+        if getattr(usage, "input_tokens", None) is not None:
+            input_tokens = usage.input_tokens
+            details = getattr(usage, "input_tokens_details", None)
+        else:
+            input_tokens = usage.prompt_tokens
+            details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) or 0
+        record_prompt_cache_usage(model, stage, int(input_tokens or 0), int(cached_tokens))
+    except Exception as e:
+        logger.debug("Failed to record OpenAI usage: %s", e)
+
+
+def record_gemini_usage(model: str, stage: str, usage_metadata: Any) -> None:
+    """Gemini usage_metadata 기록 (prompt_token_count / cached_content_token_count)."""
+    if usage_metadata is None:
+        return
+    try:
+        input_tokens = getattr(usage_metadata, "prompt_token_count", None) or 0
+        cached_tokens = getattr(usage_metadata, "cached_content_token_count", None) or 0
+        record_prompt_cache_usage(model, stage, int(input_tokens), int(cached_tokens))
+    except Exception as e:
+        logger.debug("Failed to record Gemini usage: %s", e)
@@ -2,6 +2,12 @@
 
 체크포인팅을 위한 Redis 기반 저장소.
 Step 완료 시 Context를 저장하여 실패 복구 지원.
+
+키 구조:
+- scan:checkpoint:{task_id} (Hash) → field: step_name, value: Context JSON
+  작업 단위 Hash 1개라 최신 Step 조회(HGETALL)/정리(DEL)가 각각 1 round-trip.
+- scan:checkpoint:{task_id}:{step_name} (String): 이전 포맷. 배포 전 저장된
+  체크포인트 복구용으로 STEP_ORDER 키만 직접 조회 (SCAN 없음).
 """
 
 from __future__ import annotations
@@ -72,13 +78,13 @@ class RedisContextStore(ContextStorePort):
             )
         return self._client
 
-    def _get_key(self, task_id: str, step_name: str) -> str:
-        """Redis 키 생성."""
-        return f"{self._key_prefix}:{task_id}:{step_name}"
+    def _get_key(self, task_id: str) -> str:
+        """작업 체크포인트 Hash 키."""
+        return f"{self._key_prefix}:{task_id}"
 
-    def _get_pattern(self, task_id: str) -> str:
-        """작업의 모든 체크포인트 패턴."""
-        return f"{self._key_prefix}:{task_id}:*"
+    def _get_legacy_key(self, task_id: str, step_name: str) -> str:
+        """이전 포맷 (Step별 String) 키."""
+        return f"{self._key_prefix}:{task_id}:{step_name}"
 
     def save_checkpoint(
         self,
@@ -86,16 +92,15 @@ class RedisContextStore(ContextStorePort):
         step_name: str,
         context: dict[str, Any],
     ) -> None:
-        """Step 완료 후 Context 저장."""
+        """Step 완료 후 Context 저장 (HSET + EXPIRE 1 round-trip)."""
         client = self._get_client()
-        key = self._get_key(task_id, step_name)
+        key = self._get_key(task_id)
 
         try:
-            client.setex(
-                key,
-                self._ttl,
-                json.dumps(context, ensure_ascii=False),
-            )
+            pipe = client.pipeline(transaction=False)
+            pipe.hset(key, step_name, json.dumps(context, ensure_ascii=False))
+            pipe.expire(key, self._ttl)
+            pipe.execute()
             logger.debug(
                 "checkpoint_saved",
                 extra={
@@ -122,10 +127,11 @@ class RedisContextStore(ContextStorePort):
     ) -> dict[str, Any] | None:
         """저장된 체크포인트 조회."""
         client = self._get_client()
-        key = self._get_key(task_id, step_name)
 
         try:
-            data = client.get(key)
+            data = client.hget(self._get_key(task_id), step_name)
+            if data is None:
+                data = client.get(self._get_legacy_key(task_id, step_name))
             if data:
                 logger.debug(
                     "checkpoint_found",
@@ -147,38 +153,26 @@ class RedisContextStore(ContextStorePort):
         self,
         task_id: str,
     ) -> tuple[str, dict[str, Any]] | None:
-        """가장 최근 체크포인트 조회."""
+        """가장 최근 체크포인트 조회 (HGETALL 1회, 없으면 이전 포맷 MGET 1회)."""
         client = self._get_client()
-        pattern = self._get_pattern(task_id)
 
         try:
-            keys = list(client.scan_iter(match=pattern, count=100))
-            if not keys:
+            checkpoints = client.hgetall(self._get_key(task_id))
+            if not checkpoints:
+                legacy_keys = [self._get_legacy_key(task_id, step) for step in STEP_ORDER]
+                checkpoints = {
+                    step: data for step, data in zip(STEP_ORDER, client.mget(legacy_keys)) if data
+                }
+            if not checkpoints:
                 return None
 
-            # Step 순서로 정렬하여 가장 마지막 것 찾기
-            latest_step = None
-            latest_order = -1
-            latest_ctx = None
-
-            for key in keys:
-                # scan:checkpoint:{task_id}:{step_name}
-                step_name = key.split(":")[-1]
-                order = STEP_ORDER.get(step_name, 0)
-
-                if order > latest_order:
-                    data = client.get(key)
-                    if data:
-                        latest_step = step_name
-                        latest_order = order
-                        latest_ctx = json.loads(data)
-
-            if latest_step and latest_ctx:
-                logger.info(
-                    "latest_checkpoint_found",
-                    extra={"task_id": task_id, "step": latest_step},
-                )
-                return (latest_step, latest_ctx)
+            # Step 순서로 가장 마지막 것 선택
+            latest_step = max(checkpoints, key=lambda step: STEP_ORDER.get(step, 0))
+            logger.info(
+                "latest_checkpoint_found",
+                extra={"task_id": task_id, "step": latest_step},
+            )
+            return (latest_step, json.loads(checkpoints[latest_step]))
 
         except Exception as e:
             logger.warning(
@@ -188,18 +182,17 @@ class RedisContextStore(ContextStorePort):
         return None
 
     def clear_checkpoints(self, task_id: str) -> None:
-        """작업의 모든 체크포인트 삭제."""
+        """작업의 모든 체크포인트 삭제 (Hash + 이전 포맷 키 DEL 1회)."""
         client = self._get_client()
-        pattern = self._get_pattern(task_id)
+        keys = [self._get_key(task_id)]
+        keys.extend(self._get_legacy_key(task_id, step) for step in STEP_ORDER)
 
         try:
-            keys = list(client.scan_iter(match=pattern, count=100))
-            if keys:
-                client.delete(*keys)
-                logger.debug(
-                    "checkpoints_cleared",
-                    extra={"task_id": task_id, "count": len(keys)},
-                )
+            count = client.delete(*keys)
+            logger.debug(
+                "checkpoints_cleared",
+                extra={"task_id": task_id, "count": count},
+            )
         except Exception as e:
             logger.warning(
                 "checkpoints_clear_failed",
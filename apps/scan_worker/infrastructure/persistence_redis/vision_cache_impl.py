@@ -0,0 +1,249 @@
+"""Redis Vision Cache - VisionCachePort 구현체.
+
+이미지 지문(fingerprint) 기반 Vision 결과 캐시.
+
+지문:
+- exact: 이미지 바이트 SHA-256 (재시도, 같은 파일 재업로드)
+- near: 64bit dHash (재인코딩/리사이즈/거의 같은 사진). Pillow 필요 (없으면 비활성)
+
+Redis 키 구조:
+- scan:vision_cache:exact:{scope}:{sha256}  → 결과 JSON (TTL)
+- scan:vision_cache:near:{scope}:{dhash}    → 결과 JSON (TTL)
+- scan:vision_cache:band:{scope}:{i}:{band} → dHash ZSET (16bit band 4개, 후보 검색용,
+                                               score=엔트리 만료 시각)
+- scan:vision_cache:lru                      → 엔트리 키 ZSET (score=마지막 저장/적중 시각)
+
+크기 제한: ZSET 크기가 max_entries를 넘으면 가장 오래 사용되지 않은 엔트리부터 삭제.
+band 정리: 저장 시 해당 band의 만료 멤버 삭제 (TTL), LRU 삭제 시 같은 dHash 멤버 삭제.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import time
+from typing import Any
+
+import redis
+
+from scan_worker.application.classify.ports.vision_cache import (
+    VisionCacheHit,
+    VisionCachePort,
+)
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow 미설치 시 near 매칭 비활성
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "scan:vision_cache"
+LRU_KEY = f"{KEY_PREFIX}:lru"
+
+# dHash 64bit → 16bit band 4개 (hamming 거리 ≤ 3이면 최소 1개 band 일치 보장)
+DHASH_BANDS = 4
+DHASH_BAND_BITS = 16
+
+DEFAULT_VISION_CACHE_TTL = 6 * 3600
+DEFAULT_VISION_CACHE_MAX_ENTRIES = 50_000
+DEFAULT_NEAR_MAX_DISTANCE = 3
+
+
+def compute_dhash(image_bytes: bytes) -> int | None:
+    """64bit difference hash 계산.
+
+    9x8 grayscale 축소 후 가로 인접 픽셀 밝기 비교.
+    디코딩 실패 또는 Pillow 미설치 시 None.
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            # JPEG은 draft 모드로 축소 디코딩 (전체 해상도 디코딩 회피)
+            img.draft("L", (64, 64))
+            pixels = img.convert("L").resize((9, 8), Image.BILINEAR).tobytes()
+    except Exception as e:
+        logger.debug("dHash failed: %s", e)
+        return None
+
+    value = 0
+    for row in range(8):
+        offset = row * 9
+        for col in range(8):
+            value = (value << 1) | (pixels[offset + col] < pixels[offset + col + 1])
+    return value
+
+
+def _bands(dhash: int) -> list[str]:
+    mask = (1 << DHASH_BAND_BITS) - 1
+    return [f"{(dhash >> (i * DHASH_BAND_BITS)) & mask:04x}" for i in range(DHASH_BANDS)]
+
+
+class RedisVisionCache(VisionCachePort):
+    """Redis 기반 Vision 결과 캐시 구현체."""
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        ttl: int = DEFAULT_VISION_CACHE_TTL,
+        max_entries: int = DEFAULT_VISION_CACHE_MAX_ENTRIES,
+        near_enabled: bool = False,
+        near_max_distance: int = DEFAULT_NEAR_MAX_DISTANCE,
+    ):
+        """초기화.
+
+        Args:
+            redis_url: Redis URL (None이면 환경변수 사용)
+            ttl: 엔트리 TTL (초)
+            max_entries: 최대 엔트리 수 (초과 시 LRU 순 삭제)
+            near_enabled: perceptual hash 근접 매칭 사용 여부 (기본 False, 사용자 간 공유 캐시)
+            near_max_distance: 근접 매칭 최대 hamming 거리 (0~64)
+        """
+        self._redis_url = redis_url or os.environ.get(
+            "REDIS_CACHE_URL",
+            "redis://rfr-cache-redis.redis.svc.cluster.local:6379/0",
+        )
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._near_enabled = near_enabled and Image is not None
+        self._near_max_distance = near_max_distance
+        self._client: redis.Redis | None = None
+        logger.info(
+            "RedisVisionCache initialized (ttl=%d, max_entries=%d, near=%s)",
+            ttl,
+            max_entries,
+            self._near_enabled,
+        )
+
+    def _get_client(self) -> redis.Redis:
+        """Lazy Redis 클라이언트 생성."""
+        if self._client is None:
+            self._client = redis.from_url(
+                self._redis_url,
+                decode_responses=True,
+                socket_timeout=5.0,
+                socket_connect_timeout=5.0,
+            )
+        return self._client
+
+    def lookup(self, image_bytes: bytes, scope: str) -> VisionCacheHit | None:
+        """이미지 지문으로 캐시 조회 (exact → near 순)."""
+        client = self._get_client()
+        digest = hashlib.sha256(image_bytes).hexdigest()
+
+        exact_key = f"{KEY_PREFIX}:exact:{scope}:{digest}"
+        data = client.get(exact_key)
+        if data:
+            self._touch(client, exact_key)
+            return self._to_hit(data, "exact")
+
+        if not self._near_enabled:
+            return None
+        dhash = compute_dhash(image_bytes)
+        if dhash is None:
+            return None
+
+        candidates = self._near_candidates(client, scope, dhash)
+        if not candidates:
+            return None
+        # 가까운 순으로 조회, 삭제된 엔트리는 건너뜀
+        near_keys = [f"{KEY_PREFIX}:near:{scope}:{value:016x}" for value in candidates]
+        for near_key, data in zip(near_keys, client.mget(near_keys)):
+            if data:
+                self._touch(client, near_key)
+                return self._to_hit(data, "near")
+        return None
+
+    def store(
+        self,
+        image_bytes: bytes,
+        scope: str,
+        result: dict[str, Any],
+        elapsed_ms: float,
+    ) -> None:
+        """Vision 결과 저장 + 크기 제한 적용."""
+        client = self._get_client()
+        payload = json.dumps({"result": result, "elapsed_ms": elapsed_ms}, ensure_ascii=False)
+        now = time.time()
+
+        entry_keys = [f"{KEY_PREFIX}:exact:{scope}:{hashlib.sha256(image_bytes).hexdigest()}"]
+        pipe = client.pipeline(transaction=False)
+        pipe.set(entry_keys[0], payload, ex=self._ttl)
+
+        dhash = compute_dhash(image_bytes) if self._near_enabled else None
+        if dhash is not None:
+            near_key = f"{KEY_PREFIX}:near:{scope}:{dhash:016x}"
+            entry_keys.append(near_key)
+            pipe.set(near_key, payload, ex=self._ttl)
+            for band_key in self._band_keys(scope, dhash):
+                # 멤버 score = 엔트리 만료 시각 → TTL 만료 멤버는 저장 시 함께 정리
+                pipe.zadd(band_key, {f"{dhash:016x}": now + self._ttl})
+                pipe.zremrangebyscore(band_key, "-inf", now)
+                pipe.expire(band_key, self._ttl)
+
+        pipe.zadd(LRU_KEY, {key: now for key in entry_keys})
+        pipe.zcard(LRU_KEY)
+        size = pipe.execute()[-1]
+
+        if size > self._max_entries:
+            self._evict(client, size - self._max_entries)
+
+    def _near_candidates(self, client: redis.Redis, scope: str, dhash: int) -> list[int]:
+        """band 후보 중 max_distance 이내 dHash를 hamming 거리 순으로 반환."""
+        now = time.time()
+        pipe = client.pipeline(transaction=False)
+        for band_key in self._band_keys(scope, dhash):
+            pipe.zrangebyscore(band_key, now, "+inf")
+        members = set().union(*pipe.execute())
+
+        scored = []
+        for member in members:
+            value = int(member, 16)
+            distance = (value ^ dhash).bit_count()
+            if distance <= self._near_max_distance:
+                scored.append((distance, value))
+        return [value for _, value in sorted(scored)]
+
+    @staticmethod
+    def _band_keys(scope: str, dhash: int) -> list[str]:
+        return [f"{KEY_PREFIX}:band:{scope}:{i}:{band}" for i, band in enumerate(_bands(dhash))]
+
+    @staticmethod
+    def _touch(client: redis.Redis, key: str) -> None:
+        """적중 엔트리의 LRU 시각 갱신 (이미 삭제된 키는 추가하지 않음)."""
+        client.zadd(LRU_KEY, {key: time.time()}, xx=True)
+
+    def _evict(self, client: redis.Redis, count: int) -> None:
+        """오래된 엔트리 삭제 (near 엔트리는 band 멤버도 함께 삭제)."""
+        evicted = [key for key, _ in client.zpopmin(LRU_KEY, count)]
+        if not evicted:
+            return
+
+        pipe = client.pipeline(transaction=False)
+        pipe.delete(*evicted)
+        near_prefix = f"{KEY_PREFIX}:near:"
+        for key in evicted:
+            if not key.startswith(near_prefix):
+                continue
+            scope, _, member = key[len(near_prefix) :].rpartition(":")
+            try:
+                dhash = int(member, 16)
+            except ValueError:
+                continue
+            for band_key in self._band_keys(scope, dhash):
+                pipe.zrem(band_key, member)
+        pipe.execute()
+        logger.debug("Vision cache evicted (count=%d)", len(evicted))
+
+    @staticmethod
+    def _to_hit(data: str, match: str) -> VisionCacheHit:
+        entry = json.loads(data)
+        return VisionCacheHit(
+            result=entry["result"],
+            match=match,
+            elapsed_ms=float(entry.get("elapsed_ms", 0.0)),
+        )
@@ -7,6 +7,7 @@ Clean Architecture:
 """
 
 from scan_worker.presentation.tasks.answer_task import answer_task
+from scan_worker.presentation.tasks.pipeline_task import pipeline_task
 from scan_worker.presentation.tasks.reward_task import reward_task
 from scan_worker.presentation.tasks.rule_task import rule_task
 from scan_worker.presentation.tasks.vision_task import vision_task
@@ -16,4 +17,5 @@ __all__ = [
     "rule_task",
     "answer_task",
     "reward_task",
+    "pipeline_task",
 ]
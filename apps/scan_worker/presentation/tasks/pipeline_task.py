@@ -0,0 +1,127 @@
+"""Pipeline Task - 전체 파이프라인 단일 Task 실행 (fused 모드).
+
+Chain 모드(scan.vision → scan.rule → scan.answer → scan.reward)와 같은 Step을
+하나의 Task에서 순서대로 실행. Step 간 브로커 왕복/직렬화 없음.
+
+진입 큐는 scan.vision 공유 (Topology/KEDA 설정 변경 없음).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from celery import Task
+
+from scan_worker.setup.celery import celery_app
+from scan_worker.setup.dependencies import (
+    create_context,
+    get_fused_pipeline_runner,
+    get_pipeline_steps,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    bind=True,
+    name="scan.pipeline",
+    queue="scan.vision",
+    max_retries=2,
+    soft_time_limit=150,
+    time_limit=210,
+    default_retry_delay=1,
+)
+def pipeline_task(
+    self: Task,
+    task_id: str,
+    user_id: str,
+    image_url: str,
+    user_input: str | None = None,
+    model: str | None = None,
+) -> dict[str, Any]:
+    """전체 파이프라인 태스크 (vision → rule → answer → reward).
+
+    재시도 시 최신 체크포인트 이후 Step부터 재개 (vision/answer LLM 재호출 방지).
+
+    Args:
+        task_id: 작업 ID (UUID)
+        user_id: 사용자 ID
+        image_url: 이미지 URL
+        user_input: 사용자 입력
+        model: LLM 모델명 (None이면 기본값 사용)
+
+    Returns:
+        최종 파이프라인 결과
+    """
+    log_ctx = {
+        "task_id": task_id,
+        "user_id": user_id,
+        "celery_task_id": self.request.id,
+        "stage": "pipeline",
+        "model": model,
+        "retries": self.request.retries,
+    }
+    logger.info("Pipeline task started", extra=log_ctx)
+
+    ctx = create_context(
+        task_id=task_id,
+        user_id=user_id,
+        image_url=image_url,
+        user_input=user_input,
+        model=model,
+    )
+
+    try:
+        steps = get_pipeline_steps(celery_app, model)
+        runner = get_fused_pipeline_runner()
+
+        ctx = runner.run(steps, ctx, resume=self.request.retries > 0)
+
+    except Exception as exc:
+        logger.error(
+            "Pipeline processing failed",
+            extra={**log_ctx, "error": str(exc)},
+            exc_info=True,
+        )
+        # Exponential backoff: 1s, 2s
+        countdown = 2**self.request.retries
+        raise self.retry(exc=exc, countdown=countdown)
+
+    logger.info(
+        "scan_task_completed",
+        extra={
+            "event_type": "scan_completed",
+            "task_id": ctx.task_id,
+            "user_id": ctx.user_id,
+            "pipeline_mode": "fused",
+            "category": (
+                ctx.classification.get("classification", {}).get("major_category")
+                if ctx.classification
+                else None
+            ),
+            "duration_total_ms": ctx.latencies.get("duration_total_ms"),
+            "duration_vision_ms": ctx.latencies.get("duration_vision_ms"),
+            "duration_rule_ms": ctx.latencies.get("duration_rule_ms"),
+            "duration_answer_ms": ctx.latencies.get("duration_answer_ms"),
+            "has_disposal_rules": ctx.disposal_rules is not None,
+            "has_reward": ctx.reward is not None,
+            "matched_character": ctx.reward.get("name") if ctx.reward else None,
+        },
+    )
+
+    # [Legacy] 커스텀 이벤트 발행 (Celery Events 방식)
+    try:
+        self.send_event(
+            "task-result",
+            result=ctx.to_dict(),
+            task_id=ctx.task_id,
+            root_id=ctx.task_id,
+        )
+    except Exception as e:
+        logger.warning(
+            "task_result_event_failed",
+            extra={"task_id": ctx.task_id, "error": str(e)},
+        )
+
+    return ctx.to_dict()
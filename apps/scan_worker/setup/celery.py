@@ -26,6 +26,8 @@ SCAN_TASK_ROUTES = {
     "scan.rule": {"queue": "scan.rule"},
     "scan.answer": {"queue": "scan.answer"},
     "scan.reward": {"queue": "scan.reward"},
+    # fused 모드: 전체 Chain을 Task 1개로 실행 (진입 큐 공유 → Topology/KEDA 변경 없음)
+    "scan.pipeline": {"queue": "scan.vision"},
 }
 
 # 소비할 큐 정의 (이름만, arguments 없음 → Topology CR 정의 사용)
@@ -179,6 +181,21 @@ def init_worker_resources(sender: Any, **kwargs: Any) -> None:
     # 1. OpenTelemetry Celery 트레이싱 설정
     _setup_celery_tracing()
 
+    # 2. 캐릭터 매칭 인덱스 동기화 (character.cache fanout 구독)
+    if settings.character_match_local_enabled:
+        from scan_worker.infrastructure.character import start_character_cache_consumer
+        from scan_worker.setup.dependencies import get_character_matcher
+
+        start_character_cache_consumer(settings.celery_broker_url, get_character_matcher())
+
+    # 3. Prometheus 메트릭 서버 (prompt cache / 토큰 메트릭)
+    metrics_port = settings.metrics_port
+    if metrics_port:
+        from prometheus_client import start_http_server
+
+        start_http_server(metrics_port)
+        logger.info("Metrics server started (port=%d)", metrics_port)
+
     logger.info("scan_worker_initialized")
 
 
@@ -188,4 +205,7 @@ def shutdown_worker_resources(sender: Any, **kwargs: Any) -> None:
 
     ⚠️ domains 의존성 제거됨
     """
+    from scan_worker.infrastructure.character import stop_character_cache_consumer
+
+    stop_character_cache_consumer()
     logger.info("scan_worker_shutdown")
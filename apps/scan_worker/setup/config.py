@@ -101,8 +101,68 @@ class Settings(BaseSettings):
         description="character.match task 대기 타임아웃 (초)",
     )
 
+    # === Vision Result Cache ===
+    vision_cache_enabled: bool = Field(
+        True,
+        description="이미지 지문 기반 Vision 결과 캐시 사용 여부",
+    )
+    vision_cache_ttl: int = Field(
+        6 * 3600,
+        ge=60,
+        description="Vision 결과 캐시 TTL (초)",
+    )
+    vision_cache_max_entries: int = Field(
+        50_000,
+        ge=1,
+        description="Vision 결과 캐시 최대 엔트리 수 (초과 시 LRU 순 삭제)",
+    )
+    vision_cache_near_enabled: bool = Field(
+        False,
+        description=(
+            "perceptual hash(dHash) 근접 매칭 사용 여부 (Pillow 필요). "
+            "캐시는 사용자 간 공유되므로 기본은 정확 일치(digest)만 사용"
+        ),
+    )
+    vision_cache_near_max_distance: int = Field(
+        3,
+        ge=0,
+        le=16,
+        description="근접 매칭 최대 hamming 거리 (64bit dHash 기준)",
+    )
+
     # === Reward ===
     reward_enabled: bool = Field(True, description="Enable reward feature")
+    character_match_local_enabled: bool = Field(
+        True,
+        description="로컬 match_label 인덱스로 캐릭터 매칭 (character.cache 이벤트 동기화, RPC는 fallback)",
+    )
+    character_default_code: str = Field(
+        "char-eco",
+        description="매칭 라벨이 없을 때 기본 캐릭터 코드 (character-worker와 동일해야 함)",
+    )
+    character_match_learned_ttl: int = Field(
+        600,
+        ge=0,
+        description="RPC 응답으로 학습한 매칭 항목 유효 시간 (초)",
+    )
+
+    # === Fused Pipeline (scan.pipeline) ===
+    fused_checkpoint_steps_str: str = Field(
+        "vision,answer",
+        description="fused 모드에서 체크포인트를 저장할 Step (쉼표 구분, LLM 호출 경계)",
+    )
+    fused_speculative_enabled: bool = Field(
+        True,
+        description="fused 모드 speculative 실행 (vision 직후 reward 캐릭터 매칭을 answer와 병렬 시작)",
+    )
+
+    # === Metrics ===
+    metrics_port: int = Field(
+        0,
+        ge=0,
+        le=65535,
+        description="Prometheus 메트릭 HTTP 포트 (0이면 비활성화)",
+    )
 
     # === Resources ===
     @property
@@ -113,6 +173,13 @@ class Settings(BaseSettings):
         """
         return str(Path(__file__).parent.parent / "infrastructure" / "assets")
 
+    @property
+    def fused_checkpoint_steps(self) -> frozenset[str]:
+        """fused 모드 체크포인트 Step 집합."""
+        return frozenset(
+            step.strip() for step in self.fused_checkpoint_steps_str.split(",") if step.strip()
+        )
+
     # ==========================================
     # Public Methods (명시적 매핑 기반)
     # ==========================================
@@ -12,9 +12,13 @@ from typing import TYPE_CHECKING
 from scan_worker.application.classify.commands.execute_pipeline import (
     CheckpointingStepRunner,
     ClassifyPipeline,
+    FusedPipelineRunner,
     SingleStepRunner,
 )
 from scan_worker.application.classify.dto.classify_context import ClassifyContext
+from scan_worker.application.classify.ports.character_matcher import (
+    CharacterMatcherPort,
+)
 from scan_worker.application.classify.ports.context_store import ContextStorePort
 from scan_worker.application.classify.ports.event_publisher import (
     EventPublisherPort,
@@ -25,22 +29,29 @@ from scan_worker.application.classify.ports.prompt_repository import (
 )
 from scan_worker.application.classify.ports.result_cache import ResultCachePort
 from scan_worker.application.classify.ports.retriever import RetrieverPort
+from scan_worker.application.classify.ports.vision_cache import VisionCachePort
 from scan_worker.application.classify.ports.vision_model import VisionModelPort
 from scan_worker.application.classify.steps.answer_step import AnswerStep
 from scan_worker.application.classify.steps.reward_step import RewardStep
 from scan_worker.application.classify.steps.rule_step import RuleStep
 from scan_worker.application.classify.steps.vision_step import VisionStep
+from scan_worker.application.common.step_interface import Step
 from scan_worker.infrastructure.asset_loader.prompt_repository_impl import (
     FilePromptRepository,
 )
+from scan_worker.infrastructure.character import CharacterMatchIndex
 from scan_worker.infrastructure.llm import (
+    CachedVisionAdapter,
     GeminiLLMAdapter,
     GeminiVisionAdapter,
     GPTLLMAdapter,
     GPTVisionAdapter,
 )
 from scan_worker.infrastructure.event_bus import RedisEventPublisher
-from scan_worker.infrastructure.persistence_redis import RedisResultCache
+from scan_worker.infrastructure.persistence_redis import (
+    RedisResultCache,
+    RedisVisionCache,
+)
 from scan_worker.infrastructure.retrievers.json_regulation import (
     JsonRegulationRetriever,
 )
@@ -89,6 +100,29 @@ def get_result_cache() -> ResultCachePort:
     )
 
 
+@lru_cache
+def get_vision_cache() -> VisionCachePort:
+    """VisionCache 싱글톤 (이미지 지문 기반 Vision 결과 캐시)."""
+    settings = get_settings()
+    return RedisVisionCache(
+        redis_url=settings.redis_cache_url,
+        ttl=settings.vision_cache_ttl,
+        max_entries=settings.vision_cache_max_entries,
+        near_enabled=settings.vision_cache_near_enabled,
+        near_max_distance=settings.vision_cache_near_max_distance,
+    )
+
+
+@lru_cache
+def get_character_matcher() -> CharacterMatcherPort:
+    """CharacterMatcher 싱글톤 (character.cache 이벤트로 동기화)."""
+    settings = get_settings()
+    return CharacterMatchIndex(
+        default_code=settings.character_default_code,
+        learned_ttl=settings.character_match_learned_ttl,
+    )
+
+
 @lru_cache
 def get_context_store() -> ContextStorePort:
     """ContextStore 싱글톤 (체크포인팅)."""
@@ -142,9 +176,14 @@ def get_vision_model(model: str | None = None) -> VisionModelPort:
     api_key = settings.get_api_key(provider)
 
     if provider == "google":
-        return GeminiVisionAdapter(model=model, api_key=api_key)
-    # 기본: GPT
-    return GPTVisionAdapter(model=model, api_key=api_key)
+        vision: VisionModelPort = GeminiVisionAdapter(model=model, api_key=api_key)
+    else:
+        # 기본: GPT
+        vision = GPTVisionAdapter(model=model, api_key=api_key)
+
+    if settings.vision_cache_enabled:
+        return CachedVisionAdapter(inner=vision, cache=get_vision_cache(), model=model)
+    return vision
 
 
 def get_llm(model: str | None = None) -> LLMPort:
@@ -225,10 +264,14 @@ def get_reward_step(celery_app: "Celery") -> RewardStep:
     Returns:
         RewardStep 인스턴스
     """
+    settings = get_settings()
     return RewardStep(
         celery_app=celery_app,
         event_publisher=get_event_publisher(),
         result_cache=get_result_cache(),
+        character_matcher=(
+            get_character_matcher() if settings.character_match_local_enabled else None
+        ),
     )
 
 
@@ -260,28 +303,53 @@ def get_checkpointing_step_runner(
     )
 
 
-def create_classify_pipeline(
+def get_fused_pipeline_runner() -> FusedPipelineRunner:
+    """FusedPipelineRunner 생성 (scan.pipeline 단일 Task 실행)."""
+    settings = get_settings()
+    return FusedPipelineRunner(
+        event_publisher=get_event_publisher(),
+        context_store=get_context_store(),
+        checkpoint_steps=settings.fused_checkpoint_steps,
+        speculative=settings.fused_speculative_enabled,
+    )
+
+
+def get_pipeline_steps(
     celery_app: "Celery",
     model: str | None = None,
-) -> ClassifyPipeline:
-    """ClassifyPipeline 생성 - 전체 DI 조립.
+) -> list[tuple[str, Step]]:
+    """전체 Step 목록 (vision → rule → answer → reward).
 
     Args:
         celery_app: Celery 앱 인스턴스
         model: 모델명 (None이면 기본값 사용)
 
     Returns:
-        ClassifyPipeline 인스턴스
+        [(name, step), ...]
     """
-    steps = [
+    return [
         ("vision", get_vision_step(model)),
         ("rule", get_rule_step()),
         ("answer", get_answer_step(model)),
         ("reward", get_reward_step(celery_app)),
     ]
 
+
+def create_classify_pipeline(
+    celery_app: "Celery",
+    model: str | None = None,
+) -> ClassifyPipeline:
+    """ClassifyPipeline 생성 - 전체 DI 조립.
+
+    Args:
+        celery_app: Celery 앱 인스턴스
+        model: 모델명 (None이면 기본값 사용)
+
+    Returns:
+        ClassifyPipeline 인스턴스
+    """
     return ClassifyPipeline(
-        steps=steps,
+        steps=get_pipeline_steps(celery_app, model),
         event_publisher=get_event_publisher(),
     )
 
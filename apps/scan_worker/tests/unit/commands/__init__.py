@@ -0,0 +1 @@
+"""Command Unit Tests."""
@@ -0,0 +1,198 @@
+"""FusedPipelineRunner Unit Tests."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from scan_worker.application.classify.commands import FusedPipelineRunner
+from scan_worker.application.classify.dto.classify_context import ClassifyContext
+from scan_worker.application.common.step_interface import SpeculativeStep
+
+STEP_NAMES = ["vision", "rule", "answer", "reward"]
+
+
+@pytest.fixture
+def ctx() -> ClassifyContext:
+    return ClassifyContext(
+        task_id="test-task-001",
+        user_id="00000000-0000-0000-0000-000000000001",
+        image_url="https://example.com/image.jpg",
+    )
+
+
+def _steps(fail_at: str | None = None) -> list[tuple[str, MagicMock]]:
+    steps = []
+    for name in STEP_NAMES:
+        step = MagicMock()
+        if name == fail_at:
+            step.run.side_effect = RuntimeError(f"{name} failed")
+        else:
+            step.run.side_effect = lambda c: c
+        steps.append((name, step))
+    return steps
+
+
+def _runner(
+    store: MagicMock | None = None,
+    checkpoint_steps=frozenset({"vision", "answer"}),
+    speculative: bool = False,
+):
+    publisher = MagicMock()
+    store = store or MagicMock()
+    runner = FusedPipelineRunner(publisher, store, checkpoint_steps, speculative=speculative)
+    return runner, publisher, store
+
+
+class PrefetchStep(SpeculativeStep):
+    """answer 실행 중에 prefetch가 끝나야 진행되는 reward 대역."""
+
+    def __init__(self, answer_running: threading.Event):
+        self.answer_running = answer_running
+        self.prefetch_ctx = None
+        self.prefetched = None
+        self.run_called = False
+
+    def prefetch(self, ctx):
+        self.prefetch_ctx = ctx
+        assert self.answer_running.wait(timeout=5)
+        return {"name": "페트"}
+
+    def run(self, ctx):
+        self.run_called = True
+        return ctx
+
+    def run_prefetched(self, ctx, prefetched):
+        self.prefetched = prefetched
+        ctx.reward = prefetched
+        return ctx
+
+
+class TestFusedPipelineRunner:
+    """단일 Task 전체 Step 실행."""
+
+    def test_runs_all_steps_and_checkpoints_boundaries_only(self, ctx):
+        runner, publisher, store = _runner()
+        steps = _steps()
+
+        runner.run(steps, ctx)
+
+        assert all(step.run.call_count == 1 for _, step in steps)
+        saved = [c.args[1] for c in store.save_checkpoint.call_args_list]
+        assert saved == ["vision", "answer"]
+        statuses = [
+            (c.kwargs["stage"], c.kwargs["status"])
+            for c in publisher.publish_stage_event.call_args_list
+        ]
+        assert statuses == [(n, s) for n in STEP_NAMES for s in ("started", "completed")]
+
+    def test_checkpoint_steps_none_saves_every_step(self, ctx):
+        runner, _, store = _runner(checkpoint_steps=None)
+
+        runner.run(_steps(), ctx)
+
+        assert store.save_checkpoint.call_count == 4
+
+    def test_failure_publishes_failed_event_and_raises(self, ctx):
+        runner, publisher, store = _runner()
+        steps = _steps(fail_at="answer")
+
+        with pytest.raises(RuntimeError, match="answer failed"):
+            runner.run(steps, ctx)
+
+        last = publisher.publish_stage_event.call_args.kwargs
+        assert (last["stage"], last["status"]) == ("answer", "failed")
+        assert steps[3][1].run.call_count == 0
+        assert [c.args[1] for c in store.save_checkpoint.call_args_list] == ["vision"]
+
+    def test_resume_skips_checkpointed_steps(self, ctx):
+        store = MagicMock()
+        restored = ClassifyContext(
+            task_id=ctx.task_id,
+            user_id=ctx.user_id,
+            image_url=ctx.image_url,
+            classification={"classification": {"major_category": "재활용폐기물"}},
+        )
+        store.get_latest_checkpoint.return_value = ("vision", restored.to_dict())
+        runner, _, _ = _runner(store)
+        steps = _steps()
+
+        result = runner.run(steps, ctx, resume=True)
+
+        assert steps[0][1].run.call_count == 0
+        assert all(step.run.call_count == 1 for _, step in steps[1:])
+        assert result.classification == restored.classification
+
+    def test_resume_without_checkpoint_starts_from_first_step(self, ctx):
+        store = MagicMock()
+        store.get_latest_checkpoint.return_value = None
+        runner, _, _ = _runner(store)
+        steps = _steps()
+
+        runner.run(steps, ctx, resume=True)
+
+        assert all(step.run.call_count == 1 for _, step in steps)
+
+
+class TestSpeculativePrefetch:
+    """vision 직후 SpeculativeStep prefetch 선행 실행."""
+
+    def _speculative_steps(self):
+        answer_running = threading.Event()
+        reward = PrefetchStep(answer_running)
+        steps = _steps()
+
+        def answer(c):
+            answer_running.set()
+            return c
+
+        steps[2][1].run.side_effect = answer
+        steps[3] = ("reward", reward)
+        return steps, reward
+
+    def test_prefetch_overlaps_answer_and_result_is_used(self, ctx):
+        runner, publisher, _ = _runner(speculative=True)
+        steps, reward = self._speculative_steps()
+
+        result = runner.run(steps, ctx)
+
+        assert reward.prefetched == {"name": "페트"}
+        assert not reward.run_called
+        assert result.reward == {"name": "페트"}
+        # prefetch는 vision 시점 사본 사용 (rule/answer 결과와 독립)
+        assert reward.prefetch_ctx is not result
+        stages = [c.kwargs["stage"] for c in publisher.publish_stage_event.call_args_list]
+        assert stages == [n for n in STEP_NAMES for _ in range(2)]
+
+    def test_prefetch_failure_falls_back_to_run(self, ctx):
+        runner, _, _ = _runner(speculative=True)
+        steps, reward = self._speculative_steps()
+        reward.prefetch = MagicMock(side_effect=RuntimeError("rpc down"))
+
+        runner.run(steps, ctx)
+
+        assert reward.run_called
+        assert reward.prefetched is None
+
+    def test_disabled_runs_steps_normally(self, ctx):
+        runner, _, _ = _runner(speculative=False)
+        reward = PrefetchStep(threading.Event())
+        steps = _steps()
+        steps[3] = ("reward", reward)
+
+        runner.run(steps, ctx)
+
+        assert reward.run_called
+        assert reward.prefetch_ctx is None
+
+    def test_resume_after_vision_starts_prefetch(self, ctx):
+        store = MagicMock()
+        store.get_latest_checkpoint.return_value = ("vision", ctx.to_dict())
+        runner, _, _ = _runner(store, speculative=True)
+        steps, reward = self._speculative_steps()
+
+        runner.run(steps, ctx, resume=True)
+
+        assert reward.prefetched == {"name": "페트"}
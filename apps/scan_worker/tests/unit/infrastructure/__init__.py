@@ -0,0 +1 @@
+"""Infrastructure Unit Tests."""
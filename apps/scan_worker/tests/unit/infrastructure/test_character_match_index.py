@@ -0,0 +1,85 @@
+"""CharacterMatchIndex Unit Tests."""
+
+from __future__ import annotations
+
+from scan_worker.infrastructure.character import CharacterMatchIndex
+
+PET = {
+    "id": "11111111-1111-1111-1111-111111111111",
+    "code": "char-pet",
+    "name": "페트",
+    "type_label": "플라스틱",
+    "dialog": "깨끗하게 헹궈줘!",
+    "match_label": "무색페트병",
+}
+ECO = {
+    "id": "22222222-2222-2222-2222-222222222222",
+    "code": "char-eco",
+    "name": "이코",
+    "type_label": "기본",
+    "dialog": "고마워!",
+    "match_label": "기타",
+}
+RPC_REWARD = {
+    "name": "페트",
+    "dialog": "깨끗하게 헹궈줘!",
+    "match_reason": "무색페트병",
+    "type": "플라스틱",
+    "character_id": PET["id"],
+    "character_code": "char-pet",
+    "received": True,
+}
+
+
+class TestCharacterMatchIndex:
+    """match_label 인덱스 테스트."""
+
+    def test_unknown_before_full_refresh(self):
+        """full_refresh 전 모르는 라벨은 None (RPC fallback)."""
+        index = CharacterMatchIndex()
+
+        assert index.match("무색페트병") is None
+
+    def test_full_refresh_match_and_default(self):
+        """full_refresh 후 라벨 매칭, 없는 라벨은 기본 캐릭터."""
+        index = CharacterMatchIndex(default_code="char-eco")
+        index.apply_event({"type": "full_refresh", "characters": [PET, ECO]})
+
+        assert index.match("무색페트병")["code"] == "char-pet"
+        assert index.match("유리병")["code"] == "char-eco"
+
+    def test_upsert_moves_label_and_delete_removes(self):
+        index = CharacterMatchIndex()
+        index.apply_event({"type": "upsert", "character": PET})
+        index.apply_event({"type": "upsert", "character": {**PET, "match_label": "투명페트병"}})
+
+        assert index.match("무색페트병") is None
+        assert index.match("투명페트병")["name"] == "페트"
+
+        index.apply_event({"type": "delete", "character_id": PET["id"]})
+        assert index.match("투명페트병") is None
+
+    def test_remember_rpc_result_expires(self, monkeypatch):
+        """RPC 학습 항목은 learned_ttl 후 만료."""
+        from scan_worker.infrastructure.character import match_index
+
+        now = [1000.0]
+        monkeypatch.setattr(match_index.time, "monotonic", lambda: now[0])
+        index = CharacterMatchIndex(learned_ttl=60)
+
+        index.remember("무색페트병", RPC_REWARD)
+        assert index.match("무색페트병")["id"] == PET["id"]
+
+        now[0] += 61
+        assert index.match("무색페트병") is None
+
+    def test_remember_does_not_override_event_entry(self):
+        index = CharacterMatchIndex()
+        index.apply_event({"type": "upsert", "character": PET})
+
+        index.remember("무색페트병", {**RPC_REWARD, "name": "오래된 이름"})
+
+        assert index.match("무색페트병")["name"] == "페트"
+
+    def test_unknown_event_type(self):
+        assert CharacterMatchIndex().apply_event({"type": "noop"}) is False
@@ -0,0 +1,67 @@
+"""RedisContextStore Unit Tests."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from scan_worker.infrastructure.persistence_redis.context_store_impl import (
+    RedisContextStore,
+)
+
+
+@pytest.fixture
+def store() -> RedisContextStore:
+    store = RedisContextStore(redis_url="redis://localhost:6379/0", ttl=600)
+    store._client = MagicMock()
+    return store
+
+
+class TestRedisContextStore:
+    """작업 단위 Hash 체크포인트 테스트."""
+
+    def test_save_writes_step_field_with_ttl(self, store):
+        pipe = MagicMock()
+        store._client.pipeline.return_value = pipe
+
+        store.save_checkpoint("task-1", "vision", {"progress": 25})
+
+        pipe.hset.assert_called_once_with("scan:checkpoint:task-1", "vision", '{"progress": 25}')
+        pipe.expire.assert_called_once_with("scan:checkpoint:task-1", 600)
+        pipe.execute.assert_called_once()
+
+    def test_latest_checkpoint_single_hgetall(self, store):
+        """최신 Step은 HGETALL 1회로 결정 (SCAN 없음)."""
+        store._client.hgetall.return_value = {
+            "vision": json.dumps({"progress": 25}),
+            "answer": json.dumps({"progress": 75}),
+            "rule": json.dumps({"progress": 50}),
+        }
+
+        assert store.get_latest_checkpoint("task-1") == ("answer", {"progress": 75})
+        store._client.scan_iter.assert_not_called()
+        store._client.mget.assert_not_called()
+
+    def test_latest_checkpoint_legacy_keys(self, store):
+        """Hash가 없으면 이전 포맷 키를 MGET 1회로 조회."""
+        store._client.hgetall.return_value = {}
+        store._client.mget.return_value = [json.dumps({"progress": 25}), None, None, None]
+
+        assert store.get_latest_checkpoint("task-1") == ("vision", {"progress": 25})
+        store._client.mget.assert_called_once_with(
+            [
+                "scan:checkpoint:task-1:vision",
+                "scan:checkpoint:task-1:rule",
+                "scan:checkpoint:task-1:answer",
+                "scan:checkpoint:task-1:reward",
+            ]
+        )
+
+    def test_clear_single_delete(self, store):
+        store.clear_checkpoints("task-1")
+
+        store._client.delete.assert_called_once()
+        assert store._client.delete.call_args.args[0] == "scan:checkpoint:task-1"
+        store._client.scan_iter.assert_not_called()
@@ -0,0 +1,76 @@
+"""FilePromptRepository Unit Tests."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from scan_worker.infrastructure.asset_loader.prompt_repository_impl import (
+    FilePromptRepository,
+)
+
+
+@pytest.fixture
+def assets(tmp_path: Path) -> Path:
+    (tmp_path / "prompts").mkdir()
+    (tmp_path / "data").mkdir()
+    (tmp_path / "prompts" / "vision.txt").write_text(
+        "분류: {{ITEM_CLASS_YAML}}\n태그: {{SITUATION_TAG_YAML}}", encoding="utf-8"
+    )
+    (tmp_path / "data" / "item_class_list.yaml").write_text(
+        "분류체계: 플라스틱\n", encoding="utf-8"
+    )
+    (tmp_path / "data" / "situation_tags.yaml").write_text("상태: 깨끗함\n", encoding="utf-8")
+    return tmp_path
+
+
+def _touch(path: Path, content: str) -> None:
+    """내용 변경 + mtime 강제 갱신 (파일시스템 mtime 해상도 회피)."""
+    stat = path.stat()
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestRenderedPromptCache:
+    """렌더링 프롬프트 캐시 테스트."""
+
+    def test_rendered_prompt_cached(self, assets, monkeypatch):
+        """같은 에셋 버전이면 재렌더링 없이 캐시 반환."""
+        from scan_worker.infrastructure.asset_loader import prompt_repository_impl
+
+        calls = []
+        render = prompt_repository_impl.render_prompt_template
+        monkeypatch.setattr(
+            prompt_repository_impl,
+            "render_prompt_template",
+            lambda *args: calls.append(args) or render(*args),
+        )
+        repo = FilePromptRepository(assets)
+
+        first = repo.get_rendered_prompt("vision")
+        second = repo.get_rendered_prompt("vision")
+
+        assert first is second
+        assert len(calls) == 1
+        assert "{{ITEM_CLASS_YAML}}" not in first
+        assert "플라스틱" in first
+
+    def test_invalidated_when_asset_changes(self, assets):
+        """YAML 에셋이 바뀌면 다시 렌더링."""
+        repo = FilePromptRepository(assets)
+        assert "깨끗함" in repo.get_rendered_prompt("vision")
+
+        _touch(assets / "data" / "situation_tags.yaml", "상태: 오염됨\n")
+
+        rendered = repo.get_rendered_prompt("vision")
+        assert "오염됨" in rendered
+        assert repo.get_situation_tags() == {"상태": "오염됨"}
+
+    def test_missing_prompt_raises(self, assets):
+        """없는 프롬프트는 FileNotFoundError."""
+        repo = FilePromptRepository(assets)
+
+        with pytest.raises(FileNotFoundError):
+            repo.get_rendered_prompt("unknown")
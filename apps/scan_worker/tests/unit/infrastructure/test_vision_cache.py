@@ -0,0 +1,234 @@
+"""Vision Result Cache Unit Tests."""
+
+from __future__ import annotations
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from scan_worker.application.classify.ports.vision_cache import VisionCacheHit
+from scan_worker.infrastructure.llm.cached_vision import CachedVisionAdapter
+
+RESULT = {
+    "classification": {"major_category": "재활용폐기물", "middle_category": "플라스틱류"},
+    "situation_tags": ["깨끗한 상태"],
+    "meta": {"user_input": "테스트"},
+}
+
+
+def _http_client(content: bytes = b"image-bytes") -> MagicMock:
+    client = MagicMock()
+    client.get.return_value = MagicMock(
+        content=content, headers={"content-type": "image/png; charset=binary"}
+    )
+    return client
+
+
+@pytest.fixture
+def inner():
+    vision = MagicMock()
+    vision.analyze_image.return_value = RESULT
+    return vision
+
+
+class TestCachedVisionAdapter:
+    """캐시 데코레이터 테스트."""
+
+    def test_hit_skips_vision_call(self, inner):
+        """캐시 적중 시 Vision 모델 호출 안 함."""
+        cache = MagicMock()
+        cache.lookup.return_value = VisionCacheHit(result=RESULT, match="exact", elapsed_ms=4200)
+        adapter = CachedVisionAdapter(inner, cache, "gpt-5.2", http_client=_http_client())
+
+        result = adapter.analyze_image("prompt", "https://example.com/a.jpg")
+
+        assert result == RESULT
+        inner.analyze_image.assert_not_called()
+        cache.store.assert_not_called()
+
+    def test_miss_calls_vision_and_stores(self, inner):
+        """miss 시 Vision 호출 후 같은 scope로 저장."""
+        cache = MagicMock()
+        cache.lookup.return_value = None
+        adapter = CachedVisionAdapter(inner, cache, "gpt-5.2", http_client=_http_client())
+
+        result = adapter.analyze_image("prompt", "https://example.com/a.jpg", "질문")
+
+        assert result == RESULT
+        inner.analyze_image.assert_called_once()
+        # 지문용으로 받은 바이트를 그대로 넘겨 원본 어댑터가 재다운로드하지 않음
+        assert inner.analyze_image.call_args.kwargs["image_bytes"] == b"image-bytes"
+        assert inner.analyze_image.call_args.kwargs["mime_type"] == "image/png"
+        image_bytes, scope, stored, _elapsed = cache.store.call_args.args
+        assert image_bytes == b"image-bytes"
+        assert scope == cache.lookup.call_args.args[1]
+        assert stored == RESULT
+
+    def test_scope_differs_by_model_prompt_and_input(self, inner):
+        """모델/프롬프트/사용자 입력이 다르면 scope 분리."""
+        a = CachedVisionAdapter(inner, MagicMock(), "gpt-5.2", http_client=_http_client())
+        b = CachedVisionAdapter(
+            inner, MagicMock(), "gemini-3-flash-preview", http_client=_http_client()
+        )
+
+        assert a._scope("p", None) == a._scope("p", None)
+        assert a._scope("p", None) != b._scope("p", None)
+        assert a._scope("p", None) != a._scope("p2", None)
+        assert a._scope("p", None) != a._scope("p", "질문")
+
+    def test_cache_error_falls_back_to_vision(self, inner):
+        """캐시 장애 시 Vision 모델 호출로 우회."""
+        cache = MagicMock()
+        cache.lookup.side_effect = ConnectionError("redis down")
+        cache.store.side_effect = ConnectionError("redis down")
+        adapter = CachedVisionAdapter(inner, cache, "gpt-5.2", http_client=_http_client())
+
+        assert adapter.analyze_image("prompt", "https://example.com/a.jpg") == RESULT
+        inner.analyze_image.assert_called_once()
+
+    def test_image_fetch_error_bypasses_cache(self, inner):
+        """이미지 다운로드 실패 시 캐시 없이 Vision 호출."""
+        cache = MagicMock()
+        client = MagicMock()
+        client.get.side_effect = TimeoutError("timeout")
+        adapter = CachedVisionAdapter(inner, cache, "gpt-5.2", http_client=client)
+
+        assert adapter.analyze_image("prompt", "https://example.com/a.jpg") == RESULT
+        cache.lookup.assert_not_called()
+        cache.store.assert_not_called()
+        assert inner.analyze_image.call_args.kwargs["image_bytes"] is None
+
+    def test_given_image_bytes_are_not_refetched(self, inner):
+        """호출자가 바이트를 넘기면 다운로드하지 않음."""
+        cache = MagicMock()
+        cache.lookup.return_value = None
+        client = _http_client()
+        adapter = CachedVisionAdapter(inner, cache, "gpt-5.2", http_client=client)
+
+        adapter.analyze_image("prompt", "https://example.com/a.jpg", image_bytes=b"given")
+
+        client.get.assert_not_called()
+        assert cache.lookup.call_args.args[0] == b"given"
+
+
+class TestDHash:
+    """perceptual hash 테스트."""
+
+    @staticmethod
+    def _jpeg(size: tuple[int, int], quality: int = 90) -> bytes:
+        from PIL import Image
+
+        img = Image.new("L", (64, 64))
+        img.putdata([(x * 4 + y * 2) % 256 for y in range(64) for x in range(64)])
+        buf = io.BytesIO()
+        img.resize(size).convert("RGB").save(buf, format="JPEG", quality=quality)
+        return buf.getvalue()
+
+    def test_resized_reencoded_image_is_near(self):
+        """리사이즈/재인코딩 이미지는 hamming 거리가 작음."""
+        pytest.importorskip("PIL")
+        from scan_worker.infrastructure.persistence_redis.vision_cache_impl import (
+            compute_dhash,
+        )
+
+        original = compute_dhash(self._jpeg((640, 640)))
+        resized = compute_dhash(self._jpeg((320, 320), quality=60))
+
+        assert original is not None and resized is not None
+        assert (original ^ resized).bit_count() <= 3
+
+    def test_invalid_image_returns_none(self):
+        from scan_worker.infrastructure.persistence_redis.vision_cache_impl import (
+            compute_dhash,
+        )
+
+        assert compute_dhash(b"not-an-image") is None
+
+
+class TestNearMatchDefaults:
+    """근접 매칭 opt-in 테스트 (캐시는 사용자 간 공유)."""
+
+    def test_near_matching_disabled_by_default(self):
+        from scan_worker.infrastructure.persistence_redis.vision_cache_impl import (
+            RedisVisionCache,
+        )
+        from scan_worker.setup.config import Settings
+
+        assert RedisVisionCache(redis_url="redis://localhost:6379/0")._near_enabled is False
+        assert Settings.model_fields["vision_cache_near_enabled"].default is False
+
+
+class TestNearBandIndex:
+    """dHash band 인덱스 정리 테스트."""
+
+    DHASH = 0x00010002000300FF
+    BAND_KEYS = [
+        "scan:vision_cache:band:s:0:00ff",
+        "scan:vision_cache:band:s:1:0003",
+        "scan:vision_cache:band:s:2:0002",
+        "scan:vision_cache:band:s:3:0001",
+    ]
+
+    @staticmethod
+    def _cache(client: MagicMock):
+        from scan_worker.infrastructure.persistence_redis.vision_cache_impl import (
+            RedisVisionCache,
+        )
+
+        cache = RedisVisionCache(redis_url="redis://localhost:6379/0", max_entries=1)
+        cache._near_enabled = True
+        cache._client = client
+        return cache
+
+    def test_lru_eviction_removes_band_members(self):
+        pipe = MagicMock()
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+        client.zpopmin.return_value = [
+            ("scan:vision_cache:exact:s:abc", 1.0),
+            (f"scan:vision_cache:near:s:{self.DHASH:016x}", 1.0),
+        ]
+
+        self._cache(client)._evict(client, 2)
+
+        pipe.delete.assert_called_once_with(
+            "scan:vision_cache:exact:s:abc", f"scan:vision_cache:near:s:{self.DHASH:016x}"
+        )
+        assert [c.args for c in pipe.zrem.call_args_list] == [
+            (key, f"{self.DHASH:016x}") for key in self.BAND_KEYS
+        ]
+
+    def test_store_trims_expired_band_members(self, monkeypatch):
+        from scan_worker.infrastructure.persistence_redis import vision_cache_impl
+
+        monkeypatch.setattr(vision_cache_impl, "compute_dhash", lambda _: self.DHASH)
+        pipe = MagicMock()
+        pipe.execute.return_value = [1]
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+
+        self._cache(client).store(b"img", "s", RESULT, 10.0)
+
+        assert [c.args[0] for c in pipe.zremrangebyscore.call_args_list] == self.BAND_KEYS
+
+    def test_near_lookup_skips_deleted_entry(self, monkeypatch):
+        from scan_worker.infrastructure.persistence_redis import vision_cache_impl
+
+        monkeypatch.setattr(vision_cache_impl, "compute_dhash", lambda _: self.DHASH)
+        nearest, second = self.DHASH ^ 0b1, self.DHASH ^ 0b110
+        pipe = MagicMock()
+        pipe.execute.return_value = [[f"{second:016x}"], [f"{nearest:016x}"], [], []]
+        client = MagicMock()
+        client.get.return_value = None
+        client.pipeline.return_value = pipe
+        client.mget.return_value = [None, '{"result": {"a": 1}, "elapsed_ms": 5}']
+
+        hit = self._cache(client).lookup(b"img", "s")
+
+        assert hit.match == "near"
+        assert hit.result == {"a": 1}
+        assert client.mget.call_args.args[0] == [
+            f"scan:vision_cache:near:s:{nearest:016x}",
+            f"scan:vision_cache:near:s:{second:016x}",
+        ]
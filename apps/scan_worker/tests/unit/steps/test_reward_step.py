@@ -0,0 +1,156 @@
+"""RewardStep Unit Tests."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from scan_worker.application.classify.dto.classify_context import ClassifyContext
+
+CHARACTER = {
+    "id": "11111111-1111-1111-1111-111111111111",
+    "code": "char-pet",
+    "name": "페트",
+    "type_label": "플라스틱",
+    "dialog": "깨끗하게 헹궈줘!",
+}
+
+
+@pytest.fixture
+def ctx() -> ClassifyContext:
+    return ClassifyContext(
+        task_id="test-task-001",
+        user_id="00000000-0000-0000-0000-000000000001",
+        image_url="https://example.com/image.jpg",
+        classification={
+            "classification": {
+                "major_category": "재활용폐기물",
+                "middle_category": "무색페트병",
+                "minor_category": "물병",
+            },
+            "situation_tags": [],
+        },
+        disposal_rules={"배출방법": "라벨 제거"},
+        final_answer={"insufficiencies": []},
+    )
+
+
+def _step(matcher=None):
+    from scan_worker.application.classify.steps.reward_step import RewardStep
+
+    celery_app = MagicMock()
+    step = RewardStep(
+        celery_app=celery_app,
+        event_publisher=MagicMock(),
+        result_cache=MagicMock(),
+        character_matcher=matcher,
+    )
+    step._dispatch_save_tasks = MagicMock()
+    return step, celery_app
+
+
+class TestRewardStepCharacterMatch:
+    """캐릭터 매칭 경로 테스트."""
+
+    def test_local_match_skips_rpc(self, ctx):
+        """로컬 인덱스 적중 시 character.match RPC 미호출."""
+        matcher = MagicMock()
+        matcher.match.return_value = CHARACTER
+        step, celery_app = _step(matcher)
+
+        result = step.run(ctx)
+
+        celery_app.send_task.assert_not_called()
+        matcher.match.assert_called_once_with("무색페트병")
+        assert result.reward == {
+            "name": "페트",
+            "dialog": "깨끗하게 헹궈줘!",
+            "match_reason": "무색페트병>물병",
+            "type": "플라스틱",
+        }
+        saved = step._dispatch_save_tasks.call_args.args[1]
+        assert saved["character_id"] == CHARACTER["id"]
+        assert saved["character_code"] == "char-pet"
+
+    def test_local_miss_falls_back_to_rpc_and_remembers(self, ctx):
+        """로컬 판단 불가 시 RPC 호출 후 결과 학습."""
+        rpc_reward = {
+            "name": "페트",
+            "dialog": "깨끗하게 헹궈줘!",
+            "match_reason": "무색페트병>물병",
+            "type": "플라스틱",
+            "character_id": CHARACTER["id"],
+            "character_code": "char-pet",
+            "received": True,
+        }
+        matcher = MagicMock()
+        matcher.match.return_value = None
+        step, celery_app = _step(matcher)
+        celery_app.send_task.return_value.get.return_value = rpc_reward
+
+        result = step.run(ctx)
+
+        celery_app.send_task.assert_called_once()
+        matcher.remember.assert_called_once_with("무색페트병", rpc_reward)
+        assert result.reward["name"] == "페트"
+
+    def test_without_matcher_uses_rpc(self, ctx):
+        step, celery_app = _step()
+        celery_app.send_task.return_value.get.return_value = None
+
+        result = step.run(ctx)
+
+        celery_app.send_task.assert_called_once()
+        assert result.reward is None
+
+
+class TestRewardStepPrefetch:
+    """fused 모드 선행 매칭 테스트."""
+
+    def test_prefetch_matches_without_dispatching_save(self, ctx):
+        """prefetch는 매칭만 수행 (저장 Task 발행 없음)."""
+        matcher = MagicMock()
+        matcher.match.return_value = CHARACTER
+        step, _ = _step(matcher)
+
+        prefetched = step.prefetch(ctx)
+
+        assert prefetched["character_code"] == "char-pet"
+        step._dispatch_save_tasks.assert_not_called()
+
+    def test_prefetch_skips_non_candidate(self, ctx):
+        ctx.classification["classification"]["major_category"] = "일반종량제폐기물"
+        matcher = MagicMock()
+        step, celery_app = _step(matcher)
+
+        assert step.prefetch(ctx) is None
+        matcher.match.assert_not_called()
+        celery_app.send_task.assert_not_called()
+
+    def test_run_prefetched_uses_result_without_rpc(self, ctx):
+        matcher = MagicMock()
+        matcher.match.return_value = CHARACTER
+        step, celery_app = _step(matcher)
+        prefetched = step.prefetch(ctx)
+        matcher.reset_mock()
+
+        result = step.run_prefetched(ctx, prefetched)
+
+        matcher.match.assert_not_called()
+        celery_app.send_task.assert_not_called()
+        assert result.reward["name"] == "페트"
+        step._dispatch_save_tasks.assert_called_once()
+
+    def test_run_prefetched_discards_match_when_insufficient(self, ctx):
+        """answer에서 미흡항목이 나오면 prefetch 결과를 버림."""
+        matcher = MagicMock()
+        matcher.match.return_value = CHARACTER
+        step, _ = _step(matcher)
+        prefetched = step.prefetch(ctx)
+        ctx.final_answer = {"insufficiencies": ["라벨 미제거"]}
+
+        result = step.run_prefetched(ctx, prefetched)
+
+        assert result.reward is None
+        step._dispatch_save_tasks.assert_not_called()
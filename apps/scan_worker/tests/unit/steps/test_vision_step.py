@@ -9,6 +9,7 @@ import pytest
 from scan_worker.application.classify.dto.classify_context import ClassifyContext
 from scan_worker.application.classify.ports.prompt_repository import (
     PromptRepositoryPort,
+    render_prompt_template,
 )
 from scan_worker.application.classify.ports.vision_model import VisionModelPort
 
@@ -114,25 +115,48 @@ class TestVisionStep:
 
     def test_prompt_rendering(self):
         """프롬프트 렌더링 테스트."""
-        from scan_worker.application.classify.steps.vision_step import VisionStep
-
         # Given
-        vision_model = MockVisionModel()
-        prompt_repo = MockPromptRepository()
-        step = VisionStep(vision_model, prompt_repo)
-
         template = "분류: {{ITEM_CLASS_YAML}}\n태그: {{SITUATION_TAG_YAML}}"
         schema = {"분류체계": "테스트"}
         tags = {"태그": "테스트"}
 
         # When
-        rendered = step._render_prompt(template, schema, tags, None)
+        rendered = render_prompt_template(template, schema, tags)
 
         # Then
         assert "{{ITEM_CLASS_YAML}}" not in rendered
         assert "{{SITUATION_TAG_YAML}}" not in rendered
         assert "분류체계" in rendered
 
+    def test_uses_rendered_prompt(self):
+        """렌더링된 프롬프트가 Vision 모델에 전달되는지 테스트."""
+        from scan_worker.application.classify.steps.vision_step import VisionStep
+
+        # Given
+        class RenderedPromptRepository(MockPromptRepository):
+            def get_rendered_prompt(self, name: str) -> str:
+                return f"rendered:{name}"
+
+        class CapturingVisionModel(MockVisionModel):
+            def analyze_image(self, prompt, image_url, user_input=None):
+                self.last_prompt = prompt
+                return super().analyze_image(prompt, image_url, user_input)
+
+        vision_model = CapturingVisionModel()
+        step = VisionStep(vision_model, RenderedPromptRepository())
+
+        ctx = ClassifyContext(
+            task_id="test-task-005",
+            user_id="user-005",
+            image_url="https://example.com/image.jpg",
+        )
+
+        # When
+        step.run(ctx)
+
+        # Then
+        assert vision_model.last_prompt == "rendered:vision_classification_prompt"
+
     def test_user_input_passed_to_vision_model(self):
         """user_input이 VisionModel에 전달되는지 테스트."""
         from scan_worker.application.classify.steps.vision_step import VisionStep
@@ -4,6 +4,8 @@
 - REDIS_STREAMS_URL: Redis Streams + State KV (내구성 저장소)
 - REDIS_PUBSUB_URL: Redis Pub/Sub (실시간 구독)
 - SSE_SHARD_COUNT: Shard 수 (default: 4, scan_worker와 일치 필요)
+- PUBSUB_ROUTING_MODE: Pub/Sub 라우팅 모드 (shard | job, event_router와 일치 필요)
+- POD_NAME: Pod 이름 (job 라우팅 모드의 Pod 전용 채널 식별자, 기본: hostname)
 - OTEL_EXPORTER_OTLP_ENDPOINT: OTEL Collector 엔드포인트
 - LOG_LEVEL: 로그 레벨 (default: INFO)
 
@@ -16,6 +18,8 @@ State는 내구성 저장소에 있어야 복구/재접속 시 사용 가능
 참조: docs/blogs/async/34-sse-HA-architecture.md
 """
 
+import os
+import socket
 from functools import lru_cache
 
 from pydantic_settings import BaseSettings
@@ -55,6 +59,15 @@ class Settings(BaseSettings):
         5  # State 재조회 타임아웃 (무소식 시) - 짧게 설정하여 누락 이벤트 빠른 복구
     )
 
+    # Pub/Sub 라우팅 모드 (event_router와 일치 필요)
+    # - shard: 모든 shard 채널 구독 후 job_id로 필터링 (Pod 수 × 전체 이벤트 수신)
+    # - job: 구독자를 가진 job만 sse:route:{job_id}에 등록하고
+    #        Pod 전용 채널(sse:events:pod:{pod_name})만 구독 (자기 구독자 이벤트만 수신)
+    pubsub_routing_mode: str = "shard"
+    pubsub_route_prefix: str = "sse:route"
+    pubsub_route_ttl_seconds: int = 60  # Pod 장애 시 라우팅 자동 소멸 (ttl/3 주기로 갱신)
+    pod_name: str = os.environ.get("POD_NAME", socket.gethostname())
+
     # Shard 설정 (scan_worker, event_router와 일치 필요)
     shard_count: int = 4  # SSE_SHARD_COUNT 환경변수로 오버라이드 가능 (scan 기본)
     chat_shard_count: int = 4  # CHAT_SHARD_COUNT 환경변수로 오버라이드 가능
@@ -78,6 +91,8 @@ class Settings(BaseSettings):
     # OTEL (샘플링 낮춤 - SSE 경로)
     otel_enabled: bool = True
     otel_sample_rate: float = 0.1  # 10% 샘플링
+    # 구독자 분배 span 샘플링 (이벤트 단위, done/error는 항상 기록)
+    sse_distribute_span_sample_rate: float = 0.01
 
     class Config:
         env_file = ".env"
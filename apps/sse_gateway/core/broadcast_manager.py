@@ -10,6 +10,12 @@ Shard 기반 Pub/Sub (연결 최적화):
 - 현재: sse:events:{shard} (4개 채널, 4개 연결)
 - 동시 접속 1000명 → 여전히 4개 연결만 사용
 
+Job-affinity 라우팅 (pubsub_routing_mode="job"):
+- 구독자를 가진 job만 sse:route:{job_id} (ZSET, member=pod, score=만료 시각)에 등록
+- Pod 전용 채널 sse:events:pod:{pod_name} 하나만 구독
+- Event Router가 레지스트리를 조회하여 해당 Pod에만 발행
+- Pod별 수신/디코딩 비용이 전체 이벤트 수가 아닌 자기 구독자 수에 비례
+
 분산 트레이싱 통합:
 - Pub/Sub 메시지에서 trace context 추출 (trace_id, span_id, traceparent)
 - linked span 생성하여 Event Router와 연결
@@ -31,6 +37,7 @@ import hashlib
 import json
 import logging
 import os
+import random
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -41,13 +48,16 @@ from sse_gateway.metrics import (
     SSE_CONNECTIONS_ACTIVE,
     SSE_CONNECTIONS_CLOSED,
     SSE_CONNECTIONS_OPENED,
+    SSE_CATCH_UP_READS,
     SSE_CONNECTION_DURATION,
     SSE_EVENTS_DISTRIBUTED,
     SSE_EVENTS_PER_CONNECTION,
     SSE_PUBSUB_CONNECTED,
     SSE_PUBSUB_MESSAGES_RECEIVED,
+    SSE_PUBSUB_MESSAGES_UNROUTED,
     SSE_PUBSUB_SUBSCRIBE_LATENCY,
     SSE_QUEUE_DROPPED,
+    SSE_ROUTE_REGISTRATIONS,
     SSE_STATE_SNAPSHOT_HITS,
     SSE_STATE_SNAPSHOT_MISSES,
     SSE_TTFB,
@@ -71,13 +81,25 @@ DEFAULT_STATE_PREFIX = "scan:state:"
 # Pub/Sub 채널 접두사 (모든 도메인 공통)
 PUBSUB_CHANNEL_PREFIX = "sse:events:"
 
+# Job-affinity 라우팅: Pod 전용 채널 (sse:events:pod:{pod_name})
+POD_CHANNEL_PREFIX = f"{PUBSUB_CHANNEL_PREFIX}pod:"
+
 # Token v2: Token Stream + Token State (복구 가능한 토큰 스트리밍)
 TOKEN_STREAM_PREFIX = "chat:tokens"  # job별 전용 Token Stream
-TOKEN_STATE_PREFIX = "chat:token_state"  # 주기적 누적 텍스트 스냅샷
+TOKEN_STATE_PREFIX = "chat:token_state"  # 주기적 State 스냅샷 (last_seq 등)
+TOKEN_TEXT_PREFIX = "chat:token_text"  # 누적 텍스트 (Worker가 증분 APPEND)
 
 # Progress Event Stream (복구 가능한 Progress 이벤트)
 PROGRESS_STREAM_PREFIX = "chat:progress"  # job별 전용 Progress Stream
 
+# 도메인별 job Stage 인덱스 ({domain}:progress:{job_id}, Worker가 shard XADD와 함께 기록)
+# NOTE: 필드에 shard Stream ID(stream_id)를 보존 → Last-Event-ID 호환
+JOB_INDEX_PREFIXES = {
+    "scan": "scan:progress",
+    "chat": PROGRESS_STREAM_PREFIX,
+}
+JOB_INDEX_MAXLEN = 100
+
 
 def get_state_prefix(domain: str | None = None) -> str:
     """도메인별 State KV 접두사 반환."""
@@ -102,6 +124,9 @@ class SubscriberQueue:
     Drop 정책:
     - Queue가 가득 차면 가장 오래된 이벤트 제거
     - done/error 이벤트는 항상 보존
+
+    Fan-out 경로는 offer() (동기, await 없음)를 사용하여 느린 구독자가
+    같은 shard 리스너의 다른 job 분배를 지연시키지 않음.
     """
 
     job_id: str
@@ -115,6 +140,11 @@ class SubscriberQueue:
     last_stream_id: str = field(default="0-0")
     # catch-up용 seq (레거시 호환)
     last_seq: int = field(default=-1)
+    # last_stream_id 파싱 결과 (비교 시 문자열 재파싱 방지)
+    _last_stream_key: tuple[int, int] = field(default=(0, 0), repr=False)
+
+    def __post_init__(self) -> None:
+        self._last_stream_key = self.parse_stream_id(self.last_stream_id)
 
     def __hash__(self) -> int:
         """set에 추가할 수 있도록 hash 구현."""
@@ -124,6 +154,17 @@ class SubscriberQueue:
         """동일 인스턴스 비교."""
         return self is other
 
+    @staticmethod
+    def parse_stream_id(sid: str) -> tuple[int, int]:
+        """Redis Stream ID → (timestamp_ms, seq) 정수 튜플 (파싱 실패 시 (0, 0))."""
+        try:
+            parts = sid.split("-")
+            ts = int(parts[0]) if parts[0] else 0
+            seq = int(parts[1]) if len(parts) > 1 and parts[1] else 0
+            return (ts, seq)
+        except (ValueError, IndexError):
+            return (0, 0)
+
     @staticmethod
     def _compare_stream_id(a: str, b: str) -> int:
         """Redis Stream ID 비교.
@@ -134,23 +175,19 @@ class SubscriberQueue:
         Returns:
             -1 if a < b, 0 if a == b, 1 if a > b
         """
-
-        def parse(sid: str) -> tuple[int, int]:
-            try:
-                parts = sid.split("-")
-                ts = int(parts[0]) if parts[0] else 0
-                seq = int(parts[1]) if len(parts) > 1 and parts[1] else 0
-                return (ts, seq)
-            except (ValueError, IndexError):
-                return (0, 0)
-
-        a_parsed, b_parsed = parse(a), parse(b)
+        a_parsed = SubscriberQueue.parse_stream_id(a)
+        b_parsed = SubscriberQueue.parse_stream_id(b)
         if a_parsed < b_parsed:
             return -1
         elif a_parsed > b_parsed:
             return 1
         return 0
 
+    def set_last_stream_id(self, stream_id: str) -> None:
+        """마지막 수신 Stream ID 설정 (Last-Event-ID 재연결)."""
+        self.last_stream_id = stream_id
+        self._last_stream_key = self.parse_stream_id(stream_id)
+
     async def put_event(self, event: dict[str, Any]) -> bool:
         """이벤트 추가 (중복 필터링 + Drop 정책).
 
@@ -169,52 +206,60 @@ class SubscriberQueue:
         Returns:
             성공 여부
         """
-        event_stage = event.get("stage", "unknown")
+        return self.offer(event)
+
+    def offer(
+        self,
+        event: dict[str, Any],
+        stream_key: tuple[int, int] | None = None,
+        event_seq: int | None = None,
+    ) -> bool:
+        """이벤트 추가 (동기, fan-out용).
+
+        구독자 수만큼 호출되므로 이벤트 단위 파싱은 호출자가 1회만 수행하여 전달.
+
+        Args:
+            event: 이벤트 딕셔너리
+            stream_key: 미리 파싱한 stream_id (None이면 이벤트에서 파싱)
+            event_seq: 미리 파싱한 seq (None이면 이벤트에서 파싱)
+
+        Returns:
+            성공 여부
+        """
+        if event_seq is None:
+            event_seq = _parse_seq(event.get("seq", 0))
 
         # 토큰 이벤트: 전용 seq 기반 필터링
         # (모든 토큰이 stage:status="token:streaming"으로 동일)
-        if event_stage == "token":
-            event_seq = event.get("seq", 0)
-            try:
-                event_seq = int(event_seq)
-            except (ValueError, TypeError):
-                event_seq = 0
-
+        if event.get("stage") == "token":
             if event_seq <= self.last_token_seq:
                 # 이미 전달했거나 역순
                 return False
             self.last_token_seq = event_seq
-
-            # catch-up용 last_seq도 업데이트
-            if event_seq > self.last_seq:
-                self.last_seq = event_seq
         else:
             # Stage 이벤트: stream_id 기반 필터링 (단조 증가 보장)
             stream_id = event.get("stream_id", "")
 
             if stream_id:
+                if stream_key is None:
+                    stream_key = self.parse_stream_id(stream_id)
                 # Stream ID 비교 (Redis가 발급한 단조 증가 ID)
-                if self._compare_stream_id(stream_id, self.last_stream_id) <= 0:
+                if stream_key <= self._last_stream_key:
                     # 이미 전달했거나 역순
                     return False
                 self.last_stream_id = stream_id
+                self._last_stream_key = stream_key
 
-            # catch-up용 last_seq 업데이트
-            event_seq = event.get("seq", 0)
-            try:
-                event_seq = int(event_seq)
-            except (ValueError, TypeError):
-                event_seq = 0
-
-            if event_seq > self.last_seq:
-                self.last_seq = event_seq
+        # catch-up용 last_seq 업데이트
+        if event_seq > self.last_seq:
+            self.last_seq = event_seq
 
         # done/error는 항상 보존 - Queue가 가득 차면 오래된 것 제거
         if self.queue.full():
             try:
                 old_event = self.queue.get_nowait()
                 if old_event.get("stage") in ("done", "error"):
-                    await self.queue.put(old_event)
+                    self.queue.put_nowait(old_event)
                     logger.warning(
                         "queue_event_dropped",
                         extra={
@@ -238,6 +283,14 @@ class SubscriberQueue:
             return False
 
 
+def _parse_seq(value: Any) -> int:
+    """이벤트 seq → int (파싱 실패 시 0)."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
 class SSEBroadcastManager:
     """Redis Pub/Sub 기반 SSE Broadcast Manager.
 
@@ -276,6 +329,18 @@ class SSEBroadcastManager:
         self._shard_counts: dict[str, int] = {"scan": 4, "chat": 4}
         # Shard listeners 시작 완료 이벤트
         self._shard_listeners_ready: asyncio.Event | None = None
+        # Pub/Sub 라우팅 모드 (shard | job, Event Router와 일치 필요)
+        self._routing_mode: str = "shard"
+        self._route_key_prefix: str = "sse:route"
+        self._route_ttl_seconds: int = 60
+        self._pod_id: str = ""
+        # job 모드: Pod 전용 채널 리스너 + 라우팅 갱신 루프
+        self._pod_listener_task: asyncio.Task[None] | None = None
+        self._route_refresh_task: asyncio.Task[None] | None = None
+        # 라우팅 해제 background tasks (GC 방지용 참조 유지)
+        self._route_tasks: set[asyncio.Task[None]] = set()
+        # 분배 span 샘플링 비율 (done/error는 항상 기록)
+        self._span_sample_rate: float = 0.01
 
     def _get_shard_for_job(self, job_id: str) -> int:
         """job_id에서 Pub/Sub shard 계산.
@@ -322,6 +387,11 @@ class SSEBroadcastManager:
             "scan": settings.shard_count,
             "chat": settings.chat_shard_count,
         }
+        self._routing_mode = settings.pubsub_routing_mode
+        self._route_key_prefix = settings.pubsub_route_prefix
+        self._route_ttl_seconds = settings.pubsub_route_ttl_seconds
+        self._pod_id = settings.pod_name
+        self._span_sample_rate = settings.sse_distribute_span_sample_rate
 
         # Streams Redis - State 조회용 (내구성)
         self._streams_client = aioredis.from_url(
@@ -343,9 +413,14 @@ class SSEBroadcastManager:
             health_check_interval=30,
         )
 
-        # Shard 기반 Pub/Sub 리스너 시작 (4개 고정)
+        # Pub/Sub 리스너 시작
+        # - shard 모드: shard별 리스너 (4개 고정)
+        # - job 모드: Pod 전용 채널 리스너 1개 + 라우팅 갱신 루프
         self._shard_listeners_ready = asyncio.Event()
-        await self._start_shard_listeners()
+        if self._routing_mode == "job":
+            await self._start_pod_listener()
+        else:
+            await self._start_shard_listeners()
 
         logger.info(
             "broadcast_manager_redis_connected",
@@ -354,6 +429,8 @@ class SSEBroadcastManager:
                 "pubsub_url": settings.redis_pubsub_url,
                 "pubsub_shard_count": self._pubsub_shard_count,
                 "shard_counts": self._shard_counts,
+                "routing_mode": self._routing_mode,
+                "pod_id": self._pod_id,
             },
         )
 
@@ -372,6 +449,19 @@ class SSEBroadcastManager:
                     except asyncio.CancelledError:
                         pass
 
+                # job 모드: Pod 리스너 + 라우팅 갱신 루프 취소
+                for task in (
+                    cls._instance._pod_listener_task,
+                    cls._instance._route_refresh_task,
+                ):
+                    if task is None:
+                        continue
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+
                 if cls._instance._streams_client:
                     await cls._instance._streams_client.close()
                 if cls._instance._pubsub_client:
@@ -415,6 +505,109 @@ class SSEBroadcastManager:
             extra={"shard_count": self._pubsub_shard_count},
         )
 
+    async def _start_pod_listener(self) -> None:
+        """Job-affinity 라우팅: Pod 전용 채널 리스너 + 라우팅 갱신 루프 시작.
+
+        shard 채널을 구독하지 않으므로 다른 Pod의 구독자 이벤트는 수신하지 않음.
+        """
+        ready_event = asyncio.Event()
+        channel = f"{POD_CHANNEL_PREFIX}{self._pod_id}"
+        self._pod_listener_task = asyncio.create_task(self._pubsub_listener(channel, ready_event))
+        self._route_refresh_task = asyncio.create_task(self._route_refresh_loop())
+
+        try:
+            await asyncio.wait_for(ready_event.wait(), timeout=2.0)
+        except asyncio.TimeoutError:
+            logger.warning("pod_listener_subscribe_timeout", extra={"channel": channel})
+
+        if self._shard_listeners_ready:
+            self._shard_listeners_ready.set()
+
+        logger.info(
+            "pod_listener_started",
+            extra={"channel": channel, "route_ttl_seconds": self._route_ttl_seconds},
+        )
+
+    def _route_key(self, job_id: str) -> str:
+        """Job-affinity 라우팅 레지스트리 키 (sse:route:{job_id})."""
+        return f"{self._route_key_prefix}:{job_id}"
+
+    async def _register_route(self, job_id: str) -> None:
+        """job_id → 현재 Pod 라우팅 등록.
+
+        실패 시에도 구독은 계속됨 (State 재조회 타임아웃으로 복구).
+        """
+        if not self._pubsub_client:
+            return
+
+        key = self._route_key(job_id)
+        try:
+            async with self._pubsub_client.pipeline(transaction=False) as pipe:
+                pipe.zadd(key, {self._pod_id: int(time.time()) + self._route_ttl_seconds})
+                pipe.expire(key, self._route_ttl_seconds)
+                await pipe.execute()
+            SSE_ROUTE_REGISTRATIONS.labels(op="register", result="success").inc()
+        except Exception as e:
+            SSE_ROUTE_REGISTRATIONS.labels(op="register", result="error").inc()
+            logger.warning(
+                "route_register_error",
+                extra={"job_id": job_id, "pod_id": self._pod_id, "error": str(e)},
+            )
+
+    async def _unregister_route(self, job_id: str) -> None:
+        """job_id → 현재 Pod 라우팅 해제.
+
+        해제 직전에 같은 job으로 재구독한 경우에는 해제하지 않음.
+        해제와 재등록이 엇갈려도 갱신 루프가 ttl/3 이내에 복구.
+        """
+        if not self._pubsub_client or job_id in self._subscribers:
+            return
+
+        try:
+            await self._pubsub_client.zrem(self._route_key(job_id), self._pod_id)
+            SSE_ROUTE_REGISTRATIONS.labels(op="unregister", result="success").inc()
+        except Exception as e:
+            SSE_ROUTE_REGISTRATIONS.labels(op="unregister", result="error").inc()
+            logger.warning(
+                "route_unregister_error",
+                extra={"job_id": job_id, "pod_id": self._pod_id, "error": str(e)},
+            )
+
+    async def _refresh_routes(self) -> None:
+        """보유 중인 모든 job의 라우팅 만료 시각 갱신 (단일 pipeline).
+
+        만료된 다른 Pod 항목(장애 Pod)도 함께 정리.
+        """
+        if not self._pubsub_client or not self._subscribers:
+            return
+
+        now = int(time.time())
+        expires_at = now + self._route_ttl_seconds
+        async with self._pubsub_client.pipeline(transaction=False) as pipe:
+            for job_id in list(self._subscribers):
+                key = self._route_key(job_id)
+                pipe.zadd(key, {self._pod_id: expires_at})
+                pipe.zremrangebyscore(key, "-inf", now - 1)
+                pipe.expire(key, self._route_ttl_seconds)
+            await pipe.execute()
+        SSE_ROUTE_REGISTRATIONS.labels(op="refresh", result="success").inc()
+
+    async def _route_refresh_loop(self) -> None:
+        """라우팅 갱신 루프 (ttl/3 주기)."""
+        interval = max(1.0, self._route_ttl_seconds / 3)
+        while not self._shutdown:
+            try:
+                await asyncio.sleep(interval)
+                await self._refresh_routes()
+            except asyncio.CancelledError:
+                return
+            except Exception as e:
+                SSE_ROUTE_REGISTRATIONS.labels(op="refresh", result="error").inc()
+                logger.warning(
+                    "route_refresh_error",
+                    extra={"pod_id": self._pod_id, "error": str(e)},
+                )
+
     async def subscribe(
         self,
         job_id: str,
@@ -438,7 +631,7 @@ class SSEBroadcastManager:
         subscriber = SubscriberQueue(job_id=job_id, domain=domain)
         # Last-Event-ID 기반 중복 방지: 이미 수신한 이벤트 필터링
         if last_event_id and "-" in last_event_id:
-            subscriber.last_stream_id = last_event_id
+            subscriber.set_last_stream_id(last_event_id)
         connection_start = time.time()
         first_event_time: float | None = None
         event_count = 0
@@ -452,6 +645,10 @@ class SSEBroadcastManager:
         self._subscribers[job_id].add(subscriber)
         SSE_ACTIVE_JOBS.set(len(self._subscribers))
 
+        # 1-1. job 라우팅 모드: 첫 로컬 구독자면 라우팅 등록 (State 조회 전 완료 = 누락 방지)
+        if self._routing_mode == "job" and len(self._subscribers[job_id]) == 1:
+            await self._register_route(job_id)
+
         # 2. Shard 리스너 준비 완료 대기 (초기화 시 이미 시작됨)
         # Shard 기반 구독: job_id별 채널 대신 shard별 채널 구독
         # → 연결 수 O(N) → O(4)로 대폭 감소
@@ -644,6 +841,12 @@ class SSEBroadcastManager:
                 del self._subscribers[job_id]
                 SSE_ACTIVE_JOBS.set(len(self._subscribers))
 
+                # job 라우팅 모드: 라우팅 해제 (background, 연결 종료 지연 방지)
+                if self._routing_mode == "job":
+                    task = asyncio.create_task(self._unregister_route(job_id))
+                    self._route_tasks.add(task)
+                    task.add_done_callback(self._route_tasks.discard)
+
             logger.info(
                 "broadcast_subscribe_ended",
                 extra={
@@ -667,30 +870,40 @@ class SSEBroadcastManager:
         - 현재: shard별 채널 (4개 연결)
         - 이벤트의 job_id로 필터링하여 올바른 구독자에게 전달
 
+        Args:
+            shard: Pub/Sub shard 번호
+            subscribed_event: 구독 완료 시그널 (옵션)
+        """
+        await self._pubsub_listener(f"{PUBSUB_CHANNEL_PREFIX}{shard}", subscribed_event)
+
+    async def _pubsub_listener(
+        self, channel: str, subscribed_event: asyncio.Event | None = None
+    ) -> None:
+        """Pub/Sub 채널 리스너 (shard 채널 / Pod 전용 채널 공통).
+
         Stale Connection 방어:
         - get_message(timeout=N) 사용하여 무한 대기 방지
         - 연속 timeout 시 PING으로 connection liveness 확인
         - PING 실패 시 재구독 (K8s TCP idle timeout 대응)
 
         Args:
-            shard: Pub/Sub shard 번호
+            channel: 구독할 Pub/Sub 채널
             subscribed_event: 구독 완료 시그널 (옵션)
         """
         logger.info(
             "shard_pubsub_listener_started",
-            extra={"shard": shard, "has_pubsub_client": self._pubsub_client is not None},
+            extra={"channel": channel, "has_pubsub_client": self._pubsub_client is not None},
         )
 
         if not self._pubsub_client:
             logger.warning(
                 "shard_pubsub_listener_no_client",
-                extra={"shard": shard},
+                extra={"channel": channel},
             )
             if subscribed_event:
                 subscribed_event.set()
             return
 
-        channel = f"{PUBSUB_CHANNEL_PREFIX}{shard}"
         max_reconnects = 5
         reconnect_count = 0
 
@@ -704,7 +917,6 @@ class SSEBroadcastManager:
                 logger.info(
                     "shard_pubsub_subscribed",
                     extra={
-                        "shard": shard,
                         "channel": channel,
                         "reconnect_count": reconnect_count,
                     },
@@ -734,7 +946,7 @@ class SSEBroadcastManager:
                                 logger.warning(
                                     "shard_pubsub_ping_failed",
                                     extra={
-                                        "shard": shard,
+                                        "channel": channel,
                                         "error": str(ping_err),
                                         "reconnect_count": reconnect_count,
                                     },
@@ -759,50 +971,15 @@ class SSEBroadcastManager:
                     if message["type"] != "message":
                         continue
 
-                    try:
-                        event = json.loads(message["data"])
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            "shard_pubsub_message_parse_error",
-                            extra={"shard": shard, "data": message["data"]},
-                        )
-                        continue
-
-                    # 이벤트에서 job_id 추출 (라우팅용)
-                    job_id = event.get("job_id")
-                    if not job_id:
-                        logger.warning(
-                            "shard_pubsub_message_missing_job_id",
-                            extra={"shard": shard, "event": event},
-                        )
-                        continue
-
-                    # 메트릭: Pub/Sub 메시지 수신
-                    stage = event.get("stage", "unknown")
-                    seq = event.get("seq", 0)
-                    SSE_PUBSUB_MESSAGES_RECEIVED.labels(stage=stage).inc()
-
-                    logger.debug(
-                        "shard_pubsub_message_received",
-                        extra={
-                            "shard": shard,
-                            "job_id": job_id,
-                            "stage": stage,
-                            "seq": seq,
-                            "channel": channel,
-                        },
-                    )
-
-                    # job_id로 필터링하여 해당 구독자에게만 전달
-                    await self._process_event_with_tracing(job_id, event, stage, seq)
+                    await self._dispatch_message(channel, message["data"])
 
             except asyncio.CancelledError:
-                logger.debug("shard_pubsub_listener_cancelled", extra={"shard": shard})
+                logger.debug("shard_pubsub_listener_cancelled", extra={"channel": channel})
                 return
             except Exception as e:
                 logger.error(
                     "shard_pubsub_listener_error",
-                    extra={"shard": shard, "error": str(e), "reconnect_count": reconnect_count},
+                    extra={"channel": channel, "error": str(e), "reconnect_count": reconnect_count},
                 )
             finally:
                 try:
@@ -822,15 +999,65 @@ class SSEBroadcastManager:
                 await asyncio.sleep(0.5 * reconnect_count)  # backoff
                 logger.info(
                     "shard_pubsub_listener_reconnecting",
-                    extra={"shard": shard, "attempt": reconnect_count},
+                    extra={"channel": channel, "attempt": reconnect_count},
                 )
 
         if reconnect_count > max_reconnects:
             logger.error(
                 "shard_pubsub_listener_max_reconnects_exceeded",
-                extra={"shard": shard, "max_reconnects": max_reconnects},
+                extra={"channel": channel, "max_reconnects": max_reconnects},
             )
 
+    async def _dispatch_message(self, channel: str, data: str) -> None:
+        """Pub/Sub 메시지 디코딩 후 job_id의 로컬 구독자에게 분배.
+
+        로컬 구독자가 없는 job의 이벤트는 span 생성 없이 즉시 버림
+        (shard 모드에서는 다른 Pod 구독자의 이벤트도 수신하므로).
+
+        Args:
+            channel: 수신 채널
+            data: JSON 이벤트 데이터
+        """
+        try:
+            event = json.loads(data)
+        except json.JSONDecodeError:
+            logger.warning(
+                "shard_pubsub_message_parse_error",
+                extra={"channel": channel, "data": data},
+            )
+            return
+
+        # 이벤트에서 job_id 추출 (라우팅용)
+        job_id = event.get("job_id")
+        if not job_id:
+            logger.warning(
+                "shard_pubsub_message_missing_job_id",
+                extra={"channel": channel, "event": event},
+            )
+            return
+
+        # 메트릭: Pub/Sub 메시지 수신
+        stage = event.get("stage", "unknown")
+        seq = event.get("seq", 0)
+        SSE_PUBSUB_MESSAGES_RECEIVED.labels(stage=stage).inc()
+
+        if job_id not in self._subscribers:
+            SSE_PUBSUB_MESSAGES_UNROUTED.inc()
+            return
+
+        logger.debug(
+            "shard_pubsub_message_received",
+            extra={
+                "job_id": job_id,
+                "stage": stage,
+                "seq": seq,
+                "channel": channel,
+            },
+        )
+
+        # job_id로 필터링하여 해당 구독자에게만 전달
+        await self._process_event_with_tracing(job_id, event, stage, seq)
+
     async def _process_event_with_tracing(
         self,
         job_id: str,
@@ -843,6 +1070,11 @@ class SSEBroadcastManager:
         Event Router에서 전달된 trace context를 추출하여
         linked span을 생성하고 이벤트를 구독자에게 분배.
 
+        shard 리스너 코루틴에서 인라인 실행되므로 구독자별 작업을 최소화:
+        - stream_id/seq는 이벤트당 1회만 파싱하여 구독자에게 전달
+        - 구독자 큐에는 await 없이 put_nowait (Drop 정책 적용)
+        - span은 샘플링된 이벤트(+ done/error)에만 생성
+
         Args:
             job_id: 작업 ID
             event: 이벤트 딕셔너리
@@ -851,47 +1083,8 @@ class SSEBroadcastManager:
         """
         span_context_manager = None
 
-        if OTEL_ENABLED:
-            try:
-                from opentelemetry import trace
-                from opentelemetry.trace import SpanContext, TraceFlags, Link
-
-                # 이벤트에서 traceparent 추출 및 파싱
-                traceparent = event.get("traceparent", "")
-                link = None
-
-                if traceparent:
-                    # W3C TraceContext: 00-{trace_id}-{span_id}-{trace_flags}
-                    parts = traceparent.split("-")
-                    if len(parts) == 4:
-                        trace_id_int = int(parts[1], 16)
-                        span_id_int = int(parts[2], 16)
-                        trace_flags = int(parts[3], 16)
-
-                        parent_ctx = SpanContext(
-                            trace_id=trace_id_int,
-                            span_id=span_id_int,
-                            is_remote=True,
-                            trace_flags=TraceFlags(trace_flags),
-                        )
-                        link = Link(parent_ctx)
-
-                # linked span 생성 (Event Router span과 연결)
-                tracer = trace.get_tracer(__name__)
-                links = [link] if link else []
-                span_context_manager = tracer.start_as_current_span(
-                    f"sse_gateway.distribute.{stage}",
-                    links=links,
-                    attributes={
-                        "job.id": job_id,
-                        "event.stage": stage,
-                        "event.seq": seq,
-                    },
-                )
-            except ImportError:
-                pass
-            except Exception as e:
-                logger.debug(f"Failed to create linked span: {e}")
+        if OTEL_ENABLED and self._should_trace(stage):
+            span_context_manager = self._start_distribute_span(job_id, event, stage, seq)
 
         # span context 진입
         span = None
@@ -900,14 +1093,18 @@ class SSEBroadcastManager:
 
         try:
             # 해당 job_id의 모든 구독자에게 분배
-            subscribers = self._subscribers.get(job_id, set())
+            subscribers = self._subscribers.get(job_id, ())
+            stream_id = event.get("stream_id")
+            stream_key = SubscriberQueue.parse_stream_id(stream_id) if stream_id else None
+            event_seq = _parse_seq(seq)
+
             distributed_count = 0
-            for subscriber in subscribers:
-                success = await subscriber.put_event(event)
-                if success:
+            for subscriber in tuple(subscribers):
+                if subscriber.offer(event, stream_key, event_seq):
                     distributed_count += 1
-                else:
-                    SSE_QUEUE_DROPPED.labels(stage=stage).inc()
+            dropped_count = len(subscribers) - distributed_count
+            if dropped_count:
+                SSE_QUEUE_DROPPED.labels(stage=stage).inc(dropped_count)
 
             if span:
                 span.set_attribute("sse.subscriber_count", len(subscribers))
@@ -930,6 +1127,52 @@ class SSEBroadcastManager:
             if span_context_manager:
                 span_context_manager.__exit__(None, None, None)
 
+    def _should_trace(self, stage: str) -> bool:
+        """분배 span 샘플링 여부 (done/error는 항상 기록)."""
+        if stage in ("done", "error"):
+            return True
+        return random.random() < self._span_sample_rate
+
+    @staticmethod
+    def _start_distribute_span(job_id: str, event: dict[str, Any], stage: str, seq: int) -> Any:
+        """Event Router span과 연결된 분배 span 생성 (실패 시 None)."""
+        try:
+            from opentelemetry import trace
+            from opentelemetry.trace import Link, SpanContext, TraceFlags
+
+            # 이벤트에서 traceparent 추출 및 파싱
+            traceparent = event.get("traceparent", "")
+            link = None
+
+            if traceparent:
+                # W3C TraceContext: 00-{trace_id}-{span_id}-{trace_flags}
+                parts = traceparent.split("-")
+                if len(parts) == 4:
+                    parent_ctx = SpanContext(
+                        trace_id=int(parts[1], 16),
+                        span_id=int(parts[2], 16),
+                        is_remote=True,
+                        trace_flags=TraceFlags(int(parts[3], 16)),
+                    )
+                    link = Link(parent_ctx)
+
+            # linked span 생성 (Event Router span과 연결)
+            tracer = trace.get_tracer(__name__)
+            return tracer.start_as_current_span(
+                f"sse_gateway.distribute.{stage}",
+                links=[link] if link else [],
+                attributes={
+                    "job.id": job_id,
+                    "event.stage": stage,
+                    "event.seq": seq,
+                },
+            )
+        except ImportError:
+            return None
+        except Exception as e:
+            logger.debug(f"Failed to create linked span: {e}")
+            return None
+
     async def _get_state_snapshot(self, job_id: str, domain: str = "scan") -> dict[str, Any] | None:
         """State KV에서 현재 상태 스냅샷 조회 (Streams Redis).
 
@@ -1020,6 +1263,9 @@ class SSEBroadcastManager:
 
         Pub/Sub 구독 전 이벤트가 유실된 경우, Streams에서 직접 읽어 전달.
 
+        1. job Stage 인덱스 ({domain}:progress:{job_id}) 범위 읽기 1회
+        2. 인덱스가 없으면 (인덱스 도입 전 job) shard Stream 최근 100개에서 필터링
+
         Args:
             job_id: job ID
             from_seq: 마지막으로 수신한 seq (이 이후부터 읽음)
@@ -1033,44 +1279,38 @@ class SSEBroadcastManager:
         if not self._streams_client:
             return
 
-        # job_id 기반 shard 계산 (worker와 동일한 해시 함수)
-        import hashlib
-
-        shard_count = self._shard_counts.get(domain, 4)
-        shard = int.from_bytes(hashlib.md5(job_id.encode()).digest()[:8], "big") % shard_count
-        stream_key = f"{domain}:events:{shard}"
+        after_key = SubscriberQueue.parse_stream_id(after_stream_id) if after_stream_id else None
 
         try:
-            # Streams에서 전체 이벤트 읽기 (최근 100개)
-            messages = await self._streams_client.xrevrange(stream_key, count=100)
+            source = "index"
+            entries = await self._read_job_index(job_id, domain)
+            if not entries:
+                source = "shard"
+                entries = await self._read_shard_stream(job_id, domain)
+            SSE_CATCH_UP_READS.labels(source=source).inc()
 
             # seq 순서대로 정렬을 위해 먼저 필터링
-            # NOTE: decode_responses=True이므로 키/값이 이미 문자열
             events_to_yield = []
-            for msg_id, data in messages:
-                if data.get("job_id", "") != job_id:
-                    continue
-
+            for stream_id, data in entries:
                 seq = int(data.get("seq", "0"))
-                if from_seq < seq <= to_seq:
-                    # Last-Event-ID 기반 중복 방지: 이미 수신한 이벤트 스킵
-                    if (
-                        after_stream_id
-                        and SubscriberQueue._compare_stream_id(msg_id, after_stream_id) <= 0
-                    ):
-                        continue
-                    event = dict(data)  # 이미 문자열
-                    # stream_id 추가 (SSE id 필드용)
-                    event["stream_id"] = msg_id
-                    # result 필드 JSON 파싱
-                    if event.get("result"):
-                        try:
-                            event["result"] = json.loads(event["result"])
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                    # seq를 int로 변환
-                    event["seq"] = seq
-                    events_to_yield.append((seq, event))
+                if not from_seq < seq <= to_seq:
+                    continue
+                # Last-Event-ID 기반 중복 방지: 이미 수신한 이벤트 스킵
+                if after_key and SubscriberQueue.parse_stream_id(stream_id) <= after_key:
+                    continue
+                event = dict(data)  # 이미 문자열
+                event["job_id"] = job_id
+                # stream_id 추가 (SSE id 필드용)
+                event["stream_id"] = stream_id
+                # result 필드 JSON 파싱
+                if event.get("result"):
+                    try:
+                        event["result"] = json.loads(event["result"])
+                    except (json.JSONDecodeError, TypeError):
+                        pass
+                # seq를 int로 변환
+                event["seq"] = seq
+                events_to_yield.append((seq, event))
 
             # seq 순서대로 정렬 후 yield
             events_to_yield.sort(key=lambda x: x[0])
@@ -1088,6 +1328,7 @@ class SSEBroadcastManager:
                         "from_seq": from_seq,
                         "to_seq": to_seq,
                         "caught_up_count": caught_up_count,
+                        "source": source,
                     },
                 )
 
@@ -1100,6 +1341,34 @@ class SSEBroadcastManager:
                 },
             )
 
+    async def _read_job_index(self, job_id: str, domain: str) -> list[tuple[str, dict[str, str]]]:
+        """job Stage 인덱스 읽기 → [(shard stream_id, data), ...] (없으면 빈 리스트)."""
+        prefix = JOB_INDEX_PREFIXES.get(domain)
+        if prefix is None:
+            return []
+
+        messages = await self._streams_client.xrange(
+            f"{prefix}:{job_id}", min="-", max="+", count=JOB_INDEX_MAXLEN
+        )
+        entries = []
+        for msg_id, data in messages:
+            data = dict(data)
+            entries.append((data.pop("stream_id", None) or msg_id, data))
+        return entries
+
+    async def _read_shard_stream(
+        self, job_id: str, domain: str
+    ) -> list[tuple[str, dict[str, str]]]:
+        """shard Stream 최근 100개에서 job 이벤트 필터링 (인덱스 도입 전 job 호환)."""
+        # job_id 기반 shard 계산 (worker와 동일한 해시 함수)
+        shard_count = self._shard_counts.get(domain, 4)
+        shard = int.from_bytes(hashlib.md5(job_id.encode()).digest()[:8], "big") % shard_count
+        stream_key = f"{domain}:events:{shard}"
+
+        # NOTE: decode_responses=True이므로 키/값이 이미 문자열
+        messages = await self._streams_client.xrevrange(stream_key, count=100)
+        return [(msg_id, data) for msg_id, data in messages if data.get("job_id", "") == job_id]
+
     def _total_subscriber_count(self) -> int:
         """총 구독자 수."""
         return sum(len(subs) for subs in self._subscribers.values())
@@ -1124,6 +1393,9 @@ class SSEBroadcastManager:
         Token v2: Worker가 주기적으로 저장하는 누적 텍스트 스냅샷.
         재연결 시 전체 텍스트를 즉시 복구할 수 있음.
 
+        스트리밍 중에는 State(메타데이터)와 Text(증분 APPEND)가 분리되어 있고,
+        finalize 시 State 하나로 병합됨. MGET 한 번으로 두 키를 함께 조회.
+
         Args:
             job_id: 작업 ID
 
@@ -1139,10 +1411,15 @@ class SSEBroadcastManager:
             return None
 
         try:
-            key = f"{TOKEN_STATE_PREFIX}:{job_id}"
-            data = await self._streams_client.get(key)
+            data, text = await self._streams_client.mget(
+                f"{TOKEN_STATE_PREFIX}:{job_id}",
+                f"{TOKEN_TEXT_PREFIX}:{job_id}",
+            )
             if data:
-                return json.loads(data)
+                state = json.loads(data)
+                if "accumulated" not in state:
+                    state["accumulated"] = text or ""
+                return state
         except Exception as e:
             logger.warning(
                 "token_state_error",
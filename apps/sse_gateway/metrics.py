@@ -281,6 +281,13 @@ SSE_STATE_SNAPSHOT_MISSES = Counter(
     registry=REGISTRY,
 )
 
+SSE_CATCH_UP_READS = Counter(
+    "sse_gateway_catch_up_reads_total",
+    "Stream catch-up reads by source",
+    labelnames=["source"],  # index (job Stage 인덱스), shard (shard Stream 스캔)
+    registry=REGISTRY,
+)
+
 SSE_EVENT_REPLAY_TOTAL = Counter(
     "sse_gateway_event_replay_total",
     "Total events replayed from history",
@@ -331,6 +338,19 @@ SSE_PUBSUB_MESSAGES_RECEIVED = Counter(
     registry=REGISTRY,
 )
 
+SSE_PUBSUB_MESSAGES_UNROUTED = Counter(
+    "sse_gateway_pubsub_messages_unrouted_total",
+    "Pub/Sub messages received for jobs with no local subscriber (discarded)",
+    registry=REGISTRY,
+)
+
+SSE_ROUTE_REGISTRATIONS = Counter(
+    "sse_gateway_route_registrations_total",
+    "Job-affinity route registry operations",
+    labelnames=["op", "result"],  # op: register, unregister, refresh / result: success, error
+    registry=REGISTRY,
+)
+
 SSE_PUBSUB_SUBSCRIBE_LATENCY = Histogram(
     "sse_gateway_pubsub_subscribe_latency_seconds",
     "Time to subscribe to a job channel",
@@ -199,6 +199,42 @@ class TestSSEBroadcastManager:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_token_state_streaming_merges_text(self):
+        """스트리밍 중: State 메타데이터 + 증분 Text 키 병합."""
+        from sse_gateway.core.broadcast_manager import SSEBroadcastManager
+
+        manager = SSEBroadcastManager()
+        mock_streams = AsyncMock()
+        state = {"last_seq": 1010, "accumulated_len": 15, "node": "answer"}
+        mock_streams.mget = AsyncMock(return_value=[json.dumps(state), "안녕하세요"])
+        manager._streams_client = mock_streams
+
+        result = await manager.get_token_state("test-job")
+
+        assert result["accumulated"] == "안녕하세요"
+        assert result["last_seq"] == 1010
+        mock_streams.mget.assert_called_once_with(
+            "chat:token_state:test-job", "chat:token_text:test-job"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_token_recovery_event_completed_state(self):
+        """finalize 후: State에 병합된 accumulated 사용."""
+        from sse_gateway.core.broadcast_manager import SSEBroadcastManager
+
+        manager = SSEBroadcastManager()
+        mock_streams = AsyncMock()
+        state = {"last_seq": 1012, "accumulated": "완료된 답변", "completed": True}
+        mock_streams.mget = AsyncMock(return_value=[json.dumps(state), None])
+        manager._streams_client = mock_streams
+
+        event = await manager.get_token_recovery_event("test-job")
+
+        assert event["accumulated"] == "완료된 답변"
+        assert event["last_seq"] == 1012
+        assert event["completed"] is True
+
     @pytest.mark.asyncio
     async def test_shutdown_cleans_up(self):
         """shutdown 시 리소스 정리."""
@@ -223,3 +259,212 @@ class TestSSEBroadcastManager:
         assert SSEBroadcastManager._instance is None
         mock_streams.close.assert_called_once()
         mock_pubsub.close.assert_called_once()
+
+
+class TestJobAffinityRouting:
+    """Job-affinity Pub/Sub 라우팅 테스트."""
+
+    @pytest.fixture
+    def manager(self):
+        from sse_gateway.core.broadcast_manager import SSEBroadcastManager
+
+        manager = SSEBroadcastManager()
+        manager._routing_mode = "job"
+        manager._pod_id = "sse-gateway-0"
+        manager._route_ttl_seconds = 60
+        return manager
+
+    @staticmethod
+    def _mock_pipeline(mock_client):
+        from unittest.mock import MagicMock
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        mock_client.pipeline = MagicMock(return_value=pipe)
+        return pipe
+
+    @pytest.mark.asyncio
+    async def test_dispatch_skips_job_without_local_subscriber(self, manager):
+        """로컬 구독자가 없는 job 이벤트는 분배하지 않음."""
+        manager._process_event_with_tracing = AsyncMock()
+
+        await manager._dispatch_message(
+            "sse:events:0", json.dumps({"job_id": "other-job", "stage": "vision"})
+        )
+
+        manager._process_event_with_tracing.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_delivers_to_local_subscriber(self, manager):
+        """로컬 구독자가 있는 job 이벤트는 큐에 전달."""
+        from sse_gateway.core.broadcast_manager import SubscriberQueue
+
+        subscriber = SubscriberQueue(job_id="job-1")
+        manager._subscribers["job-1"].add(subscriber)
+
+        await manager._dispatch_message(
+            "sse:events:pod:sse-gateway-0",
+            json.dumps({"job_id": "job-1", "stage": "vision", "stream_id": "1-0"}),
+        )
+
+        assert subscriber.queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_register_route_adds_pod_with_expiry(self, manager):
+        """라우팅 등록: ZADD (pod, 만료 시각) + EXPIRE."""
+        mock_pubsub = AsyncMock()
+        pipe = self._mock_pipeline(mock_pubsub)
+        manager._pubsub_client = mock_pubsub
+
+        await manager._register_route("job-1")
+
+        key, mapping = pipe.zadd.call_args.args
+        assert key == "sse:route:job-1"
+        assert list(mapping) == ["sse-gateway-0"]
+        pipe.expire.assert_called_once_with("sse:route:job-1", 60)
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unregister_route_skipped_when_resubscribed(self, manager):
+        """해제 전에 같은 job을 재구독했으면 라우팅 유지."""
+        from sse_gateway.core.broadcast_manager import SubscriberQueue
+
+        mock_pubsub = AsyncMock()
+        manager._pubsub_client = mock_pubsub
+        manager._subscribers["job-1"].add(SubscriberQueue(job_id="job-1"))
+
+        await manager._unregister_route("job-1")
+        mock_pubsub.zrem.assert_not_called()
+
+        manager._subscribers.clear()
+        await manager._unregister_route("job-1")
+        mock_pubsub.zrem.assert_awaited_once_with("sse:route:job-1", "sse-gateway-0")
+
+    @pytest.mark.asyncio
+    async def test_refresh_routes_single_pipeline(self, manager):
+        """보유 job 라우팅을 하나의 pipeline으로 갱신."""
+        from sse_gateway.core.broadcast_manager import SubscriberQueue
+
+        mock_pubsub = AsyncMock()
+        pipe = self._mock_pipeline(mock_pubsub)
+        manager._pubsub_client = mock_pubsub
+        for job_id in ("job-1", "job-2"):
+            manager._subscribers[job_id].add(SubscriberQueue(job_id=job_id))
+
+        await manager._refresh_routes()
+
+        assert pipe.zadd.call_count == 2
+        assert pipe.zremrangebyscore.call_count == 2
+        pipe.execute.assert_awaited_once()
+
+
+class TestNonBlockingFanOut:
+    """구독자별 await 없는 fan-out 테스트."""
+
+    @pytest.fixture
+    def manager(self):
+        from sse_gateway.core.broadcast_manager import SSEBroadcastManager
+
+        manager = SSEBroadcastManager()
+        manager._span_sample_rate = 0.0
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_full_subscriber_does_not_block_others(self, manager):
+        """가득 찬 구독자 큐는 Drop 정책으로 처리, 다른 구독자는 정상 수신."""
+        from sse_gateway.core.broadcast_manager import SubscriberQueue
+
+        slow = SubscriberQueue(job_id="job-1", queue=asyncio.Queue(maxsize=1))
+        fast = SubscriberQueue(job_id="job-1")
+        manager._subscribers["job-1"].update({slow, fast})
+
+        for i in range(3):
+            event = {"job_id": "job-1", "stage": "vision", "stream_id": f"{i + 1}-0", "seq": i}
+            await asyncio.wait_for(
+                manager._process_event_with_tracing("job-1", event, "vision", i), timeout=1.0
+            )
+
+        assert slow.queue.qsize() == 1
+        assert slow.queue.get_nowait()["seq"] == 2  # 오래된 이벤트부터 제거
+        assert fast.queue.qsize() == 3
+
+    @pytest.mark.asyncio
+    async def test_span_created_only_when_sampled(self, manager):
+        from unittest.mock import MagicMock
+
+        manager._start_distribute_span = MagicMock(return_value=None)
+        for i in range(20):
+            await manager._process_event_with_tracing(
+                "job-1", {"stage": "token", "seq": i}, "token", i
+            )
+        manager._start_distribute_span.assert_not_called()
+
+        # done은 샘플링과 무관하게 항상 기록
+        await manager._process_event_with_tracing("job-1", {"stage": "done"}, "done", 21)
+        manager._start_distribute_span.assert_called_once()
+
+
+class TestStreamsCatchUp:
+    """job Stage 인덱스 기반 catch-up 테스트."""
+
+    @pytest.fixture
+    def manager(self):
+        from sse_gateway.core.broadcast_manager import SSEBroadcastManager
+
+        manager = SSEBroadcastManager()
+        manager._streams_client = AsyncMock()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_reads_job_index_only(self, manager):
+        manager._streams_client.xrange = AsyncMock(
+            return_value=[
+                (
+                    "1-0",
+                    {"stage": "vision", "status": "started", "seq": "10", "stream_id": "100-0"},
+                ),
+                (
+                    "2-0",
+                    {
+                        "stage": "vision",
+                        "status": "completed",
+                        "seq": "11",
+                        "result": '{"label": "pet"}',
+                        "stream_id": "105-0",
+                    },
+                ),
+                ("3-0", {"stage": "rule", "status": "started", "seq": "20", "stream_id": "110-0"}),
+            ]
+        )
+
+        events = [
+            e
+            async for e in manager._catch_up_from_streams(
+                "job-1", from_seq=-1, to_seq=20, domain="scan", after_stream_id="100-0"
+            )
+        ]
+
+        manager._streams_client.xrange.assert_awaited_once()
+        assert manager._streams_client.xrange.await_args.args[0] == "scan:progress:job-1"
+        manager._streams_client.xrevrange.assert_not_called()
+        # Last-Event-ID(100-0) 이후만, shard stream_id 유지
+        assert [(e["seq"], e["stream_id"]) for e in events] == [(11, "105-0"), (20, "110-0")]
+        assert events[0]["result"] == {"label": "pet"}
+        assert events[0]["job_id"] == "job-1"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_shard_stream_without_index(self, manager):
+        manager._streams_client.xrange = AsyncMock(return_value=[])
+        manager._streams_client.xrevrange = AsyncMock(
+            return_value=[
+                ("200-0", {"job_id": "job-1", "stage": "answer", "seq": "31"}),
+                ("150-0", {"job_id": "other", "stage": "answer", "seq": "31"}),
+                ("120-0", {"job_id": "job-1", "stage": "rule", "seq": "21"}),
+            ]
+        )
+
+        events = [e async for e in manager._catch_up_from_streams("job-1", -1, 31, domain="scan")]
+
+        assert [e["stream_id"] for e in events] == ["120-0", "200-0"]
@@ -352,3 +352,29 @@ class TestSubscriberQueueLegacyFallback:
         assert await queue.put_event(event1) is True
         assert await queue.put_event(event2) is True  # 허용 (stream_id 없으면 필터링 안함)
         assert queue.queue.qsize() == 2
+
+
+class TestSubscriberQueueOffer:
+    """동기 fan-out 경로 (offer) 테스트."""
+
+    def test_offer_with_preparsed_stream_key(self):
+        queue = SubscriberQueue(job_id="test-offer-1")
+        event = {"stage": "intent", "status": "completed", "stream_id": "1000-1", "seq": 3}
+
+        assert queue.offer(event, SubscriberQueue.parse_stream_id("1000-1"), 3) is True
+        assert queue.offer(event, (1000, 1), 3) is False  # 중복
+        assert queue.last_stream_id == "1000-1"
+        assert queue.last_seq == 3
+
+    def test_last_event_id_respected(self):
+        """Last-Event-ID 재연결: 이전 stream_id 이벤트 필터링."""
+        queue = SubscriberQueue(job_id="test-offer-2")
+        queue.set_last_stream_id("2000-0")
+
+        assert queue.offer({"stage": "intent", "stream_id": "1999-9", "seq": 1}) is False
+        assert queue.offer({"stage": "intent", "stream_id": "2000-1", "seq": 2}) is True
+
+    def test_parse_stream_id(self):
+        assert SubscriberQueue.parse_stream_id("1737415902456-3") == (1737415902456, 3)
+        assert SubscriberQueue.parse_stream_id("1000") == (1000, 0)
+        assert SubscriberQueue.parse_stream_id("invalid") == (0, 0)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Chat Worker L3 Calibration drift 감시 비용 벤치마크 (재계산 vs 증분 CUSUM)
+
+CalibrationMonitorService.check_drift 1회 지연과 저장소 왕복 수를 비교:
+
+- recompute: 축마다 get_recent_scores(n=50) 조회 후 CUSUM 재계산 (5축 → 5회 왕복)
+- incremental: record_scores로 누적합을 갱신해 두고 get_cusum_state 1회 조회
+- incremental+ttl: 위 결과를 status_ttl 동안 프로세스 내 캐시
+
+요청마다 점수 1건 기록(record_scores) + check_drift 1회를 수행합니다.
+저장소 왕복 지연은 sleep으로 모사합니다 (--rtt-ms).
+
+Usage:
+    python e2e-tests/performance/calibration-drift-bench.py
+    python e2e-tests/performance/calibration-drift-bench.py --requests 2000 --rtt-ms 1.0
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+os.environ.setdefault("OTEL_ENABLED", "false")
+
+APPS_DIR = Path(__file__).resolve().parents[2] / "apps"
+sys.path.insert(0, str(APPS_DIR))
+
+from chat_worker.application.services.eval.calibration_monitor import (  # noqa: E402
+    _EVAL_AXES,
+    CalibrationMonitorService,
+)
+
+
+class SleepStore:
+    """점수 이력 + CUSUM 누적 상태 저장소 모사 (호출마다 RTT 1회)."""
+
+    def __init__(self, rtt_ms: float) -> None:
+        self._rtt = rtt_ms / 1000
+        self.round_trips = 0
+        self._history: dict[str, deque] = {axis: deque(maxlen=50) for axis in _EVAL_AXES}
+        self._state: dict[str, dict[str, float]] = {}
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self._rtt)
+
+    def append(self, axis_scores: dict[str, float]) -> None:
+        for axis, score in axis_scores.items():
+            self._history[axis].appendleft(score)
+
+    # EvalResultQueryGateway
+    async def get_recent_scores(self, axis: str, n: int = 10) -> list[float]:
+        await self._round_trip()
+        return list(self._history[axis])[:n]
+
+    # DriftStateGateway
+    async def update_cusum(self, axis_scores, expected_mean, slack) -> None:
+        await self._round_trip()
+        for axis, x in axis_scores.items():
+            s = self._state.setdefault(
+                axis, {"cusum_positive": 0.0, "cusum_negative": 0.0, "sample_count": 0}
+            )
+            s["cusum_positive"] = max(0.0, s["cusum_positive"] + (x - expected_mean - slack))
+            s["cusum_negative"] = max(0.0, s["cusum_negative"] + (expected_mean - x - slack))
+            s["sample_count"] += 1
+
+    async def get_cusum_state(self):
+        await self._round_trip()
+        return self._state
+
+    async def reset_cusum(self) -> None:
+        self._state = {}
+
+
+class StaticCalibration:
+    async def get_calibration_version(self) -> str:
+        return "v1"
+
+
+async def measure(
+    mode: str, requests: int, rtt_ms: float, status_ttl: float, rps: float, seed: int
+) -> dict:
+    store = SleepStore(rtt_ms)
+    clock = [0.0]
+    service = CalibrationMonitorService(
+        eval_query_gw=store,
+        calibration_gw=StaticCalibration(),
+        bars_evaluator=None,
+        drift_state_gw=None if mode == "recompute" else store,
+        status_ttl=status_ttl if mode == "incremental+ttl" else 0.0,
+        clock=lambda: clock[0],
+    )
+    rng = random.Random(seed)
+    check_samples = []
+    for i in range(requests):
+        axis_scores = {axis: float(rng.randint(2, 4)) for axis in _EVAL_AXES}
+        store.append(axis_scores)
+        await service.record_scores(axis_scores)
+        clock[0] = i / rps  # 논리 시각 (TTL 판정용)
+        start = time.perf_counter()
+        await service.check_drift()
+        check_samples.append(time.perf_counter() - start)
+    check_samples.sort()
+    return {
+        "p50_ms": statistics.median(check_samples) * 1e3,
+        "p99_ms": check_samples[max(int(len(check_samples) * 0.99) - 1, 0)] * 1e3,
+        "round_trips": store.round_trips / requests,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Calibration drift check benchmark")
+    parser.add_argument("--requests", type=int, default=1000, help="모드별 요청 수")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="저장소 왕복 지연 (ms)")
+    parser.add_argument("--status-ttl", type=float, default=10.0, help="drift 결과 캐시 TTL (초)")
+    parser.add_argument("--rps", type=float, default=20.0, help="Pod당 평가 요청률 (TTL 판정용)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    print("=" * 66)
+    print("  Calibration drift check benchmark (check_drift, lower is better)")
+    print(
+        f"  requests={args.requests}  axes={len(_EVAL_AXES)}  rtt={args.rtt_ms}ms"
+        f"  status_ttl={args.status_ttl}s  rps={args.rps}"
+    )
+    print("=" * 66)
+    print(f"  {'mode':>16} | {'check p50 ms':>12} | {'check p99 ms':>12} | {'RTT/req':>8}")
+    print("  " + "-" * 58)
+    for mode in ("recompute", "incremental", "incremental+ttl"):
+        r = await measure(mode, args.requests, args.rtt_ms, args.status_ttl, args.rps, args.seed)
+        print(
+            f"  {mode:>16} | {r['p50_ms']:>12.3f} | {r['p99_ms']:>12.3f} | "
+            f"{r['round_trips']:>8.2f}"
+        )
+    print("=" * 66)
+    print("  RTT/req: 점수 기록(증분 모드 1회) + check_drift 저장소 왕복 합계")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
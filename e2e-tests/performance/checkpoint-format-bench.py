@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Chat Worker Checkpoint 저장 포맷 벤치마크 (legacy vs blob)
+
+멀티에이전트 한 턴(intent → waste_rag/character 병렬 → aggregator → answer)의
+super-step별 checkpoint를 재현하여 포맷별 checkpoint당 저장 바이트와
+직렬화/역직렬화 CPU 시간을 비교. Redis 없이 PlainAsyncRedisSaver의
+직렬화 경로만 측정:
+
+- legacy: checkpoint 전체(channel_values 포함)를 msgpack → base64 문자열로 저장
+- blob: channel_values를 뺀 본문 + 버전이 바뀐 channel만 raw bytes blob으로 저장
+        (조회 시 channel_versions 기준 blob 재조립)
+
+대화 히스토리(messages)가 길수록 legacy는 매 step 전체를 다시 쓰고
+blob 포맷은 바뀐 channel만 쓰므로 차이가 커져야 함.
+
+Usage:
+    python e2e-tests/performance/checkpoint-format-bench.py
+    python e2e-tests/performance/checkpoint-format-bench.py --history-turns 0,10,50 --rounds 200
+"""
+
+import argparse
+import base64
+import sys
+import time
+from pathlib import Path
+
+APPS_DIR = Path(__file__).resolve().parents[2] / "apps"
+sys.path.insert(0, str(APPS_DIR))
+
+from langchain_core.messages import AIMessage, HumanMessage  # noqa: E402
+
+from chat_worker.infrastructure.orchestration.langgraph.sync.plain_redis_saver import (  # noqa: E402
+    PlainAsyncRedisSaver,
+)
+
+ANSWER = (
+    "페트병은 내용물을 비우고 물로 헹군 뒤 라벨을 제거하여 "
+    "뚜껑을 닫은 상태로 투명 페트병 전용 수거함에 배출하세요. "
+) * 4
+
+RAG_RESULT = {
+    "category": "플라스틱",
+    "documents": [
+        {"title": f"분리배출 가이드 {i}", "content": ANSWER, "score": 0.9 - i * 0.1}
+        for i in range(5)
+    ],
+}
+
+# super-step별로 값이 바뀌는 channel (LangGraph new_versions에 해당)
+TURN_STEPS = [
+    ("intent", {"intent": "waste", "query": "페트병 어떻게 버려?"}),
+    ("subagents", {"waste_rag_result": RAG_RESULT, "character_result": {"name": "페트"}}),
+    ("aggregator", {"context": {"waste": RAG_RESULT, "character": {"name": "페트"}}}),
+    ("answer", {"answer": ANSWER}),
+]
+
+
+def build_history(turns: int) -> list:
+    """이전 대화 messages."""
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"질문 {i}: 페트병 어떻게 버려?"))
+        messages.append(AIMessage(content=ANSWER))
+    return messages
+
+
+def build_turn(history_turns: int) -> list[tuple[dict, dict]]:
+    """한 턴의 (checkpoint, new_versions) 목록."""
+    values: dict = {"messages": build_history(history_turns) + [HumanMessage(content="질문")]}
+    versions: dict = {"messages": 1}
+    checkpoints = []
+    for step, (_node, updates) in enumerate(TURN_STEPS, start=1):
+        values = {**values, **updates}
+        new_versions = {channel: step + 1 for channel in updates}
+        if _node == "answer":
+            values["messages"] = values["messages"] + [AIMessage(content=ANSWER)]
+            new_versions["messages"] = step + 1
+        versions = {**versions, **new_versions}
+        checkpoint = {
+            "v": 1,
+            "id": f"cp-{step}",
+            "ts": "2026-01-24T00:00:00+00:00",
+            "channel_values": dict(values),
+            "channel_versions": dict(versions),
+            "versions_seen": {},
+        }
+        checkpoints.append((checkpoint, new_versions))
+    return checkpoints
+
+
+def legacy_put(saver: PlainAsyncRedisSaver, checkpoint: dict, metadata: dict) -> list:
+    """legacy 포맷: 전체 checkpoint를 "type_tag:base64" 문자열로."""
+    values = []
+    for obj in (checkpoint, metadata):
+        type_tag, data = saver.serde.dumps_typed(obj)
+        values.append(f"{type_tag}:{base64.b64encode(data).decode('ascii')}")
+    return values
+
+
+def legacy_get(saver: PlainAsyncRedisSaver, stored: list) -> dict:
+    return saver._deserialize(stored[0])
+
+
+def blob_put(
+    saver: PlainAsyncRedisSaver, checkpoint: dict, metadata: dict, new_versions: dict
+) -> tuple[list, dict]:
+    """blob 포맷: 본문 + 바뀐 channel blob (aput과 동일한 직렬화)."""
+    blobs = {
+        (channel, version): saver._dumps_channel(checkpoint["channel_values"], channel)
+        for channel, version in new_versions.items()
+    }
+    body = {**checkpoint, "channel_values": {}}
+    return [saver._dumps_bin(body), saver._dumps_bin(metadata)], blobs
+
+
+def blob_get(saver: PlainAsyncRedisSaver, stored: list, store: dict) -> dict:
+    checkpoint = saver._loads_bin(stored[0])
+    checkpoint["channel_values"] = {
+        channel: saver._loads_bin(store[(channel, version)])
+        for channel, version in checkpoint["channel_versions"].items()
+    }
+    return checkpoint
+
+
+def bench(history_turns: int, rounds: int) -> dict:
+    saver = PlainAsyncRedisSaver(redis_url="redis://unused")
+    turn = build_turn(history_turns)
+    metadata = {"source": "loop", "step": 1}
+
+    # 바이트 (checkpoint 1개당 평균)
+    legacy_bytes = sum(
+        sum(len(v) for v in legacy_put(saver, cp, metadata)) for cp, _ in turn
+    ) / len(turn)
+    blob_bytes = 0
+    for cp, new_versions in turn:
+        stored, blobs = blob_put(saver, cp, metadata, new_versions)
+        blob_bytes += sum(len(v) for v in stored) + sum(len(v) for v in blobs.values())
+    blob_bytes /= len(turn)
+
+    # 초기 blob store (첫 checkpoint는 전체 channel 기록)
+    store: dict = {}
+    for cp, _ in turn:
+        store.update(blob_put(saver, cp, metadata, cp["channel_versions"])[1])
+
+    def timed(fn) -> float:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        return (time.perf_counter() - start) / (rounds * len(turn)) * 1e6
+
+    legacy_stored = [legacy_put(saver, cp, metadata) for cp, _ in turn]
+    blob_stored = [blob_put(saver, cp, metadata, nv)[0] for cp, nv in turn]
+
+    return {
+        "legacy_bytes": legacy_bytes,
+        "blob_bytes": blob_bytes,
+        "legacy_put_us": timed(lambda: [legacy_put(saver, cp, metadata) for cp, _ in turn]),
+        "blob_put_us": timed(lambda: [blob_put(saver, cp, metadata, nv) for cp, nv in turn]),
+        "legacy_get_us": timed(lambda: [legacy_get(saver, s) for s in legacy_stored]),
+        "blob_get_us": timed(lambda: [blob_get(saver, s, store) for s in blob_stored]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Checkpoint storage format benchmark")
+    parser.add_argument("--history-turns", default="0,5,20,50", help="쉼표 구분 이전 대화 턴 수")
+    parser.add_argument("--rounds", type=int, default=100, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    history = [int(h) for h in args.history_turns.split(",") if h.strip()]
+
+    print("=" * 86)
+    print("  Checkpoint format benchmark (per checkpoint, lower is better)")
+    print(f"  steps/turn={len(TURN_STEPS)}  rounds={args.rounds}")
+    print("=" * 86)
+    print(f"  {'history':>7} | {'format':>6} | {'bytes':>9} | {'put us':>9} | {'get us':>9}")
+    print("  " + "-" * 55)
+    for turns in history:
+        r = bench(turns, args.rounds)
+        for fmt in ("legacy", "blob"):
+            print(
+                f"  {turns:>7} | {fmt:>6} | {r[f'{fmt}_bytes']:>9.0f} | "
+                f"{r[f'{fmt}_put_us']:>9.1f} | {r[f'{fmt}_get_us']:>9.1f}"
+            )
+    print("=" * 86)
+    print("  get: blob 포맷은 전체 channel 재조립 기준 (Redis MGET 1회에 해당)")
+
+
+if __name__ == "__main__":
+    main()
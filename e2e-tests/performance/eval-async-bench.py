@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Chat Worker Eval 모드 벤치마크 (동기 평가 vs 비동기 평가 적재)
+
+answer → (eval | eval_dispatch) → END 구간을 실제 라우팅/노드로 구성하고
+done까지의 요청 지연(P50/P95)을 모드별로 비교:
+
+- sync: 모든 답변이 Eval 서브그래프(L1 Code Grader + L2 LLM Grader)를 기다림
+- async: 모든 답변이 eval_dispatch로 작업만 적재 (XADD 지연 모사)
+- async+blocking: eval_blocking_intents intent만 동기 평가, 나머지는 적재
+
+답변 생성/L2 LLM 호출/XADD 지연은 sleep으로 모사합니다.
+L1 Code Grader와 Score Aggregator는 실제 서비스를 사용합니다.
+
+Usage:
+    python e2e-tests/performance/eval-async-bench.py
+    python e2e-tests/performance/eval-async-bench.py --requests 400 --concurrency 32 --llm-ms 800
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, TypedDict
+
+os.environ.setdefault("OTEL_ENABLED", "false")
+
+APPS_DIR = Path(__file__).resolve().parents[2] / "apps"
+sys.path.insert(0, str(APPS_DIR))
+
+from langgraph.graph import END, StateGraph  # noqa: E402
+
+from chat_worker.application.dto.eval_config import EvalConfig  # noqa: E402
+from chat_worker.application.services.eval.code_grader import CodeGraderService  # noqa: E402
+from chat_worker.application.services.eval.score_aggregator import (  # noqa: E402
+    ScoreAggregatorService,
+)
+from chat_worker.infrastructure.orchestration.langgraph.eval_graph_factory import (  # noqa: E402
+    create_eval_subgraph,
+    create_route_after_answer,
+)
+from chat_worker.infrastructure.orchestration.langgraph.nodes.eval_node import (  # noqa: E402
+    create_eval_dispatch_node,
+)
+
+INTENTS = ["waste", "general", "character", "location", "weather"]
+INTENT_WEIGHTS = [0.4, 0.3, 0.1, 0.1, 0.1]
+
+
+class BenchState(TypedDict, total=False):
+    job_id: str
+    message: str
+    intent: str
+    answer: str
+
+
+class SleepLLMGrader:
+    """L2 LLM Grader 모사 (지연만, 점수 없음)."""
+
+    def __init__(self, llm_ms: float) -> None:
+        self._llm_ms = llm_ms
+
+    async def evaluate(self, query: str, context: str, answer: str, intent: str) -> dict:
+        await asyncio.sleep(self._llm_ms / 1000)
+        return {}
+
+
+class SleepJobQueue:
+    """RedisEvalJobQueue 모사 (XADD 1회 왕복 지연)."""
+
+    def __init__(self, xadd_ms: float) -> None:
+        self._xadd_ms = xadd_ms
+        self.jobs: list[dict[str, Any]] = []
+
+    async def enqueue(self, job: dict[str, Any]) -> bool:
+        await asyncio.sleep(self._xadd_ms / 1000)
+        self.jobs.append(job)
+        return True
+
+
+def build_graph(eval_config: EvalConfig, answer_ms: float, llm_ms: float, queue: SleepJobQueue):
+    """answer → eval/eval_dispatch → END 그래프 (factory.py 배선과 동일)."""
+
+    async def answer(state: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(answer_ms / 1000)
+        return {"answer": "페트병은 내용물을 비우고 라벨을 제거한 뒤 투명 페트병 전용함에 버려요."}
+
+    graph = StateGraph(BenchState)
+    graph.add_node("answer", answer)
+    graph.add_node(
+        "eval",
+        create_eval_subgraph(
+            eval_config=eval_config,
+            code_grader=CodeGraderService(),
+            llm_grader=SleepLLMGrader(llm_ms),
+            score_aggregator=ScoreAggregatorService(),
+        ),
+    )
+    graph.set_entry_point("answer")
+    if eval_config.eval_mode == "sync":
+        graph.add_edge("answer", "eval")
+    else:
+        graph.add_node("eval_dispatch", create_eval_dispatch_node(eval_config, queue))
+        graph.add_conditional_edges(
+            "answer",
+            create_route_after_answer(eval_config),
+            {"eval": "eval", "dispatch": "eval_dispatch"},
+        )
+        graph.add_edge("eval_dispatch", END)
+    graph.add_edge("eval", END)
+    return graph.compile()
+
+
+async def measure(graph, requests: list[dict[str, Any]], concurrency: int) -> dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+
+    async def one(request: dict[str, Any]) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await graph.ainvoke(request)
+            samples.append(time.perf_counter() - start)
+
+    wall = time.perf_counter()
+    await asyncio.gather(*(one(r) for r in requests))
+    wall = time.perf_counter() - wall
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples) * 1e3,
+        "p95_ms": samples[max(int(len(samples) * 0.95) - 1, 0)] * 1e3,
+        "mean_ms": statistics.fmean(samples) * 1e3,
+        "rps": len(samples) / wall,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Eval sync vs async benchmark")
+    parser.add_argument("--requests", type=int, default=200, help="모드별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--answer-ms", type=float, default=300.0, help="답변 생성 지연 (ms)")
+    parser.add_argument("--llm-ms", type=float, default=600.0, help="L2 LLM Grader 지연 (ms)")
+    parser.add_argument("--xadd-ms", type=float, default=0.5, help="XADD 왕복 지연 (ms)")
+    parser.add_argument("--blocking-intents", default="waste", help="async+blocking 동기 intent")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+    requests = [
+        {
+            "job_id": f"bench-{i}",
+            "message": "페트병 어떻게 버려?",
+            "intent": rng.choices(INTENTS, weights=INTENT_WEIGHTS)[0],
+        }
+        for i in range(args.requests)
+    ]
+    blocking = frozenset(i.strip() for i in args.blocking_intents.split(",") if i.strip())
+
+    print("=" * 72)
+    print("  Eval mode benchmark (answer → done latency, lower is better)")
+    print(
+        f"  requests={args.requests}  concurrency={args.concurrency}  answer={args.answer_ms:.0f}ms"
+        f"  llm_grader={args.llm_ms:.0f}ms  xadd={args.xadd_ms}ms"
+    )
+    print("=" * 72)
+    print(f"  {'mode':>22} | {'p50 ms':>8} | {'p95 ms':>8} | {'mean ms':>8} | {'rps':>6} | queued")
+    print("  " + "-" * 68)
+    modes = [
+        ("sync", EvalConfig(enable_eval_pipeline=True, eval_mode="sync")),
+        ("async", EvalConfig(enable_eval_pipeline=True, eval_mode="async")),
+        (
+            f"async+blocking({args.blocking_intents})",
+            EvalConfig(
+                enable_eval_pipeline=True, eval_mode="async", eval_blocking_intents=blocking
+            ),
+        ),
+    ]
+    for label, config in modes:
+        queue = SleepJobQueue(args.xadd_ms)
+        graph = build_graph(config, args.answer_ms, args.llm_ms, queue)
+        r = await measure(graph, requests, args.concurrency)
+        print(
+            f"  {label:>22} | {r['p50_ms']:>8.1f} | {r['p95_ms']:>8.1f} | {r['mean_ms']:>8.1f} | "
+            f"{r['rps']:>6.1f} | {len(queue.jobs)}"
+        )
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Chat Worker Intent 분류 벤치마크 (LLM only vs 로컬 분류기 fast path)
+
+ClassifyIntentCommand.execute 1회 지연과 LLM 호출 수를 임계값별로 비교:
+
+- llm: 로컬 분류기 없음. 모든 메시지가 LLM 호출 (--llm-ms + 지수분포 jitter)
+- local@T: 문자 n-gram 모델 예측 + 키워드 신호 반영 신뢰도가 T 이상이면 LLM 생략
+
+시드 데이터(intent_seed.jsonl)를 학습/평가로 나눠 학습분으로 모델을 만들고,
+평가분 메시지를 Zipf 분포로 반복 샘플링해 트래픽을 만듦 (짧고 반복적인 질문 위주).
+가짜 LLM은 시드 라벨을 반환하므로 accuracy = 최종 intent가 LLM 라벨과 같은 비율.
+Redis intent 캐시는 끔 (캐시 적중 효과와 분리).
+
+Usage:
+    python e2e-tests/performance/intent-local-fastpath-bench.py
+    python e2e-tests/performance/intent-local-fastpath-bench.py --requests 2000 \\
+        --thresholds 0.8,0.9,0.95
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("OTEL_ENABLED", "false")
+
+APPS_DIR = Path(__file__).resolve().parents[2] / "apps"
+sys.path.insert(0, str(APPS_DIR))
+
+from chat_worker.application.commands.classify_intent_command import (  # noqa: E402
+    ClassifyIntentCommand,
+    ClassifyIntentInput,
+)
+from chat_worker.application.services.intent_classifier_service import (  # noqa: E402
+    IntentClassificationSchema,
+)
+from chat_worker.infrastructure.assets.intent_ngram_model import (  # noqa: E402
+    DEFAULT_SEED_PATH,
+    CharNgramIntentModel,
+    load_labeled_jsonl,
+)
+
+
+class StaticPromptLoader:
+    def load(self, category: str, name: str) -> str:
+        return f"{category}/{name}"
+
+
+class OracleLLM:
+    """시드 라벨을 반환하는 가짜 LLM (지연은 sleep으로 모사)."""
+
+    def __init__(self, labels: dict[str, str], llm_ms: float, jitter_ms: float) -> None:
+        self._labels = labels
+        self._llm_ms = llm_ms
+        self._jitter_ms = jitter_ms
+        self.calls = 0
+
+    async def generate_structured(self, prompt, response_schema, **kwargs):
+        self.calls += 1
+        jitter = random.expovariate(1 / self._jitter_ms) if self._jitter_ms > 0 else 0.0
+        await asyncio.sleep((self._llm_ms + jitter) / 1000)
+        return IntentClassificationSchema(
+            intent=self._labels.get(prompt, "general"), confidence=0.9, reasoning="oracle"
+        )
+
+
+def build_traffic(messages: list[str], count: int, seed: int) -> list[str]:
+    """Zipf(s=1.1) 가중치로 메시지 반복 샘플링."""
+    rng = random.Random(seed)
+    ranked = messages[:]
+    rng.shuffle(ranked)
+    weights = [1 / (rank + 1) ** 1.1 for rank in range(len(ranked))]
+    return rng.choices(ranked, weights=weights, k=count)
+
+
+async def measure(command: ClassifyIntentCommand, llm: OracleLLM, traffic, labels) -> dict:
+    llm.calls = 0
+    samples = []
+    correct = 0
+    for i, message in enumerate(traffic):
+        start = time.perf_counter()
+        output = await command.execute(ClassifyIntentInput(job_id=f"bench-{i}", message=message))
+        samples.append(time.perf_counter() - start)
+        correct += output.intent == labels[message]
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples) * 1e3,
+        "p99_ms": samples[max(int(len(samples) * 0.99) - 1, 0)] * 1e3,
+        "mean_ms": statistics.fmean(samples) * 1e3,
+        "llm_calls": llm.calls / len(traffic),
+        "accuracy": correct / len(traffic),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Intent local fast path benchmark")
+    parser.add_argument("--requests", type=int, default=1000, help="모드별 분류 요청 수")
+    parser.add_argument("--thresholds", default="0.8,0.9,0.95", help="쉼표 구분 fast path 임계값")
+    parser.add_argument("--llm-ms", type=float, default=20.0, help="LLM 호출 고정 지연 (ms)")
+    parser.add_argument(
+        "--llm-jitter-ms", type=float, default=10.0, help="LLM 지수분포 jitter (ms)"
+    )
+    parser.add_argument("--holdout", type=float, default=0.3, help="평가용 시드 비율")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    random.seed(args.seed)
+    records = load_labeled_jsonl(DEFAULT_SEED_PATH)
+    random.Random(args.seed).shuffle(records)
+    cut = int(len(records) * (1 - args.holdout))
+    train, evaluation = records[:cut], records[cut:]
+
+    start = time.perf_counter()
+    model = CharNgramIntentModel.train([(r["message"], r["intent"]) for r in train])
+    train_s = time.perf_counter() - start
+    labels = {r["message"]: r["intent"] for r in evaluation}
+    traffic = build_traffic(list(labels), args.requests, args.seed)
+    llm = OracleLLM(labels, args.llm_ms, args.llm_jitter_ms)
+
+    predict_samples = []
+    for message in traffic[:500]:
+        t0 = time.perf_counter()
+        model.predict(message)
+        predict_samples.append(time.perf_counter() - t0)
+
+    print("=" * 78)
+    print("  Intent classification benchmark (ClassifyIntentCommand.execute, lower is better)")
+    print(
+        f"  requests={len(traffic)}  unique={len(set(traffic))}  train_samples={len(train)}"
+        f"  train_time={train_s:.1f}s  llm_ms={args.llm_ms}+exp({args.llm_jitter_ms})"
+        f"  predict_p50={statistics.median(predict_samples) * 1e6:.0f}us"
+    )
+    print("=" * 78)
+    print(
+        f"  {'mode':>10} | {'p50 ms':>7} | {'p99 ms':>7} | {'mean ms':>7} | "
+        f"{'LLM/req':>7} | {'accuracy':>8}"
+    )
+    print("  " + "-" * 62)
+    modes = [("llm", None)] + [
+        (f"local@{t}", float(t)) for t in args.thresholds.split(",") if t.strip()
+    ]
+    for label, threshold in modes:
+        options = {}
+        if threshold is not None:
+            options = {
+                "intent_predictor": model,
+                "enable_local_fast_path": True,
+                "local_confidence_threshold": threshold,
+            }
+        command = ClassifyIntentCommand(
+            llm=llm,
+            prompt_loader=StaticPromptLoader(),
+            cache=None,
+            enable_multi_intent=False,
+            **options,
+        )
+        r = await measure(command, llm, traffic, labels)
+        print(
+            f"  {label:>10} | {r['p50_ms']:>7.2f} | {r['p99_ms']:>7.2f} | {r['mean_ms']:>7.2f} | "
+            f"{r['llm_calls']:>7.2f} | {r['accuracy']:>8.1%}"
+        )
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
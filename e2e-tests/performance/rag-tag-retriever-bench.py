@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Chat Worker TagBasedRetriever 벤치마크 (legacy vs indexed)
+
+실제 에셋(item_class_list.yaml, situation_tags.yaml, source/*.json)으로
+메시지 1건당 태그 추출 + 규정 검색 비용을 비교:
+
+- legacy: 메시지마다 품목 전체/상황 태그 변형 전체를 `in`으로 검사,
+  문서마다 json.dumps(data).lower() 후 태그별 `in` 검사
+- indexed: 초기화 시 빌드한 Aho-Corasick 매처로 메시지 1회 스캔,
+  태그 → 문서 역색인 조회, 키워드 검색은 사전 계산된 소문자 텍스트 사용
+
+측정 전에 모든 메시지에서 두 구현의 결과(태그, 문서 순서, relevance, 인용문)가
+같은지 확인.
+
+Usage:
+    python e2e-tests/performance/rag-tag-retriever-bench.py
+    python e2e-tests/performance/rag-tag-retriever-bench.py --messages 2000 --rounds 5
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("OTEL_ENABLED", "false")
+
+APPS_DIR = Path(__file__).resolve().parents[2] / "apps"
+sys.path.insert(0, str(APPS_DIR))
+
+from chat_worker.application.ports.retrieval import (  # noqa: E402
+    ContextualSearchResult,
+    RetrievalContext,
+)
+from chat_worker.infrastructure.retrieval import TagBasedRetriever  # noqa: E402
+
+TEMPLATES = [
+    "{item} 어떻게 버려요?",
+    "{item}는 분리수거 되나요? {tag} 상태예요",
+    "집에 {item}이랑 {item2} 있는데 {tag}이면 어디에 버려야 해?",
+    "{tag} {item} 재활용 가능한가요",
+    "이사하면서 {item} 정리 중인데 {tag}라서 고민이에요. 종량제 봉투에 넣어도 되나요?",
+    "{item} 버리는 법 알려줘",
+]
+CHITCHAT = [
+    "안녕하세요 오늘 날씨 어때요?",
+    "근처 재활용 센터 어디 있어요?",
+    "분리배출 요일이 언제예요?",
+    "고마워요!",
+    "플라스틱 줄이는 방법 추천해줘",
+]
+KEYWORDS = ["페트병", "플라스틱", "유리병", "캔", "종이", "비닐", "스티로폼", "건전지", "형광등"]
+
+
+class LegacyTagBasedRetriever(TagBasedRetriever):
+    """변경 전 태그 추출/검색 (메시지마다 전체 순회 + json.dumps)."""
+
+    def search_by_keyword(self, keyword: str, limit: int = 3) -> list[dict]:
+        results = []
+        keyword_lower = keyword.lower()
+        for key, data in self._data.items():
+            if keyword_lower in key.lower():
+                results.append({"key": key, "data": data})
+                continue
+            data_str = json.dumps(data, ensure_ascii=False).lower()
+            if keyword_lower in data_str:
+                results.append({"key": key, "data": data})
+        return results[:limit]
+
+    def extract_context(self, message: str) -> RetrievalContext:
+        message_lower = message.lower()
+        message_normalized = self._normalize_message(message)
+        matched_items = []
+        suggested_category = None
+        for item, (major, _minor) in self._item_index.items():
+            if item in message_normalized:
+                matched_items.append(item)
+                if suggested_category is None:
+                    suggested_category = major
+        matched_situations = []
+        for tag in self._situation_tags:
+            lower = tag.lower()
+            for variant in (lower, lower.replace("_", " "), lower.replace("_", "")):
+                if variant in message_lower:
+                    matched_situations.append(tag)
+                    break
+        return RetrievalContext(
+            matched_items=matched_items,
+            matched_situations=matched_situations,
+            suggested_category=suggested_category,
+        )
+
+    def search_with_context(self, message, context=None) -> list[ContextualSearchResult]:
+        if context is None:
+            context = self.extract_context(message)
+        results = []
+        all_tags = context.matched_items + context.matched_situations
+        if not all_tags:
+            return self._fallback_keyword_search(message)
+        for key, data in self._data.items():
+            matched_tags = []
+            relevance = "low"
+            if context.suggested_category and context.suggested_category in key:
+                matched_tags.append(context.suggested_category)
+                relevance = "high"
+            data_str = json.dumps(data, ensure_ascii=False).lower()
+            for tag in all_tags:
+                if tag.lower() in data_str:
+                    matched_tags.append(tag)
+                    if relevance != "high":
+                        relevance = "medium"
+            if matched_tags:
+                results.append(
+                    ContextualSearchResult(
+                        chunk_id=key,
+                        category=data.get("category", key),
+                        data=data,
+                        quoted_text=self._extract_relevant_quote(data, all_tags),
+                        relevance=relevance,
+                        matched_tags=matched_tags,
+                    )
+                )
+        relevance_order = {"high": 0, "medium": 1, "low": 2}
+        results.sort(key=lambda x: relevance_order.get(x.relevance, 3))
+        return results
+
+
+def build_corpus(retriever: TagBasedRetriever, count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    items = list(retriever._item_index)
+    tags = [t.replace("_", rng.choice(["_", " ", ""])) for t in retriever._situation_tags]
+    messages = []
+    for _ in range(count):
+        if rng.random() < 0.15:
+            messages.append(rng.choice(CHITCHAT))
+            continue
+        messages.append(
+            rng.choice(TEMPLATES).format(
+                item=rng.choice(items),
+                item2=rng.choice(items),
+                tag=rng.choice(tags) if tags else "",
+            )
+        )
+    return messages
+
+
+def summarize(results: list[ContextualSearchResult]) -> list[tuple]:
+    return [(r.chunk_id, r.relevance, tuple(r.matched_tags), r.quoted_text) for r in results]
+
+
+def check_parity(legacy, indexed, messages: list[str]) -> None:
+    for message in messages:
+        assert legacy.extract_context(message) == indexed.extract_context(message), message
+        assert summarize(legacy.search_with_context(message)) == summarize(
+            indexed.search_with_context(message)
+        ), message
+    for keyword in KEYWORDS:
+        assert legacy.search_by_keyword(keyword) == indexed.search_by_keyword(keyword), keyword
+
+
+def bench(fn, inputs: list, rounds: int) -> dict:
+    samples = []
+    for _ in range(rounds):
+        for value in inputs:
+            start = time.perf_counter()
+            fn(value)
+            samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "p50_us": statistics.median(samples) * 1e6,
+        "p99_us": samples[max(int(len(samples) * 0.99) - 1, 0)] * 1e6,
+        "per_s": len(samples) / sum(samples),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TagBasedRetriever legacy vs indexed benchmark")
+    parser.add_argument("--messages", type=int, default=1000, help="메시지 코퍼스 크기")
+    parser.add_argument("--rounds", type=int, default=3, help="코퍼스 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    start = time.perf_counter()
+    indexed = TagBasedRetriever()
+    init_ms = (time.perf_counter() - start) * 1e3
+    legacy = LegacyTagBasedRetriever()
+    messages = build_corpus(indexed, args.messages, args.seed)
+    check_parity(legacy, indexed, messages)
+
+    print("=" * 78)
+    print("  TagBasedRetriever benchmark (per call, lower is better)")
+    print(
+        f"  messages={len(messages)}  rounds={args.rounds}  items={len(indexed._item_index)}"
+        f"  tags={len(indexed._situation_tags)}  docs={len(indexed._data)}"
+        f"  indexed_init={init_ms:.0f}ms  parity=ok"
+    )
+    print("=" * 78)
+    print(f"  {'operation':>19} | {'impl':>7} | {'p50 us':>9} | {'p99 us':>9} | {'calls/s':>9}")
+    print("  " + "-" * 64)
+    operations = [
+        ("extract_context", messages, lambda r: r.extract_context),
+        ("search_with_context", messages, lambda r: r.search_with_context),
+        ("search_by_keyword", KEYWORDS * 20, lambda r: r.search_by_keyword),
+    ]
+    for name, inputs, method in operations:
+        for label, retriever in (("legacy", legacy), ("indexed", indexed)):
+            r = bench(method(retriever), inputs, args.rounds)
+            print(
+                f"  {name:>19} | {label:>7} | {r['p50_us']:>9.1f} | {r['p99_us']:>9.1f} | "
+                f"{r['per_s']:>9.0f}"
+            )
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
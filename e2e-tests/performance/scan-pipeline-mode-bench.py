@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Scan 파이프라인 실행 모드 벤치마크 (chained vs fused vs speculative)
+
+같은 Step 4개(vision → rule → answer → reward)를 각 방식으로 실행하여
+Step 간 오버헤드만 비교. LLM/Redis/RabbitMQ 없이 지연을 sleep으로 모사:
+
+- chained: Step마다 Task 1개. Step 사이마다 ctx.to_dict() → JSON 메시지 →
+  브로커 hop(--hop-ms + 지수분포 jitter) → from_dict, Step마다
+  체크포인트 조회(GET) + 저장(SET) (CheckpointingStepRunner)
+- fused: Task 1개(scan.pipeline). Context는 메모리로 전달,
+  체크포인트는 vision/answer 경계에만 저장 (FusedPipelineRunner)
+- speculative: fused + vision 직후 reward 캐릭터 매칭(--match-ms)을
+  rule/answer와 병렬로 선행 실행
+
+Step 자체 시간(--step-ms)은 모든 모드가 같으므로, E2E 차이가 곧
+브로커 hop + 직렬화 + 체크포인트 왕복 비용 (speculative는 매칭 대기 제거분 추가).
+
+Usage:
+    python e2e-tests/performance/scan-pipeline-mode-bench.py
+    python e2e-tests/performance/scan-pipeline-mode-bench.py --scans 200 --hop-ms 3 --redis-ms 0.5
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("OTEL_ENABLED", "false")
+
+APPS_DIR = Path(__file__).resolve().parents[2] / "apps"
+sys.path.insert(0, str(APPS_DIR))
+
+from scan_worker.application.classify.commands.execute_pipeline import (  # noqa: E402
+    CheckpointingStepRunner,
+    FusedPipelineRunner,
+)
+from scan_worker.application.classify.dto.classify_context import ClassifyContext  # noqa: E402
+from scan_worker.application.common.step_interface import SpeculativeStep  # noqa: E402
+
+STEP_NAMES = ("vision", "rule", "answer", "reward")
+FUSED_CHECKPOINT_STEPS = frozenset({"vision", "answer"})
+
+
+class Counters:
+    def __init__(self) -> None:
+        self.broker_messages = 0
+        self.checkpoint_writes = 0
+        self.checkpoint_reads = 0
+        self.serialized_bytes = 0
+
+
+class SleepStore:
+    """Redis 왕복을 sleep으로 모사하는 체크포인트 저장소."""
+
+    def __init__(self, counters: Counters, redis_ms: float) -> None:
+        self._data: dict[str, dict[str, dict]] = {}
+        self._counters = counters
+        self._delay = redis_ms / 1000
+
+    def save_checkpoint(self, task_id: str, step_name: str, context: dict) -> None:
+        time.sleep(self._delay)
+        self._counters.checkpoint_writes += 1
+        self._data.setdefault(task_id, {})[step_name] = json.loads(json.dumps(context))
+
+    def get_checkpoint(self, task_id: str, step_name: str) -> dict | None:
+        time.sleep(self._delay)
+        self._counters.checkpoint_reads += 1
+        return self._data.get(task_id, {}).get(step_name)
+
+    def get_latest_checkpoint(self, task_id: str) -> tuple[str, dict] | None:
+        time.sleep(self._delay)
+        self._counters.checkpoint_reads += 1
+        saved = self._data.get(task_id, {})
+        for name in reversed(STEP_NAMES):
+            if name in saved:
+                return name, saved[name]
+        return None
+
+    def clear_checkpoints(self, task_id: str) -> None:
+        self._data.pop(task_id, None)
+
+
+class NullPublisher:
+    def publish_stage_event(self, **kwargs) -> str:
+        return "0-0"
+
+
+class SleepStep:
+    """Step 실행 시간 모사 + 결과 필드 채우기."""
+
+    PAYLOADS = {
+        "vision": (
+            "classification",
+            {
+                "classification": {
+                    "major_category": "재활용폐기물",
+                    "middle_category": "무색페트병",
+                    "minor_category": "물병",
+                },
+                "situation_tags": ["내용물_없음", "라벨_부착"],
+            },
+        ),
+        "rule": ("disposal_rules", {"배출방법": "내용물을 비우고 라벨을 제거 " * 20}),
+        "answer": ("final_answer", {"answer": "페트병은 깨끗이 헹군 뒤 배출하세요. " * 30}),
+        "reward": ("reward", {"name": "페트", "code": "char-pet"}),
+    }
+
+    def __init__(self, name: str, step_ms: float) -> None:
+        self._name = name
+        self._delay = step_ms / 1000
+
+    def run(self, ctx: ClassifyContext) -> ClassifyContext:
+        time.sleep(self._delay)
+        field, value = self.PAYLOADS[self._name]
+        setattr(ctx, field, value)
+        ctx.progress += 25
+        return ctx
+
+
+class SleepRewardStep(SpeculativeStep):
+    """reward Step 모사: 캐릭터 매칭(--match-ms) + 나머지(--step-ms)."""
+
+    def __init__(self, step_ms: float, match_ms: float) -> None:
+        self._step = SleepStep("reward", step_ms)
+        self._match_delay = match_ms / 1000
+
+    def prefetch(self, ctx: ClassifyContext) -> dict:
+        time.sleep(self._match_delay)
+        return {"name": "페트"}
+
+    def run(self, ctx: ClassifyContext) -> ClassifyContext:
+        return self.run_prefetched(ctx, self.prefetch(ctx))
+
+    def run_prefetched(self, ctx: ClassifyContext, prefetched: dict) -> ClassifyContext:
+        return self._step.run(ctx)
+
+
+def broker_hop(ctx: ClassifyContext, counters: Counters, hop_ms: float, jitter_ms: float):
+    """Task 메시지 발행 → 소비 (JSON 직렬화 + 브로커 지연)."""
+    body = json.dumps([[ctx.to_dict()], {}, {"chain": []}], ensure_ascii=False)
+    counters.broker_messages += 1
+    counters.serialized_bytes += len(body.encode("utf-8"))
+    delay = hop_ms + (random.expovariate(1 / jitter_ms) if jitter_ms > 0 else 0.0)
+    time.sleep(delay / 1000)
+    return ClassifyContext.from_dict(json.loads(body)[0][0])
+
+
+def new_context(i: int) -> ClassifyContext:
+    return ClassifyContext(
+        task_id=f"bench-{i:06d}",
+        user_id="00000000-0000-0000-0000-000000000001",
+        image_url="https://images.example.com/scan/bench.jpg",
+        user_input="이 폐기물을 어떻게 분리배출해야 하나요?",
+    )
+
+
+def run_chained(i: int, steps, counters: Counters, store: SleepStore, args) -> None:
+    runner = CheckpointingStepRunner(NullPublisher(), store)
+    ctx = new_context(i)
+    for name, step in steps:
+        # 첫 Task는 API가 발행, 이후는 이전 Task의 반환값이 다음 Task 메시지로 전달
+        ctx = broker_hop(ctx, counters, args.hop_ms, args.hop_jitter_ms)
+        ctx = runner.run_step(step, name, ctx)
+
+
+def run_fused(i: int, steps, counters: Counters, store: SleepStore, args) -> None:
+    runner = FusedPipelineRunner(NullPublisher(), store, FUSED_CHECKPOINT_STEPS)
+    ctx = broker_hop(new_context(i), counters, args.hop_ms, args.hop_jitter_ms)
+    runner.run(steps, ctx)
+
+
+def run_speculative(i: int, steps, counters: Counters, store: SleepStore, args) -> None:
+    runner = FusedPipelineRunner(NullPublisher(), store, FUSED_CHECKPOINT_STEPS, speculative=True)
+    ctx = broker_hop(new_context(i), counters, args.hop_ms, args.hop_jitter_ms)
+    runner.run(steps, ctx)
+
+
+def bench(mode: str, args) -> dict:
+    random.seed(42)
+    counters = Counters()
+    store = SleepStore(counters, args.redis_ms)
+    steps = [(name, SleepStep(name, args.step_ms)) for name in STEP_NAMES[:-1]]
+    steps.append(("reward", SleepRewardStep(args.step_ms, args.match_ms)))
+    run = {"chained": run_chained, "fused": run_fused, "speculative": run_speculative}[mode]
+
+    samples = []
+    for i in range(args.scans):
+        start = time.perf_counter()
+        run(i, steps, counters, store, args)
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    step_total_ms = args.step_ms * len(STEP_NAMES) + args.match_ms
+    return {
+        "p50_ms": statistics.median(samples) * 1e3,
+        "p99_ms": samples[max(int(len(samples) * 0.99) - 1, 0)] * 1e3,
+        "overhead_ms": statistics.median(samples) * 1e3 - step_total_ms,
+        "messages": counters.broker_messages / args.scans,
+        "writes": counters.checkpoint_writes / args.scans,
+        "reads": counters.checkpoint_reads / args.scans,
+        "kb": counters.serialized_bytes / args.scans / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scan pipeline chained vs fused benchmark")
+    parser.add_argument("--scans", type=int, default=100, help="모드별 실행 횟수")
+    parser.add_argument("--step-ms", type=float, default=5.0, help="Step 1개 실행 시간 (ms)")
+    parser.add_argument("--hop-ms", type=float, default=2.0, help="브로커 hop 고정 지연 (ms)")
+    parser.add_argument(
+        "--hop-jitter-ms", type=float, default=3.0, help="브로커 hop 지수분포 jitter 평균 (ms)"
+    )
+    parser.add_argument("--redis-ms", type=float, default=0.5, help="Redis 왕복 1회 (ms)")
+    parser.add_argument(
+        "--match-ms", type=float, default=5.0, help="reward 캐릭터 매칭 시간 (ms, RPC 왕복)"
+    )
+    args = parser.parse_args()
+
+    print("=" * 90)
+    print("  Scan pipeline mode benchmark (per scan, lower is better)")
+    print(
+        f"  scans={args.scans}  step_ms={args.step_ms}  hop_ms={args.hop_ms}"
+        f"  hop_jitter_ms={args.hop_jitter_ms}  redis_ms={args.redis_ms}  match_ms={args.match_ms}"
+    )
+    print("=" * 90)
+    print(
+        f"  {'mode':>11} | {'p50 ms':>8} | {'p99 ms':>8} | {'overhead':>8} | "
+        f"{'msgs':>5} | {'ckpt W':>6} | {'ckpt R':>6} | {'msg KB':>7}"
+    )
+    print("  " + "-" * 79)
+    for mode in ("chained", "fused", "speculative"):
+        r = bench(mode, args)
+        print(
+            f"  {mode:>11} | {r['p50_ms']:>8.1f} | {r['p99_ms']:>8.1f} | {r['overhead_ms']:>8.1f} | "
+            f"{r['messages']:>5.0f} | {r['writes']:>6.0f} | {r['reads']:>6.0f} | {r['kb']:>7.1f}"
+        )
+    print("=" * 90)
+    print("  overhead = p50 - (step_ms x 4 + match_ms): 브로커 hop + 직렬화 + 체크포인트 왕복")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Chat Worker 유사 질문 캐시 벤치마크 (정확 일치 캐시 vs MinHash 유사 캐시)
+
+ClassifyIntentCommand.execute 1회 지연과 LLM 호출 수를 캐시 모드별로 비교:
+
+- none: 캐시 없음. 모든 메시지가 LLM 호출
+- exact: 메시지 해시 키 캐시 (기존 CachePort 경로, 인메모리 dict로 모사)
+- semantic: MinHashSemanticCache (정규화 + 문자 3-gram MinHash/LSH)
+- exact+semantic: 둘 다 (운영 구성)
+
+시드 데이터(intent_seed.jsonl) 메시지를 Zipf 분포로 반복 샘플링하되,
+요청마다 표기 변형(끝 "요", 물음표, 띄어쓰기, "좀" 삽입)을 무작위로 적용해
+같은 질문이 다른 문자열로 들어오는 실제 트래픽을 모사합니다.
+가짜 LLM은 시드 라벨을 반환하므로 accuracy = 최종 intent가 라벨과 같은 비율.
+로컬 분류기 fast path는 끔 (캐시 효과와 분리).
+
+Usage:
+    python e2e-tests/performance/semantic-cache-bench.py
+    python e2e-tests/performance/semantic-cache-bench.py --requests 3000 --variant-rate 0.7
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("OTEL_ENABLED", "false")
+
+APPS_DIR = Path(__file__).resolve().parents[2] / "apps"
+sys.path.insert(0, str(APPS_DIR))
+
+from chat_worker.application.commands.classify_intent_command import (  # noqa: E402
+    ClassifyIntentCommand,
+    ClassifyIntentInput,
+)
+from chat_worker.application.ports.cache import CachePort  # noqa: E402
+from chat_worker.application.services.intent_classifier_service import (  # noqa: E402
+    IntentClassificationSchema,
+)
+from chat_worker.infrastructure.assets.intent_ngram_model import (  # noqa: E402
+    DEFAULT_SEED_PATH,
+    load_labeled_jsonl,
+    normalize_message,
+)
+from chat_worker.infrastructure.cache.semantic_cache import (  # noqa: E402
+    MinHashSemanticCache,
+)
+
+
+class StaticPromptLoader:
+    def load(self, category: str, name: str) -> str:
+        return f"{category}/{name}"
+
+
+class DictCache(CachePort):
+    """인메모리 정확 일치 캐시 (Redis 왕복 없이 키 적중률만 비교)."""
+
+    def __init__(self) -> None:
+        self._data: dict = {}
+
+    async def get(self, key):
+        return self._data.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self._data[key] = value
+        return True
+
+    async def delete(self, key):
+        return self._data.pop(key, None) is not None
+
+    async def exists(self, key):
+        return key in self._data
+
+
+class OracleLLM:
+    """정규화 메시지로 시드 라벨을 찾아 반환하는 가짜 LLM (지연은 sleep으로 모사)."""
+
+    def __init__(self, labels: dict[str, str], llm_ms: float, jitter_ms: float) -> None:
+        self._labels = labels
+        self._llm_ms = llm_ms
+        self._jitter_ms = jitter_ms
+        self.calls = 0
+
+    async def generate_structured(self, prompt, response_schema, **kwargs):
+        self.calls += 1
+        jitter = random.expovariate(1 / self._jitter_ms) if self._jitter_ms > 0 else 0.0
+        await asyncio.sleep((self._llm_ms + jitter) / 1000)
+        return IntentClassificationSchema(
+            intent=self._labels.get(prompt, "general"), confidence=0.9, reasoning="oracle"
+        )
+
+
+def make_variant(message: str, rng: random.Random) -> str:
+    """표기 변형 1개 적용 (의미 동일)."""
+    base = message.rstrip("?!. ")
+    choice = rng.randrange(4)
+    if choice == 0:
+        return base if base.endswith("요") else base + "요"
+    if choice == 1:
+        return base + ("?" if not message.endswith("?") else "")
+    if choice == 2:
+        return base.replace(" ", "", 1) if " " in base else base + " "
+    words = base.split()
+    if len(words) >= 2:
+        words.insert(len(words) - 1, "좀")
+    return " ".join(words)
+
+
+def build_traffic(messages: list[str], count: int, variant_rate: float, seed: int):
+    """Zipf(s=1.1) 가중치 샘플링 + 변형 적용. (요청 문자열, 원본) 목록."""
+    rng = random.Random(seed)
+    ranked = messages[:]
+    rng.shuffle(ranked)
+    weights = [1 / (rank + 1) ** 1.1 for rank in range(len(ranked))]
+    picks = rng.choices(ranked, weights=weights, k=count)
+    return [(make_variant(m, rng) if rng.random() < variant_rate else m, m) for m in picks]
+
+
+async def measure(command, llm: OracleLLM, traffic, labels) -> dict:
+    llm.calls = 0
+    samples = []
+    correct = 0
+    for i, (request, original) in enumerate(traffic):
+        start = time.perf_counter()
+        output = await command.execute(ClassifyIntentInput(job_id=f"bench-{i}", message=request))
+        samples.append(time.perf_counter() - start)
+        correct += output.intent == labels[normalize_message(original)]
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples) * 1e3,
+        "p99_ms": samples[max(int(len(samples) * 0.99) - 1, 0)] * 1e3,
+        "mean_ms": statistics.fmean(samples) * 1e3,
+        "llm_calls": llm.calls / len(traffic),
+        "accuracy": correct / len(traffic),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Semantic intent cache benchmark")
+    parser.add_argument("--requests", type=int, default=2000, help="모드별 분류 요청 수")
+    parser.add_argument("--variant-rate", type=float, default=0.5, help="표기 변형 요청 비율")
+    parser.add_argument("--threshold", type=float, default=0.8, help="유사 캐시 Jaccard 임계값")
+    parser.add_argument("--llm-ms", type=float, default=20.0, help="LLM 호출 고정 지연 (ms)")
+    parser.add_argument(
+        "--llm-jitter-ms", type=float, default=10.0, help="LLM 지수분포 jitter (ms)"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    random.seed(args.seed)
+    records = load_labeled_jsonl(DEFAULT_SEED_PATH)
+    originals = {normalize_message(r["message"]): r["message"] for r in records}
+    labels = {normalize_message(r["message"]): r["intent"] for r in records}
+    traffic = build_traffic(list(originals.values()), args.requests, args.variant_rate, args.seed)
+    # 가짜 LLM은 프롬프트(=요청 문자열)로 라벨 조회
+    llm_labels = {request: labels[normalize_message(original)] for request, original in traffic}
+    llm = OracleLLM(llm_labels, args.llm_ms, args.llm_jitter_ms)
+
+    print("=" * 78)
+    print("  Semantic intent cache benchmark (ClassifyIntentCommand.execute, lower is better)")
+    print(
+        f"  requests={len(traffic)}  unique_requests={len({r for r, _ in traffic})}"
+        f"  unique_questions={len({o for _, o in traffic})}  variant_rate={args.variant_rate}"
+        f"  threshold={args.threshold}"
+    )
+    print("=" * 78)
+    print(
+        f"  {'mode':>15} | {'p50 ms':>7} | {'p99 ms':>7} | {'mean ms':>7} | "
+        f"{'LLM/req':>7} | {'accuracy':>8}"
+    )
+    print("  " + "-" * 67)
+    modes = [
+        ("none", False, False),
+        ("exact", True, False),
+        ("semantic", False, True),
+        ("exact+semantic", True, True),
+    ]
+    for label, use_exact, use_semantic in modes:
+        command = ClassifyIntentCommand(
+            llm=llm,
+            prompt_loader=StaticPromptLoader(),
+            cache=DictCache() if use_exact else None,
+            enable_multi_intent=False,
+            semantic_cache=(
+                MinHashSemanticCache(threshold=args.threshold) if use_semantic else None
+            ),
+        )
+        r = await measure(command, llm, traffic, labels)
+        print(
+            f"  {label:>15} | {r['p50_ms']:>7.2f} | {r['p99_ms']:>7.2f} | {r['mean_ms']:>7.2f} | "
+            f"{r['llm_calls']:>7.2f} | {r['accuracy']:>8.1%}"
+        )
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+SSE Gateway 구독자 fan-out 벤치마크 (legacy vs offer)
+
+동시 구독자 10k명을 job별로 나눠 등록하고, shard 리스너가 이벤트 하나를
+job의 모든 구독자에게 분배하는 데 드는 시간을 비교. Redis 없이
+SSEBroadcastManager._process_event_with_tracing 경로만 측정:
+
+- legacy: 구독자마다 _compare_stream_id 문자열 파싱 + await put_event
+- offer: 이벤트당 stream_id/seq 1회 파싱 + 구독자별 동기 put_nowait
+
+--slow-ratio 비율의 구독자는 큐를 비우지 않는 느린 클라이언트(maxsize=1)로
+등록하여 Drop 정책 경로까지 포함. 분배 1회의 p50/p99 (us)가 낮을수록
+같은 shard의 다른 job 이벤트 지연이 줄어듦.
+
+Usage:
+    python e2e-tests/performance/sse-fanout-bench.py
+    python e2e-tests/performance/sse-fanout-bench.py --subscribers 10000 --jobs 1,100,1000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("OTEL_ENABLED", "false")
+
+APPS_DIR = Path(__file__).resolve().parents[2] / "apps"
+sys.path.insert(0, str(APPS_DIR))
+
+from sse_gateway.core.broadcast_manager import (  # noqa: E402
+    SSEBroadcastManager,
+    SubscriberQueue,
+)
+
+
+async def legacy_put_event(subscriber: SubscriberQueue, event: dict) -> bool:
+    """변경 전 put_event (구독자마다 stream_id/seq 파싱 + await)."""
+    stream_id = event.get("stream_id", "")
+    if stream_id:
+        if SubscriberQueue._compare_stream_id(stream_id, subscriber.last_stream_id) <= 0:
+            return False
+        subscriber.last_stream_id = stream_id
+    try:
+        event_seq = int(event.get("seq", 0))
+    except (ValueError, TypeError):
+        event_seq = 0
+    if event_seq > subscriber.last_seq:
+        subscriber.last_seq = event_seq
+
+    if subscriber.queue.full():
+        old_event = subscriber.queue.get_nowait()
+        if old_event.get("stage") in ("done", "error"):
+            await subscriber.queue.put(old_event)
+            return False
+    subscriber.queue.put_nowait(event)
+    subscriber.last_event_at = time.time()
+    return True
+
+
+async def legacy_distribute(manager: SSEBroadcastManager, job_id: str, event: dict) -> None:
+    for subscriber in manager._subscribers.get(job_id, set()):
+        await legacy_put_event(subscriber, event)
+
+
+def build_manager(subscribers: int, jobs: int, slow_ratio: float) -> SSEBroadcastManager:
+    manager = SSEBroadcastManager()
+    manager._span_sample_rate = 0.0
+    slow_every = int(1 / slow_ratio) if slow_ratio > 0 else 0
+    for i in range(subscribers):
+        job_id = f"job-{i % jobs}"
+        maxsize = 1 if slow_every and i % slow_every == 0 else 100
+        manager._subscribers[job_id].add(
+            SubscriberQueue(job_id=job_id, queue=asyncio.Queue(maxsize=maxsize))
+        )
+    return manager
+
+
+def drain(manager: SSEBroadcastManager) -> None:
+    """빠른 구독자 큐 비우기 (느린 구독자는 가득 찬 상태 유지)."""
+    for subscribers in manager._subscribers.values():
+        for subscriber in subscribers:
+            if subscriber.queue.maxsize > 1:
+                while not subscriber.queue.empty():
+                    subscriber.queue.get_nowait()
+
+
+async def bench(subscribers: int, jobs: int, rounds: int, slow_ratio: float, mode: str) -> dict:
+    manager = build_manager(subscribers, jobs, slow_ratio)
+    job_ids = list(manager._subscribers)
+    samples = []
+
+    for seq in range(1, rounds + 1):
+        for i, job_id in enumerate(job_ids):
+            event = {
+                "job_id": job_id,
+                "stage": "answer",
+                "status": "streaming",
+                "seq": seq,
+                "stream_id": f"{1700000000000 + seq}-{i}",
+            }
+            start = time.perf_counter()
+            if mode == "legacy":
+                await legacy_distribute(manager, job_id, event)
+            else:
+                await manager._process_event_with_tracing(job_id, event, "answer", seq)
+            samples.append(time.perf_counter() - start)
+        if seq % 50 == 0:
+            drain(manager)
+
+    samples.sort()
+    total = sum(samples)
+    deliveries = rounds * subscribers
+    return {
+        "p50_us": statistics.median(samples) * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99) - 1] * 1e6,
+        "ns_per_delivery": total / deliveries * 1e9,
+        "deliveries_per_s": deliveries / total,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="SSE Gateway subscriber fan-out benchmark")
+    parser.add_argument("--subscribers", type=int, default=10_000, help="동시 구독자 수")
+    parser.add_argument("--jobs", default="1,100,1000", help="쉼표 구분 job 수 목록")
+    parser.add_argument("--rounds", type=int, default=20, help="job당 이벤트 수")
+    parser.add_argument("--slow-ratio", type=float, default=0.01, help="느린 구독자 비율")
+    args = parser.parse_args()
+
+    job_counts = [int(j) for j in args.jobs.split(",") if j.strip()]
+
+    print("=" * 84)
+    print("  SSE Gateway fan-out benchmark (per distribute call, lower is better)")
+    print(f"  subscribers={args.subscribers}  rounds={args.rounds}  slow_ratio={args.slow_ratio}")
+    print("=" * 84)
+    print(
+        f"  {'jobs':>5} | {'mode':>6} | {'p50 us':>10} | {'p99 us':>10} | "
+        f"{'ns/deliv':>9} | {'deliv/s':>11}"
+    )
+    print("  " + "-" * 68)
+    for jobs in job_counts:
+        for mode in ("legacy", "offer"):
+            r = await bench(args.subscribers, jobs, args.rounds, args.slow_ratio, mode)
+            print(
+                f"  {jobs:>5} | {mode:>6} | {r['p50_us']:>10.1f} | {r['p99_us']:>10.1f} | "
+                f"{r['ns_per_delivery']:>9.0f} | {r['deliveries_per_s']:>11.0f}"
+            )
+    print("=" * 84)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
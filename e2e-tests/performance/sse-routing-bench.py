@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+SSE Gateway Pub/Sub 라우팅 모드 벤치마크 (shard vs job)
+
+Gateway Pod 수를 늘려가며 Pod당 이벤트 수신/디코딩/분배 CPU 시간을 비교.
+Redis 없이 SSEBroadcastManager._dispatch_message를 직접 호출하여
+Pod가 Pub/Sub에서 받게 되는 메시지 집합만 재현:
+
+- shard 모드: 모든 Pod가 모든 shard 채널 구독 → 전체 이벤트 수신
+- job 모드: Event Router가 라우팅 레지스트리 기준으로 발행 → 자기 구독자 이벤트만 수신
+
+job 수를 Pod 수에 비례해 늘리면 (Pod당 구독 job 고정)
+shard 모드의 Pod당 CPU는 Pod 수에 비례해 증가하고 job 모드는 평탄해야 함.
+
+Usage:
+    python e2e-tests/performance/sse-routing-bench.py
+    python e2e-tests/performance/sse-routing-bench.py --replicas 1,2,4,8,16 --jobs-per-pod 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("OTEL_ENABLED", "false")
+
+APPS_DIR = Path(__file__).resolve().parents[2] / "apps"
+sys.path.insert(0, str(APPS_DIR))
+
+from sse_gateway.core.broadcast_manager import (  # noqa: E402
+    SSEBroadcastManager,
+    SubscriberQueue,
+)
+
+
+def build_events(job_ids: list[str], events_per_job: int) -> list[tuple[str, str]]:
+    """job별 이벤트(JSON 문자열) 생성 → [(job_id, data), ...]."""
+    events = []
+    for seq in range(1, events_per_job + 1):
+        for i, job_id in enumerate(job_ids):
+            data = json.dumps(
+                {
+                    "job_id": job_id,
+                    "stage": "token" if seq % 5 else "answer",
+                    "status": "streaming",
+                    "seq": seq,
+                    "stream_id": f"{1700000000000 + seq}-{i}",
+                    "content": "페트병은 라벨을 제거한 뒤",
+                },
+                ensure_ascii=False,
+            )
+            events.append((job_id, data))
+    return events
+
+
+async def run_pod(manager: SSEBroadcastManager, messages: list[str]) -> float:
+    """Pod 하나가 수신한 메시지를 처리하는 CPU 시간 (초)."""
+    start = time.process_time()
+    for data in messages:
+        await manager._dispatch_message("bench", data)
+    elapsed = time.process_time() - start
+
+    # 큐 비우기 (다음 라운드 메모리 누적 방지)
+    for subscribers in manager._subscribers.values():
+        for subscriber in subscribers:
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+    return elapsed
+
+
+async def bench(replicas: int, jobs_per_pod: int, events_per_job: int, mode: str) -> dict:
+    """replicas개 Pod 시뮬레이션."""
+    queue_maxsize = events_per_job + 1
+    job_ids = [f"job-{i}" for i in range(replicas * jobs_per_pod)]
+    events = build_events(job_ids, events_per_job)
+
+    pods = []
+    owner: dict[str, int] = {}
+    for pod in range(replicas):
+        manager = SSEBroadcastManager()
+        manager._routing_mode = mode
+        pods.append(manager)
+    for i, job_id in enumerate(job_ids):
+        pod = i % replicas
+        owner[job_id] = pod
+        pods[pod]._subscribers[job_id].add(
+            SubscriberQueue(job_id=job_id, queue=asyncio.Queue(maxsize=queue_maxsize))
+        )
+
+    if mode == "shard":
+        inbox = [[data for _, data in events] for _ in range(replicas)]
+    else:
+        inbox = [[] for _ in range(replicas)]
+        for job_id, data in events:
+            inbox[owner[job_id]].append(data)
+
+    cpu = [await run_pod(pods[p], inbox[p]) for p in range(replicas)]
+    return {
+        "received_per_pod": sum(len(m) for m in inbox) / replicas,
+        "cpu_ms_per_pod": sum(cpu) / replicas * 1000,
+        "cpu_ms_total": sum(cpu) * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="SSE Gateway routing mode benchmark")
+    parser.add_argument("--replicas", default="1,2,4,8", help="쉼표 구분 Pod 수 목록")
+    parser.add_argument("--jobs-per-pod", type=int, default=100, help="Pod당 구독 job 수")
+    parser.add_argument("--events-per-job", type=int, default=50, help="job당 이벤트 수")
+    args = parser.parse_args()
+
+    replica_counts = [int(r) for r in args.replicas.split(",") if r.strip()]
+
+    print("=" * 78)
+    print("  SSE Gateway Pub/Sub routing benchmark (per-pod CPU, lower is better)")
+    print(f"  jobs/pod={args.jobs_per_pod}  events/job={args.events_per_job}")
+    print("=" * 78)
+    print(
+        f"  {'pods':>5} | {'mode':>5} | {'recv/pod':>10} | {'cpu ms/pod':>11} | {'cpu ms total':>12}"
+    )
+    print("  " + "-" * 60)
+    for replicas in replica_counts:
+        for mode in ("shard", "job"):
+            r = await bench(replicas, args.jobs_per_pod, args.events_per_job, mode)
+            print(
+                f"  {replicas:>5} | {mode:>5} | {r['received_per_pod']:>10.0f} | "
+                f"{r['cpu_ms_per_pod']:>11.1f} | {r['cpu_ms_total']:>12.1f}"
+            )
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,37 @@
+-- ============================================================================
+-- V005: location 사이트 카테고리 컬럼 추가 (주변 검색 필터 → LIMIT 이전 적용)
+--
+-- 목표:
+--   - 매장/수거 카테고리를 적재 시 1회 계산하여 저장 (요청별 키워드 분류 제거)
+--   - store_category / pickup_categories 필터를 WHERE 절에서 적용
+--     → 필터링 후 LIMIT, 필터 뷰에서도 결과 수 보장
+--
+-- 값 계산:
+--   - 컬럼 추가 후 backfill 실행 (CategoryClassifierService 규칙과 동일)
+--     python -m location.category_backfill
+--   - 미계산(NULL) 행은 API가 요청 시 분류 (backfill 전에도 결과 동일)
+-- ============================================================================
+
+-- ============================================
+-- Step 1: 컬럼 추가
+-- ============================================
+ALTER TABLE location.location_normalized_sites
+    ADD COLUMN IF NOT EXISTS store_category     VARCHAR(32),
+    ADD COLUMN IF NOT EXISTS pickup_categories  VARCHAR(32)[];
+
+-- ============================================
+-- Step 2: 인덱스 생성
+-- ============================================
+-- 매장 카테고리 필터 (store_category IN (...))
+CREATE INDEX IF NOT EXISTS idx_location_sites_store_category
+    ON location.location_normalized_sites (store_category);
+
+-- 수거 품목 필터 (pickup_categories && ARRAY[...])
+CREATE INDEX IF NOT EXISTS idx_location_sites_pickup_categories
+    ON location.location_normalized_sites USING GIN (pickup_categories);
+
+-- ============================================
+-- Step 3: 코멘트 (문서화)
+-- ============================================
+COMMENT ON COLUMN location.location_normalized_sites.store_category IS '매장 카테고리 (StoreCategory, 적재 시 계산)';
+COMMENT ON COLUMN location.location_normalized_sites.pickup_categories IS '수거 품목 카테고리 목록 (PickupCategory, 적재 시 계산)';
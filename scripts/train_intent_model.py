@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Chat Worker 로컬 Intent 모델 학습 스크립트.
+
+시드 데이터 + 운영 로그에서 추출한 LLM intent 라벨로 문자 n-gram 선형 모델을
+학습하고 chat_worker 에셋(intent_ngram_model.json)으로 저장합니다.
+
+로그 JSONL 형식 (한 줄에 1건):
+    {"message": "페트병 어떻게 버려?", "intent": "waste", "confidence": 0.95}
+
+- confidence가 --min-confidence 미만인 LLM 라벨은 제외 (노이즈 라벨 방지)
+- 같은 메시지(정규화 기준)에 라벨이 여러 개면 다수결
+- --holdout 비율만큼 떼어 임계값별 fast path 적중률/정확도를 출력한 뒤
+  전체 데이터로 재학습하여 저장
+
+Usage:
+    python scripts/train_intent_model.py
+    python scripts/train_intent_model.py --logs intent_logs.jsonl --min-confidence 0.85
+    python scripts/train_intent_model.py --no-seed --logs a.jsonl --logs b.jsonl \\
+        --output /tmp/intent_ngram_model.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+APPS_DIR = Path(__file__).resolve().parents[1] / "apps"
+sys.path.insert(0, str(APPS_DIR))
+
+from chat_worker.application.services.intent_classifier_service import (  # noqa: E402
+    IntentClassifierService,
+)
+from chat_worker.infrastructure.assets.intent_ngram_model import (  # noqa: E402
+    DEFAULT_MODEL_PATH,
+    DEFAULT_SEED_PATH,
+    CharNgramIntentModel,
+    load_labeled_jsonl,
+    normalize_message,
+)
+
+THRESHOLDS = (0.7, 0.8, 0.85, 0.9, 0.95)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Train chat_worker local intent model")
+    parser.add_argument("--logs", action="append", default=[], help="LLM intent 로그 JSONL")
+    parser.add_argument("--no-seed", action="store_true", help="시드 데이터 제외")
+    parser.add_argument("--min-confidence", type=float, default=0.85, help="로그 라벨 최소 신뢰도")
+    parser.add_argument("--output", default=str(DEFAULT_MODEL_PATH), help="모델 저장 경로")
+    parser.add_argument("--holdout", type=float, default=0.2, help="평가용 분리 비율 (0이면 생략)")
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--l2", type=float, default=1e-4)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def collect_samples(args: argparse.Namespace) -> list[tuple[str, str]]:
+    """시드 + 로그 라벨 수집 후 메시지별 다수결."""
+    records = [] if args.no_seed else load_labeled_jsonl(DEFAULT_SEED_PATH)
+    for path in args.logs:
+        for record in load_labeled_jsonl(path):
+            if float(record.get("confidence", 1.0)) >= args.min_confidence:
+                records.append(record)
+
+    votes: dict[str, Counter] = defaultdict(Counter)
+    originals: dict[str, str] = {}
+    for record in records:
+        key = normalize_message(record["message"])
+        if key:
+            votes[key][record["intent"]] += 1
+            originals.setdefault(key, record["message"])
+    return [(originals[key], counter.most_common(1)[0][0]) for key, counter in votes.items()]
+
+
+def evaluate(model: CharNgramIntentModel, samples: list[tuple[str, str]]) -> None:
+    """임계값별 fast path 적중률(coverage)과 적중 시 정확도 출력.
+
+    신뢰도는 ClassifyIntentCommand와 같이 키워드 신호를 반영한 값.
+    """
+    service = IntentClassifierService("", "", "")
+    scored = []
+    for message, intent in samples:
+        prediction = model.predict(message)
+        if prediction is None:
+            scored.append((0.0, False))
+            continue
+        result = service.parse_local_prediction(prediction.intent, prediction.probability, message)
+        scored.append((result.confidence, result.intent.value == intent))
+
+    print(f"  holdout={len(samples)}")
+    print(f"  {'threshold':>9} | {'fast path':>9} | {'accuracy':>8}")
+    print("  " + "-" * 33)
+    for threshold in THRESHOLDS:
+        hits = [correct for confidence, correct in scored if confidence >= threshold]
+        rate = len(hits) / len(scored) if scored else 0.0
+        accuracy = sum(hits) / len(hits) if hits else 0.0
+        print(f"  {threshold:>9.2f} | {rate:>8.1%} | {accuracy:>7.1%}")
+
+
+def main() -> None:
+    args = parse_args()
+    samples = collect_samples(args)
+    if not samples:
+        raise SystemExit("No training samples")
+    print(f"samples={len(samples)}  labels={dict(Counter(i for _, i in samples))}")
+
+    if args.holdout > 0:
+        rng = random.Random(args.seed)
+        shuffled = samples[:]
+        rng.shuffle(shuffled)
+        cut = int(len(shuffled) * (1 - args.holdout))
+        model = CharNgramIntentModel.train(
+            shuffled[:cut], epochs=args.epochs, l2=args.l2, seed=args.seed
+        )
+        evaluate(model, shuffled[cut:])
+
+    model = CharNgramIntentModel.train(samples, epochs=args.epochs, l2=args.l2, seed=args.seed)
+    model.save(args.output)
+    print(f"saved: {args.output} (ngrams={model.vocabulary_size})")
+
+
+if __name__ == "__main__":
+    main()